@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+#
+# python-chrono - a Python module for easy and convenient date/time handling
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+
+"""
+Benchmarks for the hot paths of chrono - parsing, formatting, calendar
+calculations, object construction, and attribute normalization - run on
+reproducible synthetic datasets.
+
+Run ``python -m benchmarks`` from the source directory, see
+:mod:`benchmarks.__main__` for the options. Import time is measured
+separately by ``benchmarks/imports.py``.
+"""
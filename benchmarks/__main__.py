@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+#
+# python-chrono - a Python module for easy and convenient date/time handling
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+
+"""
+Runs the benchmarks, and prints operations per second and bytes per object
+for each case. Results can be written to a JSON file with ``--json``, and
+compared with an earlier JSON file with ``--baseline``, in which case the
+exit status is 1 if any case regressed by more than ``--threshold``.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+
+from . import runner
+
+import argparse
+import json
+import sys
+
+
+def main():
+
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description=__doc__.strip()
+    )
+    parser.add_argument(
+        "-n", "--size", type=int, default=10000,
+        help="number of items in each dataset (default 10000)"
+    )
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=5,
+        help="number of runs per case, the best is used (default 5)"
+    )
+    parser.add_argument(
+        "-s", "--seed", type=int, default=0,
+        help="seed for the datasets (default 0)"
+    )
+    parser.add_argument(
+        "-k", "--match", help="only run cases with names containing MATCH"
+    )
+    parser.add_argument("--json", help="write results to JSON file JSON")
+    parser.add_argument(
+        "--baseline", help="compare results with JSON file BASELINE"
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.1,
+        help="allowed regression from the baseline, as a fraction "
+        "(default 0.1)"
+    )
+    args = parser.parse_args()
+
+    def report(kind, name, value):
+
+        unit = "ops/s" if kind == "throughput" else "bytes/object"
+
+        print("{0:<45} {1:14,.1f} {2}".format(name, value, unit))
+        sys.stdout.flush()
+
+    results = runner.run(
+        args.size, args.repeat, args.seed, args.match, report
+    )
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=4, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+        regressions = runner.compare(results, baseline, args.threshold)
+
+        for name, base, result in regressions:
+            print(
+                "Regression in {0}: {1:,.1f} -> {2:,.1f} ({3:+.1%})".format(
+                    name, base, result, (result - base) / base
+                )
+            )
+
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
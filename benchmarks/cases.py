@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+#
+# python-chrono - a Python module for easy and convenient date/time handling
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+
+"""
+The benchmark cases. Throughput cases are functions which run an
+operation once for each item in a dataset, and are measured in operations
+per second. Memory cases are functions which return a list of objects
+created from a dataset, and are measured in bytes per object.
+"""
+
+from __future__ import absolute_import
+
+import chrono
+
+THROUGHPUT = []
+"List of throughput cases, as tuples of name, dataset, and function."
+
+MEMORY = []
+"List of memory cases, as tuples of name, dataset, and function."
+
+
+def memory(name, dataset="tuples"):
+    "Decorator which registers a memory case"
+
+    def register(function):
+        MEMORY.append((name, dataset, function))
+
+        return function
+
+    return register
+
+
+def throughput(name, dataset="tuples"):
+    "Decorator which registers a throughput case"
+
+    def register(function):
+        THROUGHPUT.append((name, dataset, function))
+
+        return function
+
+    return register
+
+
+def parse_datetime(data):
+
+    parse = chrono.parser.CommonParser.parse_datetime
+
+    for value in data:
+        parse(value)
+
+
+for kind in ("iso", "us", "euro", "mixed"):
+    throughput("CommonParser.parse_datetime." + kind, kind)(parse_datetime)
+
+
+@throughput("CommonParser.try_parse_datetime.invalid", "invalid")
+def try_parse_datetime(data):
+
+    parse = chrono.parser.CommonParser.try_parse_datetime
+
+    for value in data:
+        parse(value)
+
+
+@throughput("cron.Schedule.next")
+def cron_next(data):
+
+    schedules = [
+        chrono.cron.Schedule(expression)
+        for expression in ("*/15 9-17 * * MON-FRI", "0 3 29 2 *", "@daily")
+    ]
+
+    for value in data:
+        for schedule in schedules:
+            schedule.next(value)
+
+
+@throughput("Date.__init__")
+def date_init(data):
+
+    for y, mo, d, h, mi, s in data:
+        chrono.Date(year=y, month=mo, day=d)
+
+
+@throughput("DateTime.__init__")
+def datetime_init(data):
+
+    for y, mo, d, h, mi, s in data:
+        chrono.DateTime(
+            year=y, month=mo, day=d, hour=h, minute=mi, second=s
+        )
+
+
+@throughput("DateTime.__init__.string", "iso")
+def datetime_init_string(data):
+
+    for value in data:
+        chrono.DateTime(value)
+
+
+@throughput("DateTime.__setattr__")
+def datetime_setattr(data):
+
+    dt = chrono.DateTime("2010-07-23 16:27:43")
+
+    # out-of-range values, which are carried into the next attribute
+    for y, mo, d, h, mi, s in data:
+        dt.month = mo + 12
+        dt.day = d + 31
+        dt.hour = h + 24
+        dt.second = s + 60
+
+
+@throughput("Formatter.format")
+def formatter_format(data):
+
+    format = chrono.formatter.Formatter(chrono.calendar.ISOCalendar).format
+    template = "$year-$0month-$0day $0hour:$0minute:$0second"
+
+    for y, mo, d, h, mi, s in data:
+        format(template, y, mo, d, h, mi, s)
+
+
+@throughput("ISOCalendar.weekdate")
+def iso_weekdate(data):
+
+    weekdate = chrono.calendar.ISOCalendar.weekdate
+
+    for y, mo, d, h, mi, s in data:
+        weekdate(y, mo, d)
+
+
+@throughput("USCalendar.weekdate")
+def us_weekdate(data):
+
+    weekdate = chrono.calendar.USCalendar.weekdate
+
+    for y, mo, d, h, mi, s in data:
+        weekdate(y, mo, d)
+
+
+@memory("CompactDate")
+def compactdate_objects(data):
+
+    return [
+        chrono.CompactDate(year=y, month=mo, day=d)
+        for y, mo, d, h, mi, s in data
+    ]
+
+
+@memory("CompactDateTime")
+def compactdatetime_objects(data):
+
+    return [
+        chrono.CompactDateTime(
+            year=y, month=mo, day=d, hour=h, minute=mi, second=s
+        )
+        for y, mo, d, h, mi, s in data
+    ]
+
+
+@memory("Date")
+def date_objects(data):
+
+    return [
+        chrono.Date(year=y, month=mo, day=d)
+        for y, mo, d, h, mi, s in data
+    ]
+
+
+@memory("DateTime")
+def datetime_objects(data):
+
+    return [
+        chrono.DateTime(year=y, month=mo, day=d, hour=h, minute=mi, second=s)
+        for y, mo, d, h, mi, s in data
+    ]
+
+
+@memory("FrozenDate")
+def frozendate_objects(data):
+
+    return [
+        chrono.FrozenDate(year=y, month=mo, day=d)
+        for y, mo, d, h, mi, s in data
+    ]
+
+
+@memory("Time")
+def time_objects(data):
+
+    return [
+        chrono.Time(hour=h, minute=mi, second=s)
+        for y, mo, d, h, mi, s in data
+    ]
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+#
+# python-chrono - a Python module for easy and convenient date/time handling
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+
+"""
+Synthetic datasets of date/time strings. The datasets are generated from a
+seeded random number generator, so the same *size* and *seed* always give
+the same strings.
+"""
+
+from __future__ import absolute_import
+
+import random
+
+KINDS = ("iso", "us", "euro", "mixed", "invalid")
+
+
+def __datetime(rand):
+    "Returns a random valid date/time tuple"
+
+    year = rand.randint(1930, 2029)
+    month = rand.randint(1, 12)
+    day = rand.randint(1, 28)
+
+    return (
+        year, month, day,
+        rand.randint(0, 23), rand.randint(0, 59), rand.randint(0, 59)
+    )
+
+
+def __iso(rand):
+
+    return "{0:04}-{1:02}-{2:02} {3:02}:{4:02}:{5:02}".format(
+        *__datetime(rand)
+    )
+
+
+def __us(rand):
+
+    y, mo, d, h, mi, s = __datetime(rand)
+
+    return "{0:02}/{1:02}/{2:04} {3:02}:{4:02}:{5:02} {6}".format(
+        mo, d, y, (h - 1) % 12 + 1, mi, s, "AM" if h < 12 else "PM"
+    )
+
+
+def __euro(rand):
+
+    y, mo, d, h, mi, s = __datetime(rand)
+
+    return "{0:02}.{1:02}.{2:04} {3:02}:{4:02}:{5:02}".format(
+        d, mo, y, h, mi, s
+    )
+
+
+def __invalid(rand):
+    "Returns an invalid value, or a valid one for one in four values"
+
+    kind = rand.randint(0, 7)
+
+    if kind < 2:
+        return rand.choice((__iso, __us, __euro))(rand)
+
+    elif kind == 2:
+        return "{0:04}-02-{1:02} 12:00:00".format(
+            rand.randint(1930, 2029), rand.randint(30, 31)
+        )
+
+    elif kind == 3:
+        return "{0:04}-{1:02}-01 12:00:00".format(
+            rand.randint(1930, 2029), rand.randint(13, 99)
+        )
+
+    elif kind == 4:
+        return "2010-07-23 {0:02}:00:00".format(rand.randint(24, 99))
+
+    elif kind == 5:
+        return __iso(rand)[:rand.randint(1, 15)]
+
+    elif kind == 6:
+        return "".join(
+            rand.choice("abcdefghijklmnopqrstuvwxyz :-/.")
+            for i in range(rand.randint(0, 20))
+        )
+
+    return __iso(rand).replace(" ", "  T ")
+
+
+def generate(kind, size, seed=0):
+    """
+    Returns a list of *size* date/time strings of the given *kind*:
+
+    * ``iso``: ``yyyy-mm-dd hh:mm:ss``
+    * ``us``: ``mm/dd/yyyy hh:mm:ss AM``
+    * ``euro``: ``dd.mm.yyyy hh:mm:ss``
+    * ``mixed``: a random mix of the ISO, US, and european formats
+    * ``invalid``: mostly invalid values - malformed strings, truncated
+      values, and out-of-range dates and times - with one in four values
+      valid
+
+    Raises :exc:`ValueError` for unknown kinds.
+    """
+
+    if kind not in KINDS:
+        raise ValueError("Invalid dataset '{0}'".format(kind))
+
+    rand = random.Random("{0}:{1}".format(kind, seed))
+
+    if kind == "mixed":
+        functions = (__iso, __us, __euro)
+
+        return [rand.choice(functions)(rand) for i in range(size)]
+
+    function = {
+        "iso": __iso, "us": __us, "euro": __euro, "invalid": __invalid
+    }[kind]
+
+    return [function(rand) for i in range(size)]
+
+
+def tuples(size, seed=0):
+    """
+    Returns a list of *size* valid date/time tuples of year, month, day,
+    hour, minute, and second.
+    """
+
+    rand = random.Random("tuples:{0}".format(seed))
+
+    return [__datetime(rand) for i in range(size)]
@@ -0,0 +1,91 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# python-chrono - a Python module for easy and convenient date/time handling
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""
+Measures the time taken by ``import chrono``, and by common first uses
+after the import, in fresh Python processes. Each statement is run
+several times, and the median is reported in milliseconds.
+
+Exits with status 1 if the median import time exceeds the limit given
+with ``--max``, for use in automated checks.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+
+import argparse
+import os.path
+import subprocess
+import sys
+
+PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STATEMENTS = (
+    ("import", "import chrono"),
+    ("format", "import chrono; chrono.Date(True).format('$year-$0month')"),
+    ("parse", "import chrono; chrono.Date('2010-07-23')"),
+    ("zone", "import chrono; chrono.DateTime(True, zone='UTC')"),
+)
+
+
+def measure(statement, runs):
+    "Returns the median time in seconds to run *statement* in a new process"
+
+    code = (
+        "import sys, time; sys.path.insert(0, {0!r}); t = time.time(); "
+        "{1}; print(time.time() - t)"
+    ).format(PATH, statement)
+
+    times = sorted(
+        float(subprocess.check_output([sys.executable, "-c", code]))
+        for i in range(runs)
+    )
+
+    return times[len(times) // 2]
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument(
+        "-n", "--runs", type=int, default=15,
+        help="number of runs per statement (default 15)"
+    )
+    parser.add_argument(
+        "--max", type=float,
+        help="maximum median import time in milliseconds"
+    )
+    args = parser.parse_args()
+
+    result = 0
+
+    for name, statement in STATEMENTS:
+        ms = measure(statement, args.runs) * 1000
+
+        print("{0:<10} {1:8.2f} ms".format(name, ms))
+
+        if name == "import" and args.max is not None and ms > args.max:
+            print("import time exceeds {0:.2f} ms".format(args.max))
+            result = 1
+
+    return result
+
+
+if __name__ == "__main__":
+    sys.exit(main())
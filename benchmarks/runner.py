@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+#
+# python-chrono - a Python module for easy and convenient date/time handling
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+
+"""
+Functions for running the benchmark cases and comparing results.
+"""
+
+from __future__ import absolute_import
+
+from . import cases
+from . import data
+
+import chrono
+import gc
+import platform
+import time
+import tracemalloc
+
+
+def compare(results, baseline, threshold):
+    """
+    Compares *results* with *baseline*, both as returned by :func:`run`,
+    and returns a list of tuples of case name, baseline value, and result
+    value for the cases which regressed by more than *threshold*, as a
+    fraction: operations per second lower than the baseline, or bytes per
+    object higher than the baseline. Cases which are only in one of the
+    results are ignored.
+    """
+
+    regressions = []
+
+    for name, result in sorted(results["throughput"].items()):
+        base = baseline.get("throughput", {}).get(name)
+
+        if base is not None and result < base * (1 - threshold):
+            regressions.append((name, base, result))
+
+    for name, result in sorted(results["memory"].items()):
+        base = baseline.get("memory", {}).get(name)
+
+        if base is not None and result > base * (1 + threshold):
+            regressions.append((name, base, result))
+
+    return regressions
+
+
+def measure_memory(function, dataset):
+    """
+    Returns the number of bytes allocated per object in the list returned
+    by ``function(dataset)``, measured with :mod:`tracemalloc`. The list
+    itself is not included.
+    """
+
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        objects = function(dataset)
+        after = tracemalloc.get_traced_memory()[0]
+
+    finally:
+        tracemalloc.stop()
+
+    size = (after - before) - (objects.__sizeof__() if objects else 0)
+
+    return size / float(len(objects))
+
+
+def measure_throughput(function, dataset, repeat):
+    """
+    Returns the number of operations per second for ``function(dataset)``,
+    where each item in *dataset* is one operation, as the best of *repeat*
+    runs.
+    """
+
+    best = None
+
+    for i in range(repeat):
+        start = time.perf_counter()
+        function(dataset)
+        elapsed = time.perf_counter() - start
+
+        if best is None or elapsed < best:
+            best = elapsed
+
+    return len(dataset) / best if best else float("inf")
+
+
+def run(size=10000, repeat=5, seed=0, match=None, report=None):
+    """
+    Runs the benchmark cases on datasets of *size* items generated with
+    *seed*, and returns a dict with information about the run, and the
+    dicts ``throughput`` with operations per second and ``memory`` with
+    bytes per object, keyed by case name. Only cases with names containing
+    *match* are run, if given. *report* is called with the type, name, and
+    value of each result as it is measured.
+    """
+
+    datasets = {}
+
+    def dataset(kind):
+        if kind not in datasets:
+            if kind == "tuples":
+                datasets[kind] = data.tuples(size, seed)
+
+            else:
+                datasets[kind] = data.generate(kind, size, seed)
+
+        return datasets[kind]
+
+    results = {
+        "chrono": chrono.__version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "size": size,
+        "repeat": repeat,
+        "seed": seed,
+        "throughput": {},
+        "memory": {},
+    }
+
+    for name, kind, function in cases.THROUGHPUT:
+        if match is None or match in name:
+            value = measure_throughput(function, dataset(kind), repeat)
+            results["throughput"][name] = value
+
+            if report is not None:
+                report("throughput", name, value)
+
+    for name, kind, function in cases.MEMORY:
+        if match is None or match in name:
+            value = measure_memory(function, dataset(kind))
+            results["memory"][name] = value
+
+            if report is not None:
+                report("memory", name, value)
+
+    return results
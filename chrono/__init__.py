@@ -22,12 +22,72 @@ __version__ = ".".join(__version_info__)
 from . import calendar
 from . import clock
 from . import formatter
-from . import parser
 from . import utility
 from .date import Date
 from .datetime import DateTime
+from .defaults import context
+from .duration import Duration
 from .error import *
 from .time import Time
 
+import importlib
+
 DEFAULT_CALENDAR = calendar.ISOCalendar
-DEFAULT_PARSER = parser.CommonParser
+
+# public names for "from chrono import *", including the names which are
+# imported on first use, except range, which would hide the builtin
+__all__ = [
+    "calendar", "clock", "formatter", "utility",
+    "Date", "DateTime", "Duration", "Time", "context", "DEFAULT_CALENDAR",
+    "DateTimeError", "DateError", "YearError", "MonthError", "WeekError",
+    "DayError", "TimeError", "HourError", "MinuteError", "SecondError",
+    "NoDateTimeError", "ParseError", "ZoneError",
+    "CompactDate", "CompactDateTime", "cron", "DateArray", "DateTimeArray",
+    "DEFAULT_PARSER", "FrozenDate", "FrozenDateTime", "FrozenTime",
+    "Interval", "parser", "recurrence", "tz",
+]
+
+# names which are imported on first use (see PEP 562), as a tuple of module
+# and attribute, or None to return the module itself
+__lazy = {
+    "CompactDate": (".compactdate", "CompactDate"),
+    "CompactDateTime": (".compactdatetime", "CompactDateTime"),
+    "cron": (".cron", None),
+    "DateArray": (".datearray", "DateArray"),
+    "DateTimeArray": (".datetimearray", "DateTimeArray"),
+    "DEFAULT_PARSER": (".parser", "CommonParser"),
+    "FrozenDate": (".frozendate", "FrozenDate"),
+    "FrozenDateTime": (".frozendatetime", "FrozenDateTime"),
+    "FrozenTime": (".frozentime", "FrozenTime"),
+    "Interval": (".interval", "Interval"),
+    "parser": (".parser", None),
+    "range": (".daterange", "range"),
+    "recurrence": (".recurrence", None),
+    "tz": (".tz", None),
+}
+
+
+def __dir__():
+
+    return sorted(set(globals()) | set(__lazy))
+
+
+def __getattr__(name):
+
+    try:
+        module, attribute = __lazy[name]
+
+    except KeyError:
+        raise AttributeError(
+            "module 'chrono' has no attribute '{0}'".format(name)
+        )
+
+    value = importlib.import_module(module, __name__)
+
+    if attribute is not None:
+        value = getattr(value, attribute)
+
+    # store the value, so later lookups don't go through __getattr__
+    globals().setdefault(name, value)
+
+    return globals()[name]
@@ -30,3 +30,7 @@ from __future__ import absolute_import
 from .calendar import Calendar
 from .iso import ISOCalendar
 from .us import USCalendar
+from .business import BusinessCalendar
+from .business import EasterHoliday
+from .business import FixedHoliday
+from .business import NthWeekdayHoliday
@@ -0,0 +1,441 @@
+# -*- coding: utf-8 -*-
+#
+# python-chrono - a Python module for easy and convenient date/time handling
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+
+from __future__ import absolute_import
+
+from .calendar import Calendar
+from .. import defaults
+from .. import error
+from .. import utility
+
+import array
+import chrono
+import threading
+
+
+class FixedHoliday(object):
+    """
+    A holiday on the same *month* and *day* every year, such as new year's
+    day. The holiday is skipped in years where the date doesn't exist, such
+    as february 29th in common years.
+
+    If *observed* is **True**, a holiday falling on a saturday is observed
+    on the preceding friday, and one falling on a sunday on the following
+    monday.
+
+    Raises :exc:`chrono.error.MonthError` or :exc:`chrono.error.DayError` if
+    *month* or *day* is invalid.
+    """
+
+    def __init__(self, month, day, observed=False):
+
+        self.month = utility.int_month(month)
+        self.day = utility.int_day(day)
+        self.observed = observed
+
+        # validate against a leap year, to allow february 29th
+        Calendar.validate(2000, self.month, self.day)
+
+    def __repr__(self):
+
+        return "chrono.calendar.FixedHoliday({0}, {1}, {2})".format(
+            self.month, self.day, self.observed
+        )
+
+    def julians(self, year):
+        """
+        Returns a list of julian day numbers for the holiday in *year*.
+        """
+
+        if not Calendar.is_valid(year, self.month, self.day):
+            return []
+
+        julian = Calendar.julian(year, self.month, self.day)
+
+        if self.observed:
+            weekday = julian % 7 + 1
+
+            if weekday == 6:
+                julian -= 1
+
+            elif weekday == 7:
+                julian += 1
+
+        return [julian]
+
+
+class NthWeekdayHoliday(object):
+    """
+    A holiday on the *n*'th occurrence of *weekday* in *month*, such as the
+    fourth thursday of november. Negative values of *n* count from the end
+    of the month, so -1 is the last occurrence. *weekday* is 1 for monday
+    through 7 for sunday, independent of calendar.
+
+    Raises :exc:`chrono.error.MonthError` or :exc:`chrono.error.DayError` if
+    *month* or *weekday* is invalid, and :exc:`ValueError` if *n* is not
+    between 1 and 5 or -5 and -1.
+    """
+
+    def __init__(self, month, weekday, n):
+
+        self.month = utility.int_month(month)
+        self.weekday = utility.int_day(weekday)
+        self.n = int(n)
+
+        Calendar.validate_month(self.month)
+        Calendar.validate_weekday(self.weekday)
+
+        if not 1 <= abs(self.n) <= 5:
+            raise ValueError("Invalid occurrence '{0}'".format(n))
+
+    def __repr__(self):
+
+        return "chrono.calendar.NthWeekdayHoliday({0}, {1}, {2})".format(
+            self.month, self.weekday, self.n
+        )
+
+    def julians(self, year):
+        """
+        Returns a list of julian day numbers for the holiday in *year*,
+        which is empty if the month has no *n*'th occurrence of the weekday.
+        """
+
+        days = Calendar.monthdays(year, self.month)
+
+        if self.n > 0:
+            first = Calendar.julian(year, self.month, 1)
+            julian = first + (self.weekday - first % 7 - 1) % 7 + \
+                (self.n - 1) * 7
+
+            if julian - first >= days:
+                return []
+
+        else:
+            last = Calendar.julian(year, self.month, days)
+            julian = last - (last % 7 + 1 - self.weekday) % 7 + \
+                (self.n + 1) * 7
+
+            if last - julian >= days:
+                return []
+
+        return [julian]
+
+
+class EasterHoliday(object):
+    """
+    A holiday *offset* days from (western) easter sunday, such as good
+    friday (-2) or easter monday (1).
+    """
+
+    def __init__(self, offset=0):
+
+        self.offset = int(offset)
+
+    def __repr__(self):
+
+        return "chrono.calendar.EasterHoliday({0})".format(self.offset)
+
+    def julians(self, year):
+        """
+        Returns a list of julian day numbers for the holiday in *year*.
+        """
+
+        return [Calendar.julian(*self.easter(year)) + self.offset]
+
+    @staticmethod
+    def easter(year):
+        """
+        Returns the date of easter sunday in *year*, as a tuple of year,
+        month, and day, using the gregorian computus.
+
+        Raises :exc:`chrono.error.YearError` if *year* is invalid.
+        """
+
+        year = utility.int_year(year)
+
+        Calendar.validate_year(year)
+
+        a = year % 19
+        b, c = divmod(year, 100)
+        d, e = divmod(b, 4)
+        g = (8 * b + 13) // 25
+        h = (19 * a + b - d - g + 15) % 30
+        i, k = divmod(c, 4)
+        w = (32 + 2 * e + 2 * i - h - k) % 7
+        m = (a + 11 * h + 19 * w) // 433
+        month = (h + w - 7 * m + 90) // 25
+        day = (h + w - 7 * m + 33 * month + 19) % 32
+
+        return (year, month, day)
+
+
+class BusinessCalendar(object):
+    """
+    A calendar of business days, wrapping *calendar* (by default the value
+    of :attr:`chrono.DEFAULT_CALENDAR`, normally
+    :class:`chrono.calendar.ISOCalendar`). Any calendar methods not defined
+    here are looked up on the wrapped calendar, so a business calendar can
+    be used wherever a calendar is expected.
+
+    *weekend* is an iterable of non-business weekdays, 1 for monday through
+    7 for sunday independent of calendar, or a mask string of seven ``0``
+    and ``1`` characters, monday first, where ``1`` marks a business day
+    (so ``1111100`` is the default saturday/sunday weekend).
+
+    *holidays* is an iterable of holiday rules -
+    :class:`chrono.calendar.FixedHoliday`,
+    :class:`chrono.calendar.NthWeekdayHoliday`,
+    :class:`chrono.calendar.EasterHoliday`, or any object with a
+    ``julians(year)`` method returning julian day numbers - and single
+    dates, as tuples of year, month, and day.
+
+    Business day counts are precomputed one span of years at a time, the
+    first time a date in them is used, as an array with the number of
+    business days before each day and an array with the day of each
+    business day. Lookups after that are a couple of array indexes, so
+    :meth:`chrono.calendar.BusinessCalendar.add_business_days`,
+    :meth:`chrono.calendar.BusinessCalendar.business_days_between` and
+    :meth:`chrono.calendar.BusinessCalendar.is_business_day` take constant
+    time regardless of the distance between dates.
+
+    Raises :exc:`ValueError` for an invalid weekend mask, and
+    :exc:`chrono.error.DateError` subclasses for invalid holiday dates.
+    """
+
+    calendar = None
+    "The wrapped calendar class."
+
+    holidays = None
+    "Tuple of holiday rules and dates."
+
+    weekend = None
+    "Tuple of non-business weekdays, 1 for monday through 7 for sunday."
+
+    span = 10
+    "Number of years to precompute beyond the requested year."
+
+    def __init__(self, calendar=None, weekend=(6, 7), holidays=()):
+
+        self.calendar = calendar or defaults.active and \
+            defaults.current_calendar.get() or chrono.DEFAULT_CALENDAR
+
+        if isinstance(weekend, str):
+            if len(weekend) != 7 or weekend.strip("01"):
+                raise ValueError("Invalid weekend mask '{0}'".format(weekend))
+
+            weekend = [i + 1 for i, c in enumerate(weekend) if c == "0"]
+
+        weekend = tuple(sorted(set(utility.int_day(d) for d in weekend)))
+
+        for weekday in weekend:
+            Calendar.validate_weekday(weekday)
+
+        if len(weekend) == 7:
+            raise ValueError("Weekend can't contain all weekdays")
+
+        self.weekend = weekend
+        self.holidays = tuple(holidays)
+
+        for holiday in self.holidays:
+            if not hasattr(holiday, "julians"):
+                Calendar.validate(*holiday)
+
+        # the table is replaced as a whole, so readers never see it partial
+        self.__lock = threading.Lock()
+        self.__table = None
+
+    def __getattr__(self, name):
+
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        return getattr(self.calendar, name)
+
+    def __repr__(self):
+
+        return "chrono.calendar.BusinessCalendar({0}, {1}, {2})".format(
+            self.calendar.__name__, self.weekend, self.holidays
+        )
+
+    def __build(self, first, last):
+
+        mask = [d + 1 not in self.weekend for d in range(7)]
+        start = Calendar.julian(first, 1, 1)
+        stop = Calendar.julian(last, 12, 31) + 1
+        closed = set()
+
+        # include neighbouring years, for holidays observed across new year
+        for holiday in self.holidays:
+            if hasattr(holiday, "julians"):
+                for year in range(max(first - 1, 1), min(last + 2, 10000)):
+                    closed.update(holiday.julians(year))
+
+            else:
+                closed.add(Calendar.julian(*holiday))
+
+        counts = array.array("i", [0])
+        days = array.array("i")
+        count = 0
+
+        for julian in range(start, stop):
+            if mask[julian % 7] and julian not in closed:
+                days.append(julian)
+                count += 1
+
+            counts.append(count)
+
+        return (first, last, start, counts, days)
+
+    def __lookup(self, year):
+
+        table = self.__table
+
+        if table is not None and table[0] <= year <= table[1]:
+            return table
+
+        with self.__lock:
+            table = self.__table
+
+            if table is None:
+                first, last = year, year
+
+            elif table[0] <= year <= table[1]:
+                return table
+
+            else:
+                first, last = min(table[0], year), max(table[1], year)
+
+            # precompute ahead in the direction the table is growing
+            if table is None or year > table[1]:
+                last = min(last + self.span, 9999)
+
+            if table is None or year < table[0]:
+                first = max(first - self.span, 1)
+
+            self.__table = self.__build(first, last)
+
+            return self.__table
+
+    def __table_for(self, julian):
+
+        if not 1721426 <= julian <= 5373484:
+            raise error.YearError("Date out of range")
+
+        return self.__lookup(Calendar.julian_to_date(julian)[0])
+
+    def add_business_days(self, year, month, day, days):
+        """
+        Returns the date *days* business days after the given date (or
+        before, for negative *days*), as a tuple of year, month, and day.
+        The given date itself is never counted, so adding one business day
+        to a friday gives the following monday, as does adding one business
+        day to a saturday. Adding zero days returns the date unchanged.
+
+        Raises :exc:`chrono.error.YearError`, :exc:`chrono.error.MonthError`
+        or :exc:`chrono.error.DayError` if the date is invalid, or if the
+        result is out of range.
+        """
+
+        julian = self.calendar.julian(year, month, day)
+        days = int(days)
+
+        if days == 0:
+            return self.calendar.julian_to_date(julian)
+
+        table = self.__table_for(julian)
+        offset = julian - table[2]
+
+        # index of the target in the array of business days
+        if days > 0:
+            index = table[3][offset + 1] + days - 1
+
+        else:
+            index = table[3][offset] + days
+
+        # extend the table until it contains the target
+        while index < 0 or index >= len(table[4]):
+            if index < 0:
+                if table[0] == 1:
+                    raise error.YearError("Date out of range")
+
+                table = self.__lookup(table[0] - 1)
+
+            else:
+                if table[1] == 9999:
+                    raise error.YearError("Date out of range")
+
+                table = self.__lookup(table[1] + 1)
+
+            offset = julian - table[2]
+            index = table[3][offset + (days > 0)] + days - (days > 0)
+
+        return self.calendar.julian_to_date(table[4][index])
+
+    def business_days(self, year):
+        """
+        Returns the number of business days in *year*.
+
+        Raises :exc:`chrono.error.YearError` if *year* is invalid.
+        """
+
+        year = utility.int_year(year)
+
+        self.calendar.validate_year(year)
+
+        table = self.__lookup(year)
+        counts = table[3]
+
+        return counts[Calendar.julian(year, 12, 31) + 1 - table[2]] - \
+            counts[Calendar.julian(year, 1, 1) - table[2]]
+
+    def business_days_between(self, start, end):
+        """
+        Returns the number of business days from the date *start* up to,
+        but not including, the date *end*, both tuples of year, month, and
+        day. The result is negative if *end* is before *start*.
+
+        Raises :exc:`chrono.error.YearError`, :exc:`chrono.error.MonthError`
+        or :exc:`chrono.error.DayError` if either date is invalid.
+        """
+
+        first = self.calendar.julian(*start)
+        last = self.calendar.julian(*end)
+
+        if first > last:
+            return -self.business_days_between(end, start)
+
+        # look up both ends first, so the table covers the whole range
+        self.__table_for(first)
+        table = self.__table_for(last)
+
+        return table[3][last - table[2]] - table[3][first - table[2]]
+
+    def is_business_day(self, year, month, day):
+        """
+        Returns **True** if the date is a business day, otherwise **False**.
+
+        Raises :exc:`chrono.error.YearError`, :exc:`chrono.error.MonthError`
+        or :exc:`chrono.error.DayError` if the date is invalid.
+        """
+
+        julian = self.calendar.julian(year, month, day)
+        table = self.__table_for(julian)
+        offset = julian - table[2]
+
+        return table[3][offset + 1] != table[3][offset]
@@ -19,10 +19,12 @@
 from __future__ import absolute_import
 from __future__ import division
 
+from .. import clock
 from .. import error
 from .. import utility
 
-import calendar
+import array
+import bisect
 import datetime
 
 
@@ -31,6 +33,11 @@ class Calendar(object):
     Base calendar class, with common calendar functionality.
     """
 
+    # days in each month of a non-leap year, indexed by month
+    __mdays = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+    __years = {}
+
     @classmethod
     def fullyear(cls, year):
         """
@@ -57,6 +64,29 @@ class Calendar(object):
         else:
             return year
 
+    @classmethod
+    def is_valid(cls, year, month, day):
+        """
+        Returns **True** if the date is valid, otherwise **False**. Uses the
+        same rules as :meth:`chrono.calendar.Calendar.validate`, but never
+        raises an exception, which makes it suitable for checking large
+        amounts of data where many values may be invalid.
+        """
+
+        year = utility.try_int_year(year)
+        month = utility.try_int_month(month)
+        day = utility.try_int_day(day)
+
+        if year is None or month is None or day is None:
+            return False
+
+        if not 1 <= year <= 9999 or not 1 <= month <= 12:
+            return False
+
+        offsets = cls.yearinfo(year)[3]
+
+        return 1 <= day <= offsets[month] - offsets[month - 1]
+
     @classmethod
     def julian(cls, year, month, day):
         """
@@ -122,9 +152,7 @@ class Calendar(object):
         Raises :exc:`chrono.error.YearError` if *year* is invalid.
         """
 
-        cls.validate_year(year)
-
-        return calendar.isleap(utility.int_year(year))
+        return cls.yearinfo(year)[0]
 
     @classmethod
     def monthdays(cls, year, month):
@@ -136,16 +164,13 @@ class Calendar(object):
         if *year* or *month* is invalid.
         """
 
-        year = utility.int_year(year)
+        offsets = cls.yearinfo(year)[3]
+
         month = utility.int_month(month)
 
-        cls.validate_year(year)
         cls.validate_month(month)
 
-        return calendar.monthrange(
-            utility.int_year(year),
-            utility.int_month(month)
-        )[1]
+        return offsets[month] - offsets[month - 1]
 
     @classmethod
     def monthname(cls, month, short=False):
@@ -175,14 +200,9 @@ class Calendar(object):
 
         cls.validate(year, month, day)
 
-        ordinal = 0
-
-        for m in range(1, utility.int_month(month)):
-            ordinal += cls.monthdays(utility.int_year(year), m)
+        offsets = cls.yearinfo(year)[3]
 
-        ordinal += utility.int_day(day)
-
-        return ordinal
+        return offsets[utility.int_month(month) - 1] + utility.int_day(day)
 
     @classmethod
     def ordinal_to_date(cls, year, day):
@@ -198,16 +218,148 @@ class Calendar(object):
 
         cls.validate_ordinal(year, day)
 
-        dt = datetime.date(
-            year=utility.int_year(year),
-            month=1,
-            day=1
+        offsets = cls.yearinfo(year)[3]
+        month = bisect.bisect_left(offsets, day)
+
+        return (utility.int_year(year), month, day - offsets[month - 1])
+
+    @classmethod
+    def unix_utc(cls, year, month, day, hour=0, minute=0, second=0):
+        """
+        Converts a date and time, interpreted as UTC, to a UNIX timestamp.
+        The timestamp is calculated from the julian day number, without
+        using the C library or the local time zone.
+
+        Raises an appropriate subclass of :exc:`chrono.error.DateTimeError`
+        for invalid values.
+        """
+
+        hour = utility.int_hour(hour)
+        minute = utility.int_minute(minute)
+        second = utility.int_second(second)
+
+        clock.Clock.validate(hour, minute, second)
+
+        return (cls.julian(year, month, day) - 2440588) * 86400 + (
+            hour * 3600 + minute * 60 + second
+        )
+
+    @classmethod
+    def unix_utc_many(cls, values):
+        """
+        Converts an iterable of dates or date/times, given as tuples of year,
+        month, and day, optionally followed by hour, minute, and second, to
+        UNIX timestamps like :meth:`chrono.calendar.Calendar.unix_utc`.
+        Returns an :class:`array.array` of type ``q``.
+
+        Raises an appropriate subclass of :exc:`chrono.error.DateTimeError`
+        for invalid values.
+        """
+
+        yearinfo = cls.yearinfo
+        timestamps = array.array("q")
+        append = timestamps.append
+
+        for value in values:
+            year, month, day = value[:3]
+            hour, minute, second = value[3:] or (0, 0, 0)
+
+            # only valid integers take the fast path, other values are
+            # converted and validated by unix_utc(), which also finds the
+            # cause of any error
+            if not (
+                type(year) is type(month) is type(day) is int and
+                type(hour) is type(minute) is type(second) is int and
+                1 <= year <= 9999 and 1 <= month <= 12
+            ):
+                append(cls.unix_utc(*value))
+                continue
+
+            info = yearinfo(year)
+            offsets = info[3]
+
+            if not (
+                0 < day <= offsets[month] - offsets[month - 1] and
+                0 <= hour <= 23 and 0 <= minute <= 59 and 0 <= second <= 59
+            ):
+                append(cls.unix_utc(*value))
+                continue
+
+            append(
+                (info[1] + offsets[month - 1] + day - 2440589) * 86400 +
+                hour * 3600 + minute * 60 + second
+            )
+
+        return timestamps
+
+    @classmethod
+    def unix_utc_to_datetime(cls, timestamp):
+        """
+        Converts a UNIX timestamp to a date and time in UTC, returned as a
+        tuple of year, month, day, hour, minute, and second. The date and
+        time are calculated from the julian day number, without using the
+        C library or the local time zone.
+
+        Raises :exc:`chrono.error.YearError` if the timestamp is outside the
+        years 1-9999.
+        """
+
+        days, seconds = divmod(int(timestamp), 86400)
+        year, month, day = cls.julian_to_date(days + 2440588)
+
+        cls.validate_year(year)
+
+        return (
+            year, month, day,
+            seconds // 3600, seconds % 3600 // 60, seconds % 60
         )
 
-        if day > 1:
-            dt += datetime.timedelta(days=day - 1)
+    @classmethod
+    def unix_utc_to_datetime_many(cls, timestamps):
+        """
+        Converts an iterable of UNIX timestamps to dates and times in UTC
+        like :meth:`chrono.calendar.Calendar.unix_utc_to_datetime`, and
+        returns a list of tuples. Each date is only calculated once for
+        consecutive timestamps on the same day.
+
+        Raises :exc:`chrono.error.YearError` if a timestamp is outside the
+        years 1-9999.
+        """
+
+        values = []
+        append = values.append
+        previous = None
+
+        for timestamp in timestamps:
+            days, seconds = divmod(timestamp, 86400)
+
+            if days != previous:
+                if not -719162 <= days <= 2932896:
+                    cls.unix_utc_to_datetime(timestamp)
 
-        return (dt.year, dt.month, dt.day)
+                # same as julian_to_date(), inlined for speed
+                j = days + 2472632
+                dg = j % 146097
+                c = (dg // 36524 + 1) * 3 // 4
+                dc = dg - c * 36524
+                db = dc % 1461
+                a = (db // 365 + 1) * 3 // 4
+                da = db - a * 365
+                m = (da * 5 + 308) // 153 - 2
+
+                date = (
+                    j // 146097 * 400 + c * 100 + dc // 1461 * 4 + a - 4800 +
+                    (m + 2) // 12,
+                    (m + 2) % 12 + 1,
+                    da - (m + 4) * 153 // 5 + 123
+                )
+                previous = days
+
+            append(date + (
+                seconds // 3600, seconds % 3600 // 60, seconds % 60
+            ))
+
+        return values
 
     @classmethod
     def validate(cls, year, month, day):
@@ -219,10 +371,17 @@ class Calendar(object):
         or :exc:`chrono.error.DayError` on invalid input.
         """
 
-        cls.validate_year(year)
+        # valid dates are the common case, so only look for the cause of
+        # the error when the date is invalid
+        if cls.is_valid(year, month, day):
+            return
+
+        offsets = cls.yearinfo(year)[3]
+
         cls.validate_month(month)
 
-        monthdays = cls.monthdays(year, month)
+        month_i = utility.int_month(month)
+        monthdays = offsets[month_i] - offsets[month_i - 1]
 
         if not 1 <= utility.int_day(day) <= monthdays:
             raise error.DayError(
@@ -437,4 +596,50 @@ class Calendar(object):
         Raises :exc:`chrono.error.YearError` if *year* is invalid.
         """
 
-        return cls.leapyear(year) and 366 or 365
+        return cls.yearinfo(year)[3][12]
+
+    @classmethod
+    def yearinfo(cls, year):
+        """
+        Returns a tuple of calendar data for *year*: **True** if it is a leap
+        year, otherwise **False**, the julian day number of January 1, the
+        weekday of January 1 (1 for Monday through 7 for Sunday, independent
+        of calendar), and a tuple of the number of days in the year before
+        each month, ending with the total number of days in the year.
+
+        The data is calculated on first use for each year and cached, and is
+        used by the other calendar methods to avoid recalculating it.
+
+        Raises :exc:`chrono.error.YearError` if *year* is invalid.
+        """
+
+        try:
+            return Calendar.__years[year]
+
+        # unhashable values such as lists are invalid years, which raise
+        # YearError below
+        except (KeyError, TypeError):
+            pass
+
+        year = utility.int_year(year)
+
+        cls.validate_year(year)
+
+        leapyear = year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+        y = year - 1
+        julian = 1721426 + 365 * y + y // 4 - y // 100 + y // 400
+
+        offsets = [0]
+
+        for month in range(1, 13):
+            offsets.append(offsets[-1] + Calendar.__mdays[month])
+
+            if month == 2 and leapyear:
+                offsets[-1] += 1
+
+        info = (leapyear, julian, julian % 7 + 1, tuple(offsets))
+
+        Calendar.__years[year] = info
+
+        return info
@@ -48,11 +48,25 @@ class ISOCalendar(calendar.Calendar):
 
         cls.validate(year, month, day)
 
-        return datetime.date(
-            utility.int_year(year),
-            utility.int_month(month),
-            utility.int_day(day)
-        ).isocalendar()
+        year = utility.int_year(year)
+        leapyear, julian, weekday, offsets = cls.yearinfo(year)
+
+        ordinal = offsets[utility.int_month(month) - 1] + utility.int_day(day)
+        weekday = (weekday + ordinal - 2) % 7 + 1
+
+        # the week is the one containing the thursday of the current week,
+        # which may be in the previous or next year
+        week = (ordinal - weekday + 10) // 7
+
+        if week < 1:
+            year -= 1
+            week = cls.weeks(year)
+
+        elif week > cls.weeks(year):
+            year += 1
+            week = 1
+
+        return (year, week, weekday)
 
     @classmethod
     def weekdate_to_date(cls, year, week, day):
@@ -71,18 +85,17 @@ class ISOCalendar(calendar.Calendar):
         week = utility.int_week(week)
         day = utility.int_day(day)
 
-        d = datetime.date(year, 1, 4)
+        leapyear, julian, weekday, offsets = cls.yearinfo(year)
 
-        if d.isoweekday() > 1:
-            d -= datetime.timedelta(d.isoweekday() - 1)
+        # week 1 starts on the monday on or before january 4
+        julian += 3 - (weekday + 2) % 7
+        julian += (week - 1) * 7 + day - 1
 
-        if week > 1:
-            d += datetime.timedelta((week - 1) * 7)
+        date = cls.julian_to_date(julian)
 
-        if day > 1:
-            d += datetime.timedelta(day - 1)
+        cls.validate_year(date[0])
 
-        return (d.year, d.month, d.day)
+        return date
 
     @classmethod
     def weekdayname(cls, weekday, short=False):
@@ -107,10 +120,14 @@ class ISOCalendar(calendar.Calendar):
         Raises :exc:`chrono.error.YearError` if *year* is invalid.
         """
 
-        if cls.leapyear(year) and cls.weekday(year, 1, 1) == 3:
+        leapyear, julian, weekday, offsets = cls.yearinfo(year)
+
+        # years starting on a thursday, or leap years starting on a
+        # wednesday, have 53 weeks
+        if weekday == 4:
             return 53
 
-        elif not cls.leapyear(year) and cls.weekday(year, 1, 1) == 4:
+        elif leapyear and weekday == 3:
             return 53
 
         else:
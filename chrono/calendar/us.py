@@ -53,24 +53,23 @@ class USCalendar(calendar.Calendar):
         month = utility.int_month(month)
         day = utility.int_day(day)
 
+        leapyear, julian, wd_jan1, offsets = cls.yearinfo(year)
+
         # find the ordinal day number
-        ordinal = cls.ordinal(year, month, day)
+        ordinal = offsets[month - 1] + day
 
         # we want ordinal from first sunday in week 1, not from jan 1,
         # so add any extra days
-        wd_jan1 = datetime.date(year, 1, 1).isoweekday() + 1
-
-        if wd_jan1 > 7:
-            wd_jan1 = 1
+        wd_jan1 = wd_jan1 % 7 + 1
 
         ordinal += wd_jan1 - 1
 
         # find number of weeks between sunday of week 1 and given date,
         # add 1 since we start in week 1
-        week = ordinal // 7 + 1
+        week = (ordinal - 1) // 7 + 1
 
         # calculate weekday
-        weekday = ordinal % 7
+        weekday = (ordinal - 1) % 7 + 1
 
         # handle rollover
         weeks = cls.weeks(year)
@@ -98,24 +97,22 @@ class USCalendar(calendar.Calendar):
         week = utility.int_week(week)
         day = utility.int_day(day)
 
-        # offset is sunday of first week in year
-        wd_jan1 = datetime.date(year, 1, 1).isoweekday() + 1
+        leapyear, julian, wd_jan1, offsets = cls.yearinfo(year)
 
-        if wd_jan1 > 7:
-            wd_jan1 = 1
+        # offset is sunday of first week in year
+        wd_jan1 = wd_jan1 % 7 + 1
 
         ordinal = - wd_jan1 + 1
 
         # find ordinal day from offset
         ordinal = ordinal + (week - 1) * 7 + day
 
-        # if ordinal day is <1, it is in previous year
-        if ordinal < 1:
-            year -= 1
-            ordinal += cls.yeardays(year)
+        # convert ordinal to date, which may be in the previous year
+        date = cls.julian_to_date(julian + ordinal - 1)
 
-        # convert ordinal to date
-        return cls.ordinal_to_date(year, ordinal)
+        cls.validate_year(date[0])
+
+        return date
 
     @classmethod
     def weekdayname(cls, weekday, short=False):
@@ -140,19 +137,14 @@ class USCalendar(calendar.Calendar):
         Raises :exc:`chrono.error.YearError` if *year* is invalid.
         """
 
-        cls.validate_year(year)
-
-        year = utility.int_year(year)
-
-        weekday = datetime.date(year, 1, 1).isoweekday() + 1
+        leapyear, julian, weekday, offsets = cls.yearinfo(year)
 
-        if weekday > 7:
-            weekday = 1
+        weekday = weekday % 7 + 1
 
-        if cls.leapyear(year) and weekday >= 6:
+        if leapyear and weekday >= 6:
             return 53
 
-        elif not cls.leapyear(year) and weekday == 7:
+        elif not leapyear and weekday == 7:
             return 53
 
         else:
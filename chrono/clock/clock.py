@@ -22,7 +22,6 @@ from __future__ import division
 from .. import error
 from .. import utility
 
-import calendar
 import datetime
 import math
 
@@ -32,6 +31,24 @@ class Clock(object):
     Basic 24-hour clock handling.
     """
 
+    @classmethod
+    def is_valid(cls, hour, minute, second):
+        """
+        Returns **True** if the time is valid, otherwise **False**. Uses the
+        same rules as :meth:`chrono.clock.Clock.validate`, but never raises
+        an exception, which makes it suitable for checking large amounts of
+        data where many values may be invalid.
+        """
+
+        hour = utility.try_int_hour(hour)
+        minute = utility.try_int_minute(minute)
+        second = utility.try_int_second(second)
+
+        if hour is None or minute is None or second is None:
+            return False
+
+        return 0 <= hour <= 23 and 0 <= minute <= 59 and 0 <= second <= 59
+
     @classmethod
     def julian(cls, hour, minute, second):
         """
@@ -89,6 +106,11 @@ class Clock(object):
         is invalid.
         """
 
+        # valid times are the common case, so only look for the cause of
+        # the error when the time is invalid
+        if cls.is_valid(hour, minute, second):
+            return
+
         cls.validate_hour(hour)
         cls.validate_minute(minute)
         cls.validate_second(second)
@@ -0,0 +1,617 @@
+# -*- coding: utf-8 -*-
+#
+# python-chrono - a Python module for easy and convenient date/time handling
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from __future__ import absolute_import
+
+from . import date as datemod
+from . import defaults
+from . import duration
+from . import error
+from . import formatter
+from . import utility
+
+import chrono
+import datetime
+import time
+
+
+class CompactDate(object):
+    """
+    A memory-efficient class for date handling, for use when large numbers
+    of dates are held in memory. It works in much the same way as
+    :class:`chrono.Date`, but the date is stored as a single julian day
+    number in :attr:`chrono.CompactDate.julian`, using slots instead of an
+    instance dictionary. The attributes :attr:`chrono.CompactDate.year`,
+    :attr:`chrono.CompactDate.month` and :attr:`chrono.CompactDate.day`
+    are calculated from the julian day number when accessed.
+
+    As for :class:`chrono.Date`, a :class:`chrono.Duration` can be added to
+    or subtracted from the date, and subtracting two dates returns a
+    :class:`chrono.Duration`.
+
+    Valid values for *date* can be:
+
+    * string: parses date from a string using the given parser (defaults
+      to the value of :attr:`chrono.DEFAULT_PARSER`, normally
+      :class:`chrono.parser.CommonParser`)
+    * **True**: sets the date to the current date
+    * integer: assumes input is a UNIX timestamp, sets date accordingly
+    * :class:`chrono.CompactDate`: sets date from another CompactDate object
+    * :class:`chrono.Date`: sets date from a Date object
+    * :class:`datetime.date`: sets date from a :class:`datetime.date` object
+    * :class:`time.struct_time`: sets date from a :class:`time.struct_time`
+      object
+    * **None**: creates an empty date
+    * **False**: creates an empty date
+
+    The class can also be initialized using the keyword arguments
+    *year*, *month*, and *day*, or *julian*::
+
+        CompactDate(year=2000, month=10, day=16)
+        CompactDate(julian=2451834)
+
+    Unlike :class:`chrono.Date`, the parser is only used when the object is
+    created, and is not stored in the object. Since the date is stored as
+    a single value, it is either fully set or empty - setting any of the
+    attributes :attr:`chrono.CompactDate.year`,
+    :attr:`chrono.CompactDate.month`, or :attr:`chrono.CompactDate.day` to
+    **None** clears the date.
+
+    *calendar* determines which calendar to use for calendar operations.
+    By default the value of :attr:`chrono.DEFAULT_CALENDAR` is used -
+    normally :class:`chrono.calendar.ISOCalendar`.
+    """
+
+    __slots__ = ("calendar", "julian")
+
+    def __add__(self, other):
+
+        if not isinstance(other, duration.Duration):
+            return NotImplemented
+
+        self.assert_set()
+
+        return CompactDate(
+            julian=other.apply(self.julian, 0, self.calendar)[0],
+            calendar=self.calendar
+        )
+
+    def __cmp__(self, other):
+
+        if not isinstance(other, CompactDate):
+            other = CompactDate(other)
+
+        if self.julian is None and other.julian is None:
+            return 0
+
+        elif other.julian is None:
+            return 1
+
+        elif self.julian is None:
+            return -1
+
+        return utility.cmp(self.julian, other.julian)
+
+    def __eq__(self, other):
+
+        return self.__cmp__(other) == 0
+
+    def __ge__(self, other):
+
+        return self.__cmp__(other) >= 0
+
+    def __gt__(self, other):
+
+        return self.__cmp__(other) > 0
+
+    def __init__(self, date=None, parser=None, calendar=None, **kwargs):
+
+        self.calendar = calendar or defaults.active and \
+            defaults.current_calendar.get() or chrono.DEFAULT_CALENDAR
+        self.julian = None
+
+        if isinstance(date, str):
+            self.set_string(date, parser)
+
+        elif date is True:
+            self.set_now()
+
+        elif isinstance(date, int):
+            self.set_unix(date)
+
+        elif isinstance(date, CompactDate):
+            self.julian = date.julian
+
+        elif isinstance(date, datemod.Date):
+            if date.is_set():
+                self.set(date.year, date.month, date.day)
+
+        elif isinstance(date, datetime.date):
+            self.set_datetime(date)
+
+        elif isinstance(date, time.struct_time):
+            self.set_struct_time(date)
+
+        elif "julian" in kwargs:
+            self.set_julian(kwargs["julian"])
+
+        elif "year" in kwargs or "month" in kwargs or "day" in kwargs:
+            self.set(
+                kwargs.get("year"), kwargs.get("month"), kwargs.get("day")
+            )
+
+        elif date is False:
+            pass
+
+        elif date is None:
+            pass
+
+        else:
+            raise TypeError("Invalid type for CompactDate parameter")
+
+    def __le__(self, other):
+
+        return self.__cmp__(other) <= 0
+
+    def __lt__(self, other):
+
+        return self.__cmp__(other) < 0
+
+    def __ne__(self, other):
+
+        return self.__cmp__(other) != 0
+
+    def __radd__(self, other):
+
+        return self.__add__(other)
+
+    def __repr__(self):
+
+        if self.julian is None:
+            return "chrono.CompactDate()"
+
+        return "chrono.CompactDate(year={0}, month={1}, day={2})".format(
+            *self.get()
+        )
+
+    def __str__(self):
+
+        try:
+            return self.get_string()
+
+        except error.NoDateTimeError:
+            return ""
+
+    def __sub__(self, other):
+
+        if isinstance(other, duration.Duration):
+            return self.__add__(-other)
+
+        elif not isinstance(other, (CompactDate, datemod.Date, datetime.date)):
+            return NotImplemented
+
+        elif not isinstance(other, CompactDate):
+            other = CompactDate(other)
+
+        self.assert_set()
+        other.assert_set()
+
+        return duration.Duration(days=self.julian - other.julian)
+
+    @property
+    def day(self):
+        """
+        Day number, range 1-31 depending on
+        :attr:`chrono.CompactDate.month` and :attr:`chrono.CompactDate.year`,
+        or **None** if no date is set. Values outside the valid range are
+        carried over into the month and year, as with :attr:`chrono.Date.day`.
+        """
+
+        if self.julian is None:
+            return None
+
+        return self.calendar.julian_to_date(self.julian)[2]
+
+    @day.setter
+    def day(self, value):
+
+        if value is None:
+            return self.clear()
+
+        self.assert_set()
+
+        self.set_julian(self.julian + utility.int_day(value) - self.day)
+
+    @property
+    def month(self):
+        """
+        Month number, range 1-12, or **None** if no date is set. Values
+        outside the valid range are carried over into the year, as with
+        :attr:`chrono.Date.month`.
+        """
+
+        if self.julian is None:
+            return None
+
+        return self.calendar.julian_to_date(self.julian)[1]
+
+    @month.setter
+    def month(self, value):
+
+        if value is None:
+            return self.clear()
+
+        self.assert_set()
+
+        year, month, day = self.get()
+        value = utility.int_month(value)
+
+        year += (value - 1) // 12
+        month = (value - 1) % 12 + 1
+
+        # days past the end of the month are carried over into the
+        # next month, like for chrono.Date
+        self.set_julian(self.calendar.julian(year, month, 1) + day - 1)
+
+    @property
+    def year(self):
+        """
+        Year number, range 1-9999, or **None** if no date is set.
+        """
+
+        if self.julian is None:
+            return None
+
+        return self.calendar.julian_to_date(self.julian)[0]
+
+    @year.setter
+    def year(self, value):
+
+        if value is None:
+            return self.clear()
+
+        self.assert_set()
+
+        year, month, day = self.get()
+        value = utility.int_year(value)
+
+        self.calendar.validate_year(value)
+
+        self.set_julian(self.calendar.julian(value, month, 1) + day - 1)
+
+    def assert_set(self):
+        """
+        Makes sure the object has a date set.
+
+        Raises :exc:`chrono.error.NoDateTimeError` if no date is set.
+        """
+
+        if self.julian is None:
+            raise error.NoDateTimeError(
+                "CompactDate object doesn't contain date data"
+            )
+
+    def clear(self):
+        """
+        Clears the date.
+        """
+
+        self.julian = None
+
+    def delta(self, date):
+        """
+        Returns the difference between the current object and another date
+        as seconds, based on the number of days between them.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date data.
+        """
+
+        if not isinstance(date, CompactDate):
+            date = CompactDate(date)
+
+        self.assert_set()
+        date.assert_set()
+
+        return (date.julian - self.julian) * 86400
+
+    def format(self, template):
+        """
+        Formats the date using *template*, replacing variables as
+        supported by :class:`chrono.formatter.Formatter`. This value is
+        dependent on the calendar set in :attr:`chrono.CompactDate.calendar`,
+        by default :class:`chrono.calendar.ISOCalendar`.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date data.
+        """
+
+        year, month, day = self.get()
+
+        return formatter.Formatter(self.calendar).format(
+            template, year, month, day
+        )
+
+    def get(self):
+        """
+        Returns the date as a tuple of year, month, and day.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date data.
+        """
+
+        self.assert_set()
+
+        return self.calendar.julian_to_date(self.julian)
+
+    def get_date(self):
+        """
+        Returns a :class:`chrono.Date` instance based on the date, using
+        the same calendar.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date data.
+        """
+
+        year, month, day = self.get()
+
+        return datemod.Date(
+            year=year, month=month, day=day, calendar=self.calendar
+        )
+
+    def get_datetime(self):
+        """
+        Returns a :class:`datetime.date` instance based on the date.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date data.
+        """
+
+        return datetime.date(*self.get())
+
+    def get_julian(self):
+        """
+        Returns the julian day number for the date.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date data.
+        """
+
+        self.assert_set()
+
+        return self.julian
+
+    def get_string(self):
+        """
+        Returns a string representation (*yyyy-mm-dd*) of the date.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date data.
+        """
+
+        return self.format("$0year-$0month-$0day")
+
+    def get_struct_time(self):
+        """
+        Returns a :class:`time.struct_time` representation of the date
+        (expected as input to many Python functions).
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date data.
+        """
+
+        return time.struct_time(self.get_datetime().timetuple())
+
+    def get_unix(self):
+        """
+        Returns a UNIX timestamp representation of the date, interpreted as
+        local time. See :meth:`chrono.CompactDate.get_unix_utc` for UTC.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date data.
+        """
+
+        return int(time.mktime(self.get_struct_time()))
+
+    def get_unix_utc(self):
+        """
+        Returns a UNIX timestamp representation of the date, interpreted as
+        UTC, calculated from the julian day number.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date data.
+        """
+
+        self.assert_set()
+
+        return (self.julian - 2440588) * 86400
+
+    def is_set(self):
+        """
+        Returns **True** if a date is set, otherwise **False**.
+        """
+
+        return self.julian is not None
+
+    def leapyear(self):
+        """
+        Returns **True** if the date is in a leap year, otherwise **False**.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date data.
+        """
+
+        return self.calendar.leapyear(self.get()[0])
+
+    def monthdays(self):
+        """
+        Returns the number of days in the set month.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date data.
+        """
+
+        return self.calendar.monthdays(*self.get()[:2])
+
+    def ordinal(self):
+        """
+        Returns the ordinal day (day number in the year) of the set date.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date data.
+        """
+
+        self.assert_set()
+
+        return self.julian - self.calendar.julian(self.year, 1, 1) + 1
+
+    def set(self, year, month, day):
+        """
+        Sets the date.
+
+        Raises :exc:`chrono.error.YearError`, :exc:`chrono.error.MonthError`,
+        or :exc:`chrono.error.DayError` for invalid values.
+        """
+
+        self.julian = self.calendar.julian(year, month, day)
+
+    def set_datetime(self, datetime):
+        """
+        Sets the date from a :class:`datetime.date` object.
+        """
+
+        self.set(datetime.year, datetime.month, datetime.day)
+
+    def set_julian(self, julian):
+        """
+        Sets the date from a julian day number.
+
+        Raises :exc:`chrono.error.DayError` on invalid julian day, or
+        :exc:`chrono.error.YearError` if the julian day is outside the
+        years 1-9999.
+        """
+
+        try:
+            julian = int(julian)
+
+        except (TypeError, ValueError):
+            raise error.DayError("Invalid julian day '{0}'".format(julian))
+
+        if not 1721426 <= julian <= 5373484:
+            raise error.YearError(
+                "Julian day '{0}' not in range 1721426-5373484 "
+                "(years 1-9999)".format(julian)
+            )
+
+        self.julian = julian
+
+    def set_now(self):
+        """
+        Sets the date to the current date.
+        """
+
+        self.set_datetime(datetime.date.today())
+
+    def set_string(self, string, parser=None):
+        """
+        Sets the date from a string, parsed with *parser* - by default the
+        parser set in :attr:`chrono.DEFAULT_PARSER`, normally
+        :class:`chrono.parser.CommonParser`.
+
+        Raises :exc:`chrono.error.ParseError` for invalid input format,
+        :exc:`TypeError` for invalid input type, and an appropriate
+        :exc:`chrono.error.DateError` subclass for invalid date values.
+        """
+
+        parser = parser or defaults.active and \
+            defaults.current_parser.get() or chrono.DEFAULT_PARSER
+
+        self.set(*parser.parse_date(string))
+
+    def set_struct_time(self, struct_time):
+        """
+        Sets the date from a :class:`time.struct_time` (as returned by
+        various Python functions).
+        """
+
+        self.set(
+            struct_time.tm_year,
+            struct_time.tm_mon,
+            struct_time.tm_mday
+        )
+
+    def set_unix(self, timestamp):
+        """
+        Sets the date from an integer UNIX timestamp, converted to local
+        time. See :meth:`chrono.CompactDate.set_unix_utc` for UTC.
+        """
+
+        self.set_datetime(datetime.date.fromtimestamp(int(timestamp)))
+
+    def set_unix_utc(self, timestamp):
+        """
+        Sets the date from an integer UNIX timestamp, interpreted as UTC,
+        calculated from the julian day number.
+
+        Raises :exc:`chrono.error.YearError` if the timestamp is outside
+        the years 1-9999.
+        """
+
+        self.set_julian(int(timestamp) // 86400 + 2440588)
+
+    def week(self):
+        """
+        Returns the week of the set date as a tuple with year and week
+        number. This value is dependent on the calendar set in
+        :attr:`chrono.CompactDate.calendar`, by default
+        :class:`chrono.calendar.ISOCalendar`.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date data.
+        """
+
+        return self.calendar.week(*self.get())
+
+    def weekdate(self):
+        """
+        Returns the week date of the set date as a tuple with year,
+        week, and weekday. This value is dependent on the calendar set in
+        :attr:`chrono.CompactDate.calendar`, by default
+        :class:`chrono.calendar.ISOCalendar`.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date data.
+        """
+
+        return self.calendar.weekdate(*self.get())
+
+    def weekday(self):
+        """
+        Returns the week day of the set date. This value is dependent on the
+        calendar set in :attr:`chrono.CompactDate.calendar`, by default
+        :class:`chrono.calendar.ISOCalendar`.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date data.
+        """
+
+        return self.calendar.weekday(*self.get())
+
+    def weeks(self):
+        """
+        Returns the number of weeks in the set year. This value is
+        dependent on the calendar set in :attr:`chrono.CompactDate.calendar`,
+        by default :class:`chrono.calendar.ISOCalendar`.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date data.
+        """
+
+        return self.calendar.weeks(self.get()[0])
+
+    def yeardays(self):
+        """
+        Returns the number of days in the year.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date data.
+        """
+
+        return self.calendar.yeardays(self.get()[0])
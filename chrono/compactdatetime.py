@@ -0,0 +1,793 @@
+# -*- coding: utf-8 -*-
+#
+# python-chrono - a Python module for easy and convenient date/time handling
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from __future__ import absolute_import
+
+from . import clock
+from . import compactdate
+from . import date
+from . import datetime as chronodatetime
+from . import defaults
+from . import duration
+from . import error
+from . import formatter
+from . import utility
+
+import chrono
+import datetime as datetimemod
+import time as timemod
+
+
+class CompactDateTime(object):
+    """
+    A class for date/time handling where the date/time is stored as a single
+    integer, the number of seconds since 1970-01-01 00:00:00, in
+    :attr:`chrono.CompactDateTime.epoch`. It works in much the same way as
+    :class:`chrono.DateTime`, but the attributes
+    :attr:`chrono.CompactDateTime.year`, :attr:`chrono.CompactDateTime.month`,
+    :attr:`chrono.CompactDateTime.day`, :attr:`chrono.CompactDateTime.hour`,
+    :attr:`chrono.CompactDateTime.minute` and
+    :attr:`chrono.CompactDateTime.second` are calculated from the epoch
+    value when accessed, and arithmetic is done on the epoch value directly,
+    so adding large offsets takes constant time. Slots are used instead of
+    an instance dictionary.
+
+    Durations can be added to or subtracted from the date/time using the
+    ``+`` and ``-`` operators, with an integer number of seconds, a
+    :class:`datetime.timedelta`, or a :class:`chrono.Duration`, which returns
+    a new object. Subtracting two date/times returns a
+    :class:`chrono.Duration`. The method
+    :meth:`chrono.CompactDateTime.shift` moves the date/time in place.
+
+    Valid values for *datetime* can be:
+
+    * string: parses date/time from a string using the given parser
+      (defaults to the value of :attr:`chrono.DEFAULT_PARSER`, normally
+      :class:`chrono.parser.CommonParser`)
+    * **True**: sets the date/time to the current date and time
+    * integer: assumes input is a UNIX timestamp, sets date/time accordingly
+    * :class:`chrono.CompactDateTime`: sets date/time from another
+      CompactDateTime object
+    * :class:`chrono.DateTime`: sets date/time from a DateTime object
+    * :class:`chrono.Date` or :class:`chrono.CompactDate`: sets date/time to
+      midnight of the date
+    * :class:`datetime.datetime`: sets date/time from a
+      :class:`datetime.datetime` object
+    * :class:`datetime.date`: sets date/time to midnight of the date
+    * :class:`time.struct_time`: sets date/time from a
+      :class:`time.struct_time` object
+    * **None**: creates an empty date/time
+    * **False**: creates an empty date/time
+
+    Date, DateTime, and CompactDate objects which are not fully set give an
+    empty date/time.
+
+    The class can also be initialized using the keyword arguments
+    *year*, *month*, *day*, *hour*, *minute*, and *second*, or *epoch*::
+
+        CompactDateTime(year=2000, month=10, day=16, hour=16, minute=27, second=43)
+        CompactDateTime(epoch=971713663)
+
+    As for :class:`chrono.CompactDate`, the parser is not stored in the
+    object, and the date/time is either fully set or empty - setting any of
+    the attributes to **None** clears the date/time.
+
+    *calendar* determines which calendar to use for calendar operations.
+    By default the value of :attr:`chrono.DEFAULT_CALENDAR` is used -
+    normally :class:`chrono.calendar.ISOCalendar`.
+    """
+
+    __slots__ = ("calendar", "epoch")
+
+    def __add__(self, other):
+
+        result = CompactDateTime(self, calendar=self.calendar)
+
+        if isinstance(other, duration.Duration):
+            self.assert_set()
+
+            days, seconds = divmod(self.epoch, 86400)
+            result.__set_julian(
+                *other.apply(days + 2440588, seconds, self.calendar)
+            )
+
+            return result
+
+        seconds = self.__seconds(other)
+
+        if seconds is None:
+            return NotImplemented
+
+        result.shift(seconds=seconds)
+
+        return result
+
+    def __cmp__(self, other):
+
+        if not isinstance(other, CompactDateTime):
+            other = CompactDateTime(other)
+
+        if self.epoch is None and other.epoch is None:
+            return 0
+
+        elif other.epoch is None:
+            return 1
+
+        elif self.epoch is None:
+            return -1
+
+        return utility.cmp(self.epoch, other.epoch)
+
+    def __eq__(self, other):
+
+        return self.__cmp__(other) == 0
+
+    def __ge__(self, other):
+
+        return self.__cmp__(other) >= 0
+
+    def __gt__(self, other):
+
+        return self.__cmp__(other) > 0
+
+    def __init__(self, datetime=None, parser=None, calendar=None, **kwargs):
+
+        self.calendar = calendar or defaults.active and \
+            defaults.current_calendar.get() or chrono.DEFAULT_CALENDAR
+        self.epoch = None
+
+        if isinstance(datetime, str):
+            self.set_string(datetime, parser)
+
+        elif datetime is True:
+            self.set_now()
+
+        elif isinstance(datetime, int):
+            self.set_unix(datetime)
+
+        elif isinstance(datetime, CompactDateTime):
+            self.epoch = datetime.epoch
+
+        elif isinstance(datetime, chronodatetime.DateTime):
+            if datetime.is_set():
+                self.set(*datetime.get())
+
+        elif isinstance(datetime, (date.Date, compactdate.CompactDate)):
+            if datetime.is_set():
+                self.set(*datetime.get() + (0, 0, 0))
+
+        elif isinstance(datetime, datetimemod.datetime):
+            self.set_datetime(datetime)
+
+        elif isinstance(datetime, datetimemod.date):
+            self.set(datetime.year, datetime.month, datetime.day, 0, 0, 0)
+
+        elif isinstance(datetime, timemod.struct_time):
+            self.set_struct_time(datetime)
+
+        elif "epoch" in kwargs:
+            self.set_epoch(kwargs["epoch"])
+
+        elif "year" in kwargs or "month" in kwargs or "day" in kwargs or \
+            "hour" in kwargs or "minute" in kwargs or "second" in kwargs:
+
+            self.set(
+                kwargs.get("year"), kwargs.get("month"), kwargs.get("day"),
+                kwargs.get("hour"), kwargs.get("minute"), kwargs.get("second")
+            )
+
+        elif datetime is False:
+            pass
+
+        elif datetime is None:
+            pass
+
+        else:
+            raise TypeError("Invalid type for CompactDateTime parameter")
+
+    def __le__(self, other):
+
+        return self.__cmp__(other) <= 0
+
+    def __lt__(self, other):
+
+        return self.__cmp__(other) < 0
+
+    def __ne__(self, other):
+
+        return self.__cmp__(other) != 0
+
+    def __radd__(self, other):
+
+        return self.__add__(other)
+
+    def __repr__(self):
+
+        if self.epoch is None:
+            return "chrono.CompactDateTime()"
+
+        return (
+            "chrono.CompactDateTime(year={0}, month={1}, day={2}, "
+            "hour={3}, minute={4}, second={5})".format(*self.get())
+        )
+
+    @staticmethod
+    def __seconds(duration):
+        "Returns a duration as seconds, or None for unsupported types"
+
+        if isinstance(duration, datetimemod.timedelta):
+            return duration.days * 86400 + duration.seconds
+
+        elif isinstance(duration, int) and not isinstance(duration, bool):
+            return duration
+
+        return None
+
+    def __str__(self):
+
+        try:
+            return self.get_string()
+
+        except error.NoDateTimeError:
+            return ""
+
+    def __sub__(self, other):
+
+        if isinstance(other, duration.Duration):
+            return self.__add__(-other)
+
+        elif isinstance(other, (
+            CompactDateTime, compactdate.CompactDate, date.Date,
+            datetimemod.date
+        )):
+            if not isinstance(other, CompactDateTime):
+                other = CompactDateTime(other)
+
+            self.assert_set()
+            other.assert_set()
+
+            return duration.Duration(seconds=self.epoch - other.epoch)
+
+        seconds = self.__seconds(other)
+
+        if seconds is None:
+            return NotImplemented
+
+        result = CompactDateTime(self, calendar=self.calendar)
+        result.shift(seconds=-seconds)
+
+        return result
+
+    @property
+    def day(self):
+        """
+        Day number, range 1-31 depending on
+        :attr:`chrono.CompactDateTime.month` and
+        :attr:`chrono.CompactDateTime.year`, or **None** if no date/time is
+        set. Values outside the valid range are carried over into the month
+        and year.
+        """
+
+        if self.epoch is None:
+            return None
+
+        return self.get()[2]
+
+    @day.setter
+    def day(self, value):
+
+        if value is None:
+            return self.clear()
+
+        self.shift(days=utility.int_day(value) - self.get()[2])
+
+    @property
+    def hour(self):
+        """
+        Hour, range 0-23, or **None** if no date/time is set. Values outside
+        the valid range are carried over into the date.
+        """
+
+        if self.epoch is None:
+            return None
+
+        return self.epoch % 86400 // 3600
+
+    @hour.setter
+    def hour(self, value):
+
+        if value is None:
+            return self.clear()
+
+        self.shift(hours=utility.int_hour(value) - self.get()[3])
+
+    @property
+    def minute(self):
+        """
+        Minute, range 0-59, or **None** if no date/time is set. Values
+        outside the valid range are carried over into the hour and date.
+        """
+
+        if self.epoch is None:
+            return None
+
+        return self.epoch % 3600 // 60
+
+    @minute.setter
+    def minute(self, value):
+
+        if value is None:
+            return self.clear()
+
+        self.shift(minutes=utility.int_minute(value) - self.get()[4])
+
+    @property
+    def month(self):
+        """
+        Month number, range 1-12, or **None** if no date/time is set. Values
+        outside the valid range are carried over into the year, and days
+        past the end of the new month are carried over into the next month,
+        as with :attr:`chrono.DateTime.month`.
+        """
+
+        if self.epoch is None:
+            return None
+
+        return self.get()[1]
+
+    @month.setter
+    def month(self, value):
+
+        if value is None:
+            return self.clear()
+
+        year, month, day, hour, minute, second = self.get()
+        years, month = divmod(utility.int_month(value) - 1, 12)
+
+        self.__set_julian(
+            self.calendar.julian(year + years, month + 1, 1) + day - 1,
+            self.epoch % 86400
+        )
+
+    @property
+    def second(self):
+        """
+        Second, range 0-59, or **None** if no date/time is set. Values
+        outside the valid range are carried over into the minute, hour, and
+        date.
+        """
+
+        if self.epoch is None:
+            return None
+
+        return self.epoch % 60
+
+    @second.setter
+    def second(self, value):
+
+        if value is None:
+            return self.clear()
+
+        self.shift(seconds=utility.int_second(value) - self.get()[5])
+
+    @property
+    def year(self):
+        """
+        Year number, range 1-9999, or **None** if no date/time is set.
+        """
+
+        if self.epoch is None:
+            return None
+
+        return self.get()[0]
+
+    @year.setter
+    def year(self, value):
+
+        if value is None:
+            return self.clear()
+
+        year, month, day, hour, minute, second = self.get()
+        value = utility.int_year(value)
+
+        self.calendar.validate_year(value)
+
+        self.__set_julian(
+            self.calendar.julian(value, month, 1) + day - 1,
+            self.epoch % 86400
+        )
+
+    def __set_julian(self, julian, seconds):
+        "Sets the date/time from a julian day and seconds since midnight"
+
+        self.set_epoch((julian - 2440588) * 86400 + seconds)
+
+    def assert_set(self):
+        """
+        Makes sure the object has a date/time set.
+
+        Raises :exc:`chrono.error.NoDateTimeError` if no date/time is set.
+        """
+
+        if self.epoch is None:
+            raise error.NoDateTimeError(
+                "CompactDateTime object doesn't contain date/time data"
+            )
+
+    def clear(self):
+        """
+        Clears the date/time.
+        """
+
+        self.epoch = None
+
+    def delta(self, datetime):
+        """
+        Returns the difference between the current object and another
+        date/time in seconds.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date/time
+        data.
+        """
+
+        if not isinstance(datetime, CompactDateTime):
+            datetime = CompactDateTime(datetime)
+
+        self.assert_set()
+        datetime.assert_set()
+
+        return datetime.epoch - self.epoch
+
+    def format(self, template):
+        """
+        Formats the date/time using *template*, replacing variables as
+        supported by :class:`chrono.formatter.Formatter`. This value is
+        dependent on the calendar set in
+        :attr:`chrono.CompactDateTime.calendar`, by default
+        :class:`chrono.calendar.ISOCalendar`.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date/time
+        data.
+        """
+
+        return formatter.Formatter(self.calendar).format(
+            template, *self.get()
+        )
+
+    def get(self):
+        """
+        Returns the date/time as a tuple of year, month, day, hour, minute,
+        and second.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date/time
+        data.
+        """
+
+        self.assert_set()
+
+        days, seconds = divmod(self.epoch, 86400)
+        hour, seconds = divmod(seconds, 3600)
+        minute, second = divmod(seconds, 60)
+
+        return self.calendar.julian_to_date(days + 2440588) + (
+            hour, minute, second
+        )
+
+    def get_datetime(self):
+        """
+        Returns a :class:`datetime.datetime` instance based on the
+        date/time.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date/time
+        data.
+        """
+
+        return datetimemod.datetime(*self.get())
+
+    def get_epoch(self):
+        """
+        Returns the number of seconds since 1970-01-01 00:00:00.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date/time
+        data.
+        """
+
+        self.assert_set()
+
+        return self.epoch
+
+    def get_julian(self):
+        """
+        Returns the julian day number for the date/time, with the time as
+        the fractional part, like :meth:`chrono.DateTime.get_julian`.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date/time
+        data.
+        """
+
+        self.assert_set()
+
+        days, seconds = divmod(self.epoch, 86400)
+
+        return days + 2440588 + clock.Clock.julian(
+            seconds // 3600, seconds % 3600 // 60, seconds % 60
+        )
+
+    def get_string(self):
+        """
+        Returns a string representation (*yyyy-mm-dd hh:mm:ss*) of the
+        date/time.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date/time
+        data.
+        """
+
+        return self.format("$0year-$0month-$0day $0hour:$0minute:$0second")
+
+    def get_struct_time(self):
+        """
+        Returns a :class:`time.struct_time` representation of the date/time
+        (expected as input to many Python functions).
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date/time
+        data.
+        """
+
+        return timemod.struct_time(self.get_datetime().timetuple())
+
+    def get_unix(self):
+        """
+        Returns a UNIX timestamp representation of the date/time, treating
+        it as local time.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date/time
+        data.
+        """
+
+        return int(timemod.mktime(self.get_struct_time()))
+
+    def get_unix_utc(self):
+        """
+        Returns a UNIX timestamp representation of the date/time, treating
+        it as UTC. This is the same as
+        :attr:`chrono.CompactDateTime.epoch`.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date/time
+        data.
+        """
+
+        self.assert_set()
+
+        return self.epoch
+
+    def is_set(self):
+        """
+        Returns **True** if a date/time is set, otherwise **False**.
+        """
+
+        return self.epoch is not None
+
+    def leapyear(self):
+        """
+        Returns **True** if the date is in a leap year, otherwise **False**.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date/time
+        data.
+        """
+
+        return self.calendar.leapyear(self.get()[0])
+
+    def monthdays(self):
+        """
+        Returns the number of days in the set month.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date/time
+        data.
+        """
+
+        return self.calendar.monthdays(*self.get()[:2])
+
+    def ordinal(self):
+        """
+        Returns the ordinal day (day number in the year) of the set date.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date/time
+        data.
+        """
+
+        return self.calendar.ordinal(*self.get()[:3])
+
+    def set(self, year, month, day, hour, minute, second):
+        """
+        Sets the date/time.
+
+        Raises an appropriate subclass of :exc:`chrono.error.DateTimeError`
+        for invalid values.
+        """
+
+        hour = utility.int_hour(hour)
+        minute = utility.int_minute(minute)
+        second = utility.int_second(second)
+
+        clock.Clock.validate(hour, minute, second)
+
+        self.__set_julian(
+            self.calendar.julian(year, month, day),
+            hour * 3600 + minute * 60 + second
+        )
+
+    def set_datetime(self, datetime):
+        """
+        Sets the date/time from a :class:`datetime.datetime` object.
+        """
+
+        self.set(
+            datetime.year, datetime.month, datetime.day,
+            datetime.hour, datetime.minute, datetime.second
+        )
+
+    def set_epoch(self, epoch):
+        """
+        Sets the date/time from the number of seconds since
+        1970-01-01 00:00:00.
+
+        Raises :exc:`chrono.error.YearError` if the date/time is outside
+        the years 1-9999, or :exc:`TypeError` on invalid input type.
+        """
+
+        if isinstance(epoch, bool) or not isinstance(epoch, int):
+            raise TypeError("Invalid type for epoch value")
+
+        if not -62135596800 <= epoch <= 253402300799:
+            raise error.YearError(
+                "Epoch value '{0}' not in range -62135596800-253402300799 "
+                "(years 1-9999)".format(epoch)
+            )
+
+        self.epoch = epoch
+
+    def set_now(self):
+        """
+        Sets the date/time to the current date and time.
+        """
+
+        self.set_datetime(datetimemod.datetime.now())
+
+    def set_string(self, string, parser=None):
+        """
+        Sets the date/time from a string, parsed with *parser* - by default
+        the parser set in :attr:`chrono.DEFAULT_PARSER`, normally
+        :class:`chrono.parser.CommonParser`.
+
+        Raises :exc:`chrono.error.ParseError` for invalid input format,
+        :exc:`TypeError` for invalid input type, and an appropriate
+        :exc:`chrono.error.DateTimeError` subclass for invalid date/time
+        values.
+        """
+
+        parser = parser or defaults.active and \
+            defaults.current_parser.get() or chrono.DEFAULT_PARSER
+
+        self.set(*parser.parse_datetime(string))
+
+    def set_struct_time(self, struct_time):
+        """
+        Sets the date/time from a :class:`time.struct_time` (as returned by
+        various Python functions).
+        """
+
+        self.set(
+            struct_time.tm_year, struct_time.tm_mon, struct_time.tm_mday,
+            struct_time.tm_hour, struct_time.tm_min, struct_time.tm_sec
+        )
+
+    def set_unix(self, timestamp):
+        """
+        Sets the date/time from an integer UNIX timestamp, converted to
+        local time.
+        """
+
+        self.set_datetime(datetimemod.datetime.fromtimestamp(int(timestamp)))
+
+    def set_unix_utc(self, timestamp):
+        """
+        Sets the date/time from an integer UNIX timestamp, treating it as
+        UTC. This is the same as :meth:`chrono.CompactDateTime.set_epoch`.
+
+        Raises :exc:`chrono.error.YearError` if the date/time is outside
+        the years 1-9999.
+        """
+
+        self.set_epoch(int(timestamp))
+
+    def shift(self, days=0, hours=0, minutes=0, seconds=0):
+        """
+        Moves the date/time by the given number of days, hours, minutes,
+        and seconds, which may be negative. This takes constant time
+        regardless of the size of the offset.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date/time
+        data, and :exc:`chrono.error.YearError` if the result is outside
+        the years 1-9999.
+        """
+
+        self.assert_set()
+
+        self.set_epoch(
+            self.epoch + days * 86400 + hours * 3600 + minutes * 60 + seconds
+        )
+
+    def week(self):
+        """
+        Returns the week of the set date as a tuple with year and week
+        number. This value is dependent on the calendar set in
+        :attr:`chrono.CompactDateTime.calendar`, by default
+        :class:`chrono.calendar.ISOCalendar`.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date/time
+        data.
+        """
+
+        return self.calendar.week(*self.get()[:3])
+
+    def weekdate(self):
+        """
+        Returns the week date of the set date as a tuple with year, week,
+        and weekday. This value is dependent on the calendar set in
+        :attr:`chrono.CompactDateTime.calendar`, by default
+        :class:`chrono.calendar.ISOCalendar`.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date/time
+        data.
+        """
+
+        return self.calendar.weekdate(*self.get()[:3])
+
+    def weekday(self):
+        """
+        Returns the week day of the set date. This value is dependent on the
+        calendar set in :attr:`chrono.CompactDateTime.calendar`, by default
+        :class:`chrono.calendar.ISOCalendar`.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date/time
+        data.
+        """
+
+        return self.calendar.weekday(*self.get()[:3])
+
+    def weeks(self):
+        """
+        Returns the number of weeks in the set year. This value is dependent
+        on the calendar set in :attr:`chrono.CompactDateTime.calendar`, by
+        default :class:`chrono.calendar.ISOCalendar`.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date/time
+        data.
+        """
+
+        return self.calendar.weeks(self.get()[0])
+
+    def yeardays(self):
+        """
+        Returns the number of days in the year.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date/time
+        data.
+        """
+
+        return self.calendar.yeardays(self.get()[0])
@@ -0,0 +1,412 @@
+# -*- coding: utf-8 -*-
+#
+# python-chrono - a Python module for easy and convenient date/time handling
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+
+"""
+This module contains :class:`chrono.cron.Schedule`, for computing the fire
+times of cron expressions.
+"""
+
+from __future__ import absolute_import
+
+from . import compactdatetime
+from . import error
+from .calendar import Calendar
+
+import bisect
+import functools
+
+
+class Schedule(object):
+    """
+    A cron schedule, for the five-field cron expression *expression*, with
+    fields for minute, hour, day of month, month, and day of week::
+
+        >>> schedule = chrono.cron.Schedule("0 3 29 2 *")
+        >>> schedule.next("2010-07-23 12:00:00")
+        (2012, 2, 29, 3, 0, 0)
+
+    Fields can contain ``*``, numbers, ranges (``1-5``), steps (``*/15``,
+    ``1-30/2``, or ``5/10``, which steps from 5 to the end of the range),
+    and comma-separated lists of these. Months and days of week can also be
+    given as english names (``JAN``, ``MON``), and day of week 0 and 7 are
+    both sunday. The expressions ``@yearly``, ``@annually``, ``@monthly``,
+    ``@weekly``, ``@daily``, ``@midnight``, and ``@hourly`` are supported
+    as well. Like most cron implementations, if both day of month and day
+    of week are restricted (not starting with ``*``), days matching either
+    field match.
+
+    Each field is stored as a bitset of allowed values, so fire times are
+    found by jumping to the next allowed month, day, hour, and minute in
+    turn, using :meth:`chrono.calendar.Calendar.monthdays` for the length
+    of each month, instead of checking every minute. Schedules which can
+    never fire, such as february 30th, give no fire times after searching
+    up to year 9999. Parsed fields and expressions, and the fire days of
+    each month, are kept in bounded caches shared by all schedules.
+
+    Raises :exc:`chrono.error.ParseError` for invalid expressions, and
+    :exc:`TypeError` for invalid input type.
+    """
+
+    days = None
+    "Bitset of days of month, bit 1 for the first day."
+
+    hours = None
+    "Bitset of hours."
+
+    minutes = None
+    "Bitset of minutes."
+
+    months = None
+    "Bitset of months, bit 1 for january."
+
+    weekdays = None
+    "Bitset of days of week, bit 0 for sunday."
+
+    macros = {
+        "@yearly": "0 0 1 1 *",
+        "@annually": "0 0 1 1 *",
+        "@monthly": "0 0 1 * *",
+        "@weekly": "0 0 * * 0",
+        "@daily": "0 0 * * *",
+        "@midnight": "0 0 * * *",
+        "@hourly": "0 * * * *",
+    }
+    "Expressions which can be used in place of the five fields."
+
+    names = (
+        (),
+        (),
+        (),
+        (
+            "JAN", "FEB", "MAR", "APR", "MAY", "JUN",
+            "JUL", "AUG", "SEP", "OCT", "NOV", "DEC"
+        ),
+        ("SUN", "MON", "TUE", "WED", "THU", "FRI", "SAT"),
+    )
+    "Names which can be used in each field, in order of value."
+
+    ranges = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+    "Smallest and largest values of each field."
+
+    def __init__(self, expression):
+
+        if not isinstance(expression, str):
+            raise TypeError("Input is not a string")
+
+        self.expression = expression
+        self.minutes, self.hours, self.days, self.months, self.weekdays, \
+            self.__either, self.__lists = Schedule.__parse(expression)
+
+    def __repr__(self):
+
+        return "chrono.cron.Schedule({0!r})".format(self.expression)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def __bits(mask):
+        """
+        Returns the set bits of a bitset as a sorted tuple, results are
+        cached
+        """
+
+        bits = []
+
+        while mask:
+            bit = mask & -mask
+            bits.append(bit.bit_length() - 1)
+            mask ^= bit
+
+        return tuple(bits)
+
+    def __days(self, year, month):
+        "Returns the sorted tuple of fire days in a month"
+
+        return Schedule.__monthdays(
+            self.days, self.weekdays, self.__either,
+            *Schedule.__month(year, month)
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def __field(index, field):
+        "Parses a field into a bitset, results are cached"
+
+        low, high = Schedule.ranges[index]
+        mask = 0
+
+        for part in field.split(","):
+            value, separator, step = part.partition("/")
+
+            try:
+                step = int(step) if separator else 1
+
+                if step < 1:
+                    raise ValueError
+
+                if value == "*":
+                    first, last = low, high
+
+                else:
+                    first, separator2, last = value.partition("-")
+                    first = Schedule.__value(index, first)
+
+                    if separator2:
+                        last = Schedule.__value(index, last)
+
+                    elif separator:
+                        last = high
+
+                    else:
+                        last = first
+
+            except ValueError:
+                raise error.ParseError(
+                    "Invalid cron field '{0}'".format(field)
+                )
+
+            if not low <= first <= last <= high:
+                raise error.ParseError(
+                    "Invalid cron field '{0}'".format(field)
+                )
+
+            # every step-th bit from first to last, as a geometric series
+            count = (last - first) // step + 1
+            mask |= ((1 << step * count) - 1) // ((1 << step) - 1) << first
+
+        return mask
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def __month(year, month):
+        """
+        Returns the first day of week and the number of days in a month,
+        results are cached
+        """
+
+        leapyear, julian, weekday, offsets = Calendar.yearinfo(year)
+
+        # cron numbers days of week from sunday, 0-6
+        return (
+            (julian + offsets[month - 1] + 1) % 7,
+            Calendar.monthdays(year, month)
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def __monthdays(days, weekdays, either, first, size):
+        """
+        Returns the sorted tuple of fire days in a month starting on day of
+        week first with size days, results are cached
+        """
+
+        # rotate the days of week to start at the first day of the month,
+        # and repeat them for five weeks, bit 1 for the first day
+        mask = ((weekdays >> first | weekdays << 7 - first) & 0x7f) * \
+            0x10204081 << 1
+
+        if either:
+            mask |= days
+
+        else:
+            mask &= days
+
+        return Schedule.__bits(mask & (2 << size) - 2)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def __parse(expression):
+        """
+        Parses an expression into bitsets, and tuples of the set bits,
+        results are cached
+        """
+
+        fields = Schedule.macros.get(expression.strip().lower(), expression)
+        fields = fields.upper().split()
+
+        if len(fields) != 5:
+            raise error.ParseError(
+                "Invalid cron expression '{0}'".format(expression)
+            )
+
+        minutes, hours, days, months, weekdays = [
+            Schedule.__field(i, field) for i, field in enumerate(fields)
+        ]
+
+        # day of week 7 is sunday as well
+        weekdays = (weekdays | weekdays >> 7) & 0x7f
+
+        # cron matches either day field if both are restricted
+        either = not fields[2].startswith("*") and \
+            not fields[4].startswith("*")
+
+        return (
+            minutes, hours, days, months, weekdays, either, (
+                Schedule.__bits(months), Schedule.__bits(hours),
+                Schedule.__bits(minutes)
+            )
+        )
+
+    @staticmethod
+    def __value(index, value):
+        "Parses a single field value, a number or a name"
+
+        names = Schedule.names[index]
+
+        if value in names:
+            return names.index(value) + (index == 3)
+
+        return int(value)
+
+    def __backward(self, year, month, day, hour, minute):
+        "Generates fire times at or before the given minute, latest first"
+
+        months, hours, minutes = self.__lists
+        first = True
+
+        while year >= 1:
+            end = bisect.bisect_right(months, month) if first else None
+
+            for m in reversed(months[:end]):
+                bounded = first and m == month
+                days = self.__days(year, m)
+                end = bisect.bisect_right(days, day) if bounded else None
+
+                for d in reversed(days[:end]):
+                    bounded = bounded and d == day
+                    end = bisect.bisect_right(hours, hour) if bounded else None
+
+                    for h in reversed(hours[:end]):
+                        bounded = bounded and h == hour
+                        end = (
+                            bisect.bisect_right(minutes, minute)
+                            if bounded else None
+                        )
+
+                        for mi in reversed(minutes[:end]):
+                            yield (year, m, d, h, mi, 0)
+
+                        bounded = False
+
+                    bounded = False
+
+                first = False
+
+            first = False
+            year -= 1
+
+    def __forward(self, year, month, day, hour, minute):
+        "Generates fire times at or after the given minute, earliest first"
+
+        months, hours, minutes = self.__lists
+        first = True
+
+        while year <= 9999:
+            start = bisect.bisect_left(months, month) if first else 0
+
+            for m in months[start:]:
+                bounded = first and m == month
+                days = self.__days(year, m)
+                start = bisect.bisect_left(days, day) if bounded else 0
+
+                for d in days[start:]:
+                    bounded = bounded and d == day
+                    start = bisect.bisect_left(hours, hour) if bounded else 0
+
+                    for h in hours[start:]:
+                        bounded = bounded and h == hour
+                        start = (
+                            bisect.bisect_left(minutes, minute)
+                            if bounded else 0
+                        )
+
+                        for mi in minutes[start:]:
+                            yield (year, m, d, h, mi, 0)
+
+                        bounded = False
+
+                    bounded = False
+
+                first = False
+
+            first = False
+            year += 1
+
+    def __start(self, datetime, offset):
+        """
+        Returns the minute of datetime plus offset, as a tuple of year,
+        month, day, hour, and minute
+        """
+
+        if isinstance(datetime, tuple):
+            year, month, day, hour, minute, second = datetime
+
+        else:
+            if not isinstance(datetime, compactdatetime.CompactDateTime):
+                datetime = compactdatetime.CompactDateTime(datetime)
+
+            year, month, day, hour, minute, second = datetime.get()
+
+        # the previous minute is the current one if there are seconds
+        if offset < 0 and second:
+            offset = 0
+
+        # the minute can be -1 or 60, which never match and move the search
+        # on to the next hour
+        return (year, month, day, hour, minute + offset)
+
+    def next(self, datetime):
+        """
+        Returns the first fire time after *datetime*, as a tuple of year,
+        month, day, hour, minute, and second, or **None** if there is none
+        before the year 10000. *datetime* can be any value accepted by
+        :class:`chrono.CompactDateTime`, or a tuple of year, month, day,
+        hour, minute, and second, which is not validated.
+
+        Raises :exc:`chrono.error.NoDateTimeError` if *datetime* is empty.
+        """
+
+        return next(self.__forward(*self.__start(datetime, 1)), None)
+
+    def previous(self, datetime):
+        """
+        Returns the last fire time before *datetime*, as a tuple of year,
+        month, day, hour, minute, and second, or **None** if there is none
+        after the year 0. *datetime* can be any value accepted by
+        :meth:`chrono.cron.Schedule.next`.
+
+        Raises :exc:`chrono.error.NoDateTimeError` if *datetime* is empty.
+        """
+
+        return next(self.__backward(*self.__start(datetime, -1)), None)
+
+    def times(self, datetime, reverse=False):
+        """
+        Returns a generator of fire times after *datetime*, or before it in
+        descending order if *reverse* is **True**, as tuples of year,
+        month, day, hour, minute, and second. *datetime* can be any value
+        accepted by :meth:`chrono.cron.Schedule.next`. Use
+        :func:`itertools.islice` to get the next *n* fire times.
+
+        Raises :exc:`chrono.error.NoDateTimeError` if *datetime* is empty.
+        """
+
+        if reverse:
+            return self.__backward(*self.__start(datetime, -1))
+
+        return self.__forward(*self.__start(datetime, 1))
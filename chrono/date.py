@@ -18,6 +18,8 @@
 
 from __future__ import absolute_import
 
+from . import defaults
+from . import duration
 from . import error
 from . import formatter
 from . import utility
@@ -53,6 +55,11 @@ class Date(object):
 
     If both *date* and keywords are specified, *date* takes precedence.
 
+    A :class:`chrono.Duration` can be added to or subtracted from the date
+    using the ``+`` and ``-`` operators, which returns a new object, and
+    subtracting two dates returns the number of days between them as a
+    :class:`chrono.Duration`.
+
     *parser* determines which parser to use for parsing dates from strings.
     By default the value of :attr:`chrono.DEFAULT_PARSER` is used - normally
     :class:`chrono.parser.CommonParser`, which supports the most common date
@@ -89,45 +96,60 @@ class Date(object):
     year = None
     "Year number, range 1-9999."
 
-    def __cmp__(self, other):
+    def __add__(self, other):
 
-        if not isinstance(other, Date):
-            other = Date(other)
+        if not isinstance(other, duration.Duration):
+            return NotImplemented
 
-        if not self.is_set() and not other.is_set():
-            return 0
+        julian = other.apply(self.get_julian(), 0, self.calendar)[0]
 
-        elif not other.is_set():
-            return 1
+        result = Date(parser=self.parser, calendar=self.calendar)
+        result.set_julian(julian)
 
-        elif not self.is_set():
-            return -1
+        return result
 
-        if self.year != other.year:
-            return utility.cmp(self.year, other.year)
+    def __cmp__(self, other):
 
-        elif self.month != other.month:
-            return utility.cmp(self.month, other.month)
+        key = self.__key(other)
 
-        else:
-            return utility.cmp(self.day, other.day)
+        if key is None:
+            return -other.__cmp__(self)
+
+        return utility.cmp(self.sort_key(), key)
 
     def __eq__(self, other):
 
-        return self.__cmp__(other) == 0
+        key = self.__key(other)
+
+        if key is None:
+            return other == self
+
+        return self.sort_key() == key
 
     def __ge__(self, other):
 
-        return self.__cmp__(other) >= 0
+        key = self.__key(other)
+
+        if key is None:
+            return other <= self
+
+        return self.sort_key() >= key
 
     def __gt__(self, other):
 
-        return self.__cmp__(other) > 0
+        key = self.__key(other)
+
+        if key is None:
+            return other < self
+
+        return self.sort_key() > key
 
     def __init__(self, date=None, parser=None, calendar=None, **kwargs):
 
-        self.parser = parser or chrono.DEFAULT_PARSER
-        self.calendar = calendar or chrono.DEFAULT_CALENDAR
+        self.parser = parser or defaults.active and \
+            defaults.current_parser.get() or chrono.DEFAULT_PARSER
+        self.calendar = calendar or defaults.active and \
+            defaults.current_calendar.get() or chrono.DEFAULT_CALENDAR
 
         if isinstance(date, str):
             self.set_string(date)
@@ -163,15 +185,34 @@ class Date(object):
 
     def __le__(self, other):
 
-        return self.__cmp__(other) <= 0
+        key = self.__key(other)
+
+        if key is None:
+            return other >= self
+
+        return self.sort_key() <= key
 
     def __lt__(self, other):
 
-        return self.__cmp__(other) < 0
+        key = self.__key(other)
+
+        if key is None:
+            return other > self
+
+        return self.sort_key() < key
 
     def __ne__(self, other):
 
-        return self.__cmp__(other) != 0
+        key = self.__key(other)
+
+        if key is None:
+            return other != self
+
+        return self.sort_key() != key
+
+    def __radd__(self, other):
+
+        return self.__add__(other)
 
     def __repr__(self):
 
@@ -206,15 +247,9 @@ class Date(object):
 
         elif name == "month":
 
-            y = self.year or 0
-
-            while value > 12:
-                y += 1
-                value -= 12
-
-            while value < 1:
-                y -= 1
-                value += 12
+            years, value = divmod(value - 1, 12)
+            value += 1
+            y = (self.year or 0) + years
 
             # set year, but only if already set
             object.__setattr__(self, "year", self.year and y or self.year)
@@ -253,6 +288,51 @@ class Date(object):
         except error.NoDateTimeError:
             return ""
 
+    def __sub__(self, other):
+
+        if isinstance(other, duration.Duration):
+            return self.__add__(-other)
+
+        elif not isinstance(other, (Date, datetime.date)):
+            return NotImplemented
+
+        elif not isinstance(other, Date):
+            other = Date(other)
+
+        return duration.Duration(
+            days=self.get_julian() - Date.get_julian(other)
+        )
+
+    @staticmethod
+    def __key(value):
+        """
+        Returns the sort key for *value*, only creating a Date object for
+        values which are not dates, or None for DateTime and CompactDateTime
+        objects, which compare dates as midnight
+        """
+
+        if isinstance(value, Date):
+            if isinstance(value, chrono.DateTime):
+                return None
+
+            return Date.sort_key(value)
+
+        elif isinstance(value, datetime.date):
+            return (value.year * 16 + value.month) * 32 + value.day
+
+        elif isinstance(value, chrono.CompactDate):
+            if value.julian is None:
+                return -1
+
+            year, month, day = value.get()
+
+            return (year * 16 + month) * 32 + day
+
+        elif isinstance(value, chrono.CompactDateTime):
+            return None
+
+        return Date(value).sort_key()
+
     def assert_set(self):
         """
         Makes sure the object has a full date set, ie the attributes
@@ -306,6 +386,18 @@ class Date(object):
             template, self.year, self.month, self.day
         )
 
+    def freeze(self):
+        """
+        Returns an immutable, hashable :class:`chrono.FrozenDate` with the
+        same date and calendar. Dates which are not fully set give an empty
+        frozen date.
+        """
+
+        if not self.is_set():
+            return chrono.FrozenDate(calendar=self.calendar)
+
+        return chrono.FrozenDate(self, calendar=self.calendar)
+
     def get(self):
         """
         Returns the date as a tuple of year, month, and day.
@@ -362,7 +454,8 @@ class Date(object):
 
     def get_unix(self):
         """
-        Returns a UNIX timestamp representation of the date.
+        Returns a UNIX timestamp representation of the date, interpreted as
+        local time. See :meth:`chrono.Date.get_unix_utc` for UTC.
 
         Raises :exc:`chrono.error.NoDateTimeError` on missing date data.
         """
@@ -371,6 +464,17 @@ class Date(object):
 
         return int(time.mktime(self.get_struct_time()))
 
+    def get_unix_utc(self):
+        """
+        Returns a UNIX timestamp representation of the date, interpreted as
+        UTC. This is calculated from the julian day number, without using
+        the C library or the local time zone.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date data.
+        """
+
+        return (self.get_julian() - 2440588) * 86400
+
     def is_set(self):
         """
         Returns **True** if a date is set, ie if the attributes
@@ -491,13 +595,39 @@ class Date(object):
 
     def set_unix(self, timestamp):
         """
-        Sets the date from an integer UNIX timestamp.
+        Sets the date from an integer UNIX timestamp, converted to local
+        time. See :meth:`chrono.Date.set_unix_utc` for UTC.
         """
 
         dt = datetime.date.fromtimestamp(int(timestamp))
 
         self.set(dt.year, dt.month, dt.day)
 
+    def set_unix_utc(self, timestamp):
+        """
+        Sets the date from an integer UNIX timestamp, interpreted as UTC.
+        This is calculated from the julian day number, without using the C
+        library or the local time zone.
+
+        Raises :exc:`chrono.error.YearError` if the timestamp is outside
+        the years 1-9999.
+        """
+
+        self.set(*self.calendar.unix_utc_to_datetime(timestamp)[:3])
+
+    def sort_key(self):
+        """
+        Returns an integer which orders dates the same way as comparisons,
+        for use as a sort key, such as ``sorted(dates, key=Date.sort_key)``.
+        Dates which are not fully set give -1, and sort before other dates.
+        The key is calculated from the attributes, without calendar lookups.
+        """
+
+        if self.year is None or self.month is None or self.day is None:
+            return -1
+
+        return (self.year * 16 + self.month) * 32 + self.day
+
     def week(self):
         """
         Returns the week of the set date as a tuple with year and week
@@ -0,0 +1,381 @@
+# -*- coding: utf-8 -*-
+#
+# python-chrono - a Python module for easy and convenient date/time handling
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from __future__ import absolute_import
+
+from . import compactdate
+from . import daterange
+from . import defaults
+from . import error
+from . import formatter
+
+import array
+import chrono
+
+
+class DateArray(object):
+    """
+    A class for handling sequences of dates as a single column, for bulk
+    operations on large numbers of dates. The dates are stored as julian
+    day numbers in an :class:`array.array` of integers, available in
+    :attr:`chrono.DateArray.julian`, and the methods operate on all dates
+    at once, returning one value per date.
+
+    *dates* is an iterable of dates, where each item can be any value
+    accepted by :class:`chrono.CompactDate` - strings are parsed using
+    *parser*, by default the value of :attr:`chrono.DEFAULT_PARSER`. Empty
+    dates are not allowed, and raise :exc:`chrono.error.NoDateTimeError`.
+
+    *calendar* determines which calendar to use for calendar operations.
+    By default the value of :attr:`chrono.DEFAULT_CALENDAR` is used -
+    normally :class:`chrono.calendar.ISOCalendar`.
+
+    Individual dates are returned as :class:`chrono.CompactDate` objects
+    when indexing or iterating, while slices return a new
+    :class:`chrono.DateArray`.
+    """
+
+    calendar = None
+    """
+    Calendar to use for calendar operations. Defaults to
+    :class:`chrono.calendar.ISOCalendar`.
+    """
+
+    julian = None
+    "Array of julian day numbers for the dates."
+
+    def __getitem__(self, index):
+
+        if isinstance(index, slice):
+            return DateArray.from_julian(self.julian[index], self.calendar)
+
+        return compactdate.CompactDate(
+            julian=self.julian[index], calendar=self.calendar
+        )
+
+    def __init__(self, dates=None, parser=None, calendar=None):
+
+        self.calendar = calendar or defaults.active and \
+            defaults.current_calendar.get() or chrono.DEFAULT_CALENDAR
+        self.julian = array.array("i")
+
+        if dates is not None:
+            self.extend(dates, parser)
+
+    def __iter__(self):
+
+        for julian in self.julian:
+            yield compactdate.CompactDate(julian=julian, calendar=self.calendar)
+
+    def __len__(self):
+
+        return len(self.julian)
+
+    def __repr__(self):
+
+        return "chrono.DateArray({0!r})".format(self.get_string())
+
+    def __dates(self):
+        "Returns arrays with the year, month, and day of each date"
+
+        years = array.array("i")
+        months = array.array("i")
+        days = array.array("i")
+        append_year = years.append
+        append_month = months.append
+        append_day = days.append
+
+        for julian in self.julian:
+
+            # same as julian_to_date(), inlined for speed
+            j = julian + 32044
+            dg = j % 146097
+            c = (dg // 36524 + 1) * 3 // 4
+            dc = dg - c * 36524
+            db = dc % 1461
+            a = (db // 365 + 1) * 3 // 4
+            da = db - a * 365
+            m = (da * 5 + 308) // 153 - 2
+
+            append_year(
+                j // 146097 * 400 + c * 100 + dc // 1461 * 4 + a - 4800 +
+                (m + 2) // 12
+            )
+            append_month((m + 2) % 12 + 1)
+            append_day(da - (m + 4) * 153 // 5 + 123)
+
+        return (years, months, days)
+
+    @classmethod
+    def from_julian(cls, julian, calendar=None):
+        """
+        Creates a :class:`chrono.DateArray` from a sequence of julian day
+        numbers. If *julian* is an :class:`array.array` of type ``i``, it is
+        used directly without copying, otherwise the values are copied into
+        a new array. The values are not validated.
+        """
+
+        dates = cls(calendar=calendar)
+
+        if isinstance(julian, array.array) and julian.typecode == "i":
+            dates.julian = julian
+
+        else:
+            dates.julian = array.array("i", julian)
+
+        return dates
+
+    @classmethod
+    def from_range(
+        cls, start, stop, step=1, unit="day", align=False, calendar=None
+    ):
+        """
+        Creates a :class:`chrono.DateArray` with the dates from *start* up
+        to, but not including, *stop*, moving *step* units at a time. Takes
+        the same arguments as :func:`chrono.range`, but stores the julian
+        day numbers directly, without creating tuples or objects.
+
+        Raises :exc:`ValueError` for invalid units or a *step* of zero, and
+        :exc:`chrono.error.NoDateTimeError` if *start* or *stop* is empty.
+        """
+
+        return cls.from_julian(
+            array.array(
+                "i", daterange.julian(start, stop, step, unit, align, calendar)
+            ),
+            calendar
+        )
+
+    @classmethod
+    def from_recurrence(cls, rule):
+        """
+        Creates a :class:`chrono.DateArray` with the occurrences of the
+        recurrence rule *rule*, a :class:`chrono.recurrence.Rule`, using the
+        calendar of the rule. The julian day numbers are stored directly,
+        without creating tuples or objects.
+        """
+
+        return cls.from_julian(array.array("i", rule.julian()), rule.calendar)
+
+    @classmethod
+    def from_unix_utc(cls, timestamps, calendar=None):
+        """
+        Creates a :class:`chrono.DateArray` from a sequence of integer UNIX
+        timestamps, interpreted as UTC, with the date of each timestamp.
+
+        Raises :exc:`chrono.error.YearError` if a timestamp is outside the
+        years 1-9999.
+        """
+
+        julian = [t // 86400 + 2440588 for t in timestamps]
+
+        if julian and not 1721426 <= min(julian) <= max(julian) <= 5373484:
+            raise error.YearError(
+                "Timestamps not in range -62135596800-253402300799 "
+                "(years 1-9999)"
+            )
+
+        return cls.from_julian(array.array("i", julian), calendar)
+
+    def append(self, date, parser=None):
+        """
+        Appends *date* to the array, where *date* can be any value accepted
+        by :class:`chrono.CompactDate`.
+
+        Raises :exc:`chrono.error.NoDateTimeError` for empty dates, and the
+        same errors as :class:`chrono.CompactDate` for invalid values.
+        """
+
+        self.extend((date,), parser)
+
+    def day(self):
+        """
+        Returns an array with the day of each date.
+        """
+
+        return self.__dates()[2]
+
+    def extend(self, dates, parser=None):
+        """
+        Appends each date in the iterable *dates* to the array, where the
+        items can be any value accepted by :class:`chrono.CompactDate`.
+
+        Raises :exc:`chrono.error.NoDateTimeError` for empty dates, and the
+        same errors as :class:`chrono.CompactDate` for invalid values.
+        """
+
+        parser = parser or defaults.active and \
+            defaults.current_parser.get() or chrono.DEFAULT_PARSER
+        julian = self.calendar.julian
+        values = []
+
+        for date in dates:
+
+            # parse strings directly, to avoid creating an object per date
+            if isinstance(date, str):
+                values.append(julian(*parser.parse_date(date)))
+
+            elif isinstance(date, compactdate.CompactDate):
+                date.assert_set()
+                values.append(date.julian)
+
+            else:
+                date = compactdate.CompactDate(
+                    date, parser=parser, calendar=self.calendar
+                )
+                date.assert_set()
+                values.append(date.julian)
+
+        self.julian.extend(values)
+
+    def format(self, template):
+        """
+        Formats each date using *template*, replacing variables as
+        supported by :class:`chrono.formatter.Formatter`, and returns a list
+        of strings. The template is only compiled once for all dates.
+        """
+
+        fmt = formatter.Formatter(self.calendar).compile(template)
+        julian_to_date = self.calendar.julian_to_date
+
+        return [fmt(*julian_to_date(j)) for j in self.julian]
+
+    def get(self):
+        """
+        Returns a list of tuples with year, month, and day for each date.
+        """
+
+        julian_to_date = self.calendar.julian_to_date
+
+        return [julian_to_date(j) for j in self.julian]
+
+    def get_julian(self):
+        """
+        Returns a copy of the array of julian day numbers.
+        """
+
+        return array.array("i", self.julian)
+
+    def get_string(self):
+        """
+        Returns a list of string representations (*yyyy-mm-dd*) of the
+        dates.
+        """
+
+        return self.format("$0year-$0month-$0day")
+
+    def get_unix_utc(self):
+        """
+        Returns an :class:`array.array` of type ``q`` with a UNIX timestamp
+        for each date, interpreted as UTC.
+        """
+
+        return array.array("q", [(j - 2440588) * 86400 for j in self.julian])
+
+    def leapyear(self):
+        """
+        Returns a list with **True** for each date in a leap year, otherwise
+        **False**.
+        """
+
+        leapyear = self.calendar.leapyear
+        years = self.year()
+        leapyears = {}
+
+        for year in years:
+            if year not in leapyears:
+                leapyears[year] = leapyear(year)
+
+        return [leapyears[year] for year in years]
+
+    def month(self):
+        """
+        Returns an array with the month of each date.
+        """
+
+        return self.__dates()[1]
+
+    def ordinal(self):
+        """
+        Returns an array with the ordinal day (day number in the year) of
+        each date.
+        """
+
+        julian = self.calendar.julian
+        julian_to_date = self.calendar.julian_to_date
+        offsets = {}
+        ordinals = array.array("i")
+
+        # the ordinal day is the offset from january 1st, which only needs
+        # to be looked up once per year
+        for j in self.julian:
+            year = julian_to_date(j)[0]
+
+            if year not in offsets:
+                offsets[year] = julian(year, 1, 1) - 1
+
+            ordinals.append(j - offsets[year])
+
+        return ordinals
+
+    def week(self):
+        """
+        Returns a list of tuples with year and week number for each date.
+        This value is dependent on the calendar set in
+        :attr:`chrono.DateArray.calendar`, by default
+        :class:`chrono.calendar.ISOCalendar`.
+        """
+
+        week = self.calendar.week
+        julian_to_date = self.calendar.julian_to_date
+
+        return [week(*julian_to_date(j)) for j in self.julian]
+
+    def weekdate(self):
+        """
+        Returns a list of tuples with year, week, and weekday for each date.
+        This value is dependent on the calendar set in
+        :attr:`chrono.DateArray.calendar`, by default
+        :class:`chrono.calendar.ISOCalendar`.
+        """
+
+        weekdate = self.calendar.weekdate
+        julian_to_date = self.calendar.julian_to_date
+
+        return [tuple(weekdate(*julian_to_date(j))) for j in self.julian]
+
+    def weekday(self):
+        """
+        Returns an array with the weekday of each date. This value is
+        dependent on the calendar set in :attr:`chrono.DateArray.calendar`,
+        by default :class:`chrono.calendar.ISOCalendar`.
+        """
+
+        # julian day numbers modulo 7 give the ISO weekday - for calendars
+        # where the week starts on another day, the offset is found from
+        # the weekday of a known Monday, 2010-01-04
+        offset = (self.calendar.weekday(2010, 1, 4) - 1) % 7
+
+        return array.array("i", [(j + offset) % 7 + 1 for j in self.julian])
+
+    def year(self):
+        """
+        Returns an array with the year of each date.
+        """
+
+        return self.__dates()[0]
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+#
+# python-chrono - a Python module for easy and convenient date/time handling
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+
+from __future__ import absolute_import
+
+from . import compactdate
+from . import defaults
+
+import chrono
+
+
+__units = ("day", "week", "month", "quarter", "year")
+
+
+def julian(start, stop, step=1, unit="day", align=False, calendar=None):
+    """
+    Returns a generator of julian day numbers from *start* up to, but not
+    including, *stop*, moving *step* units at a time. Takes the same
+    arguments as :func:`chrono.range`, and is used by it and
+    :meth:`chrono.DateArray.from_range`.
+    """
+
+    calendar = calendar or defaults.active and \
+        defaults.current_calendar.get() or chrono.DEFAULT_CALENDAR
+
+    if unit not in __units:
+        raise ValueError("Invalid unit '{0}'".format(unit))
+
+    if isinstance(step, bool) or not isinstance(step, int):
+        raise TypeError("Invalid type for step parameter")
+
+    elif step == 0:
+        raise ValueError("Step must not be zero")
+
+    start = compactdate.CompactDate(start, calendar=calendar).get_julian()
+    stop = compactdate.CompactDate(stop, calendar=calendar).get_julian()
+
+    if unit in ("day", "week"):
+        return __days(start, stop, step, unit, align, calendar)
+
+    return __months(start, stop, step, unit, align, calendar)
+
+
+def range(
+    start, stop, step=1, unit="day", align=False, cls=None, calendar=None
+):
+    """
+    Returns a generator of dates from *start* up to, but not including,
+    *stop*, moving *step* units at a time, like the built-in
+    :func:`range`. A negative *step* gives dates in descending order, up
+    to but not including a *stop* before *start*::
+
+        >>> list(chrono.range("2010-01-30", "2010-04-01", unit="month"))
+        [(2010, 1, 30), (2010, 2, 28), (2010, 3, 30)]
+
+    *start* and *stop* can be any value accepted by
+    :class:`chrono.CompactDate`. *unit* can be ``day``, ``week``,
+    ``month``, ``quarter``, or ``year``. Months, quarters, and years keep
+    the day of the month of *start*, using the last day of the month if
+    the day doesn't exist, like :class:`chrono.Duration`.
+
+    If *align* is **True**, the range starts at the beginning of the unit
+    which contains *start*: the first day of the week, month, quarter, or
+    year. The first day of the week depends on *calendar*, which defaults
+    to the value of :attr:`chrono.DEFAULT_CALENDAR` - normally
+    :class:`chrono.calendar.ISOCalendar`, with weeks starting on monday.
+    This gives one date per period, for partitioning a range of dates.
+
+    The dates are calculated using julian day numbers, and returned as
+    tuples of year, month, and day, or if *cls* is given, as instances of
+    *cls* created with the keyword arguments ``year``, ``month``, and
+    ``day`` - such as :class:`chrono.Date`, :class:`chrono.CompactDate`,
+    :class:`chrono.FrozenDate`, or :class:`datetime.date`. Use
+    :meth:`chrono.DateArray.from_range` to get the dates as a
+    :class:`chrono.DateArray`.
+
+    Raises :exc:`ValueError` for invalid units or a *step* of zero, and
+    :exc:`chrono.error.NoDateTimeError` if *start* or *stop* is empty.
+    """
+
+    calendar = calendar or defaults.active and \
+        defaults.current_calendar.get() or chrono.DEFAULT_CALENDAR
+    julians = julian(start, stop, step, unit, align, calendar)
+    convert = calendar.julian_to_date
+
+    if cls is None:
+        return (convert(j) for j in julians)
+
+    return (
+        cls(year=y, month=m, day=d)
+        for y, m, d in (convert(j) for j in julians)
+    )
+
+
+def __days(start, stop, step, unit, align, calendar):
+    "Generates julian day numbers for day and week units"
+
+    if unit == "week":
+        if align:
+            start -= calendar.weekday(*calendar.julian_to_date(start)) - 1
+
+        step *= 7
+
+    if step > 0:
+        while start < stop:
+            yield start
+            start += step
+
+    else:
+        while start > stop:
+            yield start
+            start += step
+
+
+def __months(start, stop, step, unit, align, calendar):
+    "Generates julian day numbers for month, quarter, and year units"
+
+    year, month, day = calendar.julian_to_date(start)
+    size = {"month": 1, "quarter": 3, "year": 12}[unit]
+
+    # months since year 0, for integer arithmetic on months
+    months = year * 12 + month - 1
+
+    if align:
+        months -= months % size
+        day = 1
+
+    step *= size
+
+    while 12 <= months < 120000:
+        year, month = divmod(months, 12)
+        month += 1
+
+        julian = calendar.julian(
+            year, month, min(day, calendar.monthdays(year, month))
+        )
+
+        if (step > 0 and julian >= stop) or (step < 0 and julian <= stop):
+            break
+
+        yield julian
+        months += step
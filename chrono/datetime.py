@@ -20,6 +20,8 @@ from __future__ import absolute_import
 
 from . import clock
 from . import date
+from . import defaults
+from . import duration
 from . import error
 from . import formatter
 from . import time
@@ -69,27 +71,76 @@ class DateTime(date.Date, time.Time):
     By default the value of :attr:`chrono.DEFAULT_CALENDAR` is used - normally
     :class:`chrono.calendar.ISOCalendar`. See
     :mod:`chrono.calendar` for a list of available calendars.
+
+    *zone* sets the time zone of the date/time, as a :class:`chrono.tz.Zone`
+    or a zone name such as ``Europe/Oslo``. The attributes always hold the
+    wall time in the zone, and UNIX timestamps are converted to and from the
+    zone instead of the local time zone. Comparisons and arithmetic use the
+    wall time, except subtracting date/times in different zones, which gives
+    the actual time between them. Use :meth:`chrono.DateTime.convert` to
+    bring date/times into the same zone before comparing them. Wall times
+    which occur twice, when clocks are turned back, refer to the first
+    occurrence.
+    """
+
+    zone = None
+    """
+    Time zone of the date/time, as a :class:`chrono.tz.Zone`, or **None**
+    for date/times without a time zone. See :mod:`chrono.tz`.
     """
 
+    def __add__(self, other):
+
+        if not isinstance(other, duration.Duration):
+            return NotImplemented
+
+        julian, seconds = other.apply(
+            *self.__get_julian_seconds(), calendar=self.calendar
+        )
+        hours, seconds = divmod(seconds, 3600)
+        minutes, seconds = divmod(seconds, 60)
+
+        result = DateTime(
+            parser=self.parser, calendar=self.calendar, zone=self.zone
+        )
+        result.set(
+            *self.calendar.julian_to_date(julian) + (hours, minutes, seconds)
+        )
+
+        return result
+
     def __cmp__(self, other):
 
-        if not isinstance(other, DateTime):
-            other = DateTime(other)
+        return utility.cmp(self.sort_key(), self.__key(other))
+
+    def __eq__(self, other):
 
-        c = date.Date.__cmp__(self, other)
+        return self.sort_key() == self.__key(other)
 
-        if c > 0:
-            return 1
+    def __ge__(self, other):
 
-        elif c < 0:
-            return -1
+        return self.sort_key() >= self.__key(other)
 
-        return time.Time.__cmp__(self, other)
+    def __gt__(self, other):
 
-    def __init__(self, datetime=None, parser=None, calendar=None, **kwargs):
+        return self.sort_key() > self.__key(other)
 
-        self.parser = parser or chrono.DEFAULT_PARSER
-        self.calendar = calendar or chrono.DEFAULT_CALENDAR
+    def __init__(
+        self, datetime=None, parser=None, calendar=None, zone=None, **kwargs
+    ):
+
+        self.parser = parser or defaults.active and \
+            defaults.current_parser.get() or chrono.DEFAULT_PARSER
+        self.calendar = calendar or defaults.active and \
+            defaults.current_calendar.get() or chrono.DEFAULT_CALENDAR
+
+        if isinstance(zone, str):
+            zone = chrono.tz.Zone.get(zone)
+
+        elif zone is None and isinstance(datetime, DateTime):
+            zone = datetime.zone
+
+        self.zone = zone
 
         if isinstance(datetime, str):
             self.set_string(datetime)
@@ -97,6 +148,9 @@ class DateTime(date.Date, time.Time):
         elif datetime is True:
             self.set_now()
 
+        elif isinstance(datetime, int) and zone is not None:
+            self.set_unix_utc(datetime)
+
         elif isinstance(datetime, int):
             self.set_unix(datetime)
 
@@ -132,6 +186,22 @@ class DateTime(date.Date, time.Time):
         else:
             raise TypeError("Invalid type for DateTime parameter")
 
+    def __le__(self, other):
+
+        return self.sort_key() <= self.__key(other)
+
+    def __lt__(self, other):
+
+        return self.sort_key() < self.__key(other)
+
+    def __ne__(self, other):
+
+        return self.sort_key() != self.__key(other)
+
+    def __radd__(self, other):
+
+        return self.__add__(other)
+
     def __repr__(self):
 
         args = []
@@ -154,6 +224,9 @@ class DateTime(date.Date, time.Time):
         if self.second != None:
             args.append("second={0}".format(self.second))
 
+        if self.zone is not None:
+            args.append("zone={0!r}".format(self.zone.name))
+
         return "chrono.DateTime({0})".format(", ".join(args))
 
     def __setattr__(self, name, value):
@@ -166,21 +239,14 @@ class DateTime(date.Date, time.Time):
 
         elif name == "hour":
 
-            day = self.day or 1
-
-            while value >= 24:
-                value -= 24
-                day += 1
-
-            while value < 0:
-                value += 24
-                day -= 1
-
-            # set day, but only if already set
-            object.__setattr__(self, "day", self.day and day or self.day)
+            days, value = divmod(value, 24)
 
             object.__setattr__(self, "hour", value)
 
+            # carry whole days into the date, but only if day is already set
+            if self.day is not None and days:
+                self.day = self.day + days
+
         else:
             date.Date.__setattr__(self, name, value)
 
@@ -192,6 +258,81 @@ class DateTime(date.Date, time.Time):
         except error.NoDateTimeError:
             return ""
 
+    def __sub__(self, other):
+
+        if isinstance(other, duration.Duration):
+            return self.__add__(-other)
+
+        elif not isinstance(other, (date.Date, datetimemod.date)):
+            return NotImplemented
+
+        elif not isinstance(other, DateTime):
+            other = DateTime(other)
+
+        # date/times in different zones are compared as UTC, like datetime
+        if (
+            self.zone is not None and other.zone is not None and
+            self.zone is not other.zone
+        ):
+            return duration.Duration(
+                seconds=self.get_unix_utc() - other.get_unix_utc()
+            )
+
+        julian, seconds = self.__get_julian_seconds()
+        other_julian, other_seconds = other.__get_julian_seconds()
+
+        return duration.Duration(
+            days=julian - other_julian, seconds=seconds - other_seconds
+        )
+
+    @staticmethod
+    def __key(value):
+        """
+        Returns the sort key for *value*, only creating a DateTime object
+        for values which are not dates or date/times
+        """
+
+        if isinstance(value, DateTime):
+            return DateTime.sort_key(value)
+
+        elif isinstance(value, date.Date):
+            key = date.Date.sort_key(value)
+
+            # dates compare as midnight, or as empty if not fully set
+            if key < 0:
+                return 0
+
+            return (key + 1) * 86401 + 1
+
+        elif isinstance(value, datetimemod.datetime):
+            return (
+                (value.year * 16 + value.month) * 32 + value.day + 1
+            ) * 86401 + value.hour * 3600 + value.minute * 60 + \
+                value.second + 1
+
+        elif isinstance(value, datetimemod.date):
+            return ((value.year * 16 + value.month) * 32 + value.day + 1) * \
+                86401 + 1
+
+        elif isinstance(value, chrono.CompactDateTime):
+            if value.epoch is None:
+                return 0
+
+            y, mo, d, h, mi, s = value.get()
+
+            return ((y * 16 + mo) * 32 + d + 1) * 86401 + \
+                h * 3600 + mi * 60 + s + 1
+
+        return DateTime(value).sort_key()
+
+    def __get_julian_seconds(self):
+        "Returns the julian day number and seconds since midnight"
+
+        return (
+            date.Date.get_julian(self),
+            self.hour * 3600 + self.minute * 60 + self.second
+        )
+
     def assert_set(self):
         """
         Makes sure the object has a full date set, ie the attributes
@@ -217,12 +358,31 @@ class DateTime(date.Date, time.Time):
         date.Date.clear(self)
         time.Time.clear(self)
 
+    def convert(self, zone):
+        """
+        Returns a new :class:`chrono.DateTime` with the same point in time
+        as wall time in *zone*, given as a :class:`chrono.tz.Zone` or a zone
+        name. Date/times without a time zone are taken to be UTC.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date/time
+        data, and :exc:`chrono.error.ZoneError` for unknown zones.
+        """
+
+        result = DateTime(
+            parser=self.parser, calendar=self.calendar,
+            zone=zone or chrono.tz.UTC
+        )
+        result.set_unix_utc(self.get_unix_utc())
+
+        return result
+
     def format(self, template):
         """
         Formats the date using *template*, replacing variables as
         supported by :class:`chrono.formatter.Formatter`. This value is
         dependent on the calendar set in :attr:`chrono.Date.calendar`, by
-        default :class:`chrono.calendar.ISOCalendar`.
+        default :class:`chrono.calendar.ISOCalendar`. The ``offset`` and
+        ``zonename`` variables are empty for date/times without a time zone.
 
         Raises :exc:`chrono.error.NoDateTimeError` on missing date data.
         """
@@ -231,9 +391,23 @@ class DateTime(date.Date, time.Time):
 
         return formatter.Formatter(self.calendar).format(
             template, self.year, self.month, self.day,
-            self.hour, self.minute, self.second
+            self.hour, self.minute, self.second,
+            self.get_offset(), self.get_zonename()
         )
 
+    def freeze(self):
+        """
+        Returns an immutable, hashable :class:`chrono.FrozenDateTime` with
+        the same date/time and calendar. The time zone is not kept, the
+        frozen date/time holds the wall time. Date/times which are not fully
+        set give an empty frozen date/time.
+        """
+
+        if not self.is_set():
+            return chrono.FrozenDateTime(calendar=self.calendar)
+
+        return chrono.FrozenDateTime(self, calendar=self.calendar)
+
     def get(self):
         """
         Returns the datetime as a tuple of year, month, day, hour, minute,
@@ -274,6 +448,20 @@ class DateTime(date.Date, time.Time):
 
         return date.Date.get_julian(self) + time.Time.get_julian(self)
 
+    def get_offset(self):
+        """
+        Returns the offset from UTC in seconds in the time zone set in
+        :attr:`chrono.DateTime.zone`, or **None** if no zone is set.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date/time
+        data.
+        """
+
+        if self.zone is None:
+            return None
+
+        return self.zone.utcoffset(self.get_unix_utc())
+
     def get_string(self):
         """
         Returns a string representation (*yyyy-mm-dd hh:mm:ss*) of the
@@ -284,6 +472,53 @@ class DateTime(date.Date, time.Time):
 
         return self.format("$0year-$0month-$0day $0hour:$0minute:$0second")
 
+    def get_unix(self):
+        """
+        Returns a UNIX timestamp representation of the date/time,
+        interpreted as wall time in the zone set in
+        :attr:`chrono.DateTime.zone`, or as local time if no zone is set.
+        See :meth:`chrono.DateTime.get_unix_utc` for UTC.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date/time
+        data.
+        """
+
+        if self.zone is not None:
+            return self.get_unix_utc()
+
+        return date.Date.get_unix(self)
+
+    def get_unix_utc(self):
+        """
+        Returns a UNIX timestamp representation of the date/time,
+        interpreted as wall time in the zone set in
+        :attr:`chrono.DateTime.zone`, or as UTC if no zone is set. This is
+        calculated from the julian day number and the time, without using
+        the C library or the local time zone.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing date/time
+        data.
+        """
+
+        julian, seconds = self.__get_julian_seconds()
+        timestamp = (julian - 2440588) * 86400 + seconds
+
+        if self.zone is not None:
+            return self.zone.to_utc(timestamp)
+
+        return timestamp
+
+    def get_zonename(self):
+        """
+        Returns the name of the time zone set in
+        :attr:`chrono.DateTime.zone`, or **None** if no zone is set.
+        """
+
+        if self.zone is None:
+            return None
+
+        return self.zone.name
+
     def is_set(self):
         """
         Returns **True** if a date is set, ie if the attributes
@@ -348,9 +583,14 @@ class DateTime(date.Date, time.Time):
 
     def set_now(self):
         """
-        Sets the datetime to the current date and time.
+        Sets the datetime to the current date and time, in the zone set in
+        :attr:`chrono.DateTime.zone` if any, otherwise in local time.
         """
 
+        if self.zone is not None:
+            self.set_unix_utc(int(timemod.time()))
+            return
+
         d = datetimemod.datetime.now()
 
         self.set(d.year, d.month, d.day, d.hour, d.minute, d.second)
@@ -389,9 +629,54 @@ class DateTime(date.Date, time.Time):
 
     def set_unix(self, timestamp):
         """
-        Sets the date from an integer UNIX timestamp.
+        Sets the date from an integer UNIX timestamp, converted to wall time
+        in the zone set in :attr:`chrono.DateTime.zone`, or to local time if
+        no zone is set. See :meth:`chrono.DateTime.set_unix_utc` for UTC.
         """
 
+        if self.zone is not None:
+            self.set_unix_utc(int(timestamp))
+            return
+
         dt = datetimemod.datetime.fromtimestamp(int(timestamp))
 
         self.set(dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second)
+
+    def set_unix_utc(self, timestamp):
+        """
+        Sets the date/time from an integer UNIX timestamp, converted to wall
+        time in the zone set in :attr:`chrono.DateTime.zone`, or UTC if no
+        zone is set. This is calculated from the julian day number, without
+        using the C library or the local time zone.
+
+        Raises :exc:`chrono.error.YearError` if the timestamp is outside
+        the years 1-9999.
+        """
+
+        if self.zone is not None:
+            timestamp = self.zone.to_local(timestamp)
+
+        self.set(*self.calendar.unix_utc_to_datetime(timestamp))
+
+    def sort_key(self):
+        """
+        Returns an integer which orders date/times the same way as
+        comparisons, for use as a sort key, such as
+        ``sorted(datetimes, key=DateTime.sort_key)``. Date/times without a
+        full date sort first, followed by date/times without a full time on
+        the same date. Zones are not taken into account.
+        """
+
+        key = 0
+
+        if self.year is not None and self.month is not None and \
+            self.day is not None:
+
+            key = ((self.year * 16 + self.month) * 32 + self.day + 1) * 86401
+
+        if self.hour is not None and self.minute is not None and \
+            self.second is not None:
+
+            key += self.hour * 3600 + self.minute * 60 + self.second + 1
+
+        return key
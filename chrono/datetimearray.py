@@ -0,0 +1,443 @@
+# -*- coding: utf-8 -*-
+#
+# python-chrono - a Python module for easy and convenient date/time handling
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from __future__ import absolute_import
+
+from . import compactdatetime
+from . import datearray
+from . import defaults
+from . import formatter
+
+import array
+import chrono
+
+
+class DateTimeArray(object):
+    """
+    A class for handling sequences of date/times as a single column, for
+    bulk operations on large numbers of date/times. The date/times are
+    stored as seconds since 1970-01-01 00:00:00, the same value as
+    :attr:`chrono.CompactDateTime.epoch`, in an :class:`array.array` of
+    64-bit integers available in :attr:`chrono.DateTimeArray.epoch`, and the
+    methods operate on all date/times at once, returning one value per
+    date/time. Date values are calculated once per distinct day, so columns
+    with many date/times on the same days are cheap to process.
+
+    *datetimes* is an iterable of date/times, where each item can be any
+    value accepted by :class:`chrono.CompactDateTime` - strings are parsed
+    using *parser*, by default the value of :attr:`chrono.DEFAULT_PARSER`.
+    Empty date/times are not allowed, and raise
+    :exc:`chrono.error.NoDateTimeError`.
+
+    *calendar* determines which calendar to use for calendar operations.
+    By default the value of :attr:`chrono.DEFAULT_CALENDAR` is used -
+    normally :class:`chrono.calendar.ISOCalendar`.
+
+    Individual date/times are returned as :class:`chrono.CompactDateTime`
+    objects when indexing or iterating, while slices return a new
+    :class:`chrono.DateTimeArray`.
+    """
+
+    __units = ("minute", "hour", "day", "week", "month", "year")
+
+    calendar = None
+    """
+    Calendar to use for calendar operations. Defaults to
+    :class:`chrono.calendar.ISOCalendar`.
+    """
+
+    epoch = None
+    """
+    Array of seconds since 1970-01-01 00:00:00 for the date/times. This is
+    an :class:`array.array` of type ``q``, or a :class:`memoryview` for
+    arrays created with :meth:`chrono.DateTimeArray.from_buffer`.
+    """
+
+    def __getitem__(self, index):
+
+        if isinstance(index, slice):
+            return DateTimeArray.from_epoch(self.epoch[index], self.calendar)
+
+        return compactdatetime.CompactDateTime(
+            epoch=self.epoch[index], calendar=self.calendar
+        )
+
+    def __init__(self, datetimes=None, parser=None, calendar=None):
+
+        self.calendar = calendar or defaults.active and \
+            defaults.current_calendar.get() or chrono.DEFAULT_CALENDAR
+        self.epoch = array.array("q")
+
+        if datetimes is not None:
+            self.extend(datetimes, parser)
+
+    def __iter__(self):
+
+        for epoch in self.epoch:
+            yield compactdatetime.CompactDateTime(
+                epoch=epoch, calendar=self.calendar
+            )
+
+    def __len__(self):
+
+        return len(self.epoch)
+
+    def __repr__(self):
+
+        return "chrono.DateTimeArray({0!r})".format(self.get_string())
+
+    def __by_day(self, function):
+        """
+        Returns a list with the result of *function* for the date of each
+        date/time, called once per distinct day
+        """
+
+        julian_to_date = self.calendar.julian_to_date
+        days = {}
+        values = []
+        append = values.append
+
+        for epoch in self.epoch:
+            day = epoch // 86400
+
+            try:
+                append(days[day])
+
+            except KeyError:
+                days[day] = function(*julian_to_date(day + 2440588))
+                append(days[day])
+
+        return values
+
+    def __epoch(self, other):
+        "Returns the epoch values to compare against, one per date/time"
+
+        if isinstance(other, DateTimeArray):
+            if len(other) != len(self):
+                raise ValueError(
+                    "Arrays have different lengths, {0} and {1}".format(
+                        len(self), len(other)
+                    )
+                )
+
+            return other.epoch
+
+        if not isinstance(other, compactdatetime.CompactDateTime):
+            other = compactdatetime.CompactDateTime(
+                other, calendar=self.calendar
+            )
+
+        other.assert_set()
+
+        return [other.epoch] * len(self)
+
+    def append(self, datetime, parser=None):
+        """
+        Appends *datetime* to the array, where *datetime* can be any value
+        accepted by :class:`chrono.CompactDateTime`.
+
+        Raises :exc:`chrono.error.NoDateTimeError` for empty date/times, and
+        the same errors as :class:`chrono.CompactDateTime` for invalid
+        values.
+        """
+
+        self.extend((datetime,), parser)
+
+    def argsort(self, reverse=False):
+        """
+        Returns an :class:`array.array` with the indexes of the date/times
+        in sorted order. The sort is stable, so equal date/times keep their
+        order.
+        """
+
+        epoch = self.epoch
+
+        return array.array(
+            "q",
+            sorted(range(len(epoch)), key=epoch.__getitem__, reverse=reverse)
+        )
+
+    def cmp(self, other):
+        """
+        Compares each date/time with *other*, and returns an
+        :class:`array.array` with -1, 0, or 1 for each date/time if it is
+        before, equal to, or after *other*. *other* can be any value
+        accepted by :class:`chrono.CompactDateTime`, which is compared with
+        all date/times, or a :class:`chrono.DateTimeArray` of the same
+        length, which is compared item by item.
+
+        Raises :exc:`ValueError` for arrays of different lengths.
+        """
+
+        return array.array(
+            "b", [
+                (a > b) - (a < b)
+                for a, b in zip(self.epoch, self.__epoch(other))
+            ]
+        )
+
+    def date(self):
+        """
+        Returns a :class:`chrono.DateArray` with the date of each date/time.
+        """
+
+        return datearray.DateArray.from_julian(
+            array.array("i", [e // 86400 + 2440588 for e in self.epoch]),
+            self.calendar
+        )
+
+    def day(self):
+        """
+        Returns an array with the day of each date/time.
+        """
+
+        return array.array("i", self.__by_day(lambda y, m, d: d))
+
+    def extend(self, datetimes, parser=None):
+        """
+        Appends each date/time in the iterable *datetimes* to the array,
+        where the items can be any value accepted by
+        :class:`chrono.CompactDateTime`. Strings are parsed directly, without
+        creating an object per date/time.
+
+        Raises :exc:`chrono.error.NoDateTimeError` for empty date/times, and
+        the same errors as :class:`chrono.CompactDateTime` for invalid
+        values.
+        """
+
+        parser = parser or defaults.active and \
+            defaults.current_parser.get() or chrono.DEFAULT_PARSER
+        unix_utc = self.calendar.unix_utc
+        values = []
+
+        for datetime in datetimes:
+            if isinstance(datetime, str):
+                values.append(unix_utc(*parser.parse_datetime(datetime)))
+
+            else:
+                if not isinstance(datetime, compactdatetime.CompactDateTime):
+                    datetime = compactdatetime.CompactDateTime(
+                        datetime, parser=parser, calendar=self.calendar
+                    )
+
+                datetime.assert_set()
+                values.append(datetime.epoch)
+
+        # arrays from buffers are copied on the first change
+        if not isinstance(self.epoch, array.array):
+            self.epoch = array.array("q", self.epoch)
+
+        self.epoch.extend(values)
+
+    def floor(self, unit):
+        """
+        Returns a new :class:`chrono.DateTimeArray` with each date/time
+        truncated to the start of its *unit*, which can be ``minute``,
+        ``hour``, ``day``, ``week``, ``month``, or ``year``. The start of the
+        week is dependent on the calendar set in
+        :attr:`chrono.DateTimeArray.calendar`, by default
+        :class:`chrono.calendar.ISOCalendar`.
+
+        Raises :exc:`ValueError` for invalid units.
+        """
+
+        if unit not in self.__units:
+            raise ValueError("Invalid unit '{0}'".format(unit))
+
+        epoch = self.epoch
+
+        if unit in ("minute", "hour", "day"):
+            size = {"minute": 60, "hour": 3600, "day": 86400}[unit]
+
+            return DateTimeArray.from_epoch(
+                array.array("q", [e - e % size for e in epoch]),
+                self.calendar
+            )
+
+        cal = self.calendar
+
+        # offsets in days from the date to the start of the unit
+        if unit == "week":
+            offsets = self.__by_day(lambda y, m, d: cal.weekday(y, m, d) - 1)
+
+        elif unit == "month":
+            offsets = self.__by_day(lambda y, m, d: d - 1)
+
+        else:
+            offsets = self.__by_day(
+                lambda y, m, d: cal.julian(y, m, d) - cal.julian(y, 1, 1)
+            )
+
+        return DateTimeArray.from_epoch(
+            array.array(
+                "q", [
+                    e - e % 86400 - o * 86400
+                    for e, o in zip(epoch, offsets)
+                ]
+            ),
+            self.calendar
+        )
+
+    def format(self, template):
+        """
+        Formats each date/time using *template*, replacing variables as
+        supported by :class:`chrono.formatter.Formatter`, and returns a list
+        of strings. The template is only compiled once for all date/times.
+        """
+
+        fmt = formatter.Formatter(self.calendar).compile(template)
+        dates = self.__by_day(lambda y, m, d: (y, m, d))
+
+        return [
+            fmt(*date + (e // 3600 % 24, e // 60 % 60, e % 60))
+            for date, e in zip(dates, self.epoch)
+        ]
+
+    @classmethod
+    def from_buffer(cls, buffer, calendar=None):
+        """
+        Creates a :class:`chrono.DateTimeArray` from an object supporting the
+        buffer protocol, such as :class:`bytes`, :class:`mmap.mmap`, or a
+        NumPy array, holding native 64-bit integers with seconds since
+        1970-01-01 00:00:00. The buffer is used directly through a
+        :class:`memoryview`, without copying, until the array is extended.
+        Sorting writes to the buffer, and fails for read-only buffers. The
+        values are not validated.
+
+        Raises :exc:`ValueError` if the buffer size isn't a multiple of 8.
+        """
+
+        view = memoryview(buffer).cast("B")
+
+        if len(view) % 8:
+            raise ValueError(
+                "Buffer size {0} is not a multiple of 8".format(len(view))
+            )
+
+        datetimes = cls(calendar=calendar)
+        datetimes.epoch = view.cast("q")
+
+        return datetimes
+
+    @classmethod
+    def from_epoch(cls, epoch, calendar=None):
+        """
+        Creates a :class:`chrono.DateTimeArray` from a sequence of seconds
+        since 1970-01-01 00:00:00. If *epoch* is an :class:`array.array` of
+        type ``q`` or a :class:`memoryview` of format ``q``, it is used
+        directly without copying, otherwise the values are copied into a
+        new array. The values are not validated.
+        """
+
+        datetimes = cls(calendar=calendar)
+
+        if (
+            isinstance(epoch, array.array) and epoch.typecode == "q" or
+            isinstance(epoch, memoryview) and epoch.format == "q"
+        ):
+            datetimes.epoch = epoch
+
+        else:
+            datetimes.epoch = array.array("q", epoch)
+
+        return datetimes
+
+    def get(self):
+        """
+        Returns a list of tuples with year, month, day, hour, minute, and
+        second for each date/time.
+        """
+
+        return self.calendar.unix_utc_to_datetime_many(self.epoch)
+
+    def get_epoch(self):
+        """
+        Returns a copy of the array of seconds since 1970-01-01 00:00:00.
+        """
+
+        return array.array("q", self.epoch)
+
+    def get_string(self):
+        """
+        Returns a list of string representations (*yyyy-mm-dd hh:mm:ss*) of
+        the date/times.
+        """
+
+        return self.format("$0year-$0month-$0day $0hour:$0minute:$0second")
+
+    def hour(self):
+        """
+        Returns an array with the hour of each date/time.
+        """
+
+        return array.array("i", [e // 3600 % 24 for e in self.epoch])
+
+    def minute(self):
+        """
+        Returns an array with the minute of each date/time.
+        """
+
+        return array.array("i", [e // 60 % 60 for e in self.epoch])
+
+    def month(self):
+        """
+        Returns an array with the month of each date/time.
+        """
+
+        return array.array("i", self.__by_day(lambda y, m, d: m))
+
+    def second(self):
+        """
+        Returns an array with the second of each date/time.
+        """
+
+        return array.array("i", [e % 60 for e in self.epoch])
+
+    def sort(self, reverse=False):
+        """
+        Sorts the date/times in place.
+        """
+
+        self.epoch[:] = array.array("q", sorted(self.epoch, reverse=reverse))
+
+    def week(self):
+        """
+        Returns a list of tuples with year and week number for each
+        date/time. This value is dependent on the calendar set in
+        :attr:`chrono.DateTimeArray.calendar`, by default
+        :class:`chrono.calendar.ISOCalendar`.
+        """
+
+        return self.__by_day(self.calendar.week)
+
+    def weekday(self):
+        """
+        Returns an array with the weekday of each date/time. This value is
+        dependent on the calendar set in
+        :attr:`chrono.DateTimeArray.calendar`, by default
+        :class:`chrono.calendar.ISOCalendar`.
+        """
+
+        return array.array("i", self.__by_day(self.calendar.weekday))
+
+    def year(self):
+        """
+        Returns an array with the year of each date/time.
+        """
+
+        return array.array("i", self.__by_day(lambda y, m, d: y))
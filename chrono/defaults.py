@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+#
+# python-chrono - a Python module for easy and convenient date/time handling
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+
+"""
+Context-local defaults for the parser and calendar, which take precedence
+over :attr:`chrono.DEFAULT_PARSER` and :attr:`chrono.DEFAULT_CALENDAR`.
+"""
+
+from __future__ import absolute_import
+
+import contextlib
+import contextvars
+import threading
+
+active = 0
+"""
+Number of :func:`chrono.context` blocks currently active in any thread or
+task. Defaults are only looked up in the context variables while this is
+not zero, so code which never uses contexts only reads the module globals.
+"""
+
+current_calendar = contextvars.ContextVar("chrono.calendar", default=None)
+"""
+:class:`contextvars.ContextVar` with the calendar set by
+:func:`chrono.context`, or **None**.
+"""
+
+current_parser = contextvars.ContextVar("chrono.parser", default=None)
+"""
+:class:`contextvars.ContextVar` with the parser set by
+:func:`chrono.context`, or **None**.
+"""
+
+# protects active, which is shared by all threads
+__lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def context(parser=None, calendar=None):
+    """
+    Context manager which sets the default parser and calendar for the
+    current context, for code in the ``with`` block::
+
+        >>> with chrono.context(parser=chrono.parser.USParser):
+        ...     chrono.Date("07/23/2010")
+        chrono.Date(year=2010, month=7, day=23)
+
+    The defaults are stored in :mod:`contextvars` variables, so they only
+    apply to the current thread or :mod:`asyncio` task, and take precedence
+    over :attr:`chrono.DEFAULT_PARSER` and :attr:`chrono.DEFAULT_CALENDAR`.
+    Parsers and calendars passed to constructors and methods take
+    precedence over both. A *parser* or *calendar* of **None** leaves the
+    current default unchanged, and contexts may be nested.
+    """
+
+    global active
+
+    tokens = []
+
+    with __lock:
+        active += 1
+
+    try:
+        if parser is not None:
+            tokens.append((current_parser, current_parser.set(parser)))
+
+        if calendar is not None:
+            tokens.append((current_calendar, current_calendar.set(calendar)))
+
+        yield
+
+    finally:
+        for variable, token in reversed(tokens):
+            variable.reset(token)
+
+        with __lock:
+            active -= 1
+
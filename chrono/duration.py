@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+#
+# python-chrono - a Python module for easy and convenient date/time handling
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from __future__ import absolute_import
+
+from . import defaults
+from . import error
+from . import utility
+
+import chrono
+import datetime
+
+
+class Duration(object):
+    """
+    A length of time, stored as a number of calendar months and a number of
+    seconds. Durations are returned when subtracting dates and date/times
+    from each other, and can be added to or subtracted from
+    :class:`chrono.Date`, :class:`chrono.DateTime`,
+    :class:`chrono.CompactDate`, and :class:`chrono.CompactDateTime`
+    objects::
+
+        >>> chrono.DateTime("2010-01-31 12:00:00") + chrono.Duration(months=1)
+        chrono.DateTime(year=2010, month=2, day=28, hour=12, minute=0, second=0)
+
+    Years and months are calendar-aware: they move the date by whole months,
+    keeping the day of the month, or using the last day of the month if the
+    day doesn't exist in the new month. Weeks, days, hours, and minutes are
+    converted to seconds, and all arithmetic is done on julian day numbers
+    and seconds since midnight, without going through the C library.
+
+    Values may be negative, and are truncated to whole seconds. A
+    :class:`datetime.timedelta` can be given instead of keyword arguments.
+    """
+
+    __slots__ = ("months", "seconds")
+
+    def __add__(self, other):
+
+        if not isinstance(other, Duration):
+            return NotImplemented
+
+        return Duration(
+            months=self.months + other.months,
+            seconds=self.seconds + other.seconds
+        )
+
+    def __bool__(self):
+
+        return self.months != 0 or self.seconds != 0
+
+    def __cmp__(self, other):
+
+        if not isinstance(other, Duration):
+            other = Duration(other)
+
+        if self.months != other.months:
+            raise TypeError(
+                "Durations with different months can't be ordered"
+            )
+
+        return utility.cmp(self.seconds, other.seconds)
+
+    def __eq__(self, other):
+
+        if not isinstance(other, Duration):
+            return NotImplemented
+
+        return self.months == other.months and self.seconds == other.seconds
+
+    def __ge__(self, other):
+
+        return self.__cmp__(other) >= 0
+
+    def __gt__(self, other):
+
+        return self.__cmp__(other) > 0
+
+    def __hash__(self):
+
+        return hash((self.months, self.seconds))
+
+    def __init__(
+        self, duration=None, years=0, months=0, weeks=0, days=0, hours=0,
+        minutes=0, seconds=0
+    ):
+
+        if isinstance(duration, Duration):
+            self.months = duration.months
+            self.seconds = duration.seconds
+
+        elif isinstance(duration, datetime.timedelta):
+            self.months = 0
+            self.seconds = duration.days * 86400 + duration.seconds
+
+        elif duration is None:
+            self.months = int(years * 12 + months)
+            self.seconds = int(
+                weeks * 604800 + days * 86400 + hours * 3600 + minutes * 60 +
+                seconds
+            )
+
+        else:
+            raise TypeError("Invalid type for Duration parameter")
+
+    def __le__(self, other):
+
+        return self.__cmp__(other) <= 0
+
+    def __lt__(self, other):
+
+        return self.__cmp__(other) < 0
+
+    def __mul__(self, other):
+
+        if isinstance(other, bool) or not isinstance(other, int):
+            return NotImplemented
+
+        return Duration(
+            months=self.months * other, seconds=self.seconds * other
+        )
+
+    def __ne__(self, other):
+
+        if not isinstance(other, Duration):
+            return NotImplemented
+
+        return not self.__eq__(other)
+
+    def __neg__(self):
+
+        return Duration(months=-self.months, seconds=-self.seconds)
+
+    def __repr__(self):
+
+        return "chrono.Duration(months={0}, seconds={1})".format(
+            self.months, self.seconds
+        )
+
+    def __rmul__(self, other):
+
+        return self.__mul__(other)
+
+    def __sub__(self, other):
+
+        if not isinstance(other, Duration):
+            return NotImplemented
+
+        return self.__add__(-other)
+
+    def apply(self, julian, seconds=0, calendar=None):
+        """
+        Moves the julian day number *julian* and *seconds* since midnight
+        by the duration, and returns a tuple with the new julian day number
+        and seconds since midnight (range 0-86399). Months are added first,
+        using *calendar* to find the date, then seconds.
+
+        By default the value of :attr:`chrono.DEFAULT_CALENDAR` is used as
+        calendar - normally :class:`chrono.calendar.ISOCalendar`.
+
+        Raises :exc:`chrono.error.YearError` if the result is outside the
+        years 1-9999.
+        """
+
+        if self.months:
+            calendar = calendar or defaults.active and \
+                defaults.current_calendar.get() or chrono.DEFAULT_CALENDAR
+
+            year, month, day = calendar.julian_to_date(julian)
+            years, month = divmod(month - 1 + self.months, 12)
+            year += years
+            month += 1
+
+            calendar.validate_year(year)
+
+            julian = calendar.julian(
+                year, month, min(day, calendar.monthdays(year, month))
+            )
+
+        days, seconds = divmod(seconds + self.seconds, 86400)
+        julian += days
+
+        if not 1721426 <= julian <= 5373484:
+            raise error.YearError(
+                "Julian day '{0}' not in range 1721426-5373484 "
+                "(years 1-9999)".format(julian)
+            )
+
+        return (julian, seconds)
+
+    def get_days(self):
+        """
+        Returns the number of whole days in the duration, rounded towards
+        negative infinity like :class:`datetime.timedelta`.
+
+        Raises :exc:`ValueError` if the duration contains months.
+        """
+
+        return self.get_seconds() // 86400
+
+    def get_seconds(self):
+        """
+        Returns the duration as a number of seconds.
+
+        Raises :exc:`ValueError` if the duration contains months, which
+        don't have a fixed length.
+        """
+
+        if self.months:
+            raise ValueError(
+                "Durations with months don't have a fixed number of seconds"
+            )
+
+        return self.seconds
+
+    def get_timedelta(self):
+        """
+        Returns a :class:`datetime.timedelta` instance for the duration.
+
+        Raises :exc:`ValueError` if the duration contains months.
+        """
+
+        return datetime.timedelta(seconds=self.get_seconds())
@@ -48,6 +48,7 @@ The exception tree is structured as follows:
         * :class:`chrono.error.SecondError`
 
     * :class:`chrono.error.ParseError`
+    * :class:`chrono.error.ZoneError`
 """
 
 
@@ -109,3 +110,8 @@ class NoDateTimeError(Exception):
 class ParseError(ValueError):
     "Error for parse failures."
     pass
+
+
+class ZoneError(ValueError):
+    "Error for unknown or invalid time zones."
+    pass
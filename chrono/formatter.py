@@ -20,8 +20,9 @@ from __future__ import absolute_import
 
 from . import clock
 
+import chrono
+import functools
 import re
-import string
 
 
 class Formatter(object):
@@ -42,126 +43,171 @@ class Formatter(object):
         )
     ''', re.VERBOSE | re.IGNORECASE)
 
-    def __cb_replace(self, match, year, month, day, hour, minute, second):
-        "Callback function for replacing variables in a template"
+    __variables = {
+        "year": lambda c, y, mo, d, h, mi, s, o, z:
+            y and str(y) or "",
+        "0year": lambda c, y, mo, d, h, mi, s, o, z:
+            y and str(y).zfill(4) or "",
+        "shortyear": lambda c, y, mo, d, h, mi, s, o, z:
+            y and str(y)[-2:] or "",
+        "month": lambda c, y, mo, d, h, mi, s, o, z:
+            mo and str(mo) or "",
+        "0month": lambda c, y, mo, d, h, mi, s, o, z:
+            mo and str(mo).zfill(2) or "",
+        "monthname": lambda c, y, mo, d, h, mi, s, o, z:
+            mo and c.monthname(mo) or "",
+        "shortmonthname": lambda c, y, mo, d, h, mi, s, o, z:
+            mo and c.monthname(mo, True) or "",
+        "week": lambda c, y, mo, d, h, mi, s, o, z:
+            y and mo and d and str(c.week(y, mo, d)[1]) or "",
+        "0week": lambda c, y, mo, d, h, mi, s, o, z:
+            y and mo and d and str(c.week(y, mo, d)[1]).zfill(2) or "",
+        "day": lambda c, y, mo, d, h, mi, s, o, z:
+            d and str(d) or "",
+        "0day": lambda c, y, mo, d, h, mi, s, o, z:
+            d and str(d).zfill(2) or "",
+        "weekday": lambda c, y, mo, d, h, mi, s, o, z:
+            y and mo and d and str(c.weekday(y, mo, d)) or "",
+        "weekdayname": lambda c, y, mo, d, h, mi, s, o, z:
+            y and mo and d and c.weekdayname(c.weekday(y, mo, d)) or "",
+        "shortweekdayname": lambda c, y, mo, d, h, mi, s, o, z:
+            y and mo and d and c.weekdayname(c.weekday(y, mo, d), True) or "",
+        "hour": lambda c, y, mo, d, h, mi, s, o, z:
+            h is not None and str(h) or "",
+        "0hour": lambda c, y, mo, d, h, mi, s, o, z:
+            h is not None and str(h).zfill(2) or "",
+        "012hour": lambda c, y, mo, d, h, mi, s, o, z:
+            h is not None and str(clock.USClock.from_24(h)[0]).zfill(2) or "",
+        "12hour": lambda c, y, mo, d, h, mi, s, o, z:
+            h is not None and str(clock.USClock.from_24(h)[0]) or "",
+        "ampm": lambda c, y, mo, d, h, mi, s, o, z:
+            h is not None and h >= 12 and "PM" or "AM",
+        "minute": lambda c, y, mo, d, h, mi, s, o, z:
+            mi is not None and str(mi) or "",
+        "0minute": lambda c, y, mo, d, h, mi, s, o, z:
+            mi is not None and str(mi).zfill(2) or "",
+        "second": lambda c, y, mo, d, h, mi, s, o, z:
+            s is not None and str(s) or "",
+        "0second": lambda c, y, mo, d, h, mi, s, o, z:
+            s is not None and str(s).zfill(2) or "",
+        "offset": lambda c, y, mo, d, h, mi, s, o, z:
+            o is not None and chrono.tz.Zone.format_offset(o) or "",
+        "zonename": lambda c, y, mo, d, h, mi, s, o, z:
+            z or "",
+    }
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def __compile(calendar, template):
+        "Compiles *template* for *calendar*, results are cached"
+
+        # literal text is escaped for use in a str.format() string, while
+        # variables are replaced by positional fields filled by the matching
+        # value functions
+        chunks = []
+        functions = []
+
+        for text, name in Formatter.split(template):
+            if name is None:
+                chunks.append(text.replace("{", "{{").replace("}", "}}"))
+
+            else:
+                chunks.append("{{{0}}}".format(len(functions)))
+                functions.append(Formatter.__variables[name])
+
+        fmt = "".join(chunks)
+
+        if not functions:
+            string = fmt.format()
+
+            def compiled(
+                year=None, month=None, day=None,
+                hour=None, minute=None, second=None,
+                offset=None, zonename=None
+            ):
+                return string
 
-        # handle escaped delimiters
-        if match.group("escaped") is not None:
-            return "$"
-
-        # handle invalid identifiers
-        elif match.group("invalid") is not None:
-            return match.group(0)
-
-        # otherwise, find name to use
-        name = match.group("named") or match.group("braced")
-
-        # handle year formatting
-        if name == "year":
-            return year and str(year) or ""
-
-        elif name == "0year":
-            return year and str(year).zfill(4) or ""
-
-        elif name == "shortyear":
-            return year and str(year)[-2:] or ""
-
-        # handle month formatting
-        elif name == "month":
-            return month and str(month) or ""
-
-        elif name == "0month":
-            return month and str(month).zfill(2) or ""
-
-        elif name == "monthname":
-            return month and self.calendar.monthname(month) or ""
-
-        elif name == "shortmonthname":
-            return month and self.calendar.monthname(month, True) or ""
-
-        # handle week formatting
-        elif name == "week":
-            return year and month and day and \
-                str(self.calendar.week(year, month, day)[1]) or ""
-
-        elif name == "0week":
-            return year and month and day and str(
-                self.calendar.week(year, month, day)[1]
-            ).zfill(2) or ""
-
-        # handle day formatting
-        elif name == "day":
-            return day and str(day) or ""
-
-        elif name == "0day":
-            return day and str(day).zfill(2) or ""
-
-        # handle weekday formatting
-        elif name == "weekday":
-            return year and month and day and \
-                str(self.calendar.weekday(year, month, day)) or ""
+        else:
+            def compiled(
+                year=None, month=None, day=None,
+                hour=None, minute=None, second=None,
+                offset=None, zonename=None
+            ):
+                return fmt.format(*[
+                    function(
+                        calendar, year, month, day, hour, minute, second,
+                        offset, zonename
+                    )
+                    for function in functions
+                ])
+
+        return compiled
 
-        elif name == "weekdayname":
-            return year and month and day and \
-                self.calendar.weekdayname(
-                    self.calendar.weekday(year, month, day)
-                ) or ""
+    def __init__(self, calendar):
 
-        elif name == "shortweekdayname":
-            return year and month and day and \
-                self.calendar.weekdayname(
-                    self.calendar.weekday(year, month, day), True
-                ) or ""
+        self.calendar = calendar
 
-        # handle hour formatting
-        elif name == "hour":
-            return hour is not None and str(hour) or ""
+    def compile(self, template):
+        """
+        Compiles *template* into a function which formats a date/time,
+        taking the optional arguments *year*, *month*, *day*, *hour*,
+        *minute*, *second*, *offset*, and *zonename*. Calling the function
+        gives the same result as :meth:`chrono.formatter.Formatter.format`
+        for the same template, without parsing the template again.
+
+        Compiled templates are cached per calendar, so compiling the same
+        template repeatedly is cheap.
+        """
 
-        elif name == "0hour":
-            return hour is not None and str(hour).zfill(2) or ""
+        return self.__compile(self.calendar, template)
 
-        elif name == "012hour":
-            return hour is not None and \
-                str(clock.USClock.from_24(hour)[0]).zfill(2) or ""
+    @classmethod
+    def split(cls, template):
+        """
+        Splits *template* into a list of tuples with text and variable name,
+        where the variable name is **None** for literal text. Escaped
+        delimiters (``$$``) are returned as literal ``$``, while invalid and
+        unknown variables are returned as literal text, the same way they
+        are handled by :meth:`chrono.formatter.Formatter.format`.
+        """
 
-        elif name == "12hour":
-            return hour is not None and \
-                str(clock.USClock.from_24(hour)[0]) or ""
+        chunks = []
+        position = 0
 
-        elif name == "ampm":
-            return hour is not None and hour >= 12 and "PM" or "AM"
+        for match in cls.__re_replace.finditer(template):
+            if match.start() > position:
+                chunks.append((template[position:match.start()], None))
 
-        # handle minute formatting
-        elif name == "minute":
-            return minute is not None and str(minute) or ""
+            position = match.end()
 
-        elif name == "0minute":
-            return minute is not None and str(minute).zfill(2) or ""
+            name = match.group("named") or match.group("braced")
 
-        # handle second formatting
-        elif name == "second":
-            return second is not None and str(second) or ""
+            if match.group("escaped") is not None:
+                chunks.append(("$", None))
 
-        elif name == "0second":
-            return second is not None and str(second).zfill(2) or ""
+            elif name in cls.__variables:
+                chunks.append((match.group(0), name))
 
-        # handle unknown variables
-        else:
-            return match.group(0)
+            # invalid and unknown variables are left as-is
+            else:
+                chunks.append((match.group(0), None))
 
-    def __init__(self, calendar):
+        if position < len(template):
+            chunks.append((template[position:], None))
 
-        self.calendar = calendar
+        return chunks
 
     def format(
         self, template,
         year=None, month=None, day=None,
-        hour=None, minute=None, second=None
+        hour=None, minute=None, second=None,
+        offset=None, zonename=None
     ):
         """
         Formats *template* by replacing substitution variables of the form
         ``$name`` or ``${name}`` with formatted values based on the input
-        date.
+        date. *offset* is the offset from UTC in seconds, and *zonename* the
+        name of the time zone, such as ``Europe/Oslo``.
 
         If any necessary values are missing (ie **None**) for a substitution
         variable, it will be replaced with an empty string.
@@ -186,6 +232,7 @@ class Formatter(object):
         minute              Minute
         month               Month
         monthname           Month name
+        offset              Offset from UTC, as +hh:mm
         second              Second
         shortmonthname      Month name, abbreviated
         shortweekdayname    Weekday name, abbreviated
@@ -194,14 +241,10 @@ class Formatter(object):
         weekday             Weekday
         weekdayname         Weekday name
         year                Year
+        zonename            Time zone name
         =================== ==================================
         """
 
-        # wrapper function, needed to get access to date variables, and pass
-        # them on to the actual callback function
-        def wrapper(match):
-            return self.__cb_replace(
-                match, year, month, day, hour, minute, second
-            )
-
-        return self.__re_replace.sub(wrapper, template)
+        return self.compile(template)(
+            year, month, day, hour, minute, second, offset, zonename
+        )
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+#
+# python-chrono - a Python module for easy and convenient date/time handling
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from __future__ import absolute_import
+
+from . import compactdate
+from . import date as datemod
+from . import datetime as datetimemod
+
+import datetime
+import functools
+
+
+class FrozenDate(compactdate.CompactDate):
+    """
+    An immutable, hashable variant of :class:`chrono.CompactDate`, for use as
+    dictionary keys and set members, such as for grouping and removing
+    duplicates. It accepts the same values as :class:`chrono.CompactDate`,
+    but the date can't be changed once it is created - setting attributes
+    raises :exc:`AttributeError`, while arithmetic returns new objects.
+
+    The hash is calculated once, and frozen dates are equal to and hash the
+    same as other frozen dates with the same date, regardless of calendar,
+    and :class:`datetime.date` objects with the same date, so both can be
+    mixed as keys. Frozen dates are never equal to date/times or other
+    types of values, such as strings.
+
+    Use :meth:`chrono.Date.freeze` and :meth:`chrono.FrozenDate.thaw` to
+    convert to and from :class:`chrono.Date`.
+    """
+
+    __slots__ = ("__hash",)
+
+    def __add__(self, other):
+
+        result = compactdate.CompactDate.__add__(self, other)
+
+        if result is NotImplemented:
+            return result
+
+        return FrozenDate(result, calendar=self.calendar)
+
+    def __copy__(self):
+
+        return self
+
+    def __deepcopy__(self, memo):
+
+        return self
+
+    def __eq__(self, other):
+
+        if not self.__is_date(other):
+            return NotImplemented
+
+        return compactdate.CompactDate.__eq__(self, other)
+
+    def __hash__(self):
+
+        return self.__hash
+
+    def __init__(self, date=None, parser=None, calendar=None, **kwargs):
+
+        compactdate.CompactDate.__init__(
+            self, date, parser, calendar, **kwargs
+        )
+
+        # hash like datetime.date, since frozen dates are equal to them
+        if self.julian is None:
+            self.__hash = hash(None)
+
+        else:
+            self.__hash = hash(self.get_datetime())
+
+    def __ne__(self, other):
+
+        if not self.__is_date(other):
+            return NotImplemented
+
+        return compactdate.CompactDate.__ne__(self, other)
+
+    def __reduce__(self):
+
+        return (
+            functools.partial(
+                FrozenDate, julian=self.julian, calendar=self.calendar
+            ),
+            ()
+        )
+
+    def __repr__(self):
+
+        if self.julian is None:
+            return "chrono.FrozenDate()"
+
+        return "chrono.FrozenDate(year={0}, month={1}, day={2})".format(
+            *self.get()
+        )
+
+    def __setattr__(self, name, value):
+
+        # attributes can only be set until the hash is, in __init__()
+        try:
+            self.__hash
+
+        except AttributeError:
+            return compactdate.CompactDate.__setattr__(self, name, value)
+
+        raise AttributeError("FrozenDate objects can't be changed")
+
+    @staticmethod
+    def __is_date(value):
+        """
+        Returns True if value is a date without a time, which is equal to a
+        frozen date only if it also hashes the same
+        """
+
+        return isinstance(
+            value, (compactdate.CompactDate, datemod.Date, datetime.date)
+        ) and not isinstance(
+            value, (datetimemod.DateTime, datetime.datetime)
+        )
+
+    def thaw(self):
+        """
+        Returns a mutable :class:`chrono.Date` with the same date and
+        calendar. Empty dates give an empty :class:`chrono.Date`.
+        """
+
+        if self.julian is None:
+            return datemod.Date(calendar=self.calendar)
+
+        year, month, day = self.get()
+
+        return datemod.Date(
+            year=year, month=month, day=day, calendar=self.calendar
+        )
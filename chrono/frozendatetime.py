@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+#
+# python-chrono - a Python module for easy and convenient date/time handling
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from __future__ import absolute_import
+
+from . import compactdatetime
+from . import datetime as datetimemod
+
+import datetime
+import functools
+
+
+class FrozenDateTime(compactdatetime.CompactDateTime):
+    """
+    An immutable, hashable variant of :class:`chrono.CompactDateTime`, for
+    use as dictionary keys and set members, such as for grouping and
+    removing duplicates. It accepts the same values as
+    :class:`chrono.CompactDateTime`, but the date/time can't be changed once
+    it is created - setting attributes or calling
+    :meth:`chrono.CompactDateTime.shift` raises :exc:`AttributeError`, while
+    arithmetic returns new objects.
+
+    The hash is calculated once, and frozen date/times are equal to and hash
+    the same as other frozen date/times with the same date and time,
+    regardless of calendar, and :class:`datetime.datetime` objects with the
+    same date and time, so both can be mixed as keys. Frozen date/times are
+    never equal to dates without a time or other types of values, such as
+    strings.
+
+    Use :meth:`chrono.DateTime.freeze` and :meth:`chrono.FrozenDateTime.thaw`
+    to convert to and from :class:`chrono.DateTime`.
+    """
+
+    __slots__ = ("__hash",)
+
+    def __add__(self, other):
+
+        result = compactdatetime.CompactDateTime.__add__(self, other)
+
+        if result is NotImplemented:
+            return result
+
+        return FrozenDateTime(result, calendar=self.calendar)
+
+    def __copy__(self):
+
+        return self
+
+    def __deepcopy__(self, memo):
+
+        return self
+
+    def __eq__(self, other):
+
+        if not self.__is_datetime(other):
+            return NotImplemented
+
+        return compactdatetime.CompactDateTime.__eq__(self, other)
+
+    def __hash__(self):
+
+        return self.__hash
+
+    def __init__(self, datetime=None, parser=None, calendar=None, **kwargs):
+
+        compactdatetime.CompactDateTime.__init__(
+            self, datetime, parser, calendar, **kwargs
+        )
+
+        # hash like datetime.datetime, since frozen date/times are equal to
+        # them
+        if self.epoch is None:
+            self.__hash = hash(None)
+
+        else:
+            self.__hash = hash(self.get_datetime())
+
+    def __ne__(self, other):
+
+        if not self.__is_datetime(other):
+            return NotImplemented
+
+        return compactdatetime.CompactDateTime.__ne__(self, other)
+
+    def __reduce__(self):
+
+        return (
+            functools.partial(
+                FrozenDateTime, epoch=self.epoch, calendar=self.calendar
+            ),
+            ()
+        )
+
+    def __repr__(self):
+
+        if self.epoch is None:
+            return "chrono.FrozenDateTime()"
+
+        return (
+            "chrono.FrozenDateTime(year={0}, month={1}, day={2}, "
+            "hour={3}, minute={4}, second={5})".format(*self.get())
+        )
+
+    def __setattr__(self, name, value):
+
+        # attributes can only be set until the hash is, in __init__()
+        try:
+            self.__hash
+
+        except AttributeError:
+            return compactdatetime.CompactDateTime.__setattr__(
+                self, name, value
+            )
+
+        raise AttributeError("FrozenDateTime objects can't be changed")
+
+    def __sub__(self, other):
+
+        result = compactdatetime.CompactDateTime.__sub__(self, other)
+
+        if isinstance(result, compactdatetime.CompactDateTime):
+            return FrozenDateTime(result, calendar=self.calendar)
+
+        return result
+
+    @staticmethod
+    def __is_datetime(value):
+        """
+        Returns True if value is a date/time, which is equal to a frozen
+        date/time only if it also hashes the same
+        """
+
+        return isinstance(value, (
+            compactdatetime.CompactDateTime, datetimemod.DateTime,
+            datetime.datetime
+        ))
+
+    def thaw(self):
+        """
+        Returns a mutable :class:`chrono.DateTime` with the same date/time
+        and calendar. Empty date/times give an empty
+        :class:`chrono.DateTime`.
+        """
+
+        result = datetimemod.DateTime(calendar=self.calendar)
+
+        if self.epoch is not None:
+            result.set(*self.get())
+
+        return result
@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+#
+# python-chrono - a Python module for easy and convenient date/time handling
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from __future__ import absolute_import
+
+from . import calendar
+from . import clock
+from . import datetime as datetimemod
+from . import error
+from . import formatter
+from . import time as timemod
+from . import utility
+
+import datetime
+import functools
+
+
+class FrozenTime(object):
+    """
+    An immutable, hashable class for time handling, for use as dictionary
+    keys and set members, such as for grouping and removing duplicates. The
+    time is stored as a single number of seconds since midnight in
+    :attr:`chrono.FrozenTime.seconds`, using slots instead of an instance
+    dictionary, and the attributes :attr:`chrono.FrozenTime.hour`,
+    :attr:`chrono.FrozenTime.minute` and :attr:`chrono.FrozenTime.second`
+    are calculated from it when accessed. The time can't be changed once it
+    is created - setting attributes raises :exc:`AttributeError`.
+
+    *time* and the keyword arguments can be any values accepted by
+    :class:`chrono.Time`, as well as another :class:`chrono.FrozenTime`.
+    Times which are not fully set give an empty frozen time.
+
+    The hash is calculated once, and is the same as for a
+    :class:`datetime.time` with the same time, so both can be mixed as
+    keys. Frozen times are never equal to date/times or other types of
+    values, such as strings. Use :meth:`chrono.Time.freeze` and
+    :meth:`chrono.FrozenTime.thaw` to convert to and from
+    :class:`chrono.Time`.
+    """
+
+    __slots__ = ("seconds", "__hash")
+
+    def __cmp__(self, other):
+
+        if not isinstance(other, FrozenTime):
+            other = FrozenTime(other)
+
+        if self.seconds is None and other.seconds is None:
+            return 0
+
+        elif other.seconds is None:
+            return 1
+
+        elif self.seconds is None:
+            return -1
+
+        return utility.cmp(self.seconds, other.seconds)
+
+    def __copy__(self):
+
+        return self
+
+    def __deepcopy__(self, memo):
+
+        return self
+
+    def __eq__(self, other):
+
+        if not self.__is_time(other):
+            return NotImplemented
+
+        return self.__cmp__(other) == 0
+
+    def __ge__(self, other):
+
+        return self.__cmp__(other) >= 0
+
+    def __gt__(self, other):
+
+        return self.__cmp__(other) > 0
+
+    def __hash__(self):
+
+        return self.__hash
+
+    def __init__(self, time=None, parser=None, **kwargs):
+
+        if isinstance(time, FrozenTime):
+            self.seconds = time.seconds
+
+        else:
+            if not isinstance(time, timemod.Time):
+                time = timemod.Time(time, parser, **kwargs)
+
+            if time.is_set():
+                self.seconds = time.hour * 3600 + time.minute * 60 + \
+                    time.second
+
+            else:
+                self.seconds = None
+
+        # hash like datetime.time, since frozen times are equal to them
+        if self.seconds is None:
+            self.__hash = hash(None)
+
+        else:
+            self.__hash = hash(self.get_datetime())
+
+    def __le__(self, other):
+
+        return self.__cmp__(other) <= 0
+
+    def __lt__(self, other):
+
+        return self.__cmp__(other) < 0
+
+    def __ne__(self, other):
+
+        if not self.__is_time(other):
+            return NotImplemented
+
+        return self.__cmp__(other) != 0
+
+    def __reduce__(self):
+
+        if self.seconds is None:
+            return (FrozenTime, ())
+
+        return (
+            functools.partial(
+                FrozenTime,
+                hour=self.hour, minute=self.minute, second=self.second
+            ),
+            ()
+        )
+
+    def __repr__(self):
+
+        if self.seconds is None:
+            return "chrono.FrozenTime()"
+
+        return "chrono.FrozenTime(hour={0}, minute={1}, second={2})".format(
+            *self.get()
+        )
+
+    def __setattr__(self, name, value):
+
+        # attributes can only be set until the hash is, in __init__()
+        try:
+            self.__hash
+
+        except AttributeError:
+            return object.__setattr__(self, name, value)
+
+        raise AttributeError("FrozenTime objects can't be changed")
+
+    def __str__(self):
+
+        try:
+            return self.get_string()
+
+        except error.NoDateTimeError:
+            return ""
+
+    @staticmethod
+    def __is_time(value):
+        """
+        Returns True if value is a time without a date, which is equal to a
+        frozen time only if it also hashes the same
+        """
+
+        return isinstance(
+            value, (FrozenTime, timemod.Time, datetime.time)
+        ) and not isinstance(value, datetimemod.DateTime)
+
+    @property
+    def hour(self):
+        "Hour, range 0-23, or **None** if no time is set."
+
+        if self.seconds is None:
+            return None
+
+        return self.seconds // 3600
+
+    @property
+    def minute(self):
+        "Minute, range 0-59, or **None** if no time is set."
+
+        if self.seconds is None:
+            return None
+
+        return self.seconds // 60 % 60
+
+    @property
+    def second(self):
+        "Second, range 0-59, or **None** if no time is set."
+
+        if self.seconds is None:
+            return None
+
+        return self.seconds % 60
+
+    def assert_set(self):
+        """
+        Makes sure the object has a time set.
+
+        Raises :exc:`chrono.error.NoDateTimeError` if no time is set.
+        """
+
+        if self.seconds is None:
+            raise error.NoDateTimeError(
+                "FrozenTime object doesn't contain time data"
+            )
+
+    def format(self, template):
+        """
+        Formats the time using *template*, replacing variables as
+        supported by :class:`chrono.formatter.Formatter`.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing time data.
+        """
+
+        self.assert_set()
+
+        return formatter.Formatter(calendar.ISOCalendar).format(
+            template, None, None, None, self.hour, self.minute, self.second
+        )
+
+    def get(self):
+        """
+        Returns the time as a tuple of hour, minute, and second.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing time data.
+        """
+
+        self.assert_set()
+
+        return (self.hour, self.minute, self.second)
+
+    def get_datetime(self):
+        """
+        Returns a :class:`datetime.time` instance based on the time.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing time data.
+        """
+
+        return datetime.time(*self.get())
+
+    def get_julian(self):
+        """
+        Returns a julian time for the time, as a float between 0 and 1.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing time data.
+        """
+
+        return clock.Clock.julian(*self.get())
+
+    def get_string(self):
+        """
+        Returns a string representation (*hh:mm:ss*) of the time.
+
+        Raises :exc:`chrono.error.NoDateTimeError` on missing time data.
+        """
+
+        return self.format("$0hour:$0minute:$0second")
+
+    def is_set(self):
+        """
+        Returns **True** if a time is set, otherwise **False**.
+        """
+
+        return self.seconds is not None
+
+    def thaw(self):
+        """
+        Returns a mutable :class:`chrono.Time` with the same time. Empty
+        times give an empty :class:`chrono.Time`.
+        """
+
+        if self.seconds is None:
+            return timemod.Time()
+
+        return timemod.Time(
+            hour=self.hour, minute=self.minute, second=self.second
+        )
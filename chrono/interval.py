@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+#
+# python-chrono - a Python module for easy and convenient date/time handling
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from __future__ import absolute_import
+
+from . import compactdate
+from . import compactdatetime
+from . import date
+from . import datetime as chronodatetime
+from . import duration
+
+import datetime as datetimemod
+
+
+class Interval(object):
+    """
+    A half-open interval of time, from *start* up to but not including
+    *end*. *start* and *end* can be :class:`chrono.Date`,
+    :class:`chrono.DateTime`, :class:`chrono.CompactDate`,
+    :class:`chrono.CompactDateTime`, :class:`datetime.date`, or
+    :class:`datetime.datetime` objects, or strings, which are parsed as
+    :class:`chrono.DateTime`. Dates are taken to start at midnight.
+
+    Both ends are converted to seconds since the start of the julian period
+    when the interval is created, so containment and overlap tests are plain
+    integer comparisons.
+
+    Raises :exc:`ValueError` if *end* is before *start*,
+    :exc:`chrono.error.NoDateTimeError` if either end has no date/time set,
+    and :exc:`TypeError` for invalid input type.
+    """
+
+    end = None
+    "End of the interval, not included in the interval."
+
+    start = None
+    "Start of the interval."
+
+    def __contains__(self, value):
+
+        return self.contains(value)
+
+    def __eq__(self, other):
+
+        if not isinstance(other, Interval):
+            return NotImplemented
+
+        return (
+            self.__start == other.__start and self.__end == other.__end
+        )
+
+    def __hash__(self):
+
+        return hash((self.__start, self.__end))
+
+    def __init__(self, start, end):
+
+        if isinstance(start, str):
+            start = chronodatetime.DateTime(start)
+
+        if isinstance(end, str):
+            end = chronodatetime.DateTime(end)
+
+        self.__start = self.__seconds(start)
+        self.__end = self.__seconds(end)
+
+        if self.__end < self.__start:
+            raise ValueError(
+                "Interval end '{0}' is before start '{1}'".format(end, start)
+            )
+
+        self.start = start
+        self.end = end
+
+    def __ne__(self, other):
+
+        if not isinstance(other, Interval):
+            return NotImplemented
+
+        return not self.__eq__(other)
+
+    def __repr__(self):
+
+        return "chrono.Interval({0!r}, {1!r})".format(self.start, self.end)
+
+    @staticmethod
+    def __seconds(value):
+        "Returns seconds since the start of the julian period for a value"
+
+        if isinstance(value, compactdatetime.CompactDateTime):
+            value.assert_set()
+
+            return value.epoch + 210866803200
+
+        elif isinstance(value, chronodatetime.DateTime):
+            return date.Date.get_julian(value) * 86400 + (
+                value.hour * 3600 + value.minute * 60 + value.second
+            )
+
+        elif isinstance(value, (date.Date, compactdate.CompactDate)):
+            return value.get_julian() * 86400
+
+        elif isinstance(value, datetimemod.datetime):
+            return (value.toordinal() + 1721425) * 86400 + (
+                value.hour * 3600 + value.minute * 60 + value.second
+            )
+
+        elif isinstance(value, datetimemod.date):
+            return (value.toordinal() + 1721425) * 86400
+
+        raise TypeError("Invalid type for Interval value")
+
+    def contains(self, value):
+        """
+        Returns **True** if *value* is within the interval. *value* can be
+        any type accepted for the interval ends, or another
+        :class:`chrono.Interval`, which is contained if it lies entirely
+        within the interval.
+        """
+
+        if isinstance(value, Interval):
+            return self.__start <= value.__start and value.__end <= self.__end
+
+        if isinstance(value, str):
+            value = chronodatetime.DateTime(value)
+
+        return self.__start <= self.__seconds(value) < self.__end
+
+    def duration(self):
+        """
+        Returns the length of the interval as a :class:`chrono.Duration`.
+        """
+
+        return duration.Duration(seconds=self.__end - self.__start)
+
+    def intersection(self, other):
+        """
+        Returns the interval covered by both the interval and the
+        :class:`chrono.Interval` *other*, or **None** if they don't overlap.
+
+        Raises :exc:`TypeError` if *other* is not an interval.
+        """
+
+        if not self.overlaps(other):
+            return None
+
+        return Interval(
+            self.start if self.__start >= other.__start else other.start,
+            self.end if self.__end <= other.__end else other.end
+        )
+
+    def is_empty(self):
+        """
+        Returns **True** if the interval has zero length.
+        """
+
+        return self.__start == self.__end
+
+    def overlaps(self, other):
+        """
+        Returns **True** if the interval and the :class:`chrono.Interval`
+        *other* have any time in common.
+
+        Raises :exc:`TypeError` if *other* is not an interval.
+        """
+
+        if not isinstance(other, Interval):
+            raise TypeError("Input is not an Interval")
+
+        return self.__start < other.__end and other.__start < self.__end
@@ -23,8 +23,13 @@ This module contains classes for parsing various date/time formats.
 subclasses.
 """
 
+from .bulk import ParseResult, parse_many
+from .cache import ParseCache
 from .common import CommonParser
 from .euro import EuroParser
+from .infer import InferredParser, infer
 from .iso import ISOParser
 from .parser import Parser
+from .stream import StreamParser
+from .template import TemplateParser
 from .us import USParser
@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+#
+# python-chrono - a Python module for easy and convenient date/time handling
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+
+from __future__ import absolute_import
+
+from .. import calendar
+from .. import defaults
+
+import array
+import chrono
+import os
+
+
+class ParseResult(object):
+    """
+    The result of :func:`chrono.parser.parse_many`, with the parsed
+    date/times in input order, in either
+    :attr:`chrono.parser.ParseResult.epoch` or
+    :attr:`chrono.parser.ParseResult.columns`.
+    """
+
+    chunks = None
+    """
+    List of tuples with start index, end index, and number of invalid
+    values, for each chunk of the input.
+    """
+
+    columns = None
+    """
+    Tuple of :class:`array.array` columns with year (type ``h``), month,
+    day, hour, minute, and second (type ``b``), if *columns* was **True**,
+    otherwise **None**.
+    """
+
+    epoch = None
+    """
+    :class:`array.array` of type ``q`` with UNIX timestamps, the date/times
+    interpreted as UTC, if *columns* was **False**, otherwise **None**.
+    """
+
+    errors = None
+    """
+    List of tuples with index and exception for each invalid value, in
+    input order. Invalid values are stored as 0 in the arrays.
+    """
+
+    def __init__(self, epoch=None, columns=None, errors=(), chunks=()):
+
+        self.epoch = epoch
+        self.columns = columns
+        self.errors = list(errors)
+        self.chunks = list(chunks)
+
+    def __len__(self):
+
+        return len(self.epoch if self.columns is None else self.columns[0])
+
+    def __repr__(self):
+
+        return "<chrono.parser.ParseResult: {0} values, {1} errors>".format(
+            len(self), len(self.errors)
+        )
+
+
+# parameters for the current worker process, set by __initialize()
+__worker = {}
+
+
+def __initialize(parser, columns, errors, name, total):
+    "Initializes a worker process"
+
+    from multiprocessing import shared_memory
+
+    __worker.update(
+        parser=parser, columns=columns, errors=errors, total=total,
+        memory=shared_memory.SharedMemory(name)
+    )
+
+
+def __parse(strings, parser, columns, errors):
+    """
+    Parses *strings*, and returns the values as an array of timestamps or
+    a tuple of columns, and a list of tuples of index and exception for
+    invalid values. Stops at the first invalid value if *errors* is
+    ``raise``.
+    """
+
+    parse = parser.parse_datetime
+    values = []
+    failures = []
+
+    # invalid values are stored as 0, ie 1970-01-01 00:00:00 for timestamps
+    invalid = (0, 0, 0, 0, 0, 0) if columns else (1970, 1, 1, 0, 0, 0)
+
+    for index, string in enumerate(strings):
+        try:
+            values.append(parse(string))
+
+        except (ValueError, TypeError) as e:
+            failures.append((index, e))
+
+            if errors == "raise":
+                break
+
+            values.append(invalid)
+
+    if not columns:
+        return (calendar.Calendar.unix_utc_many(values), failures)
+
+    result = [array.array("h")] + [array.array("b") for i in range(5)]
+
+    for column, value in zip(result, zip(*values)):
+        column.extend(value)
+
+    return (tuple(result), failures)
+
+
+def __work(start, strings):
+    """
+    Parses a chunk of strings starting at index *start* in a worker
+    process, writes the values to shared memory, and returns the invalid
+    values
+    """
+
+    worker = __worker
+    values, failures = __parse(
+        strings, worker["parser"], worker["columns"], worker["errors"]
+    )
+    buf = worker["memory"].buf
+
+    if worker["columns"]:
+        total = worker["total"]
+        data = values[0].tobytes()
+        buf[start * 2:start * 2 + len(data)] = data
+
+        for i, column in enumerate(values[1:]):
+            offset = total * 2 + total * i + start
+            buf[offset:offset + len(column)] = column.tobytes()
+
+    else:
+        data = values.tobytes()
+        buf[start * 8:start * 8 + len(data)] = data
+
+    return [(start + index, e) for index, e in failures]
+
+
+def parse_many(
+    strings, parser=None, workers=None, chunksize=65536, columns=False,
+    errors="raise"
+):
+    """
+    Parses a large sequence of date/time strings in parallel, using a
+    :class:`concurrent.futures.ProcessPoolExecutor` with *workers*
+    processes (by default the number of CPUs), and returns a
+    :class:`chrono.parser.ParseResult` with the values in input order.
+
+    The input is split into chunks of *chunksize* strings, which are parsed
+    with the ``parse_datetime()`` method of *parser* - by default the value
+    of :attr:`chrono.DEFAULT_PARSER`, normally
+    :class:`chrono.parser.CommonParser` - so the results are the same as
+    when parsing each string separately. The values are returned as an
+    array of UNIX timestamps, with the date/times interpreted as UTC, or
+    if *columns* is **True**, as arrays of years, months, days, hours,
+    minutes, and seconds. The workers write the values directly to shared
+    memory, so only the input strings and any errors are pickled.
+
+    If *errors* is ``raise``, the error for the first invalid value is
+    raised, as raised by the parser. If it is ``collect``, invalid values
+    are stored as 0, and listed in :attr:`chrono.parser.ParseResult.errors`
+    and :attr:`chrono.parser.ParseResult.chunks`.
+
+    The input is parsed in the current process if *workers* is 1, or the
+    input fits in a single chunk. The parser must be picklable on
+    platforms which start worker processes by spawning, such as Windows
+    and macOS - parser classes returned by
+    :meth:`chrono.parser.Parser.cached` and :func:`chrono.parser.infer`
+    are not.
+
+    Raises :exc:`ValueError` for invalid *errors* values, and
+    :exc:`chrono.error.ParseError` or an appropriate
+    :exc:`chrono.error.DateTimeError` subclass for invalid input, if
+    *errors* is ``raise``.
+    """
+
+    if errors not in ("raise", "collect"):
+        raise ValueError("Invalid errors value '{0}'".format(errors))
+
+    if chunksize < 1:
+        raise ValueError("Invalid chunk size '{0}'".format(chunksize))
+
+    parser = parser or defaults.active and \
+        defaults.current_parser.get() or chrono.DEFAULT_PARSER
+    workers = workers or os.cpu_count() or 1
+
+    if not isinstance(strings, (list, tuple)):
+        strings = list(strings)
+
+    total = len(strings)
+    starts = range(0, total, chunksize)
+    shared_memory = None
+
+    # the modules for parallel parsing are slow to import, so they are only
+    # imported when they are used, instead of when importing chrono.parser
+    if workers > 1 and total > chunksize:
+        try:
+            from multiprocessing import shared_memory
+
+        except ImportError:
+            pass
+
+    if shared_memory is None:
+        values, failures = __parse(strings, parser, columns, errors)
+
+        if failures and errors == "raise":
+            raise failures[0][1]
+
+        chunks = [
+            (
+                start, min(start + chunksize, total),
+                sum(1 for i, e in failures if start <= i < start + chunksize)
+            )
+            for start in starts
+        ]
+
+        if columns:
+            return ParseResult(None, values, failures, chunks)
+
+        return ParseResult(values, None, failures, chunks)
+
+    import concurrent.futures
+
+    memory = shared_memory.SharedMemory(
+        create=True, size=total * (7 if columns else 8)
+    )
+
+    try:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(workers, len(starts)),
+            initializer=__initialize,
+            initargs=(parser, columns, errors, memory.name, total)
+        ) as executor:
+            futures = [
+                executor.submit(
+                    __work, start, strings[start:start + chunksize]
+                )
+                for start in starts
+            ]
+
+            failures = []
+            chunks = []
+
+            for start, future in zip(starts, futures):
+                result = future.result()
+
+                if result and errors == "raise":
+                    for f in futures:
+                        f.cancel()
+
+                    raise result[0][1]
+
+                failures.extend(result)
+                chunks.append(
+                    (start, min(start + chunksize, total), len(result))
+                )
+
+        buf = memory.buf
+
+        try:
+            if columns:
+                values = [array.array("h")] + [
+                    array.array("b") for i in range(5)
+                ]
+                values[0].frombytes(buf[:total * 2])
+
+                for i, column in enumerate(values[1:]):
+                    offset = total * 2 + total * i
+                    column.frombytes(buf[offset:offset + total])
+
+                return ParseResult(None, tuple(values), failures, chunks)
+
+            epoch = array.array("q")
+            epoch.frombytes(buf[:total * 8])
+
+            return ParseResult(epoch, None, failures, chunks)
+
+        finally:
+            del buf
+
+    finally:
+        memory.close()
+        memory.unlink()
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+#
+# python-chrono - a Python module for easy and convenient date/time handling
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from __future__ import absolute_import
+
+from .. import error
+
+import collections
+import threading
+
+
+class ParseCache(object):
+    """
+    A thread-safe cache of parse results, keyed on parse method and input
+    string. Normally created by :meth:`chrono.parser.Parser.cached`, which
+    returns a parser class using the cache.
+
+    *size* is the maximum number of cached results, or **None** for an
+    unbounded cache. When the cache is full, entries are evicted according
+    to *policy*, which is either ``lru`` (least recently used) or ``fifo``
+    (first in, first out).
+
+    If *errors* is **True**, invalid input is cached as well, and raises the
+    same :exc:`chrono.error.ParseError` or
+    :exc:`chrono.error.DateTimeError` on every lookup. Non-string input is
+    never cached.
+
+    Raises :exc:`ValueError` for invalid policy.
+    """
+
+    hits = None
+    "Number of lookups found in the cache."
+
+    misses = None
+    "Number of lookups not found in the cache."
+
+    def __init__(self, size=1024, policy="lru", errors=True):
+
+        if policy not in ("lru", "fifo"):
+            raise ValueError("Invalid cache policy '{0}'".format(policy))
+
+        self.size = size
+        self.policy = policy
+        self.errors = errors
+        self.hits = 0
+        self.misses = 0
+
+        self.__items = collections.OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+
+        return len(self.__items)
+
+    def clear(self):
+        """
+        Removes all entries from the cache, and resets the hit and miss
+        counters.
+        """
+
+        with self.__lock:
+            self.__items.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def lookup(self, function, value):
+        """
+        Returns the result of calling *function* with *value*, using the
+        cached result if available. Cached errors are raised again.
+        """
+
+        if not isinstance(value, str):
+            return function(value)
+
+        key = (function.__name__, value)
+
+        with self.__lock:
+            entry = self.__items.get(key)
+
+            if entry is None:
+                self.misses += 1
+
+            else:
+                self.hits += 1
+
+                if self.policy == "lru":
+                    self.__items.move_to_end(key)
+
+        if entry is None:
+
+            # parse outside of the lock, so threads don't wait on each other
+            try:
+                entry = (function(value), None)
+
+            except (error.ParseError, error.DateTimeError) as e:
+                if not self.errors:
+                    raise
+
+                entry = (None, (type(e), e.args))
+
+            with self.__lock:
+                self.__items[key] = entry
+
+                while self.size is not None and len(self.__items) > self.size:
+                    self.__items.popitem(last=False)
+
+        result, exception = entry
+
+        # raise a new exception each time, to avoid tracebacks piling up
+        if exception is not None:
+            raise exception[0](*exception[1])
+
+        return result
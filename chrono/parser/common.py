@@ -65,7 +65,7 @@ class CommonParser(parser.Parser):
     as 0.
     """
 
-    re_datetime = re.compile('''
+    re_datetime = parser.LazyPattern('''
         ^\s*                    # ignore whitespace at start
         (?P<date>\S+?)          # date
         (?P<sep>\s+|T)          # separator
@@ -73,6 +73,64 @@ class CommonParser(parser.Parser):
         \s*$                    # ignore whitespace at end
     ''', re.VERBOSE | re.IGNORECASE)
 
+    @classmethod
+    def __date_format(cls, date):
+
+        if not isinstance(date, str):
+            raise TypeError("Input is not a string")
+
+        # the supported formats are told apart by their separators, so only
+        # the single parser matching the shape of the input needs to be run
+        if "/" in date:
+            return (USParser, "date")
+
+        elif "." in date:
+            return (EuroParser, "date")
+
+        elif "W" in date or "w" in date:
+            if date.count("-") > 1:
+                return (ISOParser, "weekdate")
+
+            else:
+                return (ISOParser, "week")
+
+        elif date.count("-") > 1:
+            return (ISOParser, "date")
+
+        elif "-" in date:
+            if len(date.split("-")[1].strip()) == 3:
+                return (ISOParser, "ordinal")
+
+            else:
+                return (ISOParser, "month")
+
+        else:
+            return (ISOParser, "year")
+
+    @classmethod
+    def __time_format(cls, time):
+
+        if not isinstance(time, str):
+            raise TypeError("Input is not a string")
+
+        # US times are recognized by their am/pm suffix, and compact times
+        # by a third digit following the hour
+        stripped = time.strip()
+
+        if "m" in stripped or "M" in stripped:
+            if ":" in stripped or not stripped[2:3].isdigit():
+                return (USParser, "time")
+
+            else:
+                return (USParser, "compacttime")
+
+        else:
+            if ":" in stripped or not stripped[2:3].isdigit():
+                return (ISOParser, "time")
+
+            else:
+                return (ISOParser, "compacttime")
+
     @classmethod
     def parse_date(cls, date):
         """
@@ -84,23 +142,13 @@ class CommonParser(parser.Parser):
         :exc:`chrono.error.DateError` subclass for invalid date values.
         """
 
-        parsers = (
-            USParser.date,
-            EuroParser.date,
-            ISOParser.date,
-            ISOParser.ordinal,
-            ISOParser.weekdate,
-            ISOParser.week,
-            ISOParser.month,
-            ISOParser.year
-        )
+        parser, name = cls.__date_format(date)
 
-        for parser in parsers:
-            try:
-                return parser(date)
+        try:
+            return getattr(parser, name)(date)
 
-            except error.ParseError:
-                pass
+        except error.ParseError:
+            pass
 
         raise error.ParseError("Invalid date value '{0}'".format(date))
 
@@ -138,18 +186,67 @@ class CommonParser(parser.Parser):
         values.
         """
 
-        parsers = (
-            ISOParser.time,
-            ISOParser.compacttime,
-            USParser.time,
-            USParser.compacttime
-        )
+        parser, name = cls.__time_format(time)
 
-        for parser in parsers:
-            try:
-                return parser(time)
+        try:
+            return getattr(parser, name)(time)
 
-            except error.ParseError:
-                pass
+        except error.ParseError:
+            pass
 
         raise error.ParseError("Invalid time value '{0}'".format(time))
+
+    @classmethod
+    def try_parse_date(cls, date):
+        """
+        Parses a date like :meth:`chrono.parser.CommonParser.parse_date`, but
+        returns **None** instead of raising an error for invalid input format
+        or date values, without raising exceptions internally.
+
+        Raises :exc:`TypeError` for invalid input type.
+        """
+
+        parser, name = cls.__date_format(date)
+
+        return parser.try_format(name, date)
+
+    @classmethod
+    def try_parse_datetime(cls, datetime):
+        """
+        Parses a date and time like
+        :meth:`chrono.parser.CommonParser.parse_datetime`, but returns
+        **None** instead of raising an error for invalid input format or
+        datetime values, without raising exceptions internally.
+
+        Raises :exc:`TypeError` for invalid input type.
+        """
+
+        match = cls.match(cls.re_datetime, datetime)
+
+        if match is None:
+            return None
+
+        elif match["sep"].upper() == "T":
+            return ISOParser.try_parse_datetime(datetime)
+
+        date = cls.try_parse_date(match["date"])
+        time = cls.try_parse_time(match["time"])
+
+        if date is None or time is None:
+            return None
+
+        return date + time
+
+    @classmethod
+    def try_parse_time(cls, time):
+        """
+        Parses a time like :meth:`chrono.parser.CommonParser.parse_time`, but
+        returns **None** instead of raising an error for invalid input format
+        or time values, without raising exceptions internally.
+
+        Raises :exc:`TypeError` for invalid input type.
+        """
+
+        parser, name = cls.__time_format(time)
+
+        return parser.try_format(name, time)
@@ -55,7 +55,9 @@ class EuroParser(parser.Parser):
     as 0.
     """
 
-    re_compactdate = re.compile('''
+    two_digit_years = True
+
+    re_compactdate = parser.LazyPattern('''
         ^\s*                    # ignore whitespace at start
         (?P<day>\d{2})          # day
         (?P<month>\d{2})        # month
@@ -63,7 +65,7 @@ class EuroParser(parser.Parser):
         \s*$                    # ignore whitespace at end
     ''', re.VERBOSE)
 
-    re_dashdate = re.compile('''
+    re_dashdate = parser.LazyPattern('''
         ^\s*                    # strip whitespace
         (?P<day>\d{1,2})        # day
         -(?P<month>\d{1,2})     # month
@@ -71,7 +73,7 @@ class EuroParser(parser.Parser):
         \s*$                    # strip whitespace
     ''', re.VERBOSE)
 
-    re_date = re.compile('''
+    re_date = parser.LazyPattern('''
         ^\s*                    # ignore whitespace at start
         (?P<day>\d{1,2})        # day
         \.(?P<month>\d{1,2})    # month
@@ -79,7 +81,7 @@ class EuroParser(parser.Parser):
         \s*$                    # ignore whitespace at end
     ''', re.VERBOSE)
 
-    re_datetime = re.compile('''
+    re_datetime = parser.LazyPattern('''
         ^\s*                    # ignore whitespace at start
         (?P<date>\S+)           # date
         \s+                     # separator
@@ -87,7 +89,7 @@ class EuroParser(parser.Parser):
         \s*$                    # ignore whitespace at end
     ''', re.VERBOSE | re.IGNORECASE)
 
-    re_slashdate = re.compile('''
+    re_slashdate = parser.LazyPattern('''
         ^\s*                    # strip whitespace
         (?P<day>\d{1,2})        # day
         /(?P<month>\d{1,2})     # month
@@ -254,8 +256,6 @@ class EuroParser(parser.Parser):
         parsers = (
             cls.time,
             cls.compacttime,
-            cls.dashdate,
-            cls.slashdate,
         )
 
         for parser in parsers:
@@ -309,3 +309,66 @@ class EuroParser(parser.Parser):
         """
 
         return ISOParser.time(time)
+
+    @classmethod
+    def try_parse_date(cls, date):
+        """
+        Parses a european date like
+        :meth:`chrono.parser.EuroParser.parse_date`, but returns **None**
+        instead of raising an error for invalid input format or date values,
+        without raising exceptions internally.
+
+        Raises :exc:`TypeError` for invalid input type.
+        """
+
+        formats = (
+            "date",
+            "compactdate",
+            "dashdate",
+            "slashdate",
+        )
+
+        for name in formats:
+            parsed = cls.try_format(name, date)
+
+            if parsed is not None:
+                return parsed
+
+        return None
+
+    @classmethod
+    def try_parse_datetime(cls, datetime):
+        """
+        Parses a european datetime like
+        :meth:`chrono.parser.EuroParser.parse_datetime`, but returns **None**
+        instead of raising an error for invalid input format or datetime
+        values, without raising exceptions internally.
+
+        Raises :exc:`TypeError` for invalid input type.
+        """
+
+        match = cls.match(cls.re_datetime, datetime)
+
+        if match is None:
+            return None
+
+        date = cls.try_parse_date(match["date"])
+        time = cls.try_parse_time(match["time"])
+
+        if date is None or time is None:
+            return None
+
+        return date + time
+
+    @classmethod
+    def try_parse_time(cls, time):
+        """
+        Parses a european time like
+        :meth:`chrono.parser.EuroParser.parse_time`, but returns **None**
+        instead of raising an error for invalid input format or time values,
+        without raising exceptions internally.
+
+        Raises :exc:`TypeError` for invalid input type.
+        """
+
+        return ISOParser.try_parse_time(time)
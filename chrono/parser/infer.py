@@ -0,0 +1,331 @@
+# -*- coding: utf-8 -*-
+#
+# python-chrono - a Python module for easy and convenient date/time handling
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from __future__ import absolute_import
+
+from . import parser
+from .common import CommonParser
+from .euro import EuroParser
+from .iso import ISOParser
+from .us import USParser
+from .. import error
+
+
+class InferredParser(parser.Parser):
+    """
+    Base class for the single-format parsers returned by
+    :func:`chrono.parser.infer`. Each subclass parses values in one format
+    only, by calling the parser method for that format directly, without
+    trying other formats first.
+
+    Parsers for date formats implement
+    :meth:`chrono.parser.InferredParser.parse_date`, parsers for time
+    formats implement :meth:`chrono.parser.InferredParser.parse_time`, and
+    parsers for datetime formats implement all three ``parse_*`` methods.
+    Unsupported methods raise :exc:`chrono.error.ParseError`.
+    """
+
+    alternatives = ()
+    """
+    Other formats which were also consistent with the samples, in order of
+    preference.
+    """
+
+    ambiguous = False
+    """
+    **True** if the samples were consistent with both US (month first) and
+    european (day first) ordering, in which case the preferred format
+    (normally US, like :class:`chrono.parser.CommonParser`) is used.
+    """
+
+    date_formats = (
+        ISOParser.date,
+        ISOParser.compactdate,
+        ISOParser.weekdate,
+        ISOParser.compactweekdate,
+        ISOParser.week,
+        ISOParser.compactweek,
+        ISOParser.ordinal,
+        ISOParser.compactordinal,
+        ISOParser.month,
+        ISOParser.year,
+        USParser.date,
+        USParser.namedate,
+        USParser.dashdate,
+        EuroParser.date,
+        USParser.dotdate,
+        USParser.compactdate,
+        EuroParser.slashdate,
+        EuroParser.dashdate,
+        EuroParser.compactdate,
+    )
+    """
+    Parser methods for the date formats tried by :func:`chrono.parser.infer`,
+    in order of preference.
+    """
+
+    date_parser = None
+    "Parser method for the date format, or **None**."
+
+    format = None
+    """
+    Name of the format, as parser method names such as ``USParser.date``,
+    or ``ISOParser.date ISOParser.time`` for datetimes.
+    """
+
+    time_formats = (
+        ISOParser.time,
+        ISOParser.compacttime,
+        USParser.time,
+        USParser.compacttime,
+    )
+    """
+    Parser methods for the time formats tried by :func:`chrono.parser.infer`,
+    in order of preference.
+    """
+
+    time_parser = None
+    "Parser method for the time format, or **None**."
+
+    @classmethod
+    def parse_date(cls, date):
+        """
+        Parses a date in the inferred format, and returns a tuple with year,
+        month, and day.
+
+        Raises :exc:`chrono.error.ParseError` for invalid input format,
+        :exc:`TypeError` for invalid input type, and an appropriate
+        :exc:`chrono.error.DateError` subclass for invalid date values.
+        """
+
+        if cls.date_parser is None:
+            raise error.ParseError(
+                "The format '{0}' doesn't contain a date".format(cls.format)
+            )
+
+        return cls.date_parser(date)
+
+    @classmethod
+    def parse_datetime(cls, datetime):
+        """
+        Parses a date and time in the inferred format, and returns a tuple
+        with year, month, day, hour, minute, and second.
+
+        Raises :exc:`chrono.error.ParseError` for invalid input format,
+        :exc:`TypeError` for invalid input type, and an appropriate
+        :exc:`chrono.error.DateTimeError` subclass for invalid datetime
+        values.
+        """
+
+        if cls.date_parser is None or cls.time_parser is None:
+            raise error.ParseError(
+                "The format '{0}' doesn't contain a date and time"
+                .format(cls.format)
+            )
+
+        match = cls.regexp(CommonParser.re_datetime, datetime)
+
+        return cls.date_parser(match["date"]) + cls.time_parser(match["time"])
+
+    @classmethod
+    def parse_time(cls, time):
+        """
+        Parses a time in the inferred format, and returns a tuple with hour,
+        minute, and second.
+
+        Raises :exc:`chrono.error.ParseError` for invalid input format,
+        :exc:`TypeError` for invalid input type, and an appropriate
+        :exc:`chrono.error.TimeError` subclass for invalid time values.
+        """
+
+        if cls.time_parser is None:
+            raise error.ParseError(
+                "The format '{0}' doesn't contain a time".format(cls.format)
+            )
+
+        return cls.time_parser(time)
+
+    @classmethod
+    def try_parse_date(cls, date):
+        """
+        Parses a date like :meth:`chrono.parser.InferredParser.parse_date`,
+        but returns **None** instead of raising an error for invalid input
+        format or date values, without raising exceptions internally.
+
+        Raises :exc:`TypeError` for invalid input type.
+        """
+
+        if cls.date_parser is None:
+            return None
+
+        return cls.date_parser.__self__.try_format(
+            cls.date_parser.__name__, date
+        )
+
+    @classmethod
+    def try_parse_datetime(cls, datetime):
+        """
+        Parses a date and time like
+        :meth:`chrono.parser.InferredParser.parse_datetime`, but returns
+        **None** instead of raising an error for invalid input format or
+        datetime values, without raising exceptions internally.
+
+        Raises :exc:`TypeError` for invalid input type.
+        """
+
+        if cls.date_parser is None or cls.time_parser is None:
+            return None
+
+        match = cls.match(CommonParser.re_datetime, datetime)
+
+        if match is None:
+            return None
+
+        date = cls.try_parse_date(match["date"])
+        time = cls.try_parse_time(match["time"])
+
+        if date is None or time is None:
+            return None
+
+        return date + time
+
+    @classmethod
+    def try_parse_time(cls, time):
+        """
+        Parses a time like :meth:`chrono.parser.InferredParser.parse_time`,
+        but returns **None** instead of raising an error for invalid input
+        format or time values, without raising exceptions internally.
+
+        Raises :exc:`TypeError` for invalid input type.
+        """
+
+        if cls.time_parser is None:
+            return None
+
+        return cls.time_parser.__self__.try_format(
+            cls.time_parser.__name__, time
+        )
+
+
+def infer(samples):
+    """
+    Infers the format of the strings in the iterable *samples*, by finding
+    the formats supported by :class:`chrono.parser.ISOParser`,
+    :class:`chrono.parser.USParser`, and :class:`chrono.parser.EuroParser`
+    which can parse all of the samples - dates, times, or datetimes (date
+    and time separated by whitespace or *T*). Returns a subclass of
+    :class:`chrono.parser.InferredParser` which only parses the preferred
+    format, with any other consistent formats listed in
+    :attr:`chrono.parser.InferredParser.alternatives`.
+
+    Formats are preferred in the order ISO, US, and european, except for
+    dot-separated dates, where the european format is preferred - the same
+    as :class:`chrono.parser.CommonParser`, which parses *03/04/2010* as
+    US and *03.04.2010* as european. Samples which are consistent with both
+    US and european ordering are marked with
+    :attr:`chrono.parser.InferredParser.ambiguous`.
+
+    Raises :exc:`chrono.error.ParseError` if no samples are given or no
+    single format can parse all samples, and :exc:`TypeError` for invalid
+    input type.
+    """
+
+    dates = InferredParser.date_formats
+    times = InferredParser.time_formats
+
+    candidates = [
+        (date, None) for date in dates
+    ] + [
+        (date, time) for date in dates for time in times
+    ] + [
+        (None, time) for time in times
+    ]
+
+    count = 0
+
+    for sample in samples:
+        count += 1
+        split = None
+
+        if not isinstance(sample, str):
+            raise TypeError("Input is not a string")
+
+        match = CommonParser.re_datetime.match(sample)
+
+        if match:
+            split = (match.group("date"), match.group("time"))
+
+        matching = []
+
+        for date, time in candidates:
+            try:
+                if date and time:
+                    if split is None:
+                        continue
+
+                    date(split[0])
+                    time(split[1])
+
+                elif date:
+                    date(sample)
+
+                else:
+                    time(sample)
+
+            except (error.ParseError, error.DateTimeError):
+                continue
+
+            matching.append((date, time))
+
+        candidates = matching
+
+        if not candidates:
+            raise error.ParseError(
+                "No consistent format found for value '{0}'".format(sample)
+            )
+
+    if not count:
+        raise error.ParseError("No samples to infer format from")
+
+    names = [
+        " ".join(
+            "{0}.{1}".format(f.__self__.__name__, f.__name__)
+            for f in candidate if f is not None
+        )
+        for candidate in candidates
+    ]
+
+    # dates are ambiguous if both US and european orderings are consistent
+    owners = set(
+        date.__self__ for date, time in candidates if date is not None
+    )
+    ambiguous = (
+        candidates[0][0] is not None and
+        candidates[0][0].__self__ in (USParser, EuroParser) and
+        USParser in owners and EuroParser in owners
+    )
+
+    return type("InferredParser", (InferredParser,), {
+        "__module__": __name__,
+        "alternatives": tuple(names[1:]),
+        "ambiguous": ambiguous,
+        "date_parser": candidates[0][0],
+        "format": names[0],
+        "time_parser": candidates[0][1],
+    })
+
@@ -61,7 +61,7 @@ class ISOParser(parser.Parser):
     as 0.
     """
 
-    re_compactdate = re.compile('''
+    re_compactdate = parser.LazyPattern('''
         ^\s*                    # ignore whitespace at start
         (?P<year>\d{4})         # year
         (?P<month>\d{2})        # month
@@ -69,14 +69,14 @@ class ISOParser(parser.Parser):
         \s*$                    # ignore whitespace at end
     ''', re.VERBOSE)
 
-    re_compactordinal = re.compile('''
+    re_compactordinal = parser.LazyPattern('''
         ^\s*                    # ignore whitespace at start
         (?P<year>\d{4})         # year
         (?P<day>\d{3})          # day
         \s*$                    # ignore whitespace at end
     ''', re.VERBOSE)
 
-    re_compacttime = re.compile('''
+    re_compacttime = parser.LazyPattern('''
         ^\s*                    # ignore whitespace at start
         (?P<hour>\d{2})         # hour
         (?:(?P<minute>\d{2}))?  # minute
@@ -84,14 +84,14 @@ class ISOParser(parser.Parser):
         \s*$                    # ignore whitespace at end
     ''', re.VERBOSE)
 
-    re_compactweek = re.compile('''
+    re_compactweek = parser.LazyPattern('''
         ^\s*                    # ignore whitespace at start
         (?P<year>\d{1,4})       # year
         W(?P<week>\d{1,2})      # week
         \s*$                    # ignore whitespace at end
     ''', re.VERBOSE | re.IGNORECASE)
 
-    re_compactweekdate = re.compile('''
+    re_compactweekdate = parser.LazyPattern('''
         ^\s*                    # ignore whitespace at start
         (?P<year>\d{4})         # year
         W(?P<week>\d{2})        # week
@@ -99,7 +99,7 @@ class ISOParser(parser.Parser):
         \s*$                    # ignore whitespace at end
     ''', re.VERBOSE | re.IGNORECASE)
 
-    re_date = re.compile('''
+    re_date = parser.LazyPattern('''
         ^\s*                    # ignore whitespace at start
         (?P<year>\d{1,4})       # year
         -(?P<month>\d{1,2})     # month
@@ -107,7 +107,7 @@ class ISOParser(parser.Parser):
         \s*$                    # ignore whitespace at end
     ''', re.VERBOSE)
 
-    re_datetime = re.compile('''
+    re_datetime = parser.LazyPattern('''
         ^\s*                    # ignore whitespace at start
         (?P<date>\S+?)          # date
         (?:T|\s+)               # separator
@@ -115,21 +115,21 @@ class ISOParser(parser.Parser):
         \s*$                    # ignore whitespace at end
     ''', re.VERBOSE | re.IGNORECASE)
 
-    re_month = re.compile('''
+    re_month = parser.LazyPattern('''
         ^\s*                    # ignore whitespace at start
         (?P<year>\d{1,4})       # year
         -(?P<month>\d{1,2})     # month
         \s*$                    # ignore whitespace at end
     ''', re.VERBOSE)
 
-    re_ordinal = re.compile('''
+    re_ordinal = parser.LazyPattern('''
         ^\s*                    # ignore whitespace at start
         (?P<year>\d{4})         # year
         -(?P<day>\d{3})         # day
         \s*$                    # ignore whitespace at end
     ''', re.VERBOSE)
 
-    re_time = re.compile('''
+    re_time = parser.LazyPattern('''
         ^\s*                    # ignore whitespace at start
         (?P<hour>\d{1,2})       # hour
         (?::(?P<minute>\d{1,2}))? # minute
@@ -137,14 +137,14 @@ class ISOParser(parser.Parser):
         \s*$                    # ignore whitespace at end
     ''', re.VERBOSE)
 
-    re_week = re.compile('''
+    re_week = parser.LazyPattern('''
         ^\s*                    # ignore whitespace at start
         (?P<year>\d{1,4})       # year
         -W(?P<week>\d{1,2})     # week
         \s*$                    # ignore whitespace at end
     ''', re.VERBOSE | re.IGNORECASE)
 
-    re_weekdate = re.compile('''
+    re_weekdate = parser.LazyPattern('''
         ^\s*                    # ignore whitespace at start
         (?P<year>\d{1,4})       # year
         -W(?P<week>\d{1,2})     # week
@@ -152,7 +152,7 @@ class ISOParser(parser.Parser):
         \s*$                    # ignore whitespace at end
     ''', re.VERBOSE | re.IGNORECASE)
 
-    re_year = re.compile('''
+    re_year = parser.LazyPattern('''
         ^\s*                    # ignore whitespace at start
         (?P<year>\d{1,4})       # year
         \s*$                    # ignore whitespace at end
@@ -437,6 +437,74 @@ class ISOParser(parser.Parser):
 
         return (h, m, s)
 
+    @classmethod
+    def try_parse_date(cls, date):
+        """
+        Parses an ISO date like :meth:`chrono.parser.ISOParser.parse_date`,
+        but returns **None** instead of raising an error for invalid input
+        format or date values, without raising exceptions internally.
+
+        Raises :exc:`TypeError` for invalid input type.
+        """
+
+        formats = (
+            "date",
+            "compactdate",
+            "month",
+            "year",
+            "week",
+            "compactweek",
+            "weekdate",
+            "compactweekdate",
+            "ordinal",
+            "compactordinal"
+        )
+
+        for name in formats:
+            parsed = cls.try_format(name, date)
+
+            if parsed is not None:
+                return parsed
+
+        return None
+
+    @classmethod
+    def try_parse_datetime(cls, datetime):
+        """
+        Parses an ISO datetime like
+        :meth:`chrono.parser.ISOParser.parse_datetime`, but returns **None**
+        instead of raising an error for invalid input format or datetime
+        values, without raising exceptions internally.
+
+        Raises :exc:`TypeError` for invalid input type.
+        """
+
+        match = cls.match(cls.re_datetime, datetime)
+
+        if match is None:
+            return None
+
+        date = cls.try_parse_date(match["date"])
+        time = cls.try_parse_time(match["time"])
+
+        if date is None or time is None:
+            return None
+
+        return date + time
+
+    @classmethod
+    def try_parse_time(cls, time):
+        """
+        Parses an ISO time like :meth:`chrono.parser.ISOParser.parse_time`,
+        but returns **None** instead of raising an error for invalid input
+        format or time values, without raising exceptions internally.
+
+        Raises :exc:`TypeError` for invalid input type.
+        """
+
+        return cls.try_format("time", time) or \
+            cls.try_format("compacttime", time)
+
     @classmethod
     def week(cls, date):
         """
@@ -18,23 +18,217 @@
 
 from __future__ import absolute_import
 
+from . import cache
+from .. import calendar
+from .. import clock
 from .. import error
+from .. import utility
+
+import re
+import threading
+
+
+class LazyPattern(object):
+    """
+    A regular expression which is compiled on first use, for use as a class
+    attribute in parsers. The first time the attribute is accessed, the
+    pattern is compiled with *flags*, and the attribute is replaced with
+    the compiled regular expression object, so later lookups are plain
+    attribute lookups. This avoids compiling the patterns of all parsers
+    when importing :mod:`chrono`.
+    """
+
+    __lock = threading.Lock()
+
+    def __get__(self, instance, owner):
+
+        with LazyPattern.__lock:
+            if self.__regexp is None:
+                self.__regexp = re.compile(self.pattern, self.flags)
+                setattr(self.__owner, self.__name, self.__regexp)
+
+        return self.__regexp
+
+    def __init__(self, pattern, flags=0):
+
+        self.pattern = pattern
+        self.flags = flags
+
+        self.__name = None
+        self.__owner = None
+        self.__regexp = None
+
+    def __set_name__(self, owner, name):
+
+        self.__name = name
+        self.__owner = owner
 
 
 class Parser(object):
     """
     Base parser class, with utility methods for subclasses.
+
+    The methods :meth:`chrono.parser.Parser.try_parse_date`,
+    :meth:`chrono.parser.Parser.try_parse_datetime`, and
+    :meth:`chrono.parser.Parser.try_parse_time` are available in all
+    parsers which implement the corresponding ``parse_*`` methods.
+
+    Parse results can be cached by using the parser class returned by
+    :meth:`chrono.parser.Parser.cached`.
+    """
+
+    two_digit_years = False
+    """
+    **True** if the parser interprets two-digit years in the range
+    1930-2029, see :meth:`chrono.calendar.Calendar.fullyear`.
     """
 
     @classmethod
-    def regexp(cls, regexp, subject):
+    def cached(cls, size=1024, policy="lru", errors=True):
         """
-        Parses *subject* based on the regular expression object *regexp*,
-        returns a dict of named captured groups.
+        Returns a subclass of the parser where the results of
+        ``parse_date()``, ``parse_datetime()``, and ``parse_time()``, and
+        of their ``try_parse_*()`` variants, are cached in a
+        :class:`chrono.parser.ParseCache`, available as the class attribute
+        ``cache``. The parser class itself is not changed, and each call
+        returns a parser with its own cache. See
+        :class:`chrono.parser.ParseCache` for a description of the
+        arguments.
 
-        Raises :exc:`chrono.error.ParseError` if the subject doesn't match the
-        expression, or :exc:`TypeError` on invalid (ie non-string) subject
-        type.
+        Only the outer call is cached, so for example ``parse_datetime()``
+        stores a single entry, not separate entries for the
+        ``parse_date()`` and ``parse_time()`` calls it makes. The
+        ``try_parse_*()`` methods store their own entries, with **None**
+        for invalid input, so they don't raise and catch cached errors.
+        """
+
+        # set while a lookup is running in the current thread, so nested
+        # parse calls go to the parser directly
+        local = threading.local()
+
+        def method(name):
+
+            def parse(subclass, value):
+                function = getattr(super(parser, subclass), name)
+
+                if getattr(local, "active", False):
+                    return function(value)
+
+                local.active = True
+
+                try:
+                    return subclass.cache.lookup(function, value)
+
+                finally:
+                    local.active = False
+
+            parse.__name__ = name
+
+            return classmethod(parse)
+
+        attributes = {
+            "__doc__": cls.__doc__,
+            "__module__": cls.__module__,
+            "cache": cache.ParseCache(size, policy, errors),
+        }
+
+        for name in (
+            "parse_date", "parse_datetime", "parse_time",
+            "try_parse_date", "try_parse_datetime", "try_parse_time"
+        ):
+            if hasattr(cls, name):
+                attributes[name] = method(name)
+
+        parser = type("Cached" + cls.__name__, (cls,), attributes)
+
+        return parser
+
+    @classmethod
+    def convert_date(cls, match):
+        """
+        Converts a dict of named captured groups, as returned by
+        :meth:`chrono.parser.Parser.match`, to a tuple with year, month, and
+        day. The dict must contain *year*, and may contain *month* and
+        *day* for dates, *week* and *day* for weekdates, or only *day* for
+        ordinal dates - missing months or days default to 1.
+
+        Returns **None** instead of raising an error for invalid date values.
+        """
+
+        year = match["year"]
+
+        if cls.two_digit_years and len(year) == 2:
+            year = calendar.Calendar.fullyear(year)
+
+        year = utility.try_int_year(year)
+        day = utility.try_int_day(match.get("day", 1))
+
+        if year is None or day is None or not 1 <= year <= 9999:
+            return None
+
+        if "week" in match:
+            week = utility.try_int_week(match["week"])
+
+            if week is None or not 1 <= day <= 7:
+                return None
+
+            if not 1 <= week <= calendar.ISOCalendar.weeks(year):
+                return None
+
+            return calendar.ISOCalendar.weekdate_to_date(year, week, day)
+
+        elif "month" in match:
+            month = utility.try_int_month(match["month"])
+
+            if not calendar.Calendar.is_valid(year, month, day):
+                return None
+
+            return (year, month, day)
+
+        else:
+            if not 1 <= day <= calendar.Calendar.yeardays(year):
+                return None
+
+            return calendar.Calendar.ordinal_to_date(year, day)
+
+    @classmethod
+    def convert_time(cls, match):
+        """
+        Converts a dict of named captured groups, as returned by
+        :meth:`chrono.parser.Parser.match`, to a tuple with hour, minute, and
+        second. The dict must contain *hour*, *minute*, and *second*, where
+        missing minutes and seconds are **None**, and may contain *ampm* for
+        times using a 12-hour clock.
+
+        Returns **None** instead of raising an error for invalid time values.
+        """
+
+        hour = utility.try_int_hour(match["hour"])
+        minute = utility.try_int_minute(match["minute"] or 0)
+        second = utility.try_int_second(match["second"] or 0)
+
+        if not clock.Clock.is_valid(hour, minute, second):
+            return None
+
+        if match.get("ampm") is None:
+            return (hour, minute, second)
+
+        if not 1 <= hour <= 12:
+            return None
+
+        ampm = match["ampm"].replace(".", "").replace(" ", "").lower()
+
+        return (clock.USClock.to_24(hour, ampm == "pm"), minute, second)
+
+    @classmethod
+    def match(cls, regexp, subject):
+        """
+        Parses *subject* based on the regular expression object *regexp*
+        like :meth:`chrono.parser.Parser.regexp`, but returns **None**
+        instead of raising an error if the subject doesn't match the
+        expression.
+
+        Raises :exc:`TypeError` on invalid (ie non-string) subject type.
         """
 
         try:
@@ -44,13 +238,121 @@ class Parser(object):
             raise TypeError("Input is not a string")
 
         if not match:
+            return None
+
+        elif match.groupdict():
+            return match.groupdict()
+
+        else:
+            return match.groups()
+
+    @classmethod
+    def regexp(cls, regexp, subject):
+        """
+        Parses *subject* based on the regular expression object *regexp*,
+        returns a dict of named captured groups.
+
+        Raises :exc:`chrono.error.ParseError` if the subject doesn't match the
+        expression, or :exc:`TypeError` on invalid (ie non-string) subject
+        type.
+        """
+
+        match = cls.match(regexp, subject)
+
+        if match is None:
             raise error.ParseError(
                 "The value '{0}' doesn't match the expected pattern"
                 .format(subject)
             )
 
-        if match.groupdict():
-            return match.groupdict()
+        return match
+
+    @classmethod
+    def try_format(cls, name, value):
+        """
+        Parses *value* in the format of the parser method *name*, for example
+        ``"date"`` for :meth:`chrono.parser.ISOParser.date`, and returns the
+        same tuple as that method. The value is matched against the
+        parser's ``re_<name>`` pattern with
+        :meth:`chrono.parser.Parser.match`, and converted with
+        :meth:`chrono.parser.Parser.convert_date` or
+        :meth:`chrono.parser.Parser.convert_time`, so no exceptions are
+        raised and caught for invalid input.
+
+        Returns **None** for invalid input format or values, and raises
+        :exc:`TypeError` for invalid input type.
+        """
+
+        match = cls.match(getattr(cls, "re_" + name), value)
+
+        if match is None:
+            return None
+
+        elif "hour" in match:
+            return cls.convert_time(match)
 
         else:
-            return match.groups()
+            return cls.convert_date(match)
+
+    @classmethod
+    def try_parse_date(cls, date):
+        """
+        Parses a date like the parser's ``parse_date()`` method, but returns
+        **None** instead of raising an error for invalid input format or
+        date values.
+
+        The parsers in :mod:`chrono.parser` override this method to match
+        and validate the input without raising exceptions internally;
+        this default implementation catches the errors raised by
+        ``parse_date()``.
+
+        Raises :exc:`TypeError` for invalid input type.
+        """
+
+        try:
+            return cls.parse_date(date)
+
+        except (error.ParseError, error.DateError):
+            return None
+
+    @classmethod
+    def try_parse_datetime(cls, datetime):
+        """
+        Parses a date and time like the parser's ``parse_datetime()``
+        method, but returns **None** instead of raising an error for invalid
+        input format or datetime values.
+
+        The parsers in :mod:`chrono.parser` override this method to match
+        and validate the input without raising exceptions internally;
+        this default implementation catches the errors raised by
+        ``parse_datetime()``.
+
+        Raises :exc:`TypeError` for invalid input type.
+        """
+
+        try:
+            return cls.parse_datetime(datetime)
+
+        except (error.ParseError, error.DateTimeError):
+            return None
+
+    @classmethod
+    def try_parse_time(cls, time):
+        """
+        Parses a time like the parser's ``parse_time()`` method, but returns
+        **None** instead of raising an error for invalid input format or
+        time values.
+
+        The parsers in :mod:`chrono.parser` override this method to match
+        and validate the input without raising exceptions internally;
+        this default implementation catches the errors raised by
+        ``parse_time()``.
+
+        Raises :exc:`TypeError` for invalid input type.
+        """
+
+        try:
+            return cls.parse_time(time)
+
+        except (error.ParseError, error.TimeError):
+            return None
@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+#
+# python-chrono - a Python module for easy and convenient date/time handling
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from __future__ import absolute_import
+
+from .. import calendar
+from .. import defaults
+from .. import error
+
+import chrono
+import mmap
+import os
+import re
+
+
+class StreamParser(object):
+    """
+    A parser for extracting date/times from large line-based files, such as
+    log files. Lines are read as bytes, and only the part of each line
+    containing the date/time is decoded and passed on to *parser* - by
+    default the value of :attr:`chrono.DEFAULT_PARSER`, normally
+    :class:`chrono.parser.CommonParser`. Repeated date/time values on
+    consecutive lines, which are common in log files, are only parsed
+    once.
+
+    The location of the date/time within each line is given by one of:
+
+    * *offset* and *length*: the date/time is at a fixed byte offset in the
+      line, with the given length (or until the end of the line if
+      *length* is **None**)
+    * *field*: the date/time is in the field with the given index (starting
+      at 0), when the line is split on *separator* (by default whitespace).
+      If the date/time spans several fields, such as *yyyy-mm-dd hh:mm:ss*
+      with whitespace separators, *fields* gives the number of fields,
+      which are joined with a single space
+    * *regexp*: a regular expression (as a string, bytes, or compiled
+      pattern) which is searched for in the line, using the named group
+      *datetime* if present, otherwise the first group, or the entire
+      match if the expression has no groups
+
+    Lines may be bytes, or strings when reading a file object opened in
+    text mode, and *regexp* and *separator* are matched against either.
+
+    If none of these are given, the entire line is used.
+
+    If *strict* is **True**, lines where no date/time is found raise
+    :exc:`chrono.error.ParseError`, and invalid date/times raise the
+    appropriate parser error. Otherwise, such lines are skipped.
+
+    Results are returned in chunks of *chunksize* lines, to limit memory
+    use for large files.
+    """
+
+    def __init__(
+        self, parser=None,
+        offset=None, length=None,
+        field=None, fields=1, separator=None,
+        regexp=None, strict=True, chunksize=10000
+    ):
+
+        self.parser = parser or defaults.active and \
+            defaults.current_parser.get() or chrono.DEFAULT_PARSER
+        self.offset = offset
+        self.length = length
+        self.field = field
+        self.fields = fields
+        self.separator = separator
+        self.strict = strict
+        self.chunksize = chunksize
+
+        if isinstance(regexp, (str, bytes)):
+            regexp = re.compile(regexp)
+
+        self.regexp = regexp
+
+        # lines are bytes when reading paths and memory mapped files, but
+        # strings for files opened in text mode, so the expression and
+        # separator are kept in both forms
+        text_regexp = binary_regexp = regexp
+        text_separator = binary_separator = separator
+
+        if regexp is not None and isinstance(regexp.pattern, str):
+            binary_regexp = re.compile(
+                regexp.pattern.encode("latin-1"), regexp.flags & ~re.UNICODE
+            )
+
+        elif regexp is not None:
+            text_regexp = re.compile(
+                regexp.pattern.decode("latin-1"), regexp.flags
+            )
+
+        if isinstance(separator, str):
+            binary_separator = separator.encode("latin-1")
+
+        elif isinstance(separator, bytes):
+            text_separator = separator.decode("latin-1")
+
+        self.__binary = (binary_regexp, binary_separator, b" ")
+        self.__text = (text_regexp, text_separator, " ")
+
+    def extract(self, line):
+        """
+        Returns the part of *line* containing the date/time, or **None**
+        if it isn't found.
+        """
+
+        if isinstance(line, bytes):
+            regexp, separator, space = self.__binary
+
+        else:
+            regexp, separator, space = self.__text
+
+        if regexp is not None:
+            match = regexp.search(line)
+
+            if not match:
+                return None
+
+            elif "datetime" in regexp.groupindex:
+                return match.group("datetime")
+
+            elif regexp.groups:
+                return match.group(1)
+
+            else:
+                return match.group(0)
+
+        elif self.field is not None:
+            fields = line.split(separator)
+
+            if len(fields) < self.field + self.fields:
+                return None
+
+            return space.join(fields[self.field:self.field + self.fields])
+
+        elif self.offset is not None:
+            if len(line) <= self.offset:
+                return None
+
+            elif self.length is None:
+                return line[self.offset:]
+
+            else:
+                return line[self.offset:self.offset + self.length]
+
+        else:
+            return line
+
+    def lines(self, source):
+        """
+        Returns an iterator over the lines in *source*, which can be a file
+        path, an :class:`mmap.mmap` object (read from the start), or a file
+        object or other iterable of lines. Files given as paths are memory
+        mapped, and closed when the iterator is exhausted.
+        """
+
+        if isinstance(source, str):
+            return self.__lines_path(source)
+
+        elif isinstance(source, mmap.mmap):
+            source.seek(0)
+
+            return iter(source.readline, b"")
+
+        else:
+            return iter(source)
+
+    def __lines_path(self, path):
+        "Generator for lines in a memory mapped file"
+
+        with open(path, "rb") as f:
+
+            # empty files can't be memory mapped
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+
+            m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+            try:
+                for line in iter(m.readline, b""):
+                    yield line
+
+            finally:
+                m.close()
+
+    def parse(self, source):
+        """
+        Parses the date/time in each line of *source* (see
+        :meth:`chrono.parser.StreamParser.lines`), and yields lists of
+        tuples with year, month, day, hour, minute, and second.
+
+        Raises :exc:`chrono.error.ParseError` for lines without a valid
+        date/time, or an appropriate :exc:`chrono.error.DateTimeError`
+        subclass for invalid date/time values, unless *strict* is
+        **False**, in which case such lines are skipped.
+        """
+
+        if self.strict:
+            parse = self.parser.parse_datetime
+
+        else:
+            parse = self.parser.try_parse_datetime
+
+        chunk = []
+        previous = None
+        result = None
+
+        for line in self.lines(source):
+            value = self.extract(line)
+
+            if value is None:
+                if self.strict:
+                    raise error.ParseError(
+                        "No date/time found in line '{0}'".format(line)
+                    )
+
+                continue
+
+            if value != previous:
+                previous = value
+
+                if isinstance(value, bytes):
+                    value = value.decode("latin-1")
+
+                result = parse(value)
+
+            if result is None:
+                continue
+
+            chunk.append(result)
+
+            if len(chunk) >= self.chunksize:
+                yield chunk
+                chunk = []
+
+        if chunk:
+            yield chunk
+
+    def unix(self, source):
+        """
+        Parses the date/time in each line of *source* like
+        :meth:`chrono.parser.StreamParser.parse`, but yields arrays of UNIX
+        timestamps (as :class:`array.array` of type ``q``) instead, with
+        the date/times interpreted as UTC.
+        """
+
+        for chunk in self.parse(source):
+            yield calendar.Calendar.unix_utc_many(chunk)
@@ -0,0 +1,398 @@
+# -*- coding: utf-8 -*-
+#
+# python-chrono - a Python module for easy and convenient date/time handling
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from __future__ import absolute_import
+
+from .. import calendar
+from .. import clock
+from .. import defaults
+from .. import error
+from .. import formatter
+
+import chrono
+import functools
+import re
+
+
+class TemplateParser(object):
+    """
+    A strict parser for date/times in a single format, given as a template
+    using the same substitution variables as
+    :meth:`chrono.formatter.Formatter.format`, for example
+    ``$0year-$0month-$0day $0hour:$0minute``. Values formatted with a
+    template can be parsed back with the same template, except for
+    templates with a week but no month and day: there is no variable for
+    the year a week belongs to, so dates at the start or end of a year
+    which fall in a week of the adjacent year don't round-trip - for
+    example, 2010-01-01 formats as ``2010-W53-5`` with
+    ``$0year-W$0week-$weekday``, which is ISO week 53 of 2009.
+
+    The template is compiled into a single regular expression, which is
+    cached per template and calendar. Literal text in the template must
+    match exactly, except for whitespace at the start and end of the value,
+    and names (months, weekdays, and AM/PM) are matched without regard to
+    case.
+
+    *calendar* is used for week and weekday variables, and for validation.
+    By default the value of :attr:`chrono.DEFAULT_CALENDAR` is used -
+    normally :class:`chrono.calendar.ISOCalendar`.
+
+    Missing values are filled in where possible: month and day default to 1
+    when the template has a year, unless it has a week, in which case the
+    date is calculated from the week and weekday (by default the first day
+    of the week). Minute and second default to 0 when the template has an
+    hour, and 12-hour values without AM/PM are interpreted as AM. Week and
+    weekday values are checked against the date if it is given by month and
+    day. Offset and time zone name values must be present, but are not
+    returned, since the results have no time zone.
+    """
+
+    __variables = {
+        "year":             ("year", r"\d{1,4}", int),
+        "0year":            ("year", r"\d{4}", int),
+        "shortyear":        ("year", r"\d{2}", calendar.Calendar.fullyear),
+        "month":            ("month", r"\d{1,2}", int),
+        "0month":           ("month", r"\d{2}", int),
+        "monthname":        ("month", None, False),
+        "shortmonthname":   ("month", None, True),
+        "week":             ("week", r"\d{1,2}", int),
+        "0week":            ("week", r"\d{2}", int),
+        "day":              ("day", r"\d{1,2}", int),
+        "0day":             ("day", r"\d{2}", int),
+        "weekday":          ("weekday", r"\d", int),
+        "weekdayname":      ("weekday", None, False),
+        "shortweekdayname": ("weekday", None, True),
+        "hour":             ("hour", r"\d{1,2}", int),
+        "0hour":            ("hour", r"\d{2}", int),
+        "12hour":           ("12hour", r"\d{1,2}", int),
+        "012hour":          ("12hour", r"\d{2}", int),
+        "ampm":             ("pm", r"[ap]m", lambda v: v.lower() == "pm"),
+        "minute":           ("minute", r"\d{1,2}", int),
+        "0minute":          ("minute", r"\d{2}", int),
+        "second":           ("second", r"\d{1,2}", int),
+        "0second":          ("second", r"\d{2}", int),
+        "offset":           ("offset", r"[+-]\d{2}:\d{2}(?::\d{2})?", str),
+        "zonename":         ("zonename", r"[\w+-]+(?:/[\w+-]+)*", str),
+    }
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def __compile(calendar, template):
+        "Compiles *template* for *calendar*, results are cached"
+
+        patterns = []
+        fields = []
+
+        for text, name in formatter.Formatter.split(template):
+            if name is None:
+                patterns.append(re.escape(text))
+                continue
+
+            field, pattern, convert = TemplateParser.__variables[name]
+
+            # names are looked up in the calendar, convert is the short flag
+            if pattern is None:
+                if field == "month":
+                    values = dict(
+                        (calendar.monthname(i, convert).lower(), i)
+                        for i in range(1, 13)
+                    )
+
+                else:
+                    values = dict(
+                        (calendar.weekdayname(i, convert).lower(), i)
+                        for i in range(1, 8)
+                    )
+
+                pattern = "|".join(
+                    re.escape(v) for v in sorted(values, key=len, reverse=True)
+                )
+                convert = lambda v, values=values: values[v.lower()]
+
+            patterns.append("({0})".format(pattern))
+            fields.append((field, convert))
+
+        regexp = re.compile(
+            r"^\s*" + "".join(patterns) + r"\s*$", re.IGNORECASE
+        )
+
+        # templates with only plain numeric fields, each given once, are
+        # resolved from a list of group indexes for the result tuple
+        names = ("year", "month", "day", "hour", "minute", "second")
+        order = None
+
+        if (
+            all(f in names and c is int for f, c in fields) and
+            len(set(f for f, c in fields)) == len(fields)
+        ):
+            order = tuple(
+                [f for f, c in fields].index(name)
+                if name in [f for f, c in fields] else -1
+                for name in names
+            )
+
+        return (regexp, tuple(fields), order)
+
+    def __init__(self, template, calendar=None):
+
+        self.calendar = calendar or defaults.active and \
+            defaults.current_calendar.get() or chrono.DEFAULT_CALENDAR
+        self.template = template
+
+        self.__regexp, self.__fields, self.__order = self.__compile(
+            self.calendar, template
+        )
+
+    def parse(self, string):
+        """
+        Parses *string* according to the template, and returns a tuple with
+        year, month, day, hour, minute, and second, where values not given
+        by the template are **None**.
+
+        Raises :exc:`chrono.error.ParseError` if the value doesn't match the
+        template, :exc:`TypeError` for invalid input type, and an
+        appropriate :exc:`chrono.error.DateTimeError` subclass for invalid
+        date/time values.
+        """
+
+        if not isinstance(string, str):
+            raise TypeError("Input is not a string")
+
+        match = self.__regexp.match(string)
+
+        if not match:
+            raise error.ParseError(
+                "The value '{0}' doesn't match the template '{1}'"
+                .format(string, self.template)
+            )
+
+        if self.__order is not None:
+            groups = match.groups() + (None,)
+
+            return self.__resolve_simple([
+                int(groups[i]) if groups[i] is not None else None
+                for i in self.__order
+            ])
+
+        values = {}
+
+        for (field, convert), text in zip(self.__fields, match.groups()):
+            value = convert(text)
+
+            if values.setdefault(field, value) != value:
+                raise error.ParseError(
+                    "Conflicting {0} values in '{1}'".format(field, string)
+                )
+
+        return self.__resolve(string, values)
+
+    def __resolve_simple(self, values):
+        "Fills in and validates missing values for simple templates"
+
+        year, month, day, hour, minute, second = values
+
+        if year is not None:
+            if month is None:
+                month = 1
+
+            if day is None:
+                day = 1
+
+            self.calendar.validate(year, month, day)
+
+        if hour is not None:
+            minute = minute or 0
+            second = second or 0
+
+            clock.Clock.validate(hour, minute, second)
+
+        return (year, month, day, hour, minute, second)
+
+    def __resolve(self, string, values):
+        "Fills in and validates missing values after parsing"
+
+        cal = self.calendar
+        year = values.get("year")
+        month = values.get("month")
+        day = values.get("day")
+        week = values.get("week")
+        weekday = values.get("weekday")
+        hour = values.get("hour")
+        minute = values.get("minute")
+        second = values.get("second")
+        pm = values.get("pm")
+
+        if "12hour" in values:
+            hour12 = clock.USClock.to_24(values["12hour"], pm)
+
+            if hour is not None and hour != hour12:
+                raise error.ParseError(
+                    "Conflicting hour values in '{0}'".format(string)
+                )
+
+            hour = hour12
+
+        elif hour is not None and pm is not None and (hour >= 12) != pm:
+            raise error.ParseError(
+                "Conflicting hour values in '{0}'".format(string)
+            )
+
+        if year is not None:
+            if week is not None and month is None and day is None:
+                if weekday is None:
+                    weekday = 1
+
+                year, month, day = cal.weekdate_to_date(year, week, weekday)
+
+            else:
+                if month is None:
+                    month = 1
+
+                if day is None:
+                    day = 1
+
+                cal.validate(year, month, day)
+
+                if (
+                    week is not None and cal.week(year, month, day)[1] != week
+                ) or (
+                    weekday is not None and
+                    cal.weekday(year, month, day) != weekday
+                ):
+                    raise error.ParseError(
+                        "Week or weekday doesn't match the date in '{0}'"
+                        .format(string)
+                    )
+
+        if hour is not None:
+            minute = minute or 0
+            second = second or 0
+
+            clock.Clock.validate(hour, minute, second)
+
+        return (year, month, day, hour, minute, second)
+
+    def parse_date(self, date):
+        """
+        Parses *date* according to the template, and returns a tuple with
+        year, month, and day.
+
+        Raises :exc:`chrono.error.ParseError` if the value doesn't match the
+        template or the template has no year, :exc:`TypeError` for invalid
+        input type, and an appropriate :exc:`chrono.error.DateTimeError`
+        subclass for invalid date/time values.
+        """
+
+        year, month, day = self.parse(date)[:3]
+
+        if year is None:
+            raise error.ParseError(
+                "The template '{0}' doesn't contain a date"
+                .format(self.template)
+            )
+
+        return (year, month, day)
+
+    def parse_datetime(self, datetime):
+        """
+        Parses *datetime* according to the template, and returns a tuple
+        with year, month, day, hour, minute, and second.
+
+        Raises :exc:`chrono.error.ParseError` if the value doesn't match the
+        template or the template has no year or hour, :exc:`TypeError` for
+        invalid input type, and an appropriate
+        :exc:`chrono.error.DateTimeError` subclass for invalid date/time
+        values.
+        """
+
+        value = self.parse(datetime)
+
+        if value[0] is None or value[3] is None:
+            raise error.ParseError(
+                "The template '{0}' doesn't contain a date and time"
+                .format(self.template)
+            )
+
+        return value
+
+    def parse_time(self, time):
+        """
+        Parses *time* according to the template, and returns a tuple with
+        hour, minute, and second.
+
+        Raises :exc:`chrono.error.ParseError` if the value doesn't match the
+        template or the template has no hour, :exc:`TypeError` for invalid
+        input type, and an appropriate :exc:`chrono.error.DateTimeError`
+        subclass for invalid date/time values.
+        """
+
+        hour, minute, second = self.parse(time)[3:]
+
+        if hour is None:
+            raise error.ParseError(
+                "The template '{0}' doesn't contain a time"
+                .format(self.template)
+            )
+
+        return (hour, minute, second)
+
+    def try_parse_date(self, date):
+        """
+        Parses a date like :meth:`chrono.parser.TemplateParser.parse_date`,
+        but returns **None** instead of raising an error for invalid input
+        format or date/time values.
+
+        Raises :exc:`TypeError` for invalid input type.
+        """
+
+        try:
+            return self.parse_date(date)
+
+        except (error.ParseError, error.DateTimeError):
+            return None
+
+    def try_parse_datetime(self, datetime):
+        """
+        Parses a date and time like
+        :meth:`chrono.parser.TemplateParser.parse_datetime`, but returns
+        **None** instead of raising an error for invalid input format or
+        date/time values.
+
+        Raises :exc:`TypeError` for invalid input type.
+        """
+
+        try:
+            return self.parse_datetime(datetime)
+
+        except (error.ParseError, error.DateTimeError):
+            return None
+
+    def try_parse_time(self, time):
+        """
+        Parses a time like :meth:`chrono.parser.TemplateParser.parse_time`,
+        but returns **None** instead of raising an error for invalid input
+        format or date/time values.
+
+        Raises :exc:`TypeError` for invalid input type.
+        """
+
+        try:
+            return self.parse_time(time)
+
+        except (error.ParseError, error.DateTimeError):
+            return None
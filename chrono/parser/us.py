@@ -55,7 +55,25 @@ class USParser(parser.Parser):
     as 0.
     """
 
-    re_compactdate = re.compile('''
+    month_names = {
+        "jan": 1,
+        "feb": 2,
+        "mar": 3,
+        "apr": 4,
+        "may": 5,
+        "jun": 6,
+        "jul": 7,
+        "aug": 8,
+        "sep": 9,
+        "oct": 10,
+        "nov": 11,
+        "dec": 12,
+    }
+    "Month numbers for the lowercase short month names used in dates."
+
+    two_digit_years = True
+
+    re_compactdate = parser.LazyPattern('''
         ^\s*                    # strip whitespace
         (?P<month>\d{2})        # month
         (?P<day>\d{2})          # day
@@ -63,7 +81,7 @@ class USParser(parser.Parser):
         \s*$                    # strip whitespace
     ''', re.VERBOSE)
 
-    re_compacttime = re.compile('''
+    re_compacttime = parser.LazyPattern('''
         ^\s*                    # ignore whitespace at start
         (?P<hour>\d{2})         # hour
         (?:(?P<minute>\d{2}))?  # minute
@@ -73,7 +91,7 @@ class USParser(parser.Parser):
         \s*$                    # ignore whitespace at end
     ''', re.VERBOSE | re.IGNORECASE)
 
-    re_dashdate = re.compile('''
+    re_dashdate = parser.LazyPattern('''
         ^\s*                    # strip whitespace
         (?P<month>\d{1,2})      # month
         -(?P<day>\d{1,2})       # day
@@ -81,7 +99,7 @@ class USParser(parser.Parser):
         \s*$                    # strip whitespace
     ''', re.VERBOSE)
 
-    re_date = re.compile('''
+    re_date = parser.LazyPattern('''
         ^\s*                    # strip whitespace
         (?P<month>\d{1,2})      # month
         /(?P<day>\d{1,2})       # day
@@ -89,7 +107,7 @@ class USParser(parser.Parser):
         \s*$                    # strip whitespace
     ''', re.VERBOSE)
 
-    re_datetime = re.compile('''
+    re_datetime = parser.LazyPattern('''
         ^\s*                    # ignore whitespace at start
         (?P<date>\S+?)          # date
         \s+                     # separator
@@ -97,7 +115,7 @@ class USParser(parser.Parser):
         \s*$                    # ignore whitespace at end
     ''', re.VERBOSE | re.IGNORECASE)
 
-    re_dotdate = re.compile('''
+    re_dotdate = parser.LazyPattern('''
         ^\s*                    # strip whitespace
         (?P<month>\d{1,2})      # month
         \.(?P<day>\d{1,2})      # day
@@ -105,7 +123,7 @@ class USParser(parser.Parser):
         \s*$                    # strip whitespace
     ''', re.VERBOSE)
 
-    re_namedate = re.compile('''
+    re_namedate = parser.LazyPattern('''
         ^\s*                    # strip whitespace
         (?P<day>\d{1,2})        # day
         -(?P<month>[a-z]+)      # month
@@ -113,7 +131,7 @@ class USParser(parser.Parser):
         \s*$                    # strip whitespace
     ''', re.VERBOSE | re.IGNORECASE)
 
-    re_time = re.compile('''
+    re_time = parser.LazyPattern('''
         ^\s*                    # strip whitespace
         (?P<hour>\d{1,2})       # hour
         (?::(?P<minute>\d{1,2}))? # minute
@@ -175,6 +193,21 @@ class USParser(parser.Parser):
 
         return (h, m, s)
 
+    @classmethod
+    def convert_date(cls, match):
+        """
+        Converts a dict of named captured groups to a tuple with year,
+        month, and day like :meth:`chrono.parser.Parser.convert_date`, but
+        also accepts short month names such as *Jul*.
+
+        Returns **None** instead of raising an error for invalid date values.
+        """
+
+        if not match["month"].isdigit():
+            match["month"] = cls.month_names.get(match["month"].lower())
+
+        return super(USParser, cls).convert_date(match)
+
     @classmethod
     def dashdate(cls, date):
         """
@@ -276,20 +309,9 @@ class USParser(parser.Parser):
         else:
             match["year"] = utility.integer(match["year"])
 
-        match["month"] = {
-            "jan": 1,
-            "feb": 2,
-            "mar": 3,
-            "apr": 4,
-            "may": 5,
-            "jun": 6,
-            "jul": 7,
-            "aug": 8,
-            "sep": 9,
-            "oct": 10,
-            "nov": 11,
-            "dec": 12,
-        }.get(match["month"].lower(), match["month"])
+        match["month"] = cls.month_names.get(
+            match["month"].lower(), match["month"]
+        )
 
         match["day"] = utility.integer(match["day"])
 
@@ -374,6 +396,69 @@ class USParser(parser.Parser):
 
         raise error.ParseError("Invalid US time value '{0}'".format(time))
 
+    @classmethod
+    def try_parse_date(cls, date):
+        """
+        Parses a US date like :meth:`chrono.parser.USParser.parse_date`, but
+        returns **None** instead of raising an error for invalid input format
+        or date values, without raising exceptions internally.
+
+        Raises :exc:`TypeError` for invalid input type.
+        """
+
+        formats = (
+            "date",
+            "namedate",
+            "dashdate",
+            "dotdate",
+            "compactdate"
+        )
+
+        for name in formats:
+            parsed = cls.try_format(name, date)
+
+            if parsed is not None:
+                return parsed
+
+        return None
+
+    @classmethod
+    def try_parse_datetime(cls, datetime):
+        """
+        Parses a US datetime like
+        :meth:`chrono.parser.USParser.parse_datetime`, but returns **None**
+        instead of raising an error for invalid input format or datetime
+        values, without raising exceptions internally.
+
+        Raises :exc:`TypeError` for invalid input type.
+        """
+
+        match = cls.match(cls.re_datetime, datetime)
+
+        if match is None:
+            return None
+
+        date = cls.try_parse_date(match["date"])
+        time = cls.try_parse_time(match["time"])
+
+        if date is None or time is None:
+            return None
+
+        return date + time
+
+    @classmethod
+    def try_parse_time(cls, time):
+        """
+        Parses a US time like :meth:`chrono.parser.USParser.parse_time`, but
+        returns **None** instead of raising an error for invalid input format
+        or time values, without raising exceptions internally.
+
+        Raises :exc:`TypeError` for invalid input type.
+        """
+
+        return cls.try_format("time", time) or \
+            cls.try_format("compacttime", time)
+
     @classmethod
     def time(cls, time):
         """
@@ -0,0 +1,594 @@
+# -*- coding: utf-8 -*-
+#
+# python-chrono - a Python module for easy and convenient date/time handling
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+
+"""
+This module contains :class:`chrono.recurrence.Rule`, for recurring dates
+described by recurrence rules as defined by RFC 5545 (iCalendar).
+"""
+
+from __future__ import absolute_import
+
+from . import compactdate
+from . import defaults
+from . import error
+
+import chrono
+import itertools
+import re
+
+
+class Rule(object):
+    """
+    A recurrence rule, generating the dates described by the RFC 5545
+    recurrence rule string *rule*, starting at *start*. *start* can be any
+    value accepted by :class:`chrono.CompactDate`::
+
+        >>> rule = chrono.recurrence.Rule(
+        ...     "FREQ=MONTHLY;BYDAY=MO,TU,WE,TH,FR;BYSETPOS=-1;COUNT=3",
+        ...     "2010-01-01"
+        ... )
+        >>> list(rule)
+        [(2010, 1, 29), (2010, 2, 26), (2010, 3, 31)]
+
+    The supported rule parts are ``FREQ`` (``DAILY``, ``WEEKLY``,
+    ``MONTHLY``, or ``YEARLY``), ``INTERVAL``, ``COUNT``, ``UNTIL``,
+    ``BYDAY``, ``BYMONTHDAY``, ``BYMONTH``, ``BYWEEKNO``, and
+    ``BYSETPOS``, with the meaning given in the RFC. Weeks start on the
+    first day of the week of *calendar*, which defaults to the value of
+    :attr:`chrono.DEFAULT_CALENDAR` - normally
+    :class:`chrono.calendar.ISOCalendar`, with weeks starting on monday.
+    ``BYWEEKNO`` uses the week numbers of *calendar*. Like most
+    implementations, only dates matching the rule are generated, so *start*
+    itself is left out if it doesn't match.
+
+    Occurrences are calculated period by period (day, week, month, or
+    year) using julian day numbers, jumping directly to each matching day
+    in the period instead of checking every day. Iterating over the rule
+    gives tuples of year, month, and day, while
+    :meth:`chrono.recurrence.Rule.julian` gives julian day numbers, and
+    :meth:`chrono.DateArray.from_recurrence` stores them in a
+    :class:`chrono.DateArray`. Rules without ``COUNT`` or ``UNTIL`` end in
+    the year 9999.
+
+    Raises :exc:`chrono.error.ParseError` for invalid or unsupported rules,
+    :exc:`TypeError` for invalid input type, and
+    :exc:`chrono.error.NoDateTimeError` if *start* is empty.
+    """
+
+    calendar = None
+    "Calendar used for weeks and week numbers."
+
+    byday = None
+    """
+    Tuple of ``BYDAY`` values, as tuples of weekday (1 for monday through 7
+    for sunday, independent of calendar) and occurrence, or **None** for
+    every occurrence.
+    """
+
+    bymonth = None
+    "Tuple of ``BYMONTH`` values."
+
+    bymonthday = None
+    "Tuple of ``BYMONTHDAY`` values."
+
+    bysetpos = None
+    "Tuple of ``BYSETPOS`` values."
+
+    byweekno = None
+    "Tuple of ``BYWEEKNO`` values."
+
+    count = None
+    "Maximum number of occurrences, or **None**."
+
+    freq = None
+    "Frequency - ``DAILY``, ``WEEKLY``, ``MONTHLY``, or ``YEARLY``."
+
+    interval = None
+    "Number of periods between each period with occurrences."
+
+    start = None
+    "First possible occurrence, as a tuple of year, month, and day."
+
+    until = None
+    "Last possible occurrence as a tuple of year, month, and day, or **None**."
+
+    re_byday = re.compile(r"^([+-]?\d{1,2})?(MO|TU|WE|TH|FR|SA|SU)$")
+    re_number = re.compile(r"^[+-]?\d{1,3}$")
+    re_until = re.compile(r"^(\d{4})(\d{2})(\d{2})(T\d{6}Z?)?$")
+
+    weekdays = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+    "Weekday names used by ``BYDAY``, monday first."
+
+    def __init__(self, rule, start, calendar=None):
+
+        self.calendar = calendar or defaults.active and \
+            defaults.current_calendar.get() or chrono.DEFAULT_CALENDAR
+        self.rule = rule
+
+        self.__start = compactdate.CompactDate(
+            start, calendar=self.calendar
+        ).get_julian()
+        self.__until = 5373484
+        self.__last = None
+
+        self.start = self.calendar.julian_to_date(self.__start)
+
+        self.__parse(rule)
+
+    def __iter__(self):
+
+        return (self.calendar.julian_to_date(j) for j in self.julian())
+
+    def __repr__(self):
+
+        return "chrono.recurrence.Rule({0!r}, '{1:04}-{2:02}-{3:02}')".format(
+            self.rule, *self.start
+        )
+
+    def __numbers(self, name, value, limit):
+        "Parses a list of non-zero numbers between -limit and limit"
+
+        numbers = []
+
+        for number in value.split(","):
+            if not self.re_number.match(number) or \
+                    not 0 < abs(int(number)) <= limit:
+                raise error.ParseError(
+                    "Invalid {0} value '{1}'".format(name, number)
+                )
+
+            numbers.append(int(number))
+
+        return tuple(numbers)
+
+    def __parse(self, rule):
+        "Parses the rule string, and sets the rule attributes"
+
+        if not isinstance(rule, str):
+            raise TypeError("Input is not a string")
+
+        parts = {}
+        rule = rule.upper()
+
+        if rule.startswith("RRULE:"):
+            rule = rule[6:]
+
+        for part in rule.split(";"):
+            name, separator, value = part.partition("=")
+
+            if not separator or not value or name in parts:
+                raise error.ParseError("Invalid rule part '{0}'".format(part))
+
+            parts[name] = value
+
+        for name in parts:
+            if name not in (
+                "FREQ", "INTERVAL", "COUNT", "UNTIL", "BYDAY", "BYMONTHDAY",
+                "BYMONTH", "BYWEEKNO", "BYSETPOS"
+            ):
+                raise error.ParseError(
+                    "Unsupported rule part '{0}'".format(name)
+                )
+
+        self.freq = parts.get("FREQ")
+
+        if self.freq not in ("DAILY", "WEEKLY", "MONTHLY", "YEARLY"):
+            raise error.ParseError(
+                "Invalid or unsupported frequency '{0}'".format(self.freq)
+            )
+
+        if "COUNT" in parts and "UNTIL" in parts:
+            raise error.ParseError("COUNT and UNTIL can't both be used")
+
+        for name in ("INTERVAL", "COUNT"):
+            if name in parts:
+                if not parts[name].isdigit() or not int(parts[name]):
+                    raise error.ParseError(
+                        "Invalid {0} value '{1}'".format(name, parts[name])
+                    )
+
+        self.interval = int(parts.get("INTERVAL", 1))
+        self.count = "COUNT" in parts and int(parts["COUNT"]) or None
+
+        if "UNTIL" in parts:
+            match = self.re_until.match(parts["UNTIL"])
+
+            if not match:
+                raise error.ParseError(
+                    "Invalid UNTIL value '{0}'".format(parts["UNTIL"])
+                )
+
+            self.__until = self.calendar.julian(*match.group(1, 2, 3))
+            self.until = self.calendar.julian_to_date(self.__until)
+
+        if "BYDAY" in parts:
+            byday = []
+
+            for value in parts["BYDAY"].split(","):
+                match = self.re_byday.match(value)
+
+                if not match or match.group(1) and \
+                        not 0 < abs(int(match.group(1))) <= 53:
+                    raise error.ParseError(
+                        "Invalid BYDAY value '{0}'".format(value)
+                    )
+
+                byday.append((
+                    self.weekdays.index(match.group(2)) + 1,
+                    match.group(1) and int(match.group(1)) or None
+                ))
+
+            self.byday = tuple(byday)
+
+        if "BYMONTH" in parts:
+            self.bymonth = self.__numbers("BYMONTH", parts["BYMONTH"], 12)
+
+            if min(self.bymonth) < 1:
+                raise error.ParseError(
+                    "Invalid BYMONTH value '{0}'".format(parts["BYMONTH"])
+                )
+
+        if "BYMONTHDAY" in parts:
+            self.bymonthday = self.__numbers(
+                "BYMONTHDAY", parts["BYMONTHDAY"], 31
+            )
+
+        if "BYWEEKNO" in parts:
+            self.byweekno = self.__numbers("BYWEEKNO", parts["BYWEEKNO"], 53)
+
+        if "BYSETPOS" in parts:
+            self.bysetpos = self.__numbers("BYSETPOS", parts["BYSETPOS"], 366)
+
+        ordinals = self.byday and any(n for w, n in self.byday)
+
+        if self.byweekno and self.freq != "YEARLY":
+            raise error.ParseError("BYWEEKNO can only be used with YEARLY")
+
+        elif self.bymonthday and self.freq == "WEEKLY":
+            raise error.ParseError("BYMONTHDAY can't be used with WEEKLY")
+
+        elif ordinals and (
+            self.freq in ("DAILY", "WEEKLY") or self.byweekno
+        ):
+            raise error.ParseError(
+                "BYDAY occurrences can only be used with MONTHLY or YEARLY"
+            )
+
+    def __period(self, days):
+        "Returns the sorted occurrences in a period, applying BYSETPOS"
+
+        days = sorted(set(days))
+
+        if not self.bysetpos:
+            return days
+
+        size = len(days)
+
+        return sorted(set(
+            days[p - 1 if p > 0 else size + p]
+            for p in self.bysetpos if -size <= p <= size
+        ))
+
+    def __periods(self, first):
+        "Generates the occurrences period by period, from julian day first"
+
+        calendar = self.calendar
+        interval = self.interval
+        start = self.__start
+        year, month, day = self.start
+        fyear, fmonth = calendar.julian_to_date(first)[:2]
+
+        # each day is a period of its own for DAILY, which only the first or
+        # last position of BYSETPOS can keep
+        if self.freq == "DAILY" and self.bysetpos and \
+                1 not in self.bysetpos and -1 not in self.bysetpos:
+            return
+
+        if self.freq == "DAILY" and (self.bymonth or self.bymonthday):
+
+            # go month by month, keeping the matching days on the interval
+            months = fyear * 12 + fmonth - 1
+
+            while months < 120000:
+                y, m = divmod(months, 12)
+                months += 1
+
+                if self.bymonth and m + 1 not in self.bymonth:
+                    continue
+
+                if self.bymonthday:
+                    days = self.__month(y, m + 1, day)
+
+                else:
+                    julian = calendar.julian(y, m + 1, 1)
+                    stop = julian + calendar.monthdays(y, m + 1)
+                    julian += (start - julian) % interval
+                    days = [
+                        j for j in range(julian, stop, interval)
+                        if not self.byday or self.__weekday(j, julian, stop)
+                    ]
+
+                for julian in sorted(set(days)):
+                    if (julian - start) % interval == 0:
+                        yield [julian]
+
+        elif self.freq == "DAILY":
+            julian = start + max(0, (first - start) // interval) * interval
+
+            while julian <= 5373484:
+                if self.__match(julian):
+                    yield [julian]
+
+                julian += interval
+
+        elif self.freq == "WEEKLY":
+            week = start - calendar.weekday(year, month, day) + 1
+            step = 7 * interval
+            week += max(0, (first - week) // step) * step
+
+            # days of the week, as offsets from the first day of the week
+            weekdays = [w for w, n in self.byday or [(start % 7 + 1, None)]]
+            offsets = [(w - week % 7 - 1) % 7 for w in weekdays]
+
+            while week <= 5373484:
+                yield self.__period(
+                    week + offset for offset in offsets
+                    if not self.bymonth or
+                    calendar.julian_to_date(week + offset)[1] in self.bymonth
+                )
+
+                week += step
+
+        elif self.freq == "MONTHLY":
+
+            # months since year 0, for integer arithmetic on months
+            months = year * 12 + month - 1
+            months += max(
+                0, (fyear * 12 + fmonth - 1 - months) // interval
+            ) * interval
+
+            while months < 120000:
+                y, m = divmod(months, 12)
+
+                if not self.bymonth or m + 1 in self.bymonth:
+                    yield self.__period(self.__month(y, m + 1, day))
+
+                months += interval
+
+        else:
+            periods = (fyear - year) // interval
+
+            # the last weeks of the year before can end in the year of first
+            if self.byweekno:
+                periods -= 1
+
+            y = year + max(0, periods) * interval
+
+            while y <= 9999:
+                yield self.__period(self.__year(y, month, day))
+                y += interval
+
+    def __final(self):
+        "Returns the julian day of the last occurrence, for COUNT rules"
+
+        if self.__last is None:
+            last = None
+
+            for last in self.julian():
+                pass
+
+            self.__last = (last,)
+
+        return self.__last[0]
+
+    def __generate(self, first):
+        "Generates the occurrences from julian day first, ignoring COUNT"
+
+        first = max(first, self.__start)
+
+        for days in self.__periods(first):
+            for julian in days:
+                if julian > self.__until:
+                    return
+
+                if julian >= first:
+                    yield julian
+
+    def __match(self, julian):
+        "Returns True if a single day matches BYMONTH, BYMONTHDAY, and BYDAY"
+
+        if self.bymonth or self.bymonthday:
+            year, month, day = self.calendar.julian_to_date(julian)
+
+            if self.bymonth and month not in self.bymonth:
+                return False
+
+            if self.bymonthday:
+                days = self.calendar.monthdays(year, month)
+
+                if day not in self.bymonthday and \
+                        day - days - 1 not in self.bymonthday:
+                    return False
+
+        if self.byday:
+            return julian % 7 + 1 in [w for w, n in self.byday]
+
+        return True
+
+    def __month(self, year, month, day):
+        "Returns the candidate days in a month"
+
+        first = self.calendar.julian(year, month, 1)
+        size = self.calendar.monthdays(year, month)
+        stop = first + size
+
+        if self.bymonthday:
+            days = [
+                first + d - 1 if d > 0 else stop + d
+                for d in self.bymonthday if abs(d) <= size
+            ]
+
+            if self.byday:
+                days = [j for j in days if self.__weekday(j, first, stop)]
+
+            return days
+
+        elif self.byday:
+            return self.__weekdays(first, stop)
+
+        elif day <= size:
+            return [first + day - 1]
+
+        return []
+
+    def __weekday(self, julian, first, stop):
+        "Returns True if a day matches BYDAY, counting from first and stop"
+
+        for weekday, n in self.byday:
+            if julian % 7 + 1 != weekday:
+                continue
+
+            elif n is None:
+                return True
+
+            elif n > 0 and (julian - first) // 7 + 1 == n:
+                return True
+
+            elif n < 0 and (stop - 1 - julian) // 7 + 1 == -n:
+                return True
+
+        return False
+
+    def __weekdays(self, first, stop):
+        "Returns the days matching BYDAY from first up to, not including, stop"
+
+        days = []
+
+        for weekday, n in self.byday:
+            if n is None:
+                julian = first + (weekday - first % 7 - 1) % 7
+                days.extend(range(julian, stop, 7))
+
+            elif n > 0:
+                julian = first + (weekday - first % 7 - 1) % 7 + (n - 1) * 7
+
+                if julian < stop:
+                    days.append(julian)
+
+            else:
+                last = stop - 1
+                julian = last - (last % 7 + 1 - weekday) % 7 + (n + 1) * 7
+
+                if julian >= first:
+                    days.append(julian)
+
+        return days
+
+    def __year(self, year, month, day):
+        "Returns the candidate days in a year"
+
+        calendar = self.calendar
+
+        if self.byweekno:
+            weeks = calendar.weeks(year)
+            first = calendar.julian(*calendar.weekdate_to_date(year, 1, 1))
+            offsets = self.byday and [
+                (w - first % 7 - 1) % 7 for w, n in self.byday
+            ] or range(7)
+            days = []
+
+            for week in self.byweekno:
+                if week < 0:
+                    week += weeks + 1
+
+                if 1 <= week <= weeks:
+                    days.extend(first + (week - 1) * 7 + o for o in offsets)
+
+            if self.bymonth or self.bymonthday:
+                days = [j for j in days if self.__match(j)]
+
+            return days
+
+        elif self.byday and not self.bymonth:
+
+            # without BYMONTH, BYDAY occurrences count within the year
+            first = calendar.julian(year, 1, 1)
+            days = self.__weekdays(first, first + calendar.yeardays(year))
+
+            if self.bymonthday:
+                days = [j for j in days if self.__match(j)]
+
+            return days
+
+        elif self.bymonth or self.bymonthday or self.byday:
+            days = []
+
+            for m in self.bymonth or range(1, 13):
+                days.extend(self.__month(year, m, day))
+
+            return days
+
+        elif calendar.is_valid(year, month, day):
+            return [calendar.julian(year, month, day)]
+
+        return []
+
+    def after(self, date, inclusive=False):
+        """
+        Returns the first occurrence after *date*, or on *date* if
+        *inclusive* is **True**, as a tuple of year, month, and day, or
+        **None** if there are no more occurrences. *date* can be any value
+        accepted by :class:`chrono.CompactDate`.
+
+        The search starts directly at the period containing *date*, without
+        generating the earlier occurrences. For rules with ``COUNT``, the
+        last occurrence is calculated on the first call, and cached.
+
+        Raises :exc:`chrono.error.NoDateTimeError` if *date* is empty.
+        """
+
+        julian = compactdate.CompactDate(
+            date, calendar=self.calendar
+        ).get_julian()
+
+        if not inclusive:
+            julian += 1
+
+        if self.count is not None:
+            last = self.__final()
+
+            if last is None or julian > last:
+                return None
+
+        for julian in self.__generate(julian):
+            return self.calendar.julian_to_date(julian)
+
+        return None
+
+    def julian(self):
+        """
+        Returns a generator of julian day numbers for the occurrences.
+        """
+
+        occurrences = self.__generate(self.__start)
+
+        if self.count is not None:
+            occurrences = itertools.islice(occurrences, self.count)
+
+        return occurrences
@@ -20,6 +20,7 @@ from __future__ import absolute_import
 
 from . import calendar
 from . import clock
+from . import defaults
 from . import error
 from . import formatter
 from . import utility
@@ -80,42 +81,24 @@ class Time(object):
 
     def __cmp__(self, other):
 
-        if not isinstance(other, Time):
-            other = Time(other)
-
-        if not self.is_set() and not other.is_set():
-            return 0
-
-        elif not other.is_set():
-            return 1
-
-        elif not self.is_set():
-            return -1
-
-        if self.hour != other.hour:
-            return utility.cmp(self.hour, other.hour)
-
-        elif self.minute != other.minute:
-            return utility.cmp(self.minute, other.minute)
-
-        else:
-            return utility.cmp(self.second, other.second)
+        return utility.cmp(self.sort_key(), self.__key(other))
 
     def __eq__(self, other):
 
-        return self.__cmp__(other) == 0
+        return self.sort_key() == self.__key(other)
 
     def __ge__(self, other):
 
-        return self.__cmp__(other) >= 0
+        return self.sort_key() >= self.__key(other)
 
     def __gt__(self, other):
 
-        return self.__cmp__(other) > 0
+        return self.sort_key() > self.__key(other)
 
     def __init__(self, time=None, parser=None, **kwargs):
 
-        self.parser = parser or chrono.DEFAULT_PARSER
+        self.parser = parser or defaults.active and \
+            defaults.current_parser.get() or chrono.DEFAULT_PARSER
 
         if isinstance(time, str):
             self.set_string(time)
@@ -151,15 +134,15 @@ class Time(object):
 
     def __le__(self, other):
 
-        return self.__cmp__(other) <= 0
+        return self.sort_key() <= self.__key(other)
 
     def __lt__(self, other):
 
-        return self.__cmp__(other) < 0
+        return self.sort_key() < self.__key(other)
 
     def __ne__(self, other):
 
-        return self.__cmp__(other) != 0
+        return self.sort_key() != self.__key(other)
 
     def __repr__(self):
 
@@ -184,47 +167,25 @@ class Time(object):
 
         elif name == "hour":
 
-            while value >= 24:
-                value -= 24
-
-            while value < 0:
-                value += 24
-
-            object.__setattr__(self, name, value)
+            object.__setattr__(self, name, value % 24)
 
         elif name == "minute":
 
-            h = self.hour or 0
-
-            while value >= 60:
-                h += 1
-                value -= 60
+            hours, value = divmod(value, 60)
 
-            while value < 0:
-                h -= 1
-                value += 60
-
-            # set hour, but only if already set
-            if self.hour is not None:
-                self.hour = h
+            # carry whole hours, but only if hour is already set
+            if self.hour is not None and hours:
+                self.hour = self.hour + hours
 
             object.__setattr__(self, "minute", value)
 
         elif name == "second":
 
-            m = self.minute or 0
-
-            while value >= 60:
-                m += 1
-                value -= 60
+            minutes, value = divmod(value, 60)
 
-            while value < 0:
-                m -= 1
-                value += 60
-
-            # set minute, but only if already set
-            if self.minute is not None:
-                self.minute = m
+            # carry whole minutes, but only if minute is already set
+            if self.minute is not None and minutes:
+                self.minute = self.minute + minutes
 
             object.__setattr__(self, "second", value)
 
@@ -240,6 +201,24 @@ class Time(object):
         except error.NoDateTimeError:
             return ""
 
+    @staticmethod
+    def __key(value):
+        """
+        Returns the sort key for *value*, only creating a Time object for
+        values which are not times
+        """
+
+        if isinstance(value, Time):
+            return Time.sort_key(value)
+
+        elif isinstance(value, (datetime.time, datetime.datetime)):
+            return value.hour * 3600 + value.minute * 60 + value.second
+
+        elif isinstance(value, chrono.FrozenTime):
+            return -1 if value.seconds is None else value.seconds
+
+        return Time(value).sort_key()
+
     def assert_set(self):
         """
         Makes sure the object has a full time set, ie the attributes
@@ -279,6 +258,14 @@ class Time(object):
             template, None, None, None, self.hour, self.minute, self.second
         )
 
+    def freeze(self):
+        """
+        Returns an immutable, hashable :class:`chrono.FrozenTime` with the
+        same time.
+        """
+
+        return chrono.FrozenTime(self)
+
     def get(self):
         """
         Returns the time as a tuple of hour, minute, and second.
@@ -411,3 +398,15 @@ class Time(object):
             struct_time.tm_min,
             struct_time.tm_sec
         )
+
+    def sort_key(self):
+        """
+        Returns an integer which orders times the same way as comparisons,
+        for use as a sort key, such as ``sorted(times, key=Time.sort_key)``.
+        Times which are not fully set give -1, and sort before other times.
+        """
+
+        if self.hour is None or self.minute is None or self.second is None:
+            return -1
+
+        return self.hour * 3600 + self.minute * 60 + self.second
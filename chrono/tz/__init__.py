@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+#
+# python-chrono - a Python module for easy and convenient date/time handling
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+
+"""
+This module contains classes for time zone handling.
+
+:class:`chrono.tz.Zone` holds the transitions of a time zone, normally
+loaded from the system zoneinfo directory with :meth:`chrono.tz.Zone.get`,
+while :class:`chrono.tz.Rule` calculates daylight saving transitions from
+POSIX ``TZ`` rules.
+"""
+
+from .rule import Rule
+from .zone import Zone
+
+UTC = Zone.fixed(0)
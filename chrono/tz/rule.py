@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+#
+# python-chrono - a Python module for easy and convenient date/time handling
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from __future__ import absolute_import
+
+from .. import calendar
+from .. import error
+
+import bisect
+import re
+
+
+class Rule(object):
+    """
+    A time zone rule in the POSIX ``TZ`` format, such as
+    ``CET-1CEST,M3.5.0,M10.5.0/3``, as used in the footer of TZif files
+    for times after the last transition in the file.
+
+    Daylight saving transitions are calculated per year, and cached.
+
+    Raises :exc:`chrono.error.ZoneError` for invalid rules.
+    """
+
+    __re_rule = re.compile(r"""
+        ^
+        (?P<std>[A-Za-z]{3,}|<[A-Za-z0-9+-]+>)
+        (?P<stdoffset>[+-]?\d{1,3}(?::\d{2}){0,2})
+        (?:
+            (?P<dst>[A-Za-z]{3,}|<[A-Za-z0-9+-]+>)
+            (?P<dstoffset>[+-]?\d{1,3}(?::\d{2}){0,2})?
+            (?:
+                ,(?P<start>M\d{1,2}\.\d\.\d|J\d{1,3}|\d{1,3})
+                (?:/(?P<starttime>[+-]?\d{1,3}(?::\d{2}){0,2}))?
+                ,(?P<end>M\d{1,2}\.\d\.\d|J\d{1,3}|\d{1,3})
+                (?:/(?P<endtime>[+-]?\d{1,3}(?::\d{2}){0,2}))?
+            )?
+        )?
+        $
+    """, re.VERBOSE)
+
+    dst = None
+    """
+    Tuple with offset from UTC in seconds, **True**, and abbreviation for
+    daylight saving time, or **None** if the rule has no daylight saving
+    time.
+    """
+
+    rule = None
+    "The rule string."
+
+    std = None
+    """
+    Tuple with offset from UTC in seconds, **False**, and abbreviation for
+    standard time.
+    """
+
+    @staticmethod
+    def __seconds(value):
+        "Converts a [+-]hh[:mm[:ss]] value to seconds"
+
+        sign = -1 if value.startswith("-") else 1
+        parts = [int(p) for p in value.lstrip("+-").split(":")] + [0, 0]
+
+        return sign * (parts[0] * 3600 + parts[1] * 60 + parts[2])
+
+    def __date(self, year, value):
+        "Returns the julian day number for a rule date in *year*"
+
+        cal = calendar.Calendar
+
+        if value.startswith("M"):
+            month, week, weekday = [int(v) for v in value[1:].split(".")]
+
+            julian = cal.julian(year, month, 1)
+
+            # weekdays are 0 for sunday, julian day 0 is a monday
+            day = 1 + (weekday - (julian + 1) % 7) % 7 + (week - 1) * 7
+
+            while day > cal.monthdays(year, month):
+                day -= 7
+
+            return julian + day - 1
+
+        elif value.startswith("J"):
+            day = int(value[1:])
+
+            # february 29 is never counted
+            if cal.leapyear(year) and day >= 60:
+                day += 1
+
+            return cal.julian(year, 1, 1) + day - 1
+
+        return cal.julian(year, 1, 1) + int(value)
+
+    def __init__(self, rule):
+
+        match = self.__re_rule.match(rule)
+
+        if not match:
+            raise error.ZoneError("Invalid time zone rule '{0}'".format(rule))
+
+        self.rule = rule
+        self.__years = {}
+
+        # POSIX offsets are west of UTC, ie the opposite of UTC offsets
+        offset = -self.__seconds(match.group("stdoffset"))
+        self.std = (offset, False, match.group("std").strip("<>"))
+
+        if match.group("dst") is None:
+            self.__start = None
+            return
+
+        if match.group("dstoffset") is not None:
+            dstoffset = -self.__seconds(match.group("dstoffset"))
+
+        else:
+            dstoffset = offset + 3600
+
+        self.dst = (dstoffset, True, match.group("dst").strip("<>"))
+
+        # rules without dates use the US rules, like most implementations
+        self.__start = match.group("start") or "M3.2.0"
+        self.__end = match.group("end") or "M11.1.0"
+        self.__starttime = self.__seconds(match.group("starttime") or "2")
+        self.__endtime = self.__seconds(match.group("endtime") or "2")
+
+    def __repr__(self):
+
+        return "chrono.tz.Rule({0!r})".format(self.rule)
+
+    def lookup(self, timestamp):
+        """
+        Returns a tuple with offset from UTC in seconds, **True** if
+        daylight saving time is in effect, otherwise **False**, and the
+        abbreviation, for the UNIX timestamp *timestamp*.
+        """
+
+        if self.__start is None:
+            return self.std
+
+        days = timestamp // 86400
+        year = calendar.Calendar.julian_to_date(days + 2440588)[0]
+        year = min(max(year, 1), 9999)
+        times, infos = self.transitions(year)
+
+        # transitions close to new year may fall in the neighbouring year
+        if timestamp < times[0]:
+            if year == 1:
+                return infos[-1]
+
+            return self.transitions(year - 1)[1][-1]
+
+        elif year < 9999 and timestamp >= self.transitions(year + 1)[0][0]:
+            times, infos = self.transitions(year + 1)
+
+        return infos[bisect.bisect_right(times, timestamp) - 1]
+
+    def transitions(self, year):
+        """
+        Returns a tuple with a list of the UNIX timestamps for the daylight
+        saving transitions in *year*, and a list of the tuples with offset,
+        daylight saving flag, and abbreviation in effect from each
+        transition. Rules without daylight saving time give a single
+        transition at the start of the year. Results are cached per year.
+        """
+
+        try:
+            return self.__years[year]
+
+        except KeyError:
+            pass
+
+        if self.__start is None:
+            times = [(calendar.Calendar.julian(year, 1, 1) - 2440588) * 86400]
+            infos = [self.std]
+
+        else:
+            start = (self.__date(year, self.__start) - 2440588) * 86400 + (
+                self.__starttime - self.std[0]
+            )
+            end = (self.__date(year, self.__end) - 2440588) * 86400 + (
+                self.__endtime - self.dst[0]
+            )
+
+            if start < end:
+                times, infos = [start, end], [self.dst, self.std]
+
+            else:
+                times, infos = [end, start], [self.std, self.dst]
+
+        self.__years[year] = (times, infos)
+
+        return (times, infos)
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+#
+# python-chrono - a Python module for easy and convenient date/time handling
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from __future__ import absolute_import
+
+from .. import error
+
+import struct
+
+
+def parse(data):
+    """
+    Parses the contents of a TZif file (see :rfc:`8536`), as found in the
+    system zoneinfo directory, and returns a tuple with a list of transition
+    times as UNIX timestamps, a list of tuples with offset from UTC in
+    seconds, daylight saving flag, and abbreviation for each transition,
+    a tuple with the same values for times before the first transition, and
+    the POSIX ``TZ`` rule string from the footer, or **None**.
+
+    Version 2 and later files use the 64-bit data, version 1 files the
+    32-bit data. Leap second records are ignored.
+
+    Raises :exc:`chrono.error.ZoneError` for invalid data.
+    """
+
+    try:
+        return __parse(bytes(data))
+
+    except (struct.error, IndexError, ValueError) as e:
+        raise error.ZoneError("Invalid TZif data: {0}".format(e))
+
+
+def __header(data, position):
+    "Returns the version and counts from the header at *position*"
+
+    if data[position:position + 4] != b"TZif":
+        raise ValueError("missing TZif header")
+
+    return (
+        data[position + 4:position + 5],
+        struct.unpack(">6l", data[position + 20:position + 44])
+    )
+
+
+def __parse(data):
+    "Parses TZif data, see parse()"
+
+    version, counts = __header(data, 0)
+    size = 4
+    position = 44
+
+    # skip the 32-bit data of version 2+ files, for the 64-bit data
+    if version not in (b"\0", b"1"):
+        isutcnt, isstdcnt, leapcnt, timecnt, typecnt, charcnt = counts
+
+        position += (
+            timecnt * 5 + typecnt * 6 + charcnt + leapcnt * 8 +
+            isstdcnt + isutcnt
+        )
+
+        version, counts = __header(data, position)
+        size = 8
+        position += 44
+
+    isutcnt, isstdcnt, leapcnt, timecnt, typecnt, charcnt = counts
+
+    if typecnt < 1:
+        raise ValueError("no local time types")
+
+    times = list(struct.unpack(
+        ">{0}{1}".format(timecnt, "q" if size == 8 else "l"),
+        data[position:position + timecnt * size]
+    ))
+    position += timecnt * size
+
+    indexes = data[position:position + timecnt]
+    position += timecnt
+
+    raw = [
+        struct.unpack(">lBB", data[p:p + 6])
+        for p in range(position, position + typecnt * 6, 6)
+    ]
+    position += typecnt * 6
+
+    chars = data[position:position + charcnt]
+    position += charcnt + leapcnt * (size + 4) + isstdcnt + isutcnt
+
+    types = [
+        (
+            offset, bool(dst),
+            chars[index:chars.index(b"\0", index)].decode("ascii")
+        )
+        for offset, dst, index in raw
+    ]
+
+    rule = None
+
+    if size == 8:
+        footer = data[position:].strip(b"\n")
+
+        if footer:
+            rule = footer.decode("ascii")
+
+    return (times, [types[i] for i in indexes], types[0], rule)
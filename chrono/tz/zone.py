@@ -0,0 +1,368 @@
+# -*- coding: utf-8 -*-
+#
+# python-chrono - a Python module for easy and convenient date/time handling
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from __future__ import absolute_import
+
+from . import rule as rulemod
+from . import tzif
+from .. import calendar
+from .. import error
+
+import array
+import bisect
+import os
+import re
+import threading
+
+
+class Zone(object):
+    """
+    A time zone, given by a table of transitions: UNIX timestamps where the
+    offset from UTC, daylight saving flag, or abbreviation changes. Zones are
+    normally loaded from the system zoneinfo directory with
+    :meth:`chrono.tz.Zone.get`.
+
+    *transitions* is a sorted sequence of UNIX timestamps, and *types* a
+    sequence of the same length with tuples of offset from UTC in seconds,
+    daylight saving flag, and abbreviation, in effect from each transition.
+    *initial* is the tuple in effect before the first transition, by
+    default the first of *types*. *rule* is a :class:`chrono.tz.Rule` or
+    POSIX ``TZ`` rule string for times after the last transition.
+
+    The transitions are stored in an :class:`array.array`, and looked up by
+    binary search, while daylight saving transitions from the rule are
+    calculated once per year and cached, so lookups take O(log n) time
+    without any file access.
+
+    Raises :exc:`chrono.error.ZoneError` for invalid data.
+    """
+
+    __lock = threading.Lock()
+
+    __re_name = re.compile(r"^[A-Za-z0-9_+-]+(?:/[A-Za-z0-9_+-]+)*$")
+
+    __zones = {}
+
+    name = None
+    "Name of the time zone, such as ``Europe/Oslo``."
+
+    path = [
+        "/usr/share/zoneinfo",
+        "/usr/lib/zoneinfo",
+        "/usr/share/lib/zoneinfo",
+        "/etc/zoneinfo",
+    ]
+    """
+    List of directories searched for TZif files by
+    :meth:`chrono.tz.Zone.get`, in order.
+    """
+
+    rule = None
+    """
+    :class:`chrono.tz.Rule` for times after the last transition, or
+    **None**.
+    """
+
+    def __init__(self, name, transitions=(), types=(), initial=None,
+                 rule=None):
+
+        if len(transitions) != len(types):
+            raise error.ZoneError(
+                "Time zone '{0}' has {1} transitions, but {2} types".format(
+                    name, len(transitions), len(types)
+                )
+            )
+
+        if isinstance(rule, str):
+            rule = rulemod.Rule(rule)
+
+        if initial is None:
+            if types:
+                initial = types[0]
+
+            elif rule is not None:
+                initial = rule.std
+
+            else:
+                raise error.ZoneError(
+                    "Time zone '{0}' has no offset".format(name)
+                )
+
+        self.name = name
+        self.rule = rule
+
+        self.__transitions = array.array("q", transitions)
+        self.__types = [tuple(t) for t in types]
+        self.__initial = tuple(initial)
+
+        if any(
+            a > b for a, b in zip(self.__transitions, self.__transitions[1:])
+        ):
+            raise error.ZoneError(
+                "Time zone '{0}' has unsorted transitions".format(name)
+            )
+
+        # the rule is only used after the last transition in the table
+        if rule is not None and transitions:
+            self.__last = self.__transitions[-1]
+
+        elif rule is not None:
+            self.__last = -2 ** 63
+
+        else:
+            self.__last = None
+
+    def __repr__(self):
+
+        return "chrono.tz.Zone({0!r})".format(self.name)
+
+    def __span(self, timestamp):
+        """
+        Returns the offset in effect at *timestamp*, and the start and end
+        of the period it is in effect for
+        """
+
+        if self.__last is not None and timestamp >= self.__last:
+            days = timestamp // 86400
+            year = calendar.Calendar.julian_to_date(days + 2440588)[0]
+            year = min(max(year, 1), 9999)
+
+            times = [self.__last]
+            infos = [self.rule.lookup(self.__last)]
+
+            for y in range(max(year - 1, 1), min(year + 1, 9999) + 1):
+                for t, i in zip(*self.rule.transitions(y)):
+                    if t > self.__last:
+                        times.append(t)
+                        infos.append(i)
+
+            index = bisect.bisect_right(times, timestamp) - 1
+
+            return (
+                infos[index][0], times[index],
+                times[index + 1] if index + 1 < len(times) else timestamp + 1
+            )
+
+        transitions = self.__transitions
+        index = bisect.bisect_right(transitions, timestamp)
+
+        return (
+            (self.__types[index - 1] if index else self.__initial)[0],
+            transitions[index - 1] if index else -2 ** 63,
+            transitions[index] if index < len(transitions) else (
+                2 ** 63 if self.__last is None else self.__last
+            )
+        )
+
+    @classmethod
+    def fixed(cls, offset, name=None):
+        """
+        Returns a time zone with a fixed *offset* from UTC in seconds. The
+        name defaults to the offset in the form ``UTC+02:00``.
+        """
+
+        if name is None:
+            name = "UTC" + cls.format_offset(offset) if offset else "UTC"
+
+        return cls(name, initial=(offset, False, name))
+
+    @classmethod
+    def from_tzif(cls, data, name):
+        """
+        Creates a time zone named *name* from the contents of a TZif file,
+        as bytes.
+
+        Raises :exc:`chrono.error.ZoneError` for invalid data.
+        """
+
+        transitions, types, initial, rule = tzif.parse(data)
+
+        return cls(name, transitions, types, initial, rule)
+
+    @staticmethod
+    def format_offset(offset):
+        """
+        Formats an offset from UTC in seconds as ``+hh:mm``, or
+        ``+hh:mm:ss`` if the offset isn't a whole number of minutes.
+        """
+
+        sign = "-" if offset < 0 else "+"
+        minutes, seconds = divmod(abs(offset), 60)
+
+        if seconds:
+            return "{0}{1:02}:{2:02}:{3:02}".format(
+                sign, minutes // 60, minutes % 60, seconds
+            )
+
+        return "{0}{1:02}:{2:02}".format(sign, minutes // 60, minutes % 60)
+
+    @classmethod
+    def get(cls, name):
+        """
+        Returns the time zone *name*, such as ``Europe/Oslo``, loaded from
+        the first directory in :attr:`chrono.tz.Zone.path` which contains
+        it. Each zone is only loaded once, and the same object is returned
+        for later calls. ``UTC`` is available even without a zoneinfo
+        directory.
+
+        Raises :exc:`chrono.error.ZoneError` for unknown or invalid zones.
+        """
+
+        try:
+            return cls.__zones[name]
+
+        except KeyError:
+            pass
+
+        if not isinstance(name, str) or not cls.__re_name.match(name):
+            raise error.ZoneError("Invalid time zone name '{0}'".format(name))
+
+        with cls.__lock:
+            if name in cls.__zones:
+                return cls.__zones[name]
+
+            for directory in cls.path:
+                path = os.path.join(directory, *name.split("/"))
+
+                if os.path.isfile(path):
+                    with open(path, "rb") as f:
+                        zone = cls.from_tzif(f.read(), name)
+
+                    break
+
+            else:
+                if name != "UTC":
+                    raise error.ZoneError(
+                        "Unknown time zone '{0}'".format(name)
+                    )
+
+                zone = cls.fixed(0)
+
+            cls.__zones[name] = zone
+
+        return zone
+
+    def lookup(self, timestamp):
+        """
+        Returns a tuple with offset from UTC in seconds, **True** if
+        daylight saving time is in effect, otherwise **False**, and the
+        abbreviation (such as ``CEST``), for the UNIX timestamp
+        *timestamp*.
+        """
+
+        if self.__last is not None and timestamp >= self.__last:
+            return self.rule.lookup(timestamp)
+
+        index = bisect.bisect_right(self.__transitions, timestamp)
+
+        return self.__types[index - 1] if index else self.__initial
+
+    def to_local(self, timestamp):
+        """
+        Converts the UNIX timestamp *timestamp* to local time in the zone,
+        returned as seconds since 1970-01-01 00:00:00 local time.
+        """
+
+        return timestamp + self.lookup(timestamp)[0]
+
+    def to_local_many(self, timestamps):
+        """
+        Converts an iterable of UNIX timestamps to local time like
+        :meth:`chrono.tz.Zone.to_local`, and returns an
+        :class:`array.array` of type ``q``. Consecutive timestamps in the
+        same period between transitions reuse the same offset, so sorted
+        or clustered input only needs one lookup per period.
+        """
+
+        result = array.array("q")
+        append = result.append
+        start = end = offset = 0
+
+        for timestamp in timestamps:
+            if not start <= timestamp < end:
+                offset, start, end = self.__span(timestamp)
+
+            append(timestamp + offset)
+
+        return result
+
+    def to_utc(self, local, fold=0):
+        """
+        Converts *local*, seconds since 1970-01-01 00:00:00 local time in
+        the zone, to a UNIX timestamp.
+
+        Local times which occur twice, when clocks are turned back, use the
+        first occurrence, unless *fold* is 1. Local times which don't occur,
+        when clocks are turned forward, are converted using the offset
+        before the transition, or after the transition if *fold* is 1. This
+        is the same behaviour as :mod:`datetime` (see :pep:`495`).
+        """
+
+        before = self.lookup(local - 86400)[0]
+        after = self.lookup(local + 86400)[0]
+
+        if before == after:
+            return local - before
+
+        first = local - before
+        second = local - after
+
+        valid = (
+            self.lookup(first)[0] == before, self.lookup(second)[0] == after
+        )
+
+        if valid[0] != valid[1]:
+            return first if valid[0] else second
+
+        return second if fold else first
+
+    def to_utc_many(self, values, fold=0):
+        """
+        Converts an iterable of local times to UNIX timestamps like
+        :meth:`chrono.tz.Zone.to_utc`, and returns an :class:`array.array`
+        of type ``q``. Local times more than a day away from a transition
+        reuse the offset of the previous value, so sorted or clustered input
+        only needs a full conversion close to transitions.
+        """
+
+        result = array.array("q")
+        append = result.append
+        start = end = offset = 0
+
+        for local in values:
+            timestamp = local - offset
+
+            if not start <= timestamp < end:
+                timestamp = self.to_utc(local, fold)
+                offset, start, end = self.__span(timestamp)
+
+                # only reuse the offset where it is unambiguous
+                start += 86400
+                end -= 86400
+
+            append(timestamp)
+
+        return result
+
+    def utcoffset(self, timestamp):
+        """
+        Returns the offset from UTC in seconds for the UNIX timestamp
+        *timestamp*.
+        """
+
+        return self.lookup(timestamp)[0]
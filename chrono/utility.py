@@ -164,3 +164,96 @@ def integer(value):
         value = int(value)
 
     return value
+
+
+def try_int_day(value):
+    """
+    Converts a day value to an integer like :func:`chrono.utility.int_day`,
+    but returns **None** instead of raising an error if *value* is invalid.
+    """
+
+    try:
+        return int(value)
+
+    except (TypeError, ValueError):
+        return None
+
+
+def try_int_hour(value):
+    """
+    Converts an hour value to an integer like :func:`chrono.utility.int_hour`,
+    but returns **None** instead of raising an error if *value* is invalid.
+    """
+
+    try:
+        return int(value)
+
+    except (TypeError, ValueError):
+        return None
+
+
+def try_int_minute(value):
+    """
+    Converts a minute value to an integer like
+    :func:`chrono.utility.int_minute`, but returns **None** instead of raising
+    an error if *value* is invalid.
+    """
+
+    try:
+        return int(value)
+
+    except (TypeError, ValueError):
+        return None
+
+
+def try_int_month(value):
+    """
+    Converts a month value to an integer like :func:`chrono.utility.int_month`,
+    but returns **None** instead of raising an error if *value* is invalid.
+    """
+
+    try:
+        return int(value)
+
+    except (TypeError, ValueError):
+        return None
+
+
+def try_int_second(value):
+    """
+    Converts a second value to an integer like
+    :func:`chrono.utility.int_second`, but returns **None** instead of raising
+    an error if *value* is invalid.
+    """
+
+    try:
+        return int(value)
+
+    except (TypeError, ValueError):
+        return None
+
+
+def try_int_week(value):
+    """
+    Converts a week value to an integer like :func:`chrono.utility.int_week`,
+    but returns **None** instead of raising an error if *value* is invalid.
+    """
+
+    try:
+        return int(value)
+
+    except (TypeError, ValueError):
+        return None
+
+
+def try_int_year(value):
+    """
+    Converts a year value to an integer like :func:`chrono.utility.int_year`,
+    but returns **None** instead of raising an error if *value* is invalid.
+    """
+
+    try:
+        return int(value)
+
+    except (TypeError, ValueError):
+        return None
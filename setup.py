@@ -83,6 +83,7 @@ setup(
         "chrono.calendar",
         "chrono.clock",
         "chrono.parser",
+        "chrono.tz",
     ),
     cmdclass=cmdclass
 )
@@ -1,11 +1,26 @@
 from __future__ import absolute_import
 
 from .test_calendar import *
+from .test_chrono import *
 from .test_clock import *
+from .test_compactdate import *
+from .test_compactdatetime import *
+from .test_cron import *
 from .test_date import *
+from .test_datearray import *
+from .test_daterange import *
 from .test_datetime import *
+from .test_datetimearray import *
+from .test_defaults import *
+from .test_duration import *
 from .test_error import *
 from .test_formatter import *
+from .test_frozendate import *
+from .test_frozendatetime import *
+from .test_frozentime import *
+from .test_interval import *
 from .test_parser import *
+from .test_recurrence import *
 from .test_time import *
+from .test_tz import *
 from .test_utility import *
@@ -1,5 +1,6 @@
 from __future__ import absolute_import
 
+from .test_business import *
 from .test_calendar import *
 from .test_iso import *
 from .test_us import *
@@ -0,0 +1,386 @@
+#!/usr/bin/env python
+
+import chrono
+import unittest
+
+
+class BusinessCalendar__initTest(unittest.TestCase):
+
+    def test_all(self):
+        "BusinessCalendar() raises ValueError for a weekend of all weekdays"
+
+        self.assertRaises(
+            ValueError,
+            chrono.calendar.BusinessCalendar, weekend=range(1, 8)
+        )
+
+    def test_context(self):
+        "BusinessCalendar() defaults to the calendar set by context()"
+
+        with chrono.context(calendar=chrono.calendar.USCalendar):
+            c = chrono.calendar.BusinessCalendar()
+
+        self.assertIs(c.calendar, chrono.calendar.USCalendar)
+
+    def test_default(self):
+        "BusinessCalendar() defaults to ISOCalendar and saturday/sunday"
+
+        c = chrono.calendar.BusinessCalendar()
+
+        self.assertIs(c.calendar, chrono.calendar.ISOCalendar)
+        self.assertEqual(c.weekend, (6, 7))
+        self.assertEqual(c.holidays, ())
+
+    def test_delegate(self):
+        "BusinessCalendar() looks up other methods on the wrapped calendar"
+
+        c = chrono.calendar.BusinessCalendar(chrono.calendar.USCalendar)
+
+        self.assertEqual(c.weekday(2010, 7, 4), 1)
+        self.assertEqual(c.weekdate(2010, 7, 4), (2010, 28, 1))
+        self.assertEqual(
+            chrono.Date("2010-07-04", calendar=c).weekdate(), (2010, 28, 1)
+        )
+
+    def test_holiday(self):
+        "BusinessCalendar() raises DateError subclass for invalid holiday"
+
+        self.assertRaises(
+            chrono.MonthError,
+            chrono.calendar.BusinessCalendar, holidays=[(2010, 13, 1)]
+        )
+
+    def test_mask(self):
+        "BusinessCalendar() accepts weekend mask strings"
+
+        c = chrono.calendar.BusinessCalendar(weekend="0111110")
+
+        self.assertEqual(c.weekend, (1, 7))
+
+    def test_mask_invalid(self):
+        "BusinessCalendar() raises ValueError for invalid weekend mask"
+
+        self.assertRaises(
+            ValueError,
+            chrono.calendar.BusinessCalendar, weekend="11111"
+        )
+        self.assertRaises(
+            ValueError,
+            chrono.calendar.BusinessCalendar, weekend="1111102"
+        )
+
+    def test_weekday(self):
+        "BusinessCalendar() raises DayError for invalid weekend weekday"
+
+        self.assertRaises(
+            chrono.DayError,
+            chrono.calendar.BusinessCalendar, weekend=(6, 8)
+        )
+
+
+class BusinessCalendar_add_business_daysTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.calendar = chrono.calendar.BusinessCalendar(holidays=[
+            chrono.calendar.FixedHoliday(7, 4, observed=True),
+        ])
+
+    def test_backward(self):
+        "BusinessCalendar.add_business_days() moves back for negative days"
+
+        self.assertEqual(
+            self.calendar.add_business_days(2010, 7, 6, -1), (2010, 7, 2)
+        )
+        self.assertEqual(
+            self.calendar.add_business_days(2010, 7, 4, -1), (2010, 7, 2)
+        )
+
+    def test_forward(self):
+        "BusinessCalendar.add_business_days() skips weekends and holidays"
+
+        self.assertEqual(
+            self.calendar.add_business_days(2010, 7, 2, 1), (2010, 7, 6)
+        )
+        self.assertEqual(
+            self.calendar.add_business_days(2010, 7, 3, 1), (2010, 7, 6)
+        )
+        self.assertEqual(
+            self.calendar.add_business_days(2010, 7, 2, 5), (2010, 7, 12)
+        )
+
+    def test_invalid(self):
+        "BusinessCalendar.add_business_days() raises DayError on invalid date"
+
+        self.assertRaises(
+            chrono.DayError,
+            self.calendar.add_business_days, 2010, 2, 30, 1
+        )
+
+    def test_long(self):
+        "BusinessCalendar.add_business_days() handles spans over many years"
+
+        c = chrono.calendar.BusinessCalendar()
+
+        self.assertEqual(c.add_business_days(2010, 1, 1, 5217), (2030, 1, 1))
+        self.assertEqual(
+            c.add_business_days(2030, 1, 1, -5217), (2010, 1, 1)
+        )
+
+    def test_range(self):
+        "BusinessCalendar.add_business_days() raises YearError out of range"
+
+        self.assertRaises(
+            chrono.YearError,
+            self.calendar.add_business_days, 9999, 12, 30, 2
+        )
+        self.assertRaises(
+            chrono.YearError,
+            self.calendar.add_business_days, 1, 1, 2, -2
+        )
+
+    def test_zero(self):
+        "BusinessCalendar.add_business_days() returns the date for zero days"
+
+        self.assertEqual(
+            self.calendar.add_business_days(2010, 7, 4, 0), (2010, 7, 4)
+        )
+
+
+class BusinessCalendar_business_daysTest(unittest.TestCase):
+
+    def test_holidays(self):
+        "BusinessCalendar.business_days() excludes weekday holidays"
+
+        c = chrono.calendar.BusinessCalendar(holidays=[
+            chrono.calendar.FixedHoliday(1, 1),
+            chrono.calendar.FixedHoliday(12, 25),
+        ])
+
+        self.assertEqual(c.business_days(2010), 260)
+
+    def test_weekdays(self):
+        "BusinessCalendar.business_days() returns weekdays without holidays"
+
+        c = chrono.calendar.BusinessCalendar()
+
+        self.assertEqual(c.business_days(2010), 261)
+        self.assertEqual(c.business_days(2012), 261)
+
+    def test_year(self):
+        "BusinessCalendar.business_days() raises YearError on invalid year"
+
+        self.assertRaises(
+            chrono.YearError,
+            chrono.calendar.BusinessCalendar().business_days, 10000
+        )
+
+
+class BusinessCalendar_business_days_betweenTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.calendar = chrono.calendar.BusinessCalendar(holidays=[
+            chrono.calendar.EasterHoliday(-2),
+            chrono.calendar.EasterHoliday(1),
+        ])
+
+    def test_between(self):
+        "BusinessCalendar.business_days_between() excludes the end date"
+
+        self.assertEqual(
+            self.calendar.business_days_between((2010, 3, 29), (2010, 4, 9)),
+            7
+        )
+
+    def test_invalid(self):
+        "BusinessCalendar.business_days_between() raises MonthError"
+
+        self.assertRaises(
+            chrono.MonthError,
+            self.calendar.business_days_between, (2010, 1, 1), (2010, 13, 1)
+        )
+
+    def test_reverse(self):
+        "BusinessCalendar.business_days_between() is negative for reverse"
+
+        self.assertEqual(
+            self.calendar.business_days_between((2010, 4, 9), (2010, 3, 29)),
+            -7
+        )
+
+    def test_same(self):
+        "BusinessCalendar.business_days_between() returns 0 for same date"
+
+        self.assertEqual(
+            self.calendar.business_days_between((2010, 3, 29), (2010, 3, 29)),
+            0
+        )
+
+    def test_years(self):
+        "BusinessCalendar.business_days_between() handles multiple years"
+
+        self.assertEqual(
+            self.calendar.business_days_between((1990, 1, 1), (2030, 1, 1)),
+            10436 - 80
+        )
+
+
+class BusinessCalendar_is_business_dayTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.calendar = chrono.calendar.BusinessCalendar(
+            chrono.calendar.USCalendar,
+            weekend="1111010",
+            holidays=[
+                chrono.calendar.NthWeekdayHoliday(11, 4, 4),
+                (2010, 12, 24),
+            ]
+        )
+
+    def test_business(self):
+        "BusinessCalendar.is_business_day() returns True for business day"
+
+        self.assertTrue(self.calendar.is_business_day(2010, 11, 24))
+        self.assertTrue(self.calendar.is_business_day(2010, 11, 27))
+
+    def test_date(self):
+        "BusinessCalendar.is_business_day() returns False for holiday date"
+
+        self.assertFalse(self.calendar.is_business_day(2010, 12, 24))
+        self.assertTrue(self.calendar.is_business_day(2011, 12, 24))
+
+    def test_holiday(self):
+        "BusinessCalendar.is_business_day() returns False for holiday rules"
+
+        self.assertFalse(self.calendar.is_business_day(2010, 11, 25))
+        self.assertFalse(self.calendar.is_business_day(2011, 11, 24))
+
+    def test_invalid(self):
+        "BusinessCalendar.is_business_day() raises DayError on invalid date"
+
+        self.assertRaises(
+            chrono.DayError,
+            self.calendar.is_business_day, 2010, 4, 31
+        )
+
+    def test_weekend(self):
+        "BusinessCalendar.is_business_day() returns False for weekend"
+
+        self.assertFalse(self.calendar.is_business_day(2010, 11, 26))
+        self.assertFalse(self.calendar.is_business_day(2010, 11, 28))
+
+
+class EasterHoliday_easterTest(unittest.TestCase):
+
+    def test_easter(self):
+        "EasterHoliday.easter() returns the date of easter sunday"
+
+        self.assertEqual(
+            chrono.calendar.EasterHoliday.easter(2010), (2010, 4, 4)
+        )
+        self.assertEqual(
+            chrono.calendar.EasterHoliday.easter(2011), (2011, 4, 24)
+        )
+        self.assertEqual(
+            chrono.calendar.EasterHoliday.easter(1818), (1818, 3, 22)
+        )
+
+    def test_invalid(self):
+        "EasterHoliday.easter() raises YearError on invalid year"
+
+        self.assertRaises(
+            chrono.YearError,
+            chrono.calendar.EasterHoliday.easter, 10000
+        )
+
+
+class EasterHoliday_juliansTest(unittest.TestCase):
+
+    def test_offset(self):
+        "EasterHoliday.julians() returns days relative to easter"
+
+        self.assertEqual(
+            chrono.calendar.EasterHoliday(-2).julians(2010),
+            [chrono.calendar.Calendar.julian(2010, 4, 2)]
+        )
+
+
+class FixedHoliday__initTest(unittest.TestCase):
+
+    def test_invalid(self):
+        "FixedHoliday() raises DayError on invalid day"
+
+        self.assertRaises(chrono.DayError, chrono.calendar.FixedHoliday, 2, 30)
+
+
+class FixedHoliday_juliansTest(unittest.TestCase):
+
+    def test_fixed(self):
+        "FixedHoliday.julians() returns the date in the year"
+
+        self.assertEqual(
+            chrono.calendar.FixedHoliday(7, 4).julians(2010),
+            [chrono.calendar.Calendar.julian(2010, 7, 4)]
+        )
+
+    def test_leapday(self):
+        "FixedHoliday.julians() returns nothing for missing leap day"
+
+        self.assertEqual(chrono.calendar.FixedHoliday(2, 29).julians(2010), [])
+
+    def test_observed(self):
+        "FixedHoliday.julians() moves observed weekend holidays"
+
+        self.assertEqual(
+            chrono.calendar.FixedHoliday(7, 4, True).julians(2010),
+            [chrono.calendar.Calendar.julian(2010, 7, 5)]
+        )
+        self.assertEqual(
+            chrono.calendar.FixedHoliday(7, 4, True).julians(2009),
+            [chrono.calendar.Calendar.julian(2009, 7, 3)]
+        )
+
+
+class NthWeekdayHoliday__initTest(unittest.TestCase):
+
+    def test_invalid(self):
+        "NthWeekdayHoliday() raises ValueError on invalid occurrence"
+
+        self.assertRaises(
+            ValueError, chrono.calendar.NthWeekdayHoliday, 5, 1, 0
+        )
+        self.assertRaises(
+            ValueError, chrono.calendar.NthWeekdayHoliday, 5, 1, 6
+        )
+
+
+class NthWeekdayHoliday_juliansTest(unittest.TestCase):
+
+    def test_last(self):
+        "NthWeekdayHoliday.julians() counts from the end for negative n"
+
+        self.assertEqual(
+            chrono.calendar.NthWeekdayHoliday(5, 1, -1).julians(2010),
+            [chrono.calendar.Calendar.julian(2010, 5, 31)]
+        )
+
+    def test_missing(self):
+        "NthWeekdayHoliday.julians() returns nothing for missing occurrence"
+
+        self.assertEqual(
+            chrono.calendar.NthWeekdayHoliday(2, 1, 5).julians(2010), []
+        )
+
+    def test_nth(self):
+        "NthWeekdayHoliday.julians() returns the n'th weekday in the month"
+
+        self.assertEqual(
+            chrono.calendar.NthWeekdayHoliday(11, 4, 4).julians(2010),
+            [chrono.calendar.Calendar.julian(2010, 11, 25)]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 
+import array
 import chrono
 import unittest
 
@@ -53,6 +54,37 @@ class Calendar_fullyearTest(unittest.TestCase):
         self.assertEqual(chrono.calendar.Calendar.fullyear("29"), 2029)
 
 
+class Calendar_is_validTest(unittest.TestCase):
+
+    def test_invalid(self):
+        "Calendar.is_valid() returns False for invalid dates"
+
+        self.assertFalse(chrono.calendar.Calendar.is_valid(0, 7, 23))
+        self.assertFalse(chrono.calendar.Calendar.is_valid(10000, 7, 23))
+        self.assertFalse(chrono.calendar.Calendar.is_valid(2010, 13, 23))
+        self.assertFalse(chrono.calendar.Calendar.is_valid(2010, 0, 23))
+        self.assertFalse(chrono.calendar.Calendar.is_valid(2010, 2, 29))
+        self.assertFalse(chrono.calendar.Calendar.is_valid(2010, 7, 0))
+
+    def test_invalid_type(self):
+        "Calendar.is_valid() returns False for invalid types and strings"
+
+        self.assertFalse(chrono.calendar.Calendar.is_valid(None, 7, 23))
+        self.assertFalse(chrono.calendar.Calendar.is_valid("abc", 7, 23))
+
+    def test_string(self):
+        "Calendar.is_valid() accepts string input"
+
+        self.assertTrue(chrono.calendar.Calendar.is_valid("2008", "2", "29"))
+
+    def test_valid(self):
+        "Calendar.is_valid() returns True for valid dates"
+
+        self.assertTrue(chrono.calendar.Calendar.is_valid(2008, 2, 29))
+        self.assertTrue(chrono.calendar.Calendar.is_valid(1, 1, 1))
+        self.assertTrue(chrono.calendar.Calendar.is_valid(9999, 12, 31))
+
+
 class Calendar_julianTest(unittest.TestCase):
 
     def test_1858_11_16(self):
@@ -313,6 +345,107 @@ class Calendar_ordinal_to_dateTest(unittest.TestCase):
         )
 
 
+class Calendar_unix_utcTest(unittest.TestCase):
+
+    def test_invalid(self):
+        "Calendar.unix_utc() raises errors on invalid values"
+
+        c = chrono.calendar.Calendar
+
+        self.assertRaises(chrono.DayError, c.unix_utc, 2010, 2, 29)
+        self.assertRaises(chrono.HourError, c.unix_utc, 2010, 2, 28, 24, 0, 0)
+
+    def test_unix_utc(self):
+        "Calendar.unix_utc() returns UTC timestamps"
+
+        c = chrono.calendar.Calendar
+
+        self.assertEqual(c.unix_utc(1970, 1, 1), 0)
+        self.assertEqual(c.unix_utc(2010, 7, 23, 16, 27, 43), 1279902463)
+        self.assertEqual(c.unix_utc(1969, 12, 31, 23, 59, 59), -1)
+        self.assertEqual(c.unix_utc(1, 1, 1), -62135596800)
+        self.assertEqual(c.unix_utc("2010", "7", "23"), 1279843200)
+
+
+class Calendar_unix_utc_manyTest(unittest.TestCase):
+
+    def test_invalid(self):
+        "Calendar.unix_utc_many() raises errors on invalid values"
+
+        c = chrono.calendar.Calendar
+
+        self.assertRaises(chrono.DayError, c.unix_utc_many, [(2010, 2, 29)])
+        self.assertRaises(chrono.MonthError, c.unix_utc_many, [(2010, 0, 1)])
+        self.assertRaises(chrono.MonthError, c.unix_utc_many, [(2010, -1, 5)])
+        self.assertRaises(chrono.MonthError, c.unix_utc_many, [(2010, 13, 1)])
+        self.assertRaises(chrono.YearError, c.unix_utc_many, [(0, 1, 1)])
+        self.assertRaises(
+            chrono.MinuteError, c.unix_utc_many, [(2010, 1, 1, 0, 60, 0)]
+        )
+
+    def test_unix_utc_many(self):
+        "Calendar.unix_utc_many() returns an array of UTC timestamps"
+
+        self.assertEqual(
+            chrono.calendar.Calendar.unix_utc_many([
+                (1970, 1, 1), (2010, 7, 23, 16, 27, 43), ("2010", "7", "23")
+            ]),
+            array.array("q", [0, 1279902463, 1279843200])
+        )
+
+    def test_values(self):
+        "Calendar.unix_utc_many() converts values like unix_utc()"
+
+        c = chrono.calendar.Calendar
+
+        for value in ((2010, 7, 23, 16.0, 27, 43), (2010, 7, 23.0)):
+            self.assertEqual(
+                c.unix_utc_many([value]),
+                array.array("q", [c.unix_utc(*value)])
+            )
+
+
+class Calendar_unix_utc_to_datetimeTest(unittest.TestCase):
+
+    def test_range(self):
+        "Calendar.unix_utc_to_datetime() raises YearError outside 1-9999"
+
+        c = chrono.calendar.Calendar
+
+        self.assertRaises(
+            chrono.YearError, c.unix_utc_to_datetime, -62135596801
+        )
+        self.assertRaises(
+            chrono.YearError, c.unix_utc_to_datetime_many, [253402300800]
+        )
+
+    def test_unix_utc_to_datetime(self):
+        "Calendar.unix_utc_to_datetime() returns UTC date/times"
+
+        c = chrono.calendar.Calendar
+
+        self.assertEqual(
+            c.unix_utc_to_datetime(1279902463), (2010, 7, 23, 16, 27, 43)
+        )
+        self.assertEqual(
+            c.unix_utc_to_datetime_many([-1, 0, 253402300799]),
+            [
+                (1969, 12, 31, 23, 59, 59), (1970, 1, 1, 0, 0, 0),
+                (9999, 12, 31, 23, 59, 59)
+            ]
+        )
+
+    def test_roundtrip(self):
+        "Calendar.unix_utc_to_datetime() is the inverse of unix_utc()"
+
+        c = chrono.calendar.Calendar
+
+        for timestamp in range(-62135596800, 253402300800, 999999937):
+            self.assertEqual(
+                c.unix_utc(*c.unix_utc_to_datetime(timestamp)), timestamp
+            )
+
+
 class Calendar_validateTest(unittest.TestCase):
 
     def test_invalid(self):
@@ -689,5 +822,49 @@ class Calendar_yeardaysTest(unittest.TestCase):
         self.assertEquals(chrono.calendar.Calendar.yeardays("2008"), 366)
 
 
+class Calendar_yearinfoTest(unittest.TestCase):
+
+    def test_2009(self):
+        "Calendar.yearinfo() returns data for 2009"
+
+        self.assertEquals(
+            chrono.calendar.Calendar.yearinfo(2009),
+            (False, 2454833, 4, (
+                0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334, 365
+            ))
+        )
+
+    def test_2008(self):
+        "Calendar.yearinfo() returns data for leap year 2008"
+
+        self.assertEquals(
+            chrono.calendar.Calendar.yearinfo(2008),
+            (True, 2454467, 2, (
+                0, 31, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335, 366
+            ))
+        )
+
+    def test_invalid(self):
+        "Calendar.yearinfo() raises YearError on invalid year"
+
+        self.assertRaises(
+            chrono.YearError, chrono.calendar.Calendar.yearinfo, 10000
+        )
+        self.assertRaises(
+            chrono.YearError, chrono.calendar.Calendar.yearinfo, "abc"
+        )
+        self.assertRaises(
+            chrono.YearError, chrono.calendar.Calendar.yearinfo, []
+        )
+
+    def test_string(self):
+        "Calendar.yearinfo() accepts string input"
+
+        self.assertEquals(
+            chrono.calendar.Calendar.yearinfo("2009"),
+            chrono.calendar.Calendar.yearinfo(2009)
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -187,6 +187,11 @@ class ISOCalendar_weeksTest(unittest.TestCase):
 
         self.assertEquals(chrono.calendar.ISOCalendar.weeks(2008), 52)
 
+    def test_2004(self):
+        "ISOCalendar.weeks() returns 53 for 2004"
+
+        self.assertEquals(chrono.calendar.ISOCalendar.weeks(2004), 53)
+
     def test_2009(self):
         "ISOCalendar.weeks() returns 53 for 2009"
 
@@ -48,6 +48,14 @@ class USCalendar_weekdateTest(unittest.TestCase):
             (2010, 1, 6)
         )
 
+    def test_2010_01_02(self):
+        "USCalendar.weekdate() returns 2010-W01-7 for 2010-01-02"
+
+        self.assertEquals(
+            chrono.calendar.USCalendar.weekdate(2010, 1, 2),
+            (2010, 1, 7)
+        )
+
     def test_2010_01_04(self):
         "USCalendar.weekdate() returns 2010-W02-2 for 2010-01-04"
 
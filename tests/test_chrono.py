@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+
+import chrono
+import os.path
+import subprocess
+import sys
+import unittest
+
+
+class chrono__allTest(unittest.TestCase):
+
+    def test_all(self):
+        "__all__ lists names which exist, including lazy ones"
+
+        for name in chrono.__all__:
+            self.assertTrue(hasattr(chrono, name), name)
+
+        self.assertFalse("range" in chrono.__all__)
+
+    def test_star(self):
+        "from chrono import * imports names which are imported on first use"
+
+        names = {}
+        exec("from chrono import *", names)
+
+        self.assertTrue(names["parser"] is chrono.parser)
+        self.assertTrue(names["DEFAULT_PARSER"] is chrono.DEFAULT_PARSER)
+        self.assertTrue(names["Date"] is chrono.Date)
+        self.assertTrue(names["ParseError"] is chrono.ParseError)
+
+
+class chrono__dirTest(unittest.TestCase):
+
+    def test_lazy(self):
+        "dir() includes names which are imported on first use"
+
+        self.assertTrue("DateArray" in dir(chrono))
+        self.assertTrue("tz" in dir(chrono))
+        self.assertTrue("Date" in dir(chrono))
+
+
+class chrono__getattrTest(unittest.TestCase):
+
+    def test_class(self):
+        "Classes are imported on first use"
+
+        import chrono.datearray
+
+        self.assertTrue(chrono.DateArray is chrono.datearray.DateArray)
+
+    def test_default_parser(self):
+        "DEFAULT_PARSER defaults to CommonParser"
+
+        self.assertTrue(chrono.DEFAULT_PARSER is chrono.parser.CommonParser)
+
+    def test_import(self):
+        "Importing chrono doesn't import parsers, time zones, or arrays"
+
+        path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        code = (
+            "import sys; sys.path.insert(0, {0!r}); import chrono; "
+            "print(' '.join(sorted(sys.modules)))"
+        ).format(path)
+
+        modules = subprocess.check_output(
+            [sys.executable, "-c", code]
+        ).decode("ascii").split()
+
+        self.assertTrue("chrono.date" in modules)
+
+        for module in (
+            "chrono.datearray", "chrono.parser", "chrono.parser.iso",
+            "chrono.tz", "calendar"
+        ):
+            self.assertFalse(module in modules, module)
+
+    def test_invalid(self):
+        "Unknown attributes raise AttributeError"
+
+        self.assertRaises(AttributeError, getattr, chrono, "invalid")
+
+    def test_module(self):
+        "Subpackages are imported on first use"
+
+        import chrono.tz.zone
+
+        self.assertTrue(chrono.tz.Zone is chrono.tz.zone.Zone)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,34 @@ import chrono
 import unittest
 
 
+class Clock_is_validTest(unittest.TestCase):
+
+    def test_invalid(self):
+        "Clock.is_valid() returns False for invalid times"
+
+        self.assertFalse(chrono.clock.Clock.is_valid(24, 27, 43))
+        self.assertFalse(chrono.clock.Clock.is_valid(-1, 27, 43))
+        self.assertFalse(chrono.clock.Clock.is_valid(16, 60, 43))
+        self.assertFalse(chrono.clock.Clock.is_valid(16, 27, 60))
+
+    def test_invalid_type(self):
+        "Clock.is_valid() returns False for invalid types and strings"
+
+        self.assertFalse(chrono.clock.Clock.is_valid(None, 27, 43))
+        self.assertFalse(chrono.clock.Clock.is_valid(16, "abc", 43))
+
+    def test_string(self):
+        "Clock.is_valid() accepts string input"
+
+        self.assertTrue(chrono.clock.Clock.is_valid("16", "27", "43"))
+
+    def test_valid(self):
+        "Clock.is_valid() returns True for valid times"
+
+        self.assertTrue(chrono.clock.Clock.is_valid(0, 0, 0))
+        self.assertTrue(chrono.clock.Clock.is_valid(23, 59, 59))
+
+
 class Clock_julianTest(unittest.TestCase):
 
     def test_0_0_0(self):
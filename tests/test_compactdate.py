@@ -0,0 +1,503 @@
+#!/usr/bin/env python
+
+import chrono
+import datetime
+import sys
+import unittest
+import time
+
+
+class CompactDate__addTest(unittest.TestCase):
+
+    def test_duration(self):
+        "CompactDate.__add__() adds durations"
+
+        d = chrono.CompactDate(
+            "2012-02-29", calendar=chrono.calendar.USCalendar
+        )
+
+        self.assertEqual((d + chrono.Duration(years=1)).get(), (2013, 2, 28))
+        self.assertEqual((chrono.Duration(days=1) + d).get(), (2012, 3, 1))
+        self.assertTrue(
+            (d + chrono.Duration()).calendar is chrono.calendar.USCalendar
+        )
+        self.assertRaises(TypeError, lambda: d + 1)
+
+
+class CompactDate__eqTest(unittest.TestCase):
+
+    def test_compactdate(self):
+        "CompactDate.__eq__() handles CompactDate objects"
+
+        self.assertTrue(
+            chrono.CompactDate("2009-12-27") == chrono.CompactDate("2009-12-27")
+        )
+        self.assertFalse(
+            chrono.CompactDate("2009-12-27") == chrono.CompactDate("2009-12-28")
+        )
+
+    def test_date(self):
+        "CompactDate.__eq__() handles Date objects"
+
+        self.assertTrue(
+            chrono.CompactDate("2009-12-27") == chrono.Date("2009-12-27")
+        )
+        self.assertFalse(
+            chrono.CompactDate("2009-12-27") == chrono.Date("2009-12-28")
+        )
+
+    def test_none(self):
+        "CompactDate.__eq__() handles None"
+
+        self.assertTrue(chrono.CompactDate() == None)
+        self.assertFalse(chrono.CompactDate("2010-07-23") == None)
+
+    def test_string(self):
+        "CompactDate.__eq__() handles strings"
+
+        self.assertTrue(chrono.CompactDate("2009-12-27") == "2009-12-27")
+        self.assertFalse(chrono.CompactDate("2010-07-23") == "2010-07-22")
+
+
+class CompactDate__ltTest(unittest.TestCase):
+
+    def test_compactdate(self):
+        "CompactDate.__lt__() handles CompactDate objects"
+
+        self.assertTrue(
+            chrono.CompactDate("2009-12-27") < chrono.CompactDate("2009-12-28")
+        )
+        self.assertFalse(
+            chrono.CompactDate("2009-12-28") < chrono.CompactDate("2009-12-28")
+        )
+
+    def test_none(self):
+        "CompactDate.__lt__() handles None"
+
+        self.assertTrue(chrono.CompactDate() < "2009-12-28")
+        self.assertFalse(chrono.CompactDate("2009-12-28") < None)
+
+
+class CompactDate__subTest(unittest.TestCase):
+
+    def test_sub(self):
+        "CompactDate.__sub__() subtracts dates and durations"
+
+        d = chrono.CompactDate("2010-07-23")
+
+        self.assertEqual(
+            d - chrono.CompactDate("2010-07-01"), chrono.Duration(days=22)
+        )
+        self.assertEqual(
+            d - chrono.Date("2010-07-24"), chrono.Duration(days=-1)
+        )
+        self.assertEqual(
+            (d - chrono.Duration(weeks=1)).get(), (2010, 7, 16)
+        )
+        self.assertRaises(TypeError, lambda: d - 1)
+
+
+class CompactDate__initTest(unittest.TestCase):
+
+    def test_compactdate(self):
+        "CompactDate.__init__() handles CompactDate objects"
+
+        self.assertEqual(
+            chrono.CompactDate(chrono.CompactDate("2010-07-23")).get(),
+            (2010, 7, 23)
+        )
+
+    def test_date(self):
+        "CompactDate.__init__() handles Date objects"
+
+        self.assertEqual(
+            chrono.CompactDate(chrono.Date("2010-07-23")).get(),
+            (2010, 7, 23)
+        )
+
+    def test_date_empty(self):
+        "CompactDate.__init__() gives an empty date for empty Date objects"
+
+        self.assertFalse(chrono.CompactDate(chrono.Date()).is_set())
+
+    def test_datetime(self):
+        "CompactDate.__init__() handles datetime.date objects"
+
+        self.assertEqual(
+            chrono.CompactDate(datetime.date(2010, 7, 23)).get(),
+            (2010, 7, 23)
+        )
+
+    def test_default_calendar(self):
+        "CompactDate.__init__() uses chrono.DEFAULT_CALENDAR by default"
+
+        self.assertTrue(
+            chrono.CompactDate().calendar is chrono.DEFAULT_CALENDAR
+        )
+
+    def test_invalid(self):
+        "CompactDate.__init__() raises TypeError on invalid type"
+
+        self.assertRaises(TypeError, chrono.CompactDate, 1.5)
+
+    def test_julian(self):
+        "CompactDate.__init__() handles julian keyword"
+
+        self.assertEqual(
+            chrono.CompactDate(julian=2455401).get(), (2010, 7, 23)
+        )
+
+    def test_keywords(self):
+        "CompactDate.__init__() handles year, month, and day keywords"
+
+        self.assertEqual(
+            chrono.CompactDate(year=2010, month=7, day=23).get(),
+            (2010, 7, 23)
+        )
+
+    def test_none(self):
+        "CompactDate.__init__() creates empty date for None"
+
+        self.assertEqual(chrono.CompactDate().julian, None)
+
+    def test_parser(self):
+        "CompactDate.__init__() uses the given parser"
+
+        self.assertEqual(
+            chrono.CompactDate(
+                "23072010", parser=chrono.parser.EuroParser
+            ).get(),
+            (2010, 7, 23)
+        )
+
+    def test_slots(self):
+        "CompactDate.__init__() creates objects without instance dictionary"
+
+        self.assertFalse(hasattr(chrono.CompactDate("2010-07-23"), "__dict__"))
+        self.assertTrue(
+            sys.getsizeof(chrono.CompactDate("2010-07-23")) <
+            sys.getsizeof(chrono.Date("2010-07-23").__dict__)
+        )
+
+    def test_string(self):
+        "CompactDate.__init__() handles strings"
+
+        self.assertEqual(
+            chrono.CompactDate("2010-07-23").get(), (2010, 7, 23)
+        )
+
+    def test_struct_time(self):
+        "CompactDate.__init__() handles struct_time objects"
+
+        self.assertEqual(
+            chrono.CompactDate(
+                datetime.date(2010, 7, 23).timetuple()
+            ).get(),
+            (2010, 7, 23)
+        )
+
+    def test_unix(self):
+        "CompactDate.__init__() handles UNIX timestamps"
+
+        self.assertEqual(
+            chrono.CompactDate(1280000000).get(),
+            chrono.Date(1280000000).get()
+        )
+
+
+class CompactDate__reprTest(unittest.TestCase):
+
+    def test_empty(self):
+        "CompactDate.__repr__() handles empty dates"
+
+        self.assertEqual(repr(chrono.CompactDate()), "chrono.CompactDate()")
+
+    def test_repr(self):
+        "CompactDate.__repr__() includes year, month, and day"
+
+        self.assertEqual(
+            repr(chrono.CompactDate("2010-07-23")),
+            "chrono.CompactDate(year=2010, month=7, day=23)"
+        )
+
+
+class CompactDate__strTest(unittest.TestCase):
+
+    def test_empty(self):
+        "CompactDate.__str__() returns empty string for empty dates"
+
+        self.assertEqual(str(chrono.CompactDate()), "")
+
+    def test_str(self):
+        "CompactDate.__str__() returns date string"
+
+        self.assertEqual(str(chrono.CompactDate("2010-07-23")), "2010-07-23")
+
+
+class CompactDate_dayTest(unittest.TestCase):
+
+    def test_get(self):
+        "CompactDate.day returns day"
+
+        self.assertEqual(chrono.CompactDate("2010-07-23").day, 23)
+        self.assertEqual(chrono.CompactDate().day, None)
+
+    def test_none(self):
+        "CompactDate.day clears date when set to None"
+
+        d = chrono.CompactDate("2010-07-23")
+        d.day = None
+
+        self.assertFalse(d.is_set())
+
+    def test_overflow(self):
+        "CompactDate.day handles overflows"
+
+        d = chrono.CompactDate("2010-12-23")
+        d.day += 10
+
+        self.assertEqual(d.get(), (2011, 1, 2))
+
+    def test_underflow(self):
+        "CompactDate.day handles underflows"
+
+        d = chrono.CompactDate("2010-03-01")
+        d.day -= 1
+
+        self.assertEqual(d.get(), (2010, 2, 28))
+
+    def test_unset(self):
+        "CompactDate.day raises NoDateTimeError when no date is set"
+
+        d = chrono.CompactDate()
+
+        self.assertRaises(chrono.NoDateTimeError, setattr, d, "day", 1)
+
+
+class CompactDate_monthTest(unittest.TestCase):
+
+    def test_daycarry(self):
+        "CompactDate.month carries days past end of month"
+
+        d = chrono.CompactDate("2010-01-31")
+        d.month = 2
+
+        self.assertEqual(d.get(), (2010, 3, 3))
+
+    def test_overflow(self):
+        "CompactDate.month handles overflows"
+
+        d = chrono.CompactDate("2010-07-23")
+        d.month += 18
+
+        self.assertEqual(d.get(), (2012, 1, 23))
+
+    def test_underflow(self):
+        "CompactDate.month handles underflows"
+
+        d = chrono.CompactDate("2010-07-23")
+        d.month -= 7
+
+        self.assertEqual(d.get(), (2009, 12, 23))
+
+    def test_same_as_date(self):
+        "CompactDate.month gives same results as Date.month"
+
+        for value in range(-30, 30):
+            c = chrono.CompactDate("2010-03-31")
+            d = chrono.Date("2010-03-31")
+
+            c.month = value
+            d.month = value
+
+            self.assertEqual(c.get(), d.get())
+
+
+class CompactDate_yearTest(unittest.TestCase):
+
+    def test_invalid(self):
+        "CompactDate.year raises YearError on invalid year"
+
+        d = chrono.CompactDate("2010-07-23")
+
+        self.assertRaises(chrono.YearError, setattr, d, "year", 10000)
+
+    def test_leapyear(self):
+        "CompactDate.year carries leap days into March"
+
+        d = chrono.CompactDate("2008-02-29")
+        d.year = 2010
+
+        self.assertEqual(d.get(), (2010, 3, 1))
+
+    def test_set(self):
+        "CompactDate.year sets year"
+
+        d = chrono.CompactDate("2010-07-23")
+        d.year = 2005
+
+        self.assertEqual(d.get(), (2005, 7, 23))
+
+
+class CompactDate_deltaTest(unittest.TestCase):
+
+    def test_delta(self):
+        "CompactDate.delta() returns difference in seconds"
+
+        self.assertEqual(
+            chrono.CompactDate("2010-07-23").delta(
+                chrono.CompactDate("2010-07-25")
+            ),
+            172800
+        )
+
+    def test_string(self):
+        "CompactDate.delta() handles strings"
+
+        self.assertEqual(
+            chrono.CompactDate("2010-07-23").delta("2010-07-22"), -86400
+        )
+
+
+class CompactDate_formatTest(unittest.TestCase):
+
+    def test_format(self):
+        "CompactDate.format() formats the date"
+
+        self.assertEqual(
+            chrono.CompactDate("2010-07-23").format("$day.$month.$year"),
+            "23.7.2010"
+        )
+
+    def test_unset(self):
+        "CompactDate.format() raises NoDateTimeError on missing date"
+
+        self.assertRaises(
+            chrono.NoDateTimeError, chrono.CompactDate().format, "$year"
+        )
+
+
+class CompactDate_get_dateTest(unittest.TestCase):
+
+    def test_get_date(self):
+        "CompactDate.get_date() returns Date object with same calendar"
+
+        d = chrono.CompactDate(
+            "2010-07-23", calendar=chrono.calendar.USCalendar
+        ).get_date()
+
+        self.assertTrue(isinstance(d, chrono.Date))
+        self.assertEqual(d.get(), (2010, 7, 23))
+        self.assertTrue(d.calendar is chrono.calendar.USCalendar)
+
+
+class CompactDate_get_julianTest(unittest.TestCase):
+
+    def test_get_julian(self):
+        "CompactDate.get_julian() returns julian day number"
+
+        self.assertEqual(
+            chrono.CompactDate("2010-07-23").get_julian(),
+            chrono.Date("2010-07-23").get_julian()
+        )
+
+
+class CompactDate_get_unixTest(unittest.TestCase):
+
+    def test_get_unix(self):
+        "CompactDate.get_unix() returns same value as Date.get_unix()"
+
+        self.assertEqual(
+            chrono.CompactDate("2010-07-23").get_unix(),
+            chrono.Date("2010-07-23").get_unix()
+        )
+
+
+class CompactDate_unix_utcTest(unittest.TestCase):
+
+    def test_get_unix_utc(self):
+        "CompactDate.get_unix_utc() returns same value as Date.get_unix_utc()"
+
+        self.assertEqual(
+            chrono.CompactDate("2010-07-23").get_unix_utc(),
+            chrono.Date("2010-07-23").get_unix_utc()
+        )
+
+    def test_set_unix_utc(self):
+        "CompactDate.set_unix_utc() sets date from UTC unix timestamp"
+
+        d = chrono.CompactDate()
+        d.set_unix_utc(-1)
+
+        self.assertEqual(d.get(), (1969, 12, 31))
+        self.assertRaises(chrono.YearError, d.set_unix_utc, 253402300800)
+
+
+class CompactDate_calendarTest(unittest.TestCase):
+
+    def test_calendar(self):
+        "CompactDate calendar methods give same results as Date"
+
+        for string in ("2008-02-29", "2009-12-31", "2010-01-03", "2010-07-23"):
+            for cal in (chrono.calendar.ISOCalendar, chrono.calendar.USCalendar):
+                c = chrono.CompactDate(string, calendar=cal)
+                d = chrono.Date(string, calendar=cal)
+
+                self.assertEqual(c.leapyear(), d.leapyear())
+                self.assertEqual(c.monthdays(), d.monthdays())
+                self.assertEqual(c.ordinal(), d.ordinal())
+                self.assertEqual(c.week(), d.week())
+                self.assertEqual(c.weekdate(), d.weekdate())
+                self.assertEqual(c.weekday(), d.weekday())
+                self.assertEqual(c.weeks(), d.weeks())
+                self.assertEqual(c.yeardays(), d.yeardays())
+
+
+class CompactDate_set_julianTest(unittest.TestCase):
+
+    def test_invalid(self):
+        "CompactDate.set_julian() raises DayError on invalid input"
+
+        self.assertRaises(
+            chrono.DayError, chrono.CompactDate().set_julian, "abc"
+        )
+
+    def test_range(self):
+        "CompactDate.set_julian() raises YearError outside years 1-9999"
+
+        self.assertRaises(
+            chrono.YearError, chrono.CompactDate().set_julian, 1721425
+        )
+        self.assertRaises(
+            chrono.YearError, chrono.CompactDate().set_julian, 5373485
+        )
+
+    def test_set_julian(self):
+        "CompactDate.set_julian() sets date from julian day"
+
+        d = chrono.CompactDate()
+        d.set_julian(2455401)
+
+        self.assertEqual(d.get(), (2010, 7, 23))
+
+
+class CompactDate_setTest(unittest.TestCase):
+
+    def test_invalid(self):
+        "CompactDate.set() raises error on invalid date"
+
+        self.assertRaises(
+            chrono.DayError, chrono.CompactDate().set, 2010, 2, 29
+        )
+
+    def test_set(self):
+        "CompactDate.set() sets date"
+
+        d = chrono.CompactDate()
+        d.set(2010, 7, 23)
+
+        self.assertEqual(d.get(), (2010, 7, 23))
+
+
+if __name__ == "__main__":
+    unittest.main()
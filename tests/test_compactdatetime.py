@@ -0,0 +1,461 @@
+#!/usr/bin/env python
+
+import chrono
+import datetime
+import sys
+import unittest
+
+
+class CompactDateTime__addTest(unittest.TestCase):
+
+    def test_calendar(self):
+        "CompactDateTime.__add__() keeps the calendar"
+
+        d = chrono.CompactDateTime(
+            "2010-07-23 16:27:43", calendar=chrono.calendar.USCalendar
+        ) + 1
+
+        self.assertTrue(d.calendar is chrono.calendar.USCalendar)
+
+    def test_invalid(self):
+        "CompactDateTime.__add__() raises TypeError on invalid type"
+
+        d = chrono.CompactDateTime("2010-07-23 16:27:43")
+
+        self.assertRaises(TypeError, lambda: d + "abc")
+        self.assertRaises(TypeError, lambda: d + 1.5)
+
+    def test_range(self):
+        "CompactDateTime.__add__() raises YearError outside years 1-9999"
+
+        d = chrono.CompactDateTime("9999-12-31 23:59:59")
+
+        self.assertRaises(chrono.YearError, lambda: d + 1)
+
+    def test_seconds(self):
+        "CompactDateTime.__add__() adds seconds"
+
+        d = chrono.CompactDateTime("2010-07-23 16:27:43")
+
+        self.assertEqual((d + 10000000).get(), (2010, 11, 16, 10, 14, 23))
+        self.assertEqual((10 + d).get(), (2010, 7, 23, 16, 27, 53))
+        self.assertEqual(d.get(), (2010, 7, 23, 16, 27, 43))
+
+    def test_timedelta(self):
+        "CompactDateTime.__add__() adds timedelta objects"
+
+        self.assertEqual(
+            (
+                chrono.CompactDateTime("2010-07-23 16:27:43") +
+                datetime.timedelta(days=-1, seconds=60)
+            ).get(),
+            (2010, 7, 22, 16, 28, 43)
+        )
+
+
+    def test_duration(self):
+        "CompactDateTime.__add__() adds Duration objects"
+
+        d = chrono.CompactDateTime("2010-01-31 16:27:43")
+
+        self.assertEqual(
+            (d + chrono.Duration(months=1, hours=8)).get(),
+            (2010, 3, 1, 0, 27, 43)
+        )
+        self.assertEqual(
+            (chrono.Duration(years=-1) + d).get(), (2009, 1, 31, 16, 27, 43)
+        )
+
+
+class CompactDateTime__eqTest(unittest.TestCase):
+
+    def test_compactdatetime(self):
+        "CompactDateTime.__eq__() handles CompactDateTime objects"
+
+        self.assertTrue(
+            chrono.CompactDateTime("2010-07-23 16:27:43") ==
+            chrono.CompactDateTime("2010-07-23 16:27:43")
+        )
+        self.assertFalse(
+            chrono.CompactDateTime("2010-07-23 16:27:43") ==
+            chrono.CompactDateTime("2010-07-23 16:27:44")
+        )
+
+    def test_none(self):
+        "CompactDateTime.__eq__() handles None"
+
+        self.assertTrue(chrono.CompactDateTime() == None)
+        self.assertFalse(chrono.CompactDateTime("2010-07-23 16:27:43") == None)
+
+    def test_string(self):
+        "CompactDateTime.__eq__() handles strings"
+
+        self.assertTrue(
+            chrono.CompactDateTime("2010-07-23 16:27:43") ==
+            "2010-07-23 16:27:43"
+        )
+
+
+class CompactDateTime__ltTest(unittest.TestCase):
+
+    def test_lt(self):
+        "CompactDateTime.__lt__() compares date/times"
+
+        self.assertTrue(
+            chrono.CompactDateTime("2010-07-23 16:27:43") <
+            chrono.CompactDateTime("2010-07-23 16:27:44")
+        )
+        self.assertFalse(
+            chrono.CompactDateTime("2010-07-23 16:27:43") <
+            chrono.CompactDateTime("2010-07-22 16:27:44")
+        )
+
+
+class CompactDateTime__initTest(unittest.TestCase):
+
+    def test_date(self):
+        "CompactDateTime.__init__() handles Date and CompactDate objects"
+
+        self.assertEqual(
+            chrono.CompactDateTime(chrono.Date("2010-07-23")).get(),
+            (2010, 7, 23, 0, 0, 0)
+        )
+        self.assertEqual(
+            chrono.CompactDateTime(chrono.CompactDate("2010-07-23")).get(),
+            (2010, 7, 23, 0, 0, 0)
+        )
+
+    def test_datetime(self):
+        "CompactDateTime.__init__() handles DateTime and datetime objects"
+
+        self.assertEqual(
+            chrono.CompactDateTime(
+                chrono.DateTime("2010-07-23 16:27:43")
+            ).get(),
+            (2010, 7, 23, 16, 27, 43)
+        )
+        self.assertEqual(
+            chrono.CompactDateTime(
+                datetime.datetime(2010, 7, 23, 16, 27, 43)
+            ).get(),
+            (2010, 7, 23, 16, 27, 43)
+        )
+
+    def test_empty(self):
+        "CompactDateTime.__init__() gives an empty object for empty values"
+
+        self.assertFalse(chrono.CompactDateTime(chrono.Date()).is_set())
+        self.assertFalse(chrono.CompactDateTime(chrono.DateTime()).is_set())
+        self.assertFalse(
+            chrono.CompactDateTime(chrono.CompactDate()).is_set()
+        )
+
+        d = chrono.DateTime()
+        d.year, d.month, d.day = 2010, 7, 23
+
+        self.assertFalse(chrono.CompactDateTime(d).is_set())
+
+    def test_epoch(self):
+        "CompactDateTime.__init__() handles epoch keyword"
+
+        self.assertEqual(
+            chrono.CompactDateTime(epoch=1279902463).get(),
+            (2010, 7, 23, 16, 27, 43)
+        )
+        self.assertEqual(
+            chrono.CompactDateTime(epoch=-62135596800).get(),
+            (1, 1, 1, 0, 0, 0)
+        )
+
+    def test_invalid(self):
+        "CompactDateTime.__init__() raises TypeError on invalid type"
+
+        self.assertRaises(TypeError, chrono.CompactDateTime, 1.5)
+
+    def test_keywords(self):
+        "CompactDateTime.__init__() handles date/time keywords"
+
+        self.assertEqual(
+            chrono.CompactDateTime(
+                year=2010, month=7, day=23, hour=16, minute=27, second=43
+            ).epoch,
+            1279902463
+        )
+
+    def test_pydate(self):
+        "CompactDateTime.__init__() handles date objects as midnight"
+
+        self.assertEqual(
+            chrono.CompactDateTime(datetime.date(2010, 7, 23)).get(),
+            (2010, 7, 23, 0, 0, 0)
+        )
+
+    def test_slots(self):
+        "CompactDateTime.__init__() creates objects without instance dictionary"
+
+        self.assertFalse(
+            hasattr(chrono.CompactDateTime("2010-07-23 16:27:43"), "__dict__")
+        )
+
+    def test_unix(self):
+        "CompactDateTime.__init__() handles UNIX timestamps"
+
+        self.assertEqual(
+            chrono.CompactDateTime(1280000000).get(),
+            chrono.DateTime(1280000000).get()
+        )
+
+
+class CompactDateTime__reprTest(unittest.TestCase):
+
+    def test_repr(self):
+        "CompactDateTime.__repr__() includes date/time values"
+
+        self.assertEqual(repr(chrono.CompactDateTime()), "chrono.CompactDateTime()")
+        self.assertEqual(
+            repr(chrono.CompactDateTime("2010-07-23 16:27:43")),
+            "chrono.CompactDateTime(year=2010, month=7, day=23, "
+            "hour=16, minute=27, second=43)"
+        )
+
+
+class CompactDateTime__subTest(unittest.TestCase):
+
+    def test_sub(self):
+        "CompactDateTime.__sub__() subtracts durations"
+
+        d = chrono.CompactDateTime("2010-07-23 16:27:43")
+
+        self.assertEqual((d - 86400).get(), (2010, 7, 22, 16, 27, 43))
+        self.assertEqual(
+            (d - datetime.timedelta(minutes=30)).get(),
+            (2010, 7, 23, 15, 57, 43)
+        )
+        self.assertRaises(TypeError, lambda: d - "abc")
+
+    def test_datetime(self):
+        "CompactDateTime.__sub__() returns the difference as a Duration"
+
+        d = chrono.CompactDateTime("2010-07-23 16:27:43")
+
+        self.assertEqual(
+            d - chrono.CompactDateTime("2010-07-22 16:27:44"),
+            chrono.Duration(seconds=86399)
+        )
+        self.assertEqual(
+            d - chrono.DateTime("2010-07-23 16:27:44"),
+            chrono.Duration(seconds=-1)
+        )
+        self.assertEqual(
+            d - chrono.Date("2010-07-23"), chrono.Duration(seconds=59263)
+        )
+        self.assertEqual(
+            d - datetime.date(2010, 7, 23), chrono.Duration(seconds=59263)
+        )
+
+
+class CompactDateTime_attributeTest(unittest.TestCase):
+
+    def test_day(self):
+        "CompactDateTime.day handles overflows"
+
+        d = chrono.CompactDateTime("2010-12-23 16:27:43")
+        d.day += 10
+
+        self.assertEqual(d.get(), (2011, 1, 2, 16, 27, 43))
+
+    def test_get(self):
+        "CompactDateTime attributes return date/time values"
+
+        d = chrono.CompactDateTime("1969-12-31 23:59:58")
+
+        self.assertEqual(
+            (d.year, d.month, d.day, d.hour, d.minute, d.second),
+            (1969, 12, 31, 23, 59, 58)
+        )
+        self.assertEqual(chrono.CompactDateTime().hour, None)
+
+    def test_hour(self):
+        "CompactDateTime.hour handles overflows into the date"
+
+        d = chrono.CompactDateTime("2010-07-31 16:27:43")
+        d.hour += 10
+
+        self.assertEqual(d.get(), (2010, 8, 1, 2, 27, 43))
+
+    def test_minute(self):
+        "CompactDateTime.minute handles underflows"
+
+        d = chrono.CompactDateTime("2010-01-01 00:00:43")
+        d.minute -= 1
+
+        self.assertEqual(d.get(), (2009, 12, 31, 23, 59, 43))
+
+    def test_month(self):
+        "CompactDateTime.month gives same results as DateTime.month"
+
+        for value in range(-30, 30):
+            c = chrono.CompactDateTime("2010-03-31 16:27:43")
+            d = chrono.DateTime("2010-03-31 16:27:43")
+
+            c.month = value
+            d.month = value
+
+            self.assertEqual(c.get(), d.get())
+
+    def test_none(self):
+        "CompactDateTime attributes clear date/time when set to None"
+
+        d = chrono.CompactDateTime("2010-07-23 16:27:43")
+        d.second = None
+
+        self.assertFalse(d.is_set())
+
+    def test_second(self):
+        "CompactDateTime.second handles large overflows"
+
+        d = chrono.CompactDateTime("2010-07-23 16:27:43")
+        d.second += 10000000
+
+        self.assertEqual(d.get(), (2010, 11, 16, 10, 14, 23))
+
+    def test_unset(self):
+        "CompactDateTime attributes raise NoDateTimeError when not set"
+
+        self.assertRaises(
+            chrono.NoDateTimeError, setattr, chrono.CompactDateTime(),
+            "hour", 1
+        )
+
+    def test_year(self):
+        "CompactDateTime.year carries leap days into March"
+
+        d = chrono.CompactDateTime("2008-02-29 16:27:43")
+        d.year = 2010
+
+        self.assertEqual(d.get(), (2010, 3, 1, 16, 27, 43))
+        self.assertRaises(chrono.YearError, setattr, d, "year", 10000)
+
+
+class CompactDateTime_calendarTest(unittest.TestCase):
+
+    def test_calendar(self):
+        "CompactDateTime calendar methods give same results as DateTime"
+
+        for string in ("2008-02-29", "2009-12-31", "2010-01-03"):
+            for cal in (chrono.calendar.ISOCalendar, chrono.calendar.USCalendar):
+                c = chrono.CompactDateTime(string + " 16:27:43", calendar=cal)
+                d = chrono.DateTime(string + " 16:27:43", calendar=cal)
+
+                self.assertEqual(c.leapyear(), d.leapyear())
+                self.assertEqual(c.monthdays(), d.monthdays())
+                self.assertEqual(c.ordinal(), d.ordinal())
+                self.assertEqual(c.week(), d.week())
+                self.assertEqual(c.weekdate(), d.weekdate())
+                self.assertEqual(c.weekday(), d.weekday())
+                self.assertEqual(c.weeks(), d.weeks())
+                self.assertEqual(c.yeardays(), d.yeardays())
+
+
+class CompactDateTime_deltaTest(unittest.TestCase):
+
+    def test_delta(self):
+        "CompactDateTime.delta() returns difference in seconds"
+
+        self.assertEqual(
+            chrono.CompactDateTime("2010-07-23 16:27:43").delta(
+                "2010-07-24 16:27:42"
+            ),
+            86399
+        )
+
+
+class CompactDateTime_getTest(unittest.TestCase):
+
+    def test_get_datetime(self):
+        "CompactDateTime.get_datetime() returns datetime.datetime object"
+
+        self.assertEqual(
+            chrono.CompactDateTime("2010-07-23 16:27:43").get_datetime(),
+            datetime.datetime(2010, 7, 23, 16, 27, 43)
+        )
+
+    def test_get_julian(self):
+        "CompactDateTime.get_julian() returns same value as DateTime"
+
+        self.assertEqual(
+            chrono.CompactDateTime("2010-07-23 16:27:43").get_julian(),
+            chrono.DateTime("2010-07-23 16:27:43").get_julian()
+        )
+
+    def test_get_string(self):
+        "CompactDateTime.get_string() returns date/time string"
+
+        self.assertEqual(
+            chrono.CompactDateTime("2010-07-23 16:27:43").get_string(),
+            "2010-07-23 16:27:43"
+        )
+
+    def test_get_unix(self):
+        "CompactDateTime.get_unix() returns same value as DateTime"
+
+        self.assertEqual(
+            chrono.CompactDateTime("2010-07-23 16:27:43").get_unix(),
+            chrono.DateTime("2010-07-23 16:27:43").get_unix()
+        )
+
+
+class CompactDateTime_unix_utcTest(unittest.TestCase):
+
+    def test_get_unix_utc(self):
+        "CompactDateTime.get_unix_utc() returns the epoch value"
+
+        self.assertEqual(
+            chrono.CompactDateTime("2009-12-27 16:27:43").get_unix_utc(),
+            1261931263
+        )
+        self.assertRaises(
+            chrono.NoDateTimeError, chrono.CompactDateTime().get_unix_utc
+        )
+
+    def test_set_unix_utc(self):
+        "CompactDateTime.set_unix_utc() sets date/time from UTC timestamp"
+
+        d = chrono.CompactDateTime()
+        d.set_unix_utc(1261931263)
+
+        self.assertEqual(d.get(), (2009, 12, 27, 16, 27, 43))
+
+
+class CompactDateTime_set_epochTest(unittest.TestCase):
+
+    def test_invalid(self):
+        "CompactDateTime.set_epoch() raises errors on invalid values"
+
+        d = chrono.CompactDateTime()
+
+        self.assertRaises(TypeError, d.set_epoch, "abc")
+        self.assertRaises(chrono.YearError, d.set_epoch, -62135596801)
+        self.assertRaises(chrono.YearError, d.set_epoch, 253402300800)
+
+
+class CompactDateTime_shiftTest(unittest.TestCase):
+
+    def test_shift(self):
+        "CompactDateTime.shift() moves the date/time in place"
+
+        d = chrono.CompactDateTime("2010-07-23 16:27:43")
+        d.shift(days=-365, hours=1, minutes=-1, seconds=17)
+
+        self.assertEqual(d.get(), (2009, 7, 23, 17, 27, 0))
+
+    def test_unset(self):
+        "CompactDateTime.shift() raises NoDateTimeError when not set"
+
+        self.assertRaises(
+            chrono.NoDateTimeError, chrono.CompactDateTime().shift, 1
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
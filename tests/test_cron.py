@@ -0,0 +1,230 @@
+#!/usr/bin/env python
+
+import chrono
+import itertools
+import unittest
+
+
+class Schedule__initTest(unittest.TestCase):
+
+    def test_bitsets(self):
+        "Schedule() stores each field as a bitset"
+
+        schedule = chrono.cron.Schedule("*/20 1-3 1,15 JAN-MAR/2 5-7")
+
+        self.assertEqual(schedule.minutes, 1 | 1 << 20 | 1 << 40)
+        self.assertEqual(schedule.hours, 1 << 1 | 1 << 2 | 1 << 3)
+        self.assertEqual(schedule.days, 1 << 1 | 1 << 15)
+        self.assertEqual(schedule.months, 1 << 1 | 1 << 3)
+        self.assertEqual(schedule.weekdays, 1 | 1 << 5 | 1 << 6)
+
+    def test_invalid(self):
+        "Schedule() raises ParseError for invalid expressions"
+
+        for expression in (
+            "", "* * * *", "* * * * * *", "60 * * * *", "* 24 * * *",
+            "* * 0 * *", "* * * 13 *", "* * * * 8", "*/0 * * * *",
+            "*/ * * * *", "5-1 * * * *", "-1 * * * *", "* * * FOO *",
+            "@reboot",
+        ):
+            self.assertRaises(
+                chrono.ParseError, chrono.cron.Schedule, expression
+            )
+
+    def test_macro(self):
+        "Schedule() supports macros"
+
+        schedule = chrono.cron.Schedule("@weekly")
+
+        self.assertEqual(schedule.minutes, 1)
+        self.assertEqual(schedule.hours, 1)
+        self.assertEqual(schedule.weekdays, 1)
+
+    def test_names(self):
+        "Schedule() supports month and weekday names"
+
+        schedule = chrono.cron.Schedule("0 0 * dec sun,sat")
+
+        self.assertEqual(schedule.months, 1 << 12)
+        self.assertEqual(schedule.weekdays, 1 | 1 << 6)
+
+    def test_step(self):
+        "Schedule() steps from a single value to the end of the range"
+
+        self.assertEqual(
+            chrono.cron.Schedule("0 20/2 * * *").hours, 1 << 20 | 1 << 22
+        )
+
+    def test_type(self):
+        "Schedule() raises TypeError for invalid input type"
+
+        self.assertRaises(TypeError, chrono.cron.Schedule, None)
+
+
+class Schedule__reprTest(unittest.TestCase):
+
+    def test_repr(self):
+        "repr() returns the expression"
+
+        self.assertEqual(
+            repr(chrono.cron.Schedule("0 3 * * *")),
+            "chrono.cron.Schedule('0 3 * * *')"
+        )
+
+
+class Schedule_nextTest(unittest.TestCase):
+
+    def test_datetime(self):
+        "Schedule.next() accepts chrono.DateTime objects"
+
+        self.assertEqual(
+            chrono.cron.Schedule("30 * * * *").next(
+                chrono.DateTime("2010-07-23 16:30:00")
+            ),
+            (2010, 7, 23, 17, 30, 0)
+        )
+
+    def test_either(self):
+        "Schedule.next() matches either day field if both are restricted"
+
+        schedule = chrono.cron.Schedule("0 0 13 * FRI")
+
+        self.assertEqual(
+            schedule.next("2010-07-23 00:00:00"), (2010, 7, 30, 0, 0, 0)
+        )
+        self.assertEqual(
+            schedule.next("2010-07-31 00:00:00"), (2010, 8, 6, 0, 0, 0)
+        )
+        self.assertEqual(
+            schedule.next("2010-08-06 00:00:00"), (2010, 8, 13, 0, 0, 0)
+        )
+
+    def test_empty(self):
+        "Schedule.next() raises NoDateTimeError for empty datetime"
+
+        self.assertRaises(
+            chrono.NoDateTimeError,
+            chrono.cron.Schedule("* * * * *").next, chrono.DateTime()
+        )
+
+    def test_leapday(self):
+        "Schedule.next() jumps to the next leap day"
+
+        self.assertEqual(
+            chrono.cron.Schedule("0 3 29 2 *").next("2010-07-23 12:00:00"),
+            (2012, 2, 29, 3, 0, 0)
+        )
+
+    def test_never(self):
+        "Schedule.next() returns None for schedules which never fire"
+
+        self.assertEqual(
+            chrono.cron.Schedule("0 0 30 2 *").next("2010-07-23 12:00:00"),
+            None
+        )
+
+    def test_next(self):
+        "Schedule.next() returns the first fire time after the datetime"
+
+        schedule = chrono.cron.Schedule("*/15 9-17 * * MON-FRI")
+
+        self.assertEqual(
+            schedule.next("2010-07-23 16:27:43"), (2010, 7, 23, 16, 30, 0)
+        )
+        self.assertEqual(
+            schedule.next("2010-07-23 16:30:00"), (2010, 7, 23, 16, 45, 0)
+        )
+        self.assertEqual(
+            schedule.next("2010-07-23 17:45:00"), (2010, 7, 26, 9, 0, 0)
+        )
+
+    def test_range(self):
+        "Schedule.next() returns None after the year 9999"
+
+        self.assertEqual(
+            chrono.cron.Schedule("@yearly").next("9999-07-23 12:00:00"),
+            None
+        )
+
+    def test_tuple(self):
+        "Schedule.next() accepts tuples"
+
+        self.assertEqual(
+            chrono.cron.Schedule("59 23 31 12 *").next(
+                (2010, 12, 31, 23, 59, 0)
+            ),
+            (2011, 12, 31, 23, 59, 0)
+        )
+
+
+class Schedule_previousTest(unittest.TestCase):
+
+    def test_leapday(self):
+        "Schedule.previous() jumps to the previous leap day"
+
+        self.assertEqual(
+            chrono.cron.Schedule("0 3 29 2 *").previous(
+                "2010-07-23 12:00:00"
+            ),
+            (2008, 2, 29, 3, 0, 0)
+        )
+
+    def test_previous(self):
+        "Schedule.previous() returns the last fire time before the datetime"
+
+        schedule = chrono.cron.Schedule("*/15 9-17 * * MON-FRI")
+
+        self.assertEqual(
+            schedule.previous("2010-07-26 09:00:00"),
+            (2010, 7, 23, 17, 45, 0)
+        )
+        self.assertEqual(
+            schedule.previous("2010-07-26 09:00:01"), (2010, 7, 26, 9, 0, 0)
+        )
+
+    def test_range(self):
+        "Schedule.previous() returns None before the year 1"
+
+        self.assertEqual(
+            chrono.cron.Schedule("@yearly").previous("0001-01-01 00:00:00"),
+            None
+        )
+
+
+class Schedule_timesTest(unittest.TestCase):
+
+    def test_reverse(self):
+        "Schedule.times() returns earlier fire times in reverse"
+
+        self.assertEqual(
+            list(itertools.islice(
+                chrono.cron.Schedule("0 0 1 * *").times(
+                    "2010-07-23 12:00:00", reverse=True
+                ),
+                3
+            )),
+            [
+                (2010, 7, 1, 0, 0, 0), (2010, 6, 1, 0, 0, 0),
+                (2010, 5, 1, 0, 0, 0),
+            ]
+        )
+
+    def test_times(self):
+        "Schedule.times() returns the following fire times"
+
+        self.assertEqual(
+            list(itertools.islice(
+                chrono.cron.Schedule("0 12 31 * *").times(
+                    "2010-07-23 12:00:00"
+                ),
+                3
+            )),
+            [
+                (2010, 7, 31, 12, 0, 0), (2010, 8, 31, 12, 0, 0),
+                (2010, 10, 31, 12, 0, 0),
+            ]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,6 +6,37 @@ import unittest
 import time
 
 
+class Date__addTest(unittest.TestCase):
+
+    def test_duration(self):
+        "Date.__add__() adds durations"
+
+        d = chrono.Date("2010-01-31")
+
+        self.assertEqual(
+            d + chrono.Duration(days=1), chrono.Date("2010-02-01")
+        )
+        self.assertEqual(
+            d + chrono.Duration(months=1), chrono.Date("2010-02-28")
+        )
+        self.assertEqual(
+            d + chrono.Duration(years=2, months=1), chrono.Date("2012-02-29")
+        )
+        self.assertEqual(d, chrono.Date("2010-01-31"))
+
+    def test_invalid(self):
+        "Date.__add__() raises errors on invalid input"
+
+        self.assertRaises(TypeError, lambda: chrono.Date("2010-01-31") + 1)
+        self.assertRaises(
+            chrono.NoDateTimeError, lambda: chrono.Date() + chrono.Duration()
+        )
+        self.assertRaises(
+            chrono.YearError,
+            lambda: chrono.Date("9999-12-31") + chrono.Duration(days=1)
+        )
+
+
 class Date__eqTest(unittest.TestCase):
 
     def test_date(self):
@@ -28,12 +59,50 @@ class Date__eqTest(unittest.TestCase):
             chrono.DateTime("2009-12-27 16:27:43")
         )
 
+    def test_datetime_empty(self):
+        "Date.__eq__() compares empty dates as empty date/times"
+
+        self.assertTrue(chrono.Date() == chrono.DateTime())
+        self.assertTrue(chrono.Date() == chrono.CompactDateTime())
+        self.assertFalse(
+            chrono.Date() == chrono.DateTime("2009-12-27 00:00:00")
+        )
+
+    def test_datetime_method(self):
+        "Date.__eq__() compares dates as midnight when called directly"
+
+        self.assertTrue(chrono.Date.__eq__(
+            chrono.Date("2009-12-27"), chrono.DateTime("2009-12-27 00:00:00")
+        ))
+        self.assertFalse(chrono.Date.__eq__(
+            chrono.Date("2009-12-27"), chrono.DateTime("2009-12-27 16:27:43")
+        ))
+        self.assertFalse(chrono.Date.__eq__(
+            chrono.Date("2009-12-27"),
+            chrono.CompactDateTime("2009-12-27 16:27:43")
+        ))
+
     def test_none(self):
         "Date.__eq__() handles None"
 
         self.assertTrue(chrono.Date() == None)
         self.assertFalse(chrono.Date("2010-07-23") == None)
 
+    def test_pydate(self):
+        "Date.__eq__() handles datetime.date objects"
+
+        self.assertTrue(
+            chrono.Date("2009-12-27") == datetime.date(2009, 12, 27)
+        )
+        self.assertTrue(
+            chrono.Date("2009-12-27") == \
+            datetime.datetime(2009, 12, 27, 16, 27, 43)
+        )
+        self.assertFalse(
+            chrono.Date("2009-12-27") == datetime.date(2009, 12, 28)
+        )
+        self.assertFalse(chrono.Date() == datetime.date(2009, 12, 27))
+
     def test_string(self):
         "Date.__eq__() handles strings"
 
@@ -329,6 +398,20 @@ class Date__ltTest(unittest.TestCase):
         self.assertFalse(chrono.Date("2009-12-27") < None)
         self.assertFalse(chrono.Date() < None)
 
+    def test_pydate(self):
+        "Date.__lt__() handles datetime.date objects"
+
+        self.assertTrue(
+            chrono.Date("2009-12-26") < datetime.date(2009, 12, 27)
+        )
+        self.assertFalse(
+            chrono.Date("2009-12-27") < datetime.date(2009, 12, 27)
+        )
+        self.assertFalse(
+            chrono.Date("2009-12-28") < datetime.datetime(2009, 12, 27)
+        )
+        self.assertTrue(chrono.Date() < datetime.date(2009, 12, 27))
+
     def test_string(self):
         "Date.__lt__() handles strings"
 
@@ -577,6 +660,30 @@ class Date__strTest(unittest.TestCase):
         self.assertEquals(str(chrono.Date("2009-12-27")), "2009-12-27")
 
 
+class Date__subTest(unittest.TestCase):
+
+    def test_date(self):
+        "Date.__sub__() returns days between dates as a Duration"
+
+        self.assertEqual(
+            chrono.Date("2010-03-01") - chrono.Date("2009-03-01"),
+            chrono.Duration(days=365)
+        )
+        self.assertEqual(
+            chrono.Date("2010-03-01") - datetime.date(2010, 3, 2),
+            chrono.Duration(days=-1)
+        )
+        self.assertRaises(TypeError, lambda: chrono.Date("2010-03-01") - 1)
+
+    def test_duration(self):
+        "Date.__sub__() subtracts durations"
+
+        self.assertEqual(
+            chrono.Date("2010-03-31") - chrono.Duration(months=1),
+            chrono.Date("2010-02-28")
+        )
+
+
 class Time_assert_setTest(unittest.TestCase):
 
     def test_empty(self):
@@ -678,6 +785,24 @@ class Date_formatTest(unittest.TestCase):
         )
 
 
+class Date_freezeTest(unittest.TestCase):
+
+    def test_freeze(self):
+        "Date.freeze() returns a FrozenDate"
+
+        d = chrono.Date("2010-07-23", calendar=chrono.calendar.USCalendar)
+        f = d.freeze()
+
+        self.assertTrue(isinstance(f, chrono.FrozenDate))
+        self.assertEqual(f.get(), (2010, 7, 23))
+        self.assertTrue(f.calendar is chrono.calendar.USCalendar)
+        self.assertEqual(hash(f), hash(chrono.FrozenDate("2010-07-23")))
+
+        d.day = None
+
+        self.assertFalse(d.freeze().is_set())
+
+
 class Date_getTest(unittest.TestCase):
 
     def test_empty(self):
@@ -784,6 +909,22 @@ class Date_get_unixTest(unittest.TestCase):
         self.assertEquals(chrono.Date("2009-12-27").get_unix(), 1261872000)
 
 
+class Date_get_unix_utcTest(unittest.TestCase):
+
+    def test_empty(self):
+        "Date.get_unix_utc() raises NoDateTimeError if date isn't set"
+
+        self.assertRaises(
+            chrono.error.NoDateTimeError, chrono.Date().get_unix_utc
+        )
+
+    def test_unix_utc(self):
+        "Date.get_unix_utc() returns UTC unix timestamp"
+
+        self.assertEqual(chrono.Date("2009-12-27").get_unix_utc(), 1261872000)
+        self.assertEqual(chrono.Date("1969-12-31").get_unix_utc(), -86400)
+
+
 class Date_is_setTest(unittest.TestCase):
 
     def test_empty(self):
@@ -968,6 +1109,62 @@ class Date_set_unixText(unittest.TestCase):
         self.assertEquals(d.get(), (2009, 12, 27))
 
 
+class Date_set_unix_utcTest(unittest.TestCase):
+
+    def test_range(self):
+        "Date.set_unix_utc() raises YearError outside years 1-9999"
+
+        self.assertRaises(
+            chrono.YearError, chrono.Date().set_unix_utc, 253402300800
+        )
+
+    def test_unix_utc(self):
+        "Date.set_unix_utc() sets date from UTC unix timestamp"
+
+        d = chrono.Date()
+        d.set_unix_utc(1261958399)
+
+        self.assertEqual(d.get(), (2009, 12, 27))
+
+        d.set_unix_utc(-1)
+
+        self.assertEqual(d.get(), (1969, 12, 31))
+
+
+class Date_sort_keyTest(unittest.TestCase):
+
+    def test_empty(self):
+        "Date.sort_key() returns -1 if no date is set"
+
+        d = chrono.Date()
+        self.assertEqual(d.sort_key(), -1)
+
+        d.year = 2009
+        self.assertEqual(d.sort_key(), -1)
+
+    def test_order(self):
+        "Date.sort_key() orders dates like comparisons"
+
+        dates = [
+            chrono.Date("2010-01-01"), chrono.Date(), chrono.Date("2009-12-31"),
+            chrono.Date("2009-12-27"), chrono.Date("0001-01-01"),
+            chrono.Date("2009-11-30"), chrono.Date("9999-12-31"),
+        ]
+
+        self.assertEqual(sorted(dates, key=chrono.Date.sort_key), sorted(dates))
+        self.assertEqual(
+            [d.sort_key() for d in sorted(dates)],
+            sorted(d.sort_key() for d in dates)
+        )
+
+    def test_sort_key(self):
+        "Date.sort_key() returns an integer key"
+
+        self.assertEqual(
+            chrono.Date("2009-12-27").sort_key(), (2009 * 16 + 12) * 32 + 27
+        )
+
+
 class Date_weekTest(unittest.TestCase):
 
     def test_empty(self):
@@ -0,0 +1,262 @@
+#!/usr/bin/env python
+
+import array
+import chrono
+import datetime
+import unittest
+
+
+class DateArray__getitemTest(unittest.TestCase):
+
+    def test_index(self):
+        "DateArray.__getitem__() returns CompactDate for index"
+
+        d = chrono.DateArray(["2010-07-23", "2010-07-24"])[1]
+
+        self.assertTrue(isinstance(d, chrono.CompactDate))
+        self.assertEqual(d.get(), (2010, 7, 24))
+
+    def test_slice(self):
+        "DateArray.__getitem__() returns DateArray for slice"
+
+        d = chrono.DateArray(["2010-07-23", "2010-07-24", "2010-07-25"])[1:]
+
+        self.assertTrue(isinstance(d, chrono.DateArray))
+        self.assertEqual(d.get(), [(2010, 7, 24), (2010, 7, 25)])
+
+
+class DateArray__initTest(unittest.TestCase):
+
+    def test_calendar(self):
+        "DateArray.__init__() uses the given calendar"
+
+        self.assertTrue(
+            chrono.DateArray(calendar=chrono.calendar.USCalendar).calendar
+            is chrono.calendar.USCalendar
+        )
+
+    def test_empty(self):
+        "DateArray.__init__() creates empty array by default"
+
+        self.assertEqual(len(chrono.DateArray()), 0)
+
+    def test_empty_date(self):
+        "DateArray.__init__() raises NoDateTimeError on empty dates"
+
+        self.assertRaises(chrono.NoDateTimeError, chrono.DateArray, [None])
+
+    def test_invalid(self):
+        "DateArray.__init__() raises error on invalid dates"
+
+        self.assertRaises(chrono.DayError, chrono.DateArray, ["2010-02-29"])
+        self.assertRaises(chrono.ParseError, chrono.DateArray, ["abc"])
+
+    def test_mixed(self):
+        "DateArray.__init__() handles any value accepted by CompactDate"
+
+        self.assertEqual(chrono.DateArray([
+            "2010-07-23",
+            chrono.Date("2010-07-24"),
+            chrono.CompactDate("2010-07-25"),
+            datetime.date(2010, 7, 26),
+        ]).get(), [
+            (2010, 7, 23), (2010, 7, 24), (2010, 7, 25), (2010, 7, 26)
+        ])
+
+    def test_parser(self):
+        "DateArray.__init__() uses the given parser"
+
+        self.assertEqual(
+            chrono.DateArray(
+                ["23072010"], parser=chrono.parser.EuroParser
+            ).get(),
+            [(2010, 7, 23)]
+        )
+
+
+class DateArray__iterTest(unittest.TestCase):
+
+    def test_iter(self):
+        "DateArray.__iter__() yields CompactDate objects"
+
+        self.assertEqual(
+            [d.get() for d in chrono.DateArray(["2010-07-23", "2010-07-24"])],
+            [(2010, 7, 23), (2010, 7, 24)]
+        )
+
+
+class DateArray__reprTest(unittest.TestCase):
+
+    def test_repr(self):
+        "DateArray.__repr__() includes date strings"
+
+        self.assertEqual(
+            repr(chrono.DateArray(["2010-07-23"])),
+            "chrono.DateArray(['2010-07-23'])"
+        )
+
+
+class DateArray_appendTest(unittest.TestCase):
+
+    def test_append(self):
+        "DateArray.append() appends date"
+
+        d = chrono.DateArray()
+        d.append("2010-07-23")
+
+        self.assertEqual(d.get(), [(2010, 7, 23)])
+
+
+class DateArray_calendarTest(unittest.TestCase):
+
+    def setUp(self):
+
+        unittest.TestCase.setUp(self)
+
+        self.strings = (
+            "2008-02-29", "2008-12-28", "2008-12-29", "2009-01-03",
+            "2009-12-31", "2010-01-01", "2010-01-02", "2010-01-03",
+            "2010-07-23", "2010-12-31",
+        )
+
+    def test_iso(self):
+        "DateArray gives same calendar values as Date with ISO calendar"
+
+        self.check(chrono.calendar.ISOCalendar)
+
+    def test_us(self):
+        "DateArray gives same calendar values as Date with US calendar"
+
+        self.check(chrono.calendar.USCalendar)
+
+    def check(self, cal):
+
+        a = chrono.DateArray(self.strings, calendar=cal)
+        dates = [chrono.Date(s, calendar=cal) for s in self.strings]
+
+        self.assertEqual(list(a.year()), [d.year for d in dates])
+        self.assertEqual(list(a.month()), [d.month for d in dates])
+        self.assertEqual(list(a.day()), [d.day for d in dates])
+        self.assertEqual(list(a.get_julian()), [d.get_julian() for d in dates])
+        self.assertEqual(a.leapyear(), [d.leapyear() for d in dates])
+        self.assertEqual(list(a.ordinal()), [d.ordinal() for d in dates])
+        self.assertEqual(a.week(), [tuple(d.week()) for d in dates])
+        self.assertEqual(a.weekdate(), [tuple(d.weekdate()) for d in dates])
+        self.assertEqual(list(a.weekday()), [d.weekday() for d in dates])
+
+
+class DateArray_formatTest(unittest.TestCase):
+
+    def test_format(self):
+        "DateArray.format() formats all dates"
+
+        self.assertEqual(
+            chrono.DateArray(["2010-07-23", "2009-12-27"]).format(
+                "$day.$month.$year"
+            ),
+            ["23.7.2010", "27.12.2009"]
+        )
+
+
+class DateArray_from_julianTest(unittest.TestCase):
+
+    def test_array(self):
+        "DateArray.from_julian() uses int arrays without copying"
+
+        julian = array.array("i", [2455401, 2455402])
+
+        self.assertTrue(chrono.DateArray.from_julian(julian).julian is julian)
+
+    def test_list(self):
+        "DateArray.from_julian() handles lists"
+
+        self.assertEqual(
+            chrono.DateArray.from_julian([2455401, 2455402]).get(),
+            [(2010, 7, 23), (2010, 7, 24)]
+        )
+
+
+class DateArray_from_rangeTest(unittest.TestCase):
+
+    def test_calendar(self):
+        "DateArray.from_range() uses the calendar for week alignment"
+
+        dates = chrono.DateArray.from_range(
+            "2009-12-30", "2010-01-08", unit="week", align=True,
+            calendar=chrono.calendar.USCalendar
+        )
+
+        self.assertTrue(dates.calendar is chrono.calendar.USCalendar)
+        self.assertEqual(dates.get(), [(2009, 12, 27), (2010, 1, 3)])
+
+    def test_range(self):
+        "DateArray.from_range() stores the dates of the range"
+
+        dates = chrono.DateArray.from_range("2010-07-23", "2010-07-26")
+
+        self.assertEqual(dates.julian.typecode, "i")
+        self.assertEqual(
+            dates.get(), [(2010, 7, 23), (2010, 7, 24), (2010, 7, 25)]
+        )
+
+
+class DateArray_from_recurrenceTest(unittest.TestCase):
+
+    def test_calendar(self):
+        "DateArray.from_recurrence() uses the calendar of the rule"
+
+        dates = chrono.DateArray.from_recurrence(chrono.recurrence.Rule(
+            "FREQ=WEEKLY;COUNT=2", "2010-07-23",
+            calendar=chrono.calendar.USCalendar
+        ))
+
+        self.assertTrue(dates.calendar is chrono.calendar.USCalendar)
+
+    def test_recurrence(self):
+        "DateArray.from_recurrence() stores the occurrences of the rule"
+
+        dates = chrono.DateArray.from_recurrence(chrono.recurrence.Rule(
+            "FREQ=MONTHLY;BYDAY=2TU;COUNT=3", "2010-07-23"
+        ))
+
+        self.assertEqual(dates.julian.typecode, "i")
+        self.assertEqual(
+            dates.get(), [(2010, 8, 10), (2010, 9, 14), (2010, 10, 12)]
+        )
+
+
+class DateArray_unix_utcTest(unittest.TestCase):
+
+    def test_from_unix_utc(self):
+        "DateArray.from_unix_utc() creates an array from UTC timestamps"
+
+        self.assertEqual(
+            chrono.DateArray.from_unix_utc([0, -1, 1279902463]).get(),
+            [(1970, 1, 1), (1969, 12, 31), (2010, 7, 23)]
+        )
+        self.assertRaises(
+            chrono.YearError, chrono.DateArray.from_unix_utc, [253402300800]
+        )
+
+    def test_get_unix_utc(self):
+        "DateArray.get_unix_utc() returns an array of UTC timestamps"
+
+        self.assertEqual(
+            chrono.DateArray(["1970-01-01", "2010-07-23"]).get_unix_utc(),
+            array.array("q", [0, 1279843200])
+        )
+
+
+class DateArray_get_stringTest(unittest.TestCase):
+
+    def test_get_string(self):
+        "DateArray.get_string() returns list of date strings"
+
+        self.assertEqual(
+            chrono.DateArray(["07/23/2010", "2009-12-27"]).get_string(),
+            ["2010-07-23", "2009-12-27"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
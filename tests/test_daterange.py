@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+
+import chrono
+import chrono.daterange
+import datetime
+import unittest
+
+
+class daterange_julianTest(unittest.TestCase):
+
+    def test_empty(self):
+        "julian() raises NoDateTimeError for empty start or stop"
+
+        self.assertRaises(
+            chrono.error.NoDateTimeError,
+            chrono.daterange.julian, None, "2010-07-23"
+        )
+        self.assertRaises(
+            chrono.error.NoDateTimeError,
+            chrono.daterange.julian, "2010-07-23", chrono.CompactDate()
+        )
+        self.assertRaises(
+            chrono.error.NoDateTimeError,
+            chrono.daterange.julian, chrono.Date(), "2010-07-23"
+        )
+
+    def test_julian(self):
+        "julian() returns julian day numbers"
+
+        self.assertEqual(
+            list(chrono.daterange.julian("2010-07-23", "2010-07-25")),
+            [2455401, 2455402]
+        )
+
+    def test_step(self):
+        "julian() raises errors for invalid steps"
+
+        self.assertRaises(
+            ValueError, chrono.daterange.julian, "2010-07-23", "2010-07-25", 0
+        )
+        self.assertRaises(
+            TypeError,
+            chrono.daterange.julian, "2010-07-23", "2010-07-25", 1.5
+        )
+
+    def test_unit(self):
+        "julian() raises ValueError for invalid units"
+
+        self.assertRaises(
+            ValueError, chrono.daterange.julian, "2010-07-23", "2010-07-25",
+            1, "fortnight"
+        )
+
+
+class daterange_rangeTest(unittest.TestCase):
+
+    def test_align(self):
+        "range() aligns to the start of the unit"
+
+        self.assertEqual(
+            list(chrono.range(
+                "2010-05-17", "2011-01-01", unit="quarter", align=True
+            )),
+            [(2010, 4, 1), (2010, 7, 1), (2010, 10, 1)]
+        )
+        self.assertEqual(
+            list(chrono.range(
+                "2010-05-17", "2012-01-01", unit="year", align=True
+            )),
+            [(2010, 1, 1), (2011, 1, 1)]
+        )
+
+    def test_class(self):
+        "range() creates objects of the given class"
+
+        self.assertEqual(
+            list(chrono.range("2010-07-23", "2010-07-25", cls=datetime.date)),
+            [datetime.date(2010, 7, 23), datetime.date(2010, 7, 24)]
+        )
+        self.assertEqual(
+            list(chrono.range("2010-07-23", "2010-07-25", cls=chrono.Date)),
+            [chrono.Date("2010-07-23"), chrono.Date("2010-07-24")]
+        )
+
+    def test_day(self):
+        "range() steps by days"
+
+        self.assertEqual(
+            list(chrono.range("2009-12-30", "2010-01-03")),
+            [(2009, 12, 30), (2009, 12, 31), (2010, 1, 1), (2010, 1, 2)]
+        )
+        self.assertEqual(
+            list(chrono.range("2009-12-30", "2010-01-03", 2)),
+            [(2009, 12, 30), (2010, 1, 1)]
+        )
+
+    def test_empty(self):
+        "range() returns no dates if stop isn't after start"
+
+        self.assertEqual(list(chrono.range("2010-07-23", "2010-07-23")), [])
+        self.assertEqual(list(chrono.range("2010-07-23", "2010-07-22")), [])
+        self.assertEqual(
+            list(chrono.range("2010-07-23", "2010-07-24", -1)), []
+        )
+
+    def test_limits(self):
+        "range() stops at the year limits"
+
+        self.assertEqual(
+            list(chrono.range("9999-10-31", "9999-12-31", unit="month")),
+            [(9999, 10, 31), (9999, 11, 30)]
+        )
+        self.assertEqual(
+            list(chrono.range("0001-03-01", "0001-01-01", -1, unit="month")),
+            [(1, 3, 1), (1, 2, 1)]
+        )
+
+    def test_month(self):
+        "range() steps by months, keeping the day of the month"
+
+        self.assertEqual(
+            list(chrono.range("2010-01-31", "2010-05-01", unit="month")),
+            [(2010, 1, 31), (2010, 2, 28), (2010, 3, 31), (2010, 4, 30)]
+        )
+
+    def test_negative(self):
+        "range() handles negative steps"
+
+        self.assertEqual(
+            list(chrono.range("2010-01-02", "2009-12-30", -1)),
+            [(2010, 1, 2), (2010, 1, 1), (2009, 12, 31)]
+        )
+        self.assertEqual(
+            list(chrono.range("2010-03-31", "2009-12-31", -1, unit="month")),
+            [(2010, 3, 31), (2010, 2, 28), (2010, 1, 31)]
+        )
+
+    def test_week(self):
+        "range() steps by weeks, starting on the calendar's first weekday"
+
+        self.assertEqual(
+            list(chrono.range("2009-12-30", "2010-01-14", unit="week")),
+            [(2009, 12, 30), (2010, 1, 6), (2010, 1, 13)]
+        )
+        self.assertEqual(
+            list(chrono.range(
+                "2009-12-30", "2010-01-14", unit="week", align=True
+            )),
+            [(2009, 12, 28), (2010, 1, 4), (2010, 1, 11)]
+        )
+        self.assertEqual(
+            list(chrono.range(
+                "2009-12-30", "2010-01-14", unit="week", align=True,
+                calendar=chrono.calendar.USCalendar
+            )),
+            [(2009, 12, 27), (2010, 1, 3), (2010, 1, 10)]
+        )
+
+    def test_year(self):
+        "range() steps by years, keeping the day of the month"
+
+        self.assertEqual(
+            list(chrono.range("2008-02-29", "2011-01-01", unit="year")),
+            [(2008, 2, 29), (2009, 2, 28), (2010, 2, 28)]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
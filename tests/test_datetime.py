@@ -6,6 +6,39 @@ import unittest
 import time
 
 
+class DateTime__addTest(unittest.TestCase):
+
+    def test_calendar(self):
+        "DateTime.__add__() keeps calendar and parser"
+
+        d = chrono.DateTime(
+            "2010-07-23 16:27:43", calendar=chrono.calendar.USCalendar,
+            parser=chrono.parser.ISOParser
+        ) + chrono.Duration()
+
+        self.assertTrue(d.calendar is chrono.calendar.USCalendar)
+        self.assertTrue(d.parser is chrono.parser.ISOParser)
+
+    def test_duration(self):
+        "DateTime.__add__() adds durations"
+
+        d = chrono.DateTime("2010-01-31 16:27:43")
+
+        self.assertEqual(
+            (d + chrono.Duration(months=1, hours=8)).get(),
+            (2010, 3, 1, 0, 27, 43)
+        )
+        self.assertEqual(
+            (chrono.Duration(seconds=-59264) + d).get(),
+            (2010, 1, 30, 23, 59, 59)
+        )
+        self.assertEqual(
+            (d + chrono.Duration(days=100000)).get(),
+            (2283, 11, 16, 16, 27, 43)
+        )
+        self.assertRaises(TypeError, lambda: d + 1)
+
+
 class DateTime__eqTest(unittest.TestCase):
 
     def test_date(self):
@@ -18,6 +51,15 @@ class DateTime__eqTest(unittest.TestCase):
             chrono.DateTime("2009-12-27 16:27:43") == chrono.Date("2009-12-27")
         )
 
+    def test_date_empty(self):
+        "DateTime.__eq__() compares empty dates as empty date/times"
+
+        self.assertTrue(chrono.DateTime() == chrono.Date())
+        self.assertFalse(
+            chrono.DateTime("2009-12-27 00:00:00") == chrono.Date()
+        )
+        self.assertFalse(chrono.DateTime() < chrono.Date())
+
     def test_datetime(self):
         "DateTime.__eq__() handles DateTime objects"
 
@@ -36,6 +78,33 @@ class DateTime__eqTest(unittest.TestCase):
         self.assertTrue(chrono.DateTime() == None)
         self.assertFalse(chrono.DateTime("2010-07-23 16:27:43") == None)
 
+    def test_pydate(self):
+        "DateTime.__eq__() handles datetime.date objects"
+
+        self.assertTrue(
+            chrono.DateTime("2009-12-27 00:00:00") == \
+            datetime.date(2009, 12, 27)
+        )
+        self.assertFalse(
+            chrono.DateTime("2009-12-27 16:27:43") == \
+            datetime.date(2009, 12, 27)
+        )
+
+    def test_pydatetime(self):
+        "DateTime.__eq__() handles datetime.datetime objects"
+
+        self.assertTrue(
+            chrono.DateTime("2009-12-27 16:27:43") == \
+            datetime.datetime(2009, 12, 27, 16, 27, 43)
+        )
+        self.assertFalse(
+            chrono.DateTime("2009-12-27 16:27:43") == \
+            datetime.datetime(2009, 12, 27, 16, 27, 44)
+        )
+        self.assertFalse(
+            chrono.DateTime() == datetime.datetime(2009, 12, 27, 16, 27, 43)
+        )
+
     def test_string(self):
         "DateTime.__eq__() handles strings"
 
@@ -336,6 +405,23 @@ class DateTime__initTest(unittest.TestCase):
 
         self.assertRaises(TypeError, chrono.DateTime, [])
 
+    def test_zone(self):
+        "DateTime.__init__() takes zone as input"
+
+        zone = chrono.tz.Zone("Test", rule="CET-1CEST,M3.5.0,M10.5.0/3")
+        d = chrono.DateTime(1280000000, zone=zone)
+
+        self.assertTrue(d.zone is zone)
+        self.assertEqual(d.get(), (2010, 7, 24, 21, 33, 20))
+        self.assertTrue(chrono.DateTime(d).zone is zone)
+        self.assertEqual(
+            chrono.DateTime("2010-07-23 16:27:43", zone="UTC").zone.name,
+            "UTC"
+        )
+        self.assertRaises(
+            chrono.ZoneError, chrono.DateTime, zone="Invalid/../Zone"
+        )
+
 
 class DateTime__leTest(unittest.TestCase):
 
@@ -425,6 +511,33 @@ class DateTime__ltTest(unittest.TestCase):
         self.assertFalse(chrono.DateTime("2009-12-27 16:27:43") < None)
         self.assertFalse(chrono.DateTime() < None)
 
+    def test_pydate(self):
+        "DateTime.__lt__() handles datetime.date objects"
+
+        self.assertTrue(
+            chrono.DateTime("2009-12-26 16:27:43") < \
+            datetime.date(2009, 12, 27)
+        )
+        self.assertFalse(
+            chrono.DateTime("2009-12-27 00:00:00") < \
+            datetime.date(2009, 12, 27)
+        )
+
+    def test_pydatetime(self):
+        "DateTime.__lt__() handles datetime.datetime objects"
+
+        self.assertTrue(
+            chrono.DateTime("2009-12-27 16:27:42") < \
+            datetime.datetime(2009, 12, 27, 16, 27, 43)
+        )
+        self.assertFalse(
+            chrono.DateTime("2009-12-27 16:27:43") < \
+            datetime.datetime(2009, 12, 27, 16, 27, 43)
+        )
+        self.assertTrue(
+            chrono.DateTime() < datetime.datetime(2009, 12, 27, 16, 27, 43)
+        )
+
     def test_string(self):
         "DateTime.__lt__() handles strings"
 
@@ -507,6 +620,15 @@ class DateTime__reprTest(unittest.TestCase):
             "minute=27, second=43)"
         )
 
+    def test_zone(self):
+        "DateTime.__repr__() includes the zone name"
+
+        self.assertEquals(
+            repr(chrono.DateTime("2010-07-23 16:27:43", zone="UTC")),
+            "chrono.DateTime(year=2010, month=7, day=23, hour=16, " + \
+            "minute=27, second=43, zone='UTC')"
+        )
+
 
 class DateTime__setattrTest(unittest.TestCase):
 
@@ -630,6 +752,22 @@ class DateTime__setattrTest(unittest.TestCase):
 
         self.assertEquals(d.get(), (2010, 7, 25, 2, 27, 43))
 
+    def test_hour_overflow_month(self):
+        "DateTime.__setattr__() handles month rollover for hour overflow"
+
+        d = chrono.DateTime("2010-07-31 16:27:43")
+        d.hour += 10
+
+        self.assertEquals(d.get(), (2010, 8, 1, 2, 27, 43))
+
+    def test_hour_negative_month(self):
+        "DateTime.__setattr__() handles month rollunder for negative hours"
+
+        d = chrono.DateTime("2010-07-01 16:27:43")
+        d.hour -= 20
+
+        self.assertEquals(d.get(), (2010, 6, 30, 20, 27, 43))
+
     def test_minute_negative(self):
         "DateTime.__setattr__() handles hour rollunder for negative minutes"
 
@@ -662,6 +800,14 @@ class DateTime__setattrTest(unittest.TestCase):
 
         self.assertEquals(d.get(), (2010, 7, 23, 18, 27, 43))
 
+    def test_second_overflow_large(self):
+        "DateTime.__setattr__() handles large second overflows"
+
+        d = chrono.DateTime("2010-07-23 16:27:43")
+        d.second += 10000000
+
+        self.assertEquals(d.get(), (2010, 11, 16, 10, 14, 23))
+
     def test_month_dayoverflow(self):
         "DateTime.__setattr__() handles days outside new month range"
 
@@ -806,6 +952,52 @@ class DateTime__strTest(unittest.TestCase):
         )
 
 
+class DateTime__subTest(unittest.TestCase):
+
+    def test_datetime(self):
+        "DateTime.__sub__() returns the difference as a Duration"
+
+        d = chrono.DateTime("2010-07-23 16:27:43")
+
+        self.assertEqual(
+            d - chrono.DateTime("2010-07-22 16:27:44"),
+            chrono.Duration(seconds=86399)
+        )
+        self.assertEqual(
+            d - chrono.Date("2010-07-23"), chrono.Duration(seconds=59263)
+        )
+        self.assertEqual(
+            chrono.DateTime("1-01-01 00:00:00") -
+            chrono.DateTime("9999-12-31 23:59:59"),
+            chrono.Duration(seconds=-315537897599)
+        )
+        self.assertRaises(TypeError, lambda: d - "abc")
+
+    def test_duration(self):
+        "DateTime.__sub__() subtracts durations"
+
+        self.assertEqual(
+            (
+                chrono.DateTime("2010-03-31 00:00:00") -
+                chrono.Duration(months=1, seconds=1)
+            ).get(),
+            (2010, 2, 27, 23, 59, 59)
+        )
+
+    def test_zone(self):
+        "DateTime.__sub__() uses UTC for date/times in different zones"
+
+        d = chrono.DateTime("2010-07-23 16:27:43", zone=chrono.tz.Zone("Test", rule="CET-1CEST,M3.5.0,M10.5.0/3"))
+
+        self.assertEqual(
+            d - chrono.DateTime("2010-07-23 16:27:43", zone="UTC"),
+            chrono.Duration(seconds=-7200)
+        )
+        self.assertEqual(
+            d - chrono.DateTime("2010-07-23 16:27:43"), chrono.Duration()
+        )
+
+
 class Time_assert_setTest(unittest.TestCase):
 
     def test_empty(self):
@@ -845,6 +1037,31 @@ class DateTime_clearTest(unittest.TestCase):
         self.assertEquals(d.second, None)
 
 
+class DateTime_convertTest(unittest.TestCase):
+
+    def test_convert(self):
+        "DateTime.convert() converts the date/time to another zone"
+
+        zone = chrono.tz.Zone("Test", rule="CET-1CEST,M3.5.0,M10.5.0/3")
+        d = chrono.DateTime("2010-07-23 16:27:43", zone="UTC").convert(zone)
+
+        self.assertTrue(d.zone is zone)
+        self.assertEqual(d.get(), (2010, 7, 23, 18, 27, 43))
+        self.assertEqual(
+            d.convert("UTC").get(), (2010, 7, 23, 16, 27, 43)
+        )
+
+    def test_naive(self):
+        "DateTime.convert() handles date/times without a zone as UTC"
+
+        self.assertEqual(
+            chrono.DateTime("2010-01-23 16:27:43").convert(
+                chrono.tz.Zone("Test", rule="CET-1CEST,M3.5.0,M10.5.0/3")
+            ).get(),
+            (2010, 1, 23, 17, 27, 43)
+        )
+
+
 class DateTime_formatTest(unittest.TestCase):
 
     def test_empty(self):
@@ -866,6 +1083,29 @@ class DateTime_formatTest(unittest.TestCase):
             "2009-12-27 05:45:18"
         )
 
+    def test_zone(self):
+        "DateTime.format() handles $offset and $zonename"
+
+        d = chrono.DateTime("2010-07-23 16:27:43")
+
+        self.assertEquals(d.format("$offset$zonename"), "")
+
+        d.zone = chrono.tz.Zone("Test", rule="CET-1CEST,M3.5.0,M10.5.0/3")
+
+        self.assertEquals(d.format("$offset $zonename"), "+02:00 Test")
+
+
+class DateTime_freezeTest(unittest.TestCase):
+
+    def test_freeze(self):
+        "DateTime.freeze() returns a FrozenDateTime"
+
+        f = chrono.DateTime("2010-07-23 16:27:43", zone="UTC").freeze()
+
+        self.assertTrue(isinstance(f, chrono.FrozenDateTime))
+        self.assertEqual(f.get(), (2010, 7, 23, 16, 27, 43))
+        self.assertFalse(chrono.DateTime().freeze().is_set())
+
 
 class DateTime_getTest(unittest.TestCase):
 
@@ -927,6 +1167,26 @@ class DateTime_get_julianTest(unittest.TestCase):
         )
 
 
+class DateTime_get_offsetTest(unittest.TestCase):
+
+    def test_offset(self):
+        "DateTime.get_offset() returns the offset from UTC"
+
+        zone = chrono.tz.Zone("Test", rule="CET-1CEST,M3.5.0,M10.5.0/3")
+
+        self.assertEqual(
+            chrono.DateTime("2010-07-23 16:27:43", zone=zone).get_offset(),
+            7200
+        )
+        self.assertEqual(
+            chrono.DateTime("2010-01-23 16:27:43", zone=zone).get_offset(),
+            3600
+        )
+        self.assertEqual(
+            chrono.DateTime("2010-07-23 16:27:43").get_offset(), None
+        )
+
+
 class DateTime_get_stringTest(unittest.TestCase):
 
     def test_empty(self):
@@ -988,6 +1248,66 @@ class DateTime_get_unixTest(unittest.TestCase):
             chrono.DateTime("2009-12-27 16:27:43").get_unix(), 1261931263
         )
 
+    def test_zone(self):
+        "DateTime.get_unix() converts from the zone"
+
+        zone = chrono.tz.Zone("Test", rule="EST5EDT,M3.2.0,M11.1.0")
+
+        self.assertEqual(
+            chrono.DateTime("2010-07-01 12:00:00", zone=zone).get_unix(),
+            1278000000
+        )
+
+
+class DateTime_get_unix_utcTest(unittest.TestCase):
+
+    def test_empty(self):
+        "DateTime.get_unix_utc() raises NoDateTimeError if date isn't set"
+
+        self.assertRaises(
+            chrono.error.NoDateTimeError, chrono.DateTime().get_unix_utc
+        )
+
+    def test_unix_utc(self):
+        "DateTime.get_unix_utc() returns UTC unix timestamp"
+
+        self.assertEqual(
+            chrono.DateTime("2009-12-27 16:27:43").get_unix_utc(), 1261931263
+        )
+        self.assertEqual(
+            chrono.DateTime("1969-12-31 23:59:59").get_unix_utc(), -1
+        )
+
+    def test_zone(self):
+        "DateTime.get_unix_utc() converts from the zone"
+
+        zone = chrono.tz.Zone("Test", rule="CET-1CEST,M3.5.0,M10.5.0/3")
+
+        self.assertEqual(
+            chrono.DateTime("2009-12-27 16:27:43", zone=zone).get_unix_utc(),
+            1261931263 - 3600
+        )
+
+        # 02:30:00 occurs twice, the first occurrence is used
+        self.assertEqual(
+            chrono.DateTime("2010-10-31 02:30:00", zone=zone).get_unix_utc(),
+            1288485000
+        )
+
+
+class DateTime_get_zonenameTest(unittest.TestCase):
+
+    def test_zonename(self):
+        "DateTime.get_zonename() returns the name of the zone"
+
+        self.assertEqual(
+            chrono.DateTime("2010-07-23 16:27:43", zone="UTC").get_zonename(),
+            "UTC"
+        )
+        self.assertEqual(
+            chrono.DateTime("2010-07-23 16:27:43").get_zonename(), None
+        )
+
 
 class DateTime_is_setTest(unittest.TestCase):
 
@@ -1211,6 +1531,80 @@ class DateTime_set_unixText(unittest.TestCase):
 
         self.assertEquals(d.get(), (2009, 12, 27, 5, 45, 18))
 
+    def test_zone(self):
+        "DateTime.set_unix() converts to the zone"
+
+        d = chrono.DateTime(
+            zone=chrono.tz.Zone("Test", rule="CET-1CEST,M3.5.0,M10.5.0/3")
+        )
+        d.set_unix(0)
+
+        self.assertEqual(d.get(), (1970, 1, 1, 1, 0, 0))
+
+
+class DateTime_set_unix_utcTest(unittest.TestCase):
+
+    def test_range(self):
+        "DateTime.set_unix_utc() raises YearError outside years 1-9999"
+
+        self.assertRaises(
+            chrono.YearError, chrono.DateTime().set_unix_utc, -62135596801
+        )
+
+    def test_unix_utc(self):
+        "DateTime.set_unix_utc() sets date/time from UTC unix timestamp"
+
+        d = chrono.DateTime()
+        d.set_unix_utc(1261931263)
+
+        self.assertEqual(d.get(), (2009, 12, 27, 16, 27, 43))
+
+    def test_zone(self):
+        "DateTime.set_unix_utc() converts to the zone"
+
+        d = chrono.DateTime(zone=chrono.tz.Zone("Test", rule="CET-1CEST,M3.5.0,M10.5.0/3"))
+        d.set_unix_utc(1261931263)
+
+        self.assertEqual(d.get(), (2009, 12, 27, 17, 27, 43))
+
+
+class DateTime_sort_keyTest(unittest.TestCase):
+
+    def test_empty(self):
+        "DateTime.sort_key() sorts date/times which are not set first"
+
+        d = chrono.DateTime()
+        self.assertEqual(d.sort_key(), 0)
+
+        d.year, d.month, d.day = 2009, 12, 27
+        self.assertTrue(
+            0 < d.sort_key() < chrono.DateTime("2009-12-27 00:00:00").sort_key()
+        )
+
+    def test_order(self):
+        "DateTime.sort_key() orders date/times like comparisons"
+
+        datetimes = [
+            chrono.DateTime("2009-12-27 16:27:43"), chrono.DateTime(),
+            chrono.DateTime("2009-12-27 16:27:42"),
+            chrono.DateTime("2009-12-26 23:59:59"),
+            chrono.DateTime("2010-01-01 00:00:00"),
+            chrono.DateTime("0001-01-01 00:00:00"),
+        ]
+
+        self.assertEqual(
+            [d.sort_key() for d in sorted(datetimes)],
+            sorted(d.sort_key() for d in datetimes)
+        )
+
+    def test_zone(self):
+        "DateTime.sort_key() ignores zones"
+
+        self.assertEqual(
+            chrono.DateTime("2009-12-27 16:27:43", zone="UTC").sort_key(),
+            chrono.DateTime("2009-12-27 16:27:43").sort_key()
+        )
+
 
 class DateTime_weekTest(unittest.TestCase):
 
@@ -0,0 +1,301 @@
+#!/usr/bin/env python
+
+import array
+import chrono
+import datetime
+import unittest
+
+
+class DateTimeArray__getitemTest(unittest.TestCase):
+
+    def test_index(self):
+        "DateTimeArray.__getitem__() returns CompactDateTime for index"
+
+        d = chrono.DateTimeArray(
+            ["2010-07-23 16:27:43", "2010-07-24 00:00:00"]
+        )[1]
+
+        self.assertTrue(isinstance(d, chrono.CompactDateTime))
+        self.assertEqual(d.get(), (2010, 7, 24, 0, 0, 0))
+
+    def test_slice(self):
+        "DateTimeArray.__getitem__() returns DateTimeArray for slice"
+
+        d = chrono.DateTimeArray.from_epoch([0, 60, 120])[1:]
+
+        self.assertTrue(isinstance(d, chrono.DateTimeArray))
+        self.assertEqual(d.get_epoch(), array.array("q", [60, 120]))
+
+
+class DateTimeArray__initTest(unittest.TestCase):
+
+    def test_empty(self):
+        "DateTimeArray.__init__() creates empty array by default"
+
+        self.assertEqual(len(chrono.DateTimeArray()), 0)
+
+    def test_empty_datetime(self):
+        "DateTimeArray.__init__() raises NoDateTimeError on empty values"
+
+        self.assertRaises(
+            chrono.NoDateTimeError, chrono.DateTimeArray, [None]
+        )
+
+    def test_invalid(self):
+        "DateTimeArray.__init__() raises error on invalid date/times"
+
+        self.assertRaises(
+            chrono.DayError, chrono.DateTimeArray, ["2010-02-29 00:00:00"]
+        )
+        self.assertRaises(
+            chrono.HourError, chrono.DateTimeArray, ["2010-02-28 24:00:00"]
+        )
+        self.assertRaises(chrono.ParseError, chrono.DateTimeArray, ["abc"])
+
+    def test_mixed(self):
+        "DateTimeArray.__init__() handles values accepted by CompactDateTime"
+
+        self.assertEqual(chrono.DateTimeArray([
+            "2010-07-23 16:27:43",
+            chrono.DateTime("2010-07-24 00:00:01"),
+            chrono.CompactDateTime("2010-07-25 12:00:00"),
+            chrono.Date("2010-07-26"),
+            datetime.datetime(2010, 7, 27, 23, 59, 59),
+        ]).get(), [
+            (2010, 7, 23, 16, 27, 43), (2010, 7, 24, 0, 0, 1),
+            (2010, 7, 25, 12, 0, 0), (2010, 7, 26, 0, 0, 0),
+            (2010, 7, 27, 23, 59, 59),
+        ])
+
+    def test_parser(self):
+        "DateTimeArray.__init__() uses the given parser"
+
+        self.assertEqual(
+            chrono.DateTimeArray(
+                ["23.07.2010 16:27:43"], parser=chrono.parser.EuroParser
+            ).get(),
+            [(2010, 7, 23, 16, 27, 43)]
+        )
+
+
+class DateTimeArray__reprTest(unittest.TestCase):
+
+    def test_repr(self):
+        "DateTimeArray.__repr__() includes date/time strings"
+
+        self.assertEqual(
+            repr(chrono.DateTimeArray(["2010-07-23 16:27:43"])),
+            "chrono.DateTimeArray(['2010-07-23 16:27:43'])"
+        )
+
+
+class DateTimeArray_appendTest(unittest.TestCase):
+
+    def test_append(self):
+        "DateTimeArray.append() appends date/time"
+
+        d = chrono.DateTimeArray()
+        d.append("2010-07-23 16:27:43")
+
+        self.assertEqual(d.get(), [(2010, 7, 23, 16, 27, 43)])
+
+
+class DateTimeArray_cmpTest(unittest.TestCase):
+
+    def test_array(self):
+        "DateTimeArray.cmp() compares arrays item by item"
+
+        a = chrono.DateTimeArray.from_epoch([0, 10, 20])
+
+        self.assertEqual(
+            a.cmp(chrono.DateTimeArray.from_epoch([10, 10, 10])),
+            array.array("b", [-1, 0, 1])
+        )
+        self.assertRaises(
+            ValueError, a.cmp, chrono.DateTimeArray.from_epoch([0])
+        )
+
+    def test_value(self):
+        "DateTimeArray.cmp() compares all date/times with a value"
+
+        self.assertEqual(
+            chrono.DateTimeArray([
+                "2010-07-23 16:27:42", "2010-07-23 16:27:43",
+                "2010-07-23 16:27:44",
+            ]).cmp("2010-07-23 16:27:43"),
+            array.array("b", [-1, 0, 1])
+        )
+
+
+class DateTimeArray_fieldsTest(unittest.TestCase):
+
+    def setUp(self):
+
+        unittest.TestCase.setUp(self)
+
+        self.d = chrono.DateTimeArray([
+            "2010-07-23 16:27:43", "2009-12-27 05:45:18",
+            "2010-01-01 00:00:00", "1969-12-31 23:59:59",
+        ])
+
+    def test_date(self):
+        "DateTimeArray.date() returns a DateArray with the dates"
+
+        self.assertEqual(self.d.date().get_string(), [
+            "2010-07-23", "2009-12-27", "2010-01-01", "1969-12-31"
+        ])
+
+    def test_fields(self):
+        "DateTimeArray returns arrays with date/time fields"
+
+        self.assertEqual(list(self.d.year()), [2010, 2009, 2010, 1969])
+        self.assertEqual(list(self.d.month()), [7, 12, 1, 12])
+        self.assertEqual(list(self.d.day()), [23, 27, 1, 31])
+        self.assertEqual(list(self.d.hour()), [16, 5, 0, 23])
+        self.assertEqual(list(self.d.minute()), [27, 45, 0, 59])
+        self.assertEqual(list(self.d.second()), [43, 18, 0, 59])
+
+    def test_week(self):
+        "DateTimeArray week and weekday depend on the calendar"
+
+        self.assertEqual(list(self.d.weekday()), [5, 7, 5, 3])
+        self.assertEqual(
+            self.d.week(), [(2010, 29), (2009, 52), (2009, 53), (1970, 1)]
+        )
+
+        self.d.calendar = chrono.calendar.USCalendar
+
+        self.assertEqual(list(self.d.weekday()), [6, 1, 6, 4])
+
+
+class DateTimeArray_floorTest(unittest.TestCase):
+
+    def setUp(self):
+
+        unittest.TestCase.setUp(self)
+
+        self.d = chrono.DateTimeArray(
+            ["2010-07-23 16:27:43", "1969-12-31 23:59:59"]
+        )
+
+    def test_floor(self):
+        "DateTimeArray.floor() truncates date/times to the start of a unit"
+
+        self.assertEqual(self.d.floor("minute").get_string(), [
+            "2010-07-23 16:27:00", "1969-12-31 23:59:00"
+        ])
+        self.assertEqual(self.d.floor("hour").get_string(), [
+            "2010-07-23 16:00:00", "1969-12-31 23:00:00"
+        ])
+        self.assertEqual(self.d.floor("day").get_string(), [
+            "2010-07-23 00:00:00", "1969-12-31 00:00:00"
+        ])
+        self.assertEqual(self.d.floor("month").get_string(), [
+            "2010-07-01 00:00:00", "1969-12-01 00:00:00"
+        ])
+        self.assertEqual(self.d.floor("year").get_string(), [
+            "2010-01-01 00:00:00", "1969-01-01 00:00:00"
+        ])
+        self.assertRaises(ValueError, self.d.floor, "second")
+
+    def test_week(self):
+        "DateTimeArray.floor() uses the calendar for the start of weeks"
+
+        self.assertEqual(self.d.floor("week").get_string(), [
+            "2010-07-19 00:00:00", "1969-12-29 00:00:00"
+        ])
+
+        self.d.calendar = chrono.calendar.USCalendar
+
+        self.assertEqual(self.d.floor("week").get_string(), [
+            "2010-07-18 00:00:00", "1969-12-28 00:00:00"
+        ])
+
+
+class DateTimeArray_formatTest(unittest.TestCase):
+
+    def test_format(self):
+        "DateTimeArray.format() formats all date/times"
+
+        self.assertEqual(
+            chrono.DateTimeArray(
+                ["2010-07-23 16:27:43", "2009-12-27 05:45:18"]
+            ).format("$day.$month.$year $012hour $ampm"),
+            ["23.7.2010 04 PM", "27.12.2009 05 AM"]
+        )
+
+
+class DateTimeArray_from_bufferTest(unittest.TestCase):
+
+    def test_buffer(self):
+        "DateTimeArray.from_buffer() uses buffers without copying"
+
+        buffer = bytearray(array.array("q", [20, 0, 10]).tobytes())
+        d = chrono.DateTimeArray.from_buffer(buffer)
+
+        self.assertEqual(list(d.second()), [20, 0, 10])
+
+        d.sort()
+
+        self.assertEqual(
+            array.array("q", bytes(buffer)), array.array("q", [0, 10, 20])
+        )
+
+        d.append(30)
+
+        self.assertEqual(len(d), 4)
+        self.assertEqual(
+            array.array("q", bytes(buffer)), array.array("q", [0, 10, 20])
+        )
+
+    def test_invalid(self):
+        "DateTimeArray.from_buffer() raises ValueError on invalid size"
+
+        self.assertRaises(
+            ValueError, chrono.DateTimeArray.from_buffer, b"\0" * 12
+        )
+
+
+class DateTimeArray_from_epochTest(unittest.TestCase):
+
+    def test_array(self):
+        "DateTimeArray.from_epoch() uses int64 arrays without copying"
+
+        epoch = array.array("q", [0, 1])
+
+        self.assertTrue(chrono.DateTimeArray.from_epoch(epoch).epoch is epoch)
+
+    def test_list(self):
+        "DateTimeArray.from_epoch() handles lists"
+
+        self.assertEqual(
+            chrono.DateTimeArray.from_epoch([0, 1279902463]).get(),
+            [(1970, 1, 1, 0, 0, 0), (2010, 7, 23, 16, 27, 43)]
+        )
+
+
+class DateTimeArray_sortTest(unittest.TestCase):
+
+    def test_argsort(self):
+        "DateTimeArray.argsort() returns indexes in sorted order"
+
+        d = chrono.DateTimeArray.from_epoch([20, 0, 10, 0])
+
+        self.assertEqual(d.argsort(), array.array("q", [1, 3, 2, 0]))
+        self.assertEqual(d.argsort(True), array.array("q", [0, 2, 1, 3]))
+
+    def test_sort(self):
+        "DateTimeArray.sort() sorts the date/times in place"
+
+        d = chrono.DateTimeArray.from_epoch([20, 0, 10])
+        d.sort()
+
+        self.assertEqual(d.get_epoch(), array.array("q", [0, 10, 20]))
+
+        d.sort(reverse=True)
+
+        self.assertEqual(d.get_epoch(), array.array("q", [20, 10, 0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+
+import chrono
+import contextvars
+import threading
+import unittest
+
+
+class defaults_contextTest(unittest.TestCase):
+
+    def test_active(self):
+        "context() counts the active contexts, also on exceptions"
+
+        self.assertEqual(chrono.defaults.active, 0)
+
+        with chrono.context():
+            self.assertEqual(chrono.defaults.active, 1)
+
+            try:
+                with chrono.context(calendar=chrono.calendar.USCalendar):
+                    self.assertEqual(chrono.defaults.active, 2)
+                    raise ValueError
+
+            except ValueError:
+                pass
+
+            self.assertEqual(chrono.defaults.active, 1)
+
+        self.assertEqual(chrono.defaults.active, 0)
+
+    def test_arguments(self):
+        "context() is overridden by arguments"
+
+        with chrono.context(
+            parser=chrono.parser.USParser, calendar=chrono.calendar.USCalendar
+        ):
+            d = chrono.Date(
+                "2010-07-23", parser=chrono.parser.ISOParser,
+                calendar=chrono.calendar.ISOCalendar
+            )
+
+        self.assertTrue(d.parser is chrono.parser.ISOParser)
+        self.assertTrue(d.calendar is chrono.calendar.ISOCalendar)
+
+    def test_calendar(self):
+        "context() sets the default calendar"
+
+        with chrono.context(calendar=chrono.calendar.USCalendar):
+            self.assertTrue(
+                chrono.Date().calendar is chrono.calendar.USCalendar
+            )
+            self.assertTrue(
+                chrono.CompactDate().calendar is chrono.calendar.USCalendar
+            )
+            self.assertTrue(
+                chrono.DateTimeArray().calendar is chrono.calendar.USCalendar
+            )
+            self.assertEqual(
+                chrono.Date("2010-07-25").weekdate(), (2010, 31, 1)
+            )
+
+        self.assertTrue(chrono.Date().calendar is chrono.DEFAULT_CALENDAR)
+
+    def test_context(self):
+        "context() only applies to the current context"
+
+        def run():
+            return chrono.Date().calendar
+
+        with chrono.context(calendar=chrono.calendar.USCalendar):
+            self.assertTrue(
+                contextvars.copy_context().run(run) is
+                chrono.calendar.USCalendar
+            )
+            self.assertTrue(
+                contextvars.Context().run(run) is chrono.DEFAULT_CALENDAR
+            )
+
+    def test_exception(self):
+        "context() restores the defaults on exceptions"
+
+        try:
+            with chrono.context(parser=chrono.parser.USParser):
+                raise ValueError
+
+        except ValueError:
+            pass
+
+        self.assertTrue(chrono.Date().parser is chrono.DEFAULT_PARSER)
+
+    def test_nested(self):
+        "context() may be nested"
+
+        with chrono.context(parser=chrono.parser.USParser):
+            with chrono.context(calendar=chrono.calendar.USCalendar):
+                d = chrono.Date("07/23/2010")
+
+                self.assertTrue(d.parser is chrono.parser.USParser)
+                self.assertTrue(d.calendar is chrono.calendar.USCalendar)
+
+            with chrono.context(parser=chrono.parser.EuroParser):
+                self.assertEqual(
+                    chrono.Date("23.07.2010").get(), (2010, 7, 23)
+                )
+
+            d = chrono.Date("07/23/2010")
+
+            self.assertTrue(d.parser is chrono.parser.USParser)
+            self.assertTrue(d.calendar is chrono.DEFAULT_CALENDAR)
+
+    def test_parser(self):
+        "context() sets the default parser"
+
+        with chrono.context(parser=chrono.parser.USParser):
+            self.assertEqual(chrono.Date("07/23/2010").get(), (2010, 7, 23))
+            self.assertEqual(
+                chrono.CompactDateTime("07/23/2010 04:27:43 PM").get(),
+                (2010, 7, 23, 16, 27, 43)
+            )
+            self.assertRaises(chrono.ParseError, chrono.Date, "2010-07-23")
+
+        self.assertTrue(chrono.Date().parser is chrono.DEFAULT_PARSER)
+
+    def test_thread(self):
+        "context() doesn't apply to other threads"
+
+        result = []
+        thread = threading.Thread(
+            target=lambda: result.append(chrono.Date().parser)
+        )
+
+        with chrono.context(parser=chrono.parser.USParser):
+            thread.start()
+            thread.join()
+
+        self.assertTrue(result[0] is chrono.DEFAULT_PARSER)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,231 @@
+#!/usr/bin/env python
+
+import chrono
+import datetime
+import unittest
+
+
+class Duration__addTest(unittest.TestCase):
+
+    def test_date(self):
+        "Duration.__add__() adds durations to dates"
+
+        self.assertEqual(
+            chrono.Duration(days=2) + chrono.Date("2010-07-23"),
+            chrono.Date("2010-07-25")
+        )
+
+    def test_duration(self):
+        "Duration.__add__() adds durations"
+
+        self.assertEqual(
+            chrono.Duration(months=1, hours=1) + chrono.Duration(seconds=30),
+            chrono.Duration(months=1, seconds=3630)
+        )
+
+    def test_invalid(self):
+        "Duration.__add__() raises TypeError on invalid type"
+
+        self.assertRaises(TypeError, lambda: chrono.Duration() + 1)
+
+
+class Duration__cmpTest(unittest.TestCase):
+
+    def test_eq(self):
+        "Duration.__eq__() compares months and seconds"
+
+        self.assertEqual(chrono.Duration(days=1), chrono.Duration(hours=24))
+        self.assertNotEqual(
+            chrono.Duration(days=30), chrono.Duration(months=1)
+        )
+        self.assertNotEqual(chrono.Duration(), None)
+
+    def test_hash(self):
+        "Duration.__hash__() is equal for equal durations"
+
+        self.assertEqual(
+            hash(chrono.Duration(weeks=1)), hash(chrono.Duration(days=7))
+        )
+
+    def test_lt(self):
+        "Duration.__lt__() compares seconds"
+
+        self.assertTrue(chrono.Duration(hours=1) < chrono.Duration(hours=2))
+        self.assertTrue(
+            chrono.Duration(hours=1) < datetime.timedelta(hours=2)
+        )
+        self.assertFalse(
+            chrono.Duration(months=1, hours=2) <
+            chrono.Duration(months=1, hours=1)
+        )
+
+    def test_months(self):
+        "Duration.__lt__() raises TypeError for different months"
+
+        self.assertRaises(
+            TypeError,
+            lambda: chrono.Duration(months=1) < chrono.Duration(days=31)
+        )
+
+
+class Duration__initTest(unittest.TestCase):
+
+    def test_duration(self):
+        "Duration.__init__() handles Duration objects"
+
+        self.assertEqual(
+            chrono.Duration(chrono.Duration(months=2, seconds=5)),
+            chrono.Duration(months=2, seconds=5)
+        )
+
+    def test_invalid(self):
+        "Duration.__init__() raises TypeError on invalid type"
+
+        self.assertRaises(TypeError, chrono.Duration, "abc")
+
+    def test_keywords(self):
+        "Duration.__init__() converts keywords to months and seconds"
+
+        d = chrono.Duration(
+            years=1, months=2, weeks=1, days=1, hours=1, minutes=1, seconds=1
+        )
+
+        self.assertEqual(d.months, 14)
+        self.assertEqual(d.seconds, 694861)
+
+    def test_timedelta(self):
+        "Duration.__init__() handles timedelta objects"
+
+        d = chrono.Duration(datetime.timedelta(days=-1, seconds=10))
+
+        self.assertEqual(d.months, 0)
+        self.assertEqual(d.seconds, -86390)
+
+
+class Duration__mulTest(unittest.TestCase):
+
+    def test_mul(self):
+        "Duration.__mul__() multiplies months and seconds"
+
+        self.assertEqual(
+            chrono.Duration(months=1, days=1) * 3,
+            chrono.Duration(months=3, days=3)
+        )
+        self.assertEqual(
+            -2 * chrono.Duration(hours=1), chrono.Duration(hours=-2)
+        )
+        self.assertRaises(TypeError, lambda: chrono.Duration() * 1.5)
+
+
+class Duration__reprTest(unittest.TestCase):
+
+    def test_repr(self):
+        "Duration.__repr__() returns months and seconds"
+
+        self.assertEqual(
+            repr(chrono.Duration(years=1, minutes=1)),
+            "chrono.Duration(months=12, seconds=60)"
+        )
+
+
+class Duration__subTest(unittest.TestCase):
+
+    def test_sub(self):
+        "Duration.__sub__() subtracts durations"
+
+        self.assertEqual(
+            chrono.Duration(days=1) - chrono.Duration(months=1, hours=1),
+            chrono.Duration(months=-1, hours=23)
+        )
+        self.assertEqual(-chrono.Duration(days=1), chrono.Duration(days=-1))
+
+
+class Duration_applyTest(unittest.TestCase):
+
+    def test_calendar(self):
+        "Duration.apply() uses the given calendar for months"
+
+        cal = chrono.calendar.USCalendar
+
+        self.assertEqual(
+            chrono.Duration(months=1).apply(
+                cal.julian(2010, 1, 31), calendar=cal
+            ),
+            (cal.julian(2010, 2, 28), 0)
+        )
+
+    def test_months(self):
+        "Duration.apply() clamps the day to the end of the month"
+
+        cal = chrono.calendar.ISOCalendar
+
+        for date, months, result in (
+            ((2010, 1, 31), 1, (2010, 2, 28)),
+            ((2012, 1, 31), 1, (2012, 2, 29)),
+            ((2012, 2, 29), 12, (2013, 2, 28)),
+            ((2010, 3, 31), -1, (2010, 2, 28)),
+            ((2010, 12, 15), 1, (2011, 1, 15)),
+            ((2010, 1, 15), -13, (2008, 12, 15)),
+        ):
+            julian, seconds = chrono.Duration(months=months).apply(
+                cal.julian(*date), 3600
+            )
+
+            self.assertEqual(cal.julian_to_date(julian), result)
+            self.assertEqual(seconds, 3600)
+
+    def test_range(self):
+        "Duration.apply() raises YearError outside years 1-9999"
+
+        self.assertRaises(
+            chrono.YearError, chrono.Duration(seconds=1).apply, 5373484, 86399
+        )
+        self.assertRaises(
+            chrono.YearError, chrono.Duration(months=-1).apply, 1721426
+        )
+
+    def test_seconds(self):
+        "Duration.apply() carries seconds into days"
+
+        self.assertEqual(
+            chrono.Duration(seconds=-3601).apply(2455401, 3600),
+            (2455400, 86399)
+        )
+        self.assertEqual(
+            chrono.Duration(weeks=100, seconds=1).apply(2455401, 86399),
+            (2456102, 0)
+        )
+
+
+class Duration_getTest(unittest.TestCase):
+
+    def test_days(self):
+        "Duration.get_days() returns whole days"
+
+        self.assertEqual(chrono.Duration(hours=47).get_days(), 1)
+        self.assertEqual(chrono.Duration(hours=-1).get_days(), -1)
+
+    def test_months(self):
+        "Duration.get_seconds() raises ValueError for months"
+
+        self.assertRaises(ValueError, chrono.Duration(months=1).get_seconds)
+        self.assertRaises(ValueError, chrono.Duration(years=1).get_timedelta)
+
+    def test_seconds(self):
+        "Duration.get_seconds() returns seconds"
+
+        self.assertEqual(
+            chrono.Duration(days=1, seconds=1).get_seconds(), 86401
+        )
+
+    def test_timedelta(self):
+        "Duration.get_timedelta() returns a timedelta"
+
+        self.assertEqual(
+            chrono.Duration(days=-1, seconds=1).get_timedelta(),
+            datetime.timedelta(days=-1, seconds=1)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
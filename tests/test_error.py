@@ -100,5 +100,13 @@ class YearErrorTest(unittest.TestCase):
         self.assertTrue(issubclass(chrono.YearError, chrono.DateError))
 
 
+class ZoneErrorTest(unittest.TestCase):
+
+    def test_subclass(self):
+        "ZoneError is a subclass of ValueError"
+
+        self.assertTrue(issubclass(chrono.ZoneError, ValueError))
+
+
 if __name__ == "__main__":
     unittest.main()
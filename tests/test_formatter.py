@@ -4,6 +4,58 @@ import chrono
 import unittest
 
 
+class Formatter_compileTest(unittest.TestCase):
+
+    def setUp(self):
+
+        unittest.TestCase.setUp(self)
+
+        self.f = chrono.formatter.Formatter(chrono.calendar.ISOCalendar)
+
+    def test_braces(self):
+        "Formatter.compile() keeps literal braces in templates"
+
+        self.assertEqual(self.f.compile("{$0year}")(2010), "{2010}")
+
+    def test_cache(self):
+        "Formatter.compile() returns cached functions for the same template"
+
+        self.assertTrue(
+            self.f.compile("$0year-$0month") is
+            chrono.formatter.Formatter(chrono.calendar.ISOCalendar).compile(
+                "$0year-$0month"
+            )
+        )
+
+    def test_calendar(self):
+        "Formatter.compile() uses the calendar of the formatter"
+
+        f = chrono.formatter.Formatter(chrono.calendar.USCalendar)
+
+        self.assertEqual(self.f.compile("$week")(2010, 1, 3), "53")
+        self.assertEqual(f.compile("$week")(2010, 1, 3), "2")
+
+    def test_format(self):
+        "Formatter.compile() returns a function formatting the template"
+
+        fmt = self.f.compile("$0year-$0month-$0day $0hour:$0minute:$0second")
+
+        self.assertEqual(fmt(2010, 8, 4, 1, 2, 3), "2010-08-04 01:02:03")
+        self.assertEqual(fmt(2009, 12, 27, 16, 27, 43), "2009-12-27 16:27:43")
+
+    def test_missing(self):
+        "Formatter.compile() returns function which handles missing values"
+
+        self.assertEqual(
+            self.f.compile("$0year-$0month $0hour")(hour=16), "- 16"
+        )
+
+    def test_static(self):
+        "Formatter.compile() handles templates without variables"
+
+        self.assertEqual(self.f.compile("abc $$ $dummy")(2010), "abc $ $dummy")
+
+
 class Formatter_formatTest(unittest.TestCase):
 
     def setUp(self):
@@ -150,6 +202,22 @@ class Formatter_formatTest(unittest.TestCase):
             "$monthname", 2010, 8, 4, 1, 2, 3
         ), "August")
 
+    def test_offset(self):
+        "Formatter.format() handles $offset"
+
+        self.assertEqual(self.f.format(
+            "$offset", 2010, 8, 4, 1, 2, 3, 19800
+        ), "+05:30")
+        self.assertEqual(self.f.format(
+            "$offset", 2010, 8, 4, 1, 2, 3, -3600
+        ), "-01:00")
+        self.assertEqual(self.f.format(
+            "$offset", 2010, 8, 4, 1, 2, 3, 0
+        ), "+00:00")
+        self.assertEqual(self.f.format(
+            "$offset", 2010, 8, 4, 1, 2, 3
+        ), "")
+
     def test_second(self):
         "Formatter.format() handles $second"
 
@@ -213,6 +281,39 @@ class Formatter_formatTest(unittest.TestCase):
             "$year", 2010, 8, 4, 1, 2, 3
         ), "2010")
 
+    def test_zonename(self):
+        "Formatter.format() handles $zonename"
+
+        self.assertEqual(self.f.format(
+            "$zonename", 2010, 8, 4, 1, 2, 3, 7200, "Europe/Oslo"
+        ), "Europe/Oslo")
+        self.assertEqual(self.f.format(
+            "$zonename", 2010, 8, 4, 1, 2, 3
+        ), "")
+
+
+class Formatter_splitTest(unittest.TestCase):
+
+    def test_split(self):
+        "Formatter.split() splits template into text and variables"
+
+        self.assertEqual(
+            chrono.formatter.Formatter.split("$$${0year}-$month $abc$"),
+            [
+                ("$", None), ("${0year}", "0year"), ("-", None),
+                ("$month", "month"), (" ", None), ("$abc", None),
+                ("$", None),
+            ]
+        )
+
+    def test_text(self):
+        "Formatter.split() returns text without variables as one chunk"
+
+        self.assertEqual(
+            chrono.formatter.Formatter.split("abc"), [("abc", None)]
+        )
+        self.assertEqual(chrono.formatter.Formatter.split(""), [])
+
 
 if __name__ == "__main__":
     unittest.main()
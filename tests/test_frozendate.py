@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+
+import chrono
+import copy
+import datetime
+import pickle
+import unittest
+
+
+class FrozenDate__addTest(unittest.TestCase):
+
+    def test_add(self):
+        "FrozenDate.__add__() returns a new FrozenDate"
+
+        d = chrono.FrozenDate("2010-07-23")
+        r = d + chrono.Duration(days=1)
+
+        self.assertTrue(isinstance(r, chrono.FrozenDate))
+        self.assertEqual(r.get(), (2010, 7, 24))
+        self.assertEqual(d.get(), (2010, 7, 23))
+        self.assertEqual(
+            (d - chrono.Duration(months=1)).get(), (2010, 6, 23)
+        )
+        self.assertEqual(
+            d - chrono.FrozenDate("2010-07-01"), chrono.Duration(days=22)
+        )
+
+
+class FrozenDate__copyTest(unittest.TestCase):
+
+    def test_copy(self):
+        "FrozenDate can be copied and pickled"
+
+        d = chrono.FrozenDate(
+            "2010-07-23", calendar=chrono.calendar.USCalendar
+        )
+
+        self.assertTrue(copy.copy(d) is d)
+        self.assertTrue(copy.deepcopy(d) is d)
+
+        p = pickle.loads(pickle.dumps(d))
+
+        self.assertEqual(p, d)
+        self.assertTrue(p.calendar is chrono.calendar.USCalendar)
+
+
+class FrozenDate__eqTest(unittest.TestCase):
+
+    def test_eq(self):
+        "FrozenDate.__eq__() compares with dates"
+
+        d = chrono.FrozenDate("2010-07-23")
+
+        self.assertTrue(d == chrono.FrozenDate("2010-07-23"))
+        self.assertTrue(d == chrono.Date("2010-07-23"))
+        self.assertTrue(d == datetime.date(2010, 7, 23))
+        self.assertFalse(d != datetime.date(2010, 7, 23))
+        self.assertTrue(d != datetime.date(2010, 7, 24))
+
+    def test_other(self):
+        "FrozenDate.__eq__() is False for values which aren't dates"
+
+        d = chrono.FrozenDate("2010-07-23")
+
+        self.assertFalse(d == chrono.FrozenDateTime("2010-07-23 00:00:00"))
+        self.assertFalse(d == datetime.datetime(2010, 7, 23))
+        self.assertFalse(d == "2010-07-23")
+        self.assertFalse(d == "foo")
+        self.assertFalse(d == None)
+        self.assertTrue(d != "foo")
+
+
+class FrozenDate__hashTest(unittest.TestCase):
+
+    def test_hash(self):
+        "FrozenDate.__hash__() hashes equal dates the same"
+
+        dates = set([
+            chrono.FrozenDate("2010-07-23"),
+            chrono.FrozenDate(chrono.Date("2010-07-23")),
+            chrono.FrozenDate(julian=2455401),
+            chrono.FrozenDate("2010-07-24"),
+        ])
+
+        self.assertEqual(len(dates), 2)
+        self.assertTrue(chrono.FrozenDate("2010-07-24") in dates)
+
+    def test_pydate(self):
+        "FrozenDate.__hash__() hashes the same as equal datetime.date"
+
+        dates = set([chrono.FrozenDate("2010-07-23")])
+
+        self.assertTrue(datetime.date(2010, 7, 23) in dates)
+        self.assertEqual(
+            {datetime.date(2010, 7, 23): 1}.get(
+                chrono.FrozenDate("2010-07-23")
+            ),
+            1
+        )
+
+
+class FrozenDate__reprTest(unittest.TestCase):
+
+    def test_repr(self):
+        "FrozenDate.__repr__() shows code to recreate object"
+
+        self.assertEqual(
+            repr(chrono.FrozenDate("2010-07-23")),
+            "chrono.FrozenDate(year=2010, month=7, day=23)"
+        )
+        self.assertEqual(repr(chrono.FrozenDate()), "chrono.FrozenDate()")
+
+
+class FrozenDate__setattrTest(unittest.TestCase):
+
+    def test_immutable(self):
+        "FrozenDate can't be changed"
+
+        d = chrono.FrozenDate("2010-07-23")
+
+        def set_day():
+            d.day = 24
+
+        self.assertRaises(AttributeError, set_day)
+        self.assertRaises(AttributeError, d.set_julian, 2455402)
+        self.assertRaises(AttributeError, d.clear)
+        self.assertEqual(d.get(), (2010, 7, 23))
+
+
+class FrozenDate_thawTest(unittest.TestCase):
+
+    def test_thaw(self):
+        "FrozenDate.thaw() returns a mutable Date"
+
+        d = chrono.FrozenDate(
+            "2010-07-23", calendar=chrono.calendar.USCalendar
+        ).thaw()
+
+        self.assertTrue(isinstance(d, chrono.Date))
+        self.assertEqual(d.get(), (2010, 7, 23))
+        self.assertTrue(d.calendar is chrono.calendar.USCalendar)
+        self.assertFalse(chrono.FrozenDate().thaw().is_set())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+
+import chrono
+import datetime
+import pickle
+import unittest
+
+
+class FrozenDateTime__addTest(unittest.TestCase):
+
+    def test_add(self):
+        "FrozenDateTime.__add__() returns a new FrozenDateTime"
+
+        d = chrono.FrozenDateTime("2010-07-23 16:27:43")
+
+        for r in (d + 60, d + chrono.Duration(minutes=1), d - -60):
+            self.assertTrue(isinstance(r, chrono.FrozenDateTime))
+            self.assertEqual(r.get(), (2010, 7, 23, 16, 28, 43))
+
+        self.assertEqual(d.get(), (2010, 7, 23, 16, 27, 43))
+        self.assertEqual(
+            d - chrono.FrozenDateTime("2010-07-23 16:00:00"),
+            chrono.Duration(seconds=1663)
+        )
+
+
+class FrozenDateTime__eqTest(unittest.TestCase):
+
+    def test_eq(self):
+        "FrozenDateTime.__eq__() compares with date/times"
+
+        d = chrono.FrozenDateTime("2010-07-23 00:00:00")
+
+        self.assertTrue(d == chrono.FrozenDateTime("2010-07-23 00:00:00"))
+        self.assertTrue(d == chrono.DateTime("2010-07-23 00:00:00"))
+        self.assertTrue(d == datetime.datetime(2010, 7, 23))
+        self.assertFalse(d != datetime.datetime(2010, 7, 23))
+        self.assertTrue(d != datetime.datetime(2010, 7, 23, 0, 0, 1))
+
+    def test_other(self):
+        "FrozenDateTime.__eq__() is False for values which aren't date/times"
+
+        d = chrono.FrozenDateTime("2010-07-23 00:00:00")
+
+        self.assertFalse(d == chrono.FrozenDate("2010-07-23"))
+        self.assertFalse(d == datetime.date(2010, 7, 23))
+        self.assertFalse(d == "2010-07-23 00:00:00")
+        self.assertFalse(d == "foo")
+        self.assertTrue(d != datetime.date(2010, 7, 23))
+
+
+class FrozenDateTime__hashTest(unittest.TestCase):
+
+    def test_hash(self):
+        "FrozenDateTime.__hash__() hashes equal date/times the same"
+
+        counts = {}
+
+        for value in (
+            "2010-07-23 16:27:43", chrono.DateTime("2010-07-23 16:27:43"),
+            chrono.CompactDateTime("2010-07-23 16:27:43"),
+            "2010-07-23 16:27:44",
+        ):
+            key = chrono.FrozenDateTime(value)
+            counts[key] = counts.get(key, 0) + 1
+
+        self.assertEqual(
+            counts, {
+                chrono.FrozenDateTime("2010-07-23 16:27:43"): 3,
+                chrono.FrozenDateTime("2010-07-23 16:27:44"): 1,
+            }
+        )
+
+    def test_pydatetime(self):
+        "FrozenDateTime.__hash__() hashes the same as equal datetime.datetime"
+
+        counts = {}
+
+        for key in (
+            datetime.datetime(2010, 7, 23, 16, 27, 43),
+            chrono.FrozenDateTime("2010-07-23 16:27:43"),
+        ):
+            counts[key] = counts.get(key, 0) + 1
+
+        self.assertEqual(len(counts), 1)
+        self.assertEqual(list(counts.values()), [2])
+
+
+class FrozenDateTime__reduceTest(unittest.TestCase):
+
+    def test_pickle(self):
+        "FrozenDateTime can be pickled"
+
+        d = chrono.FrozenDateTime("2010-07-23 16:27:43")
+
+        self.assertEqual(pickle.loads(pickle.dumps(d)), d)
+
+
+class FrozenDateTime__reprTest(unittest.TestCase):
+
+    def test_repr(self):
+        "FrozenDateTime.__repr__() shows code to recreate object"
+
+        self.assertEqual(
+            repr(chrono.FrozenDateTime("2010-07-23 16:27:43")),
+            "chrono.FrozenDateTime(year=2010, month=7, day=23, hour=16, "
+            "minute=27, second=43)"
+        )
+
+
+class FrozenDateTime__setattrTest(unittest.TestCase):
+
+    def test_immutable(self):
+        "FrozenDateTime can't be changed"
+
+        d = chrono.FrozenDateTime("2010-07-23 16:27:43")
+
+        def set_hour():
+            d.hour = 1
+
+        self.assertRaises(AttributeError, set_hour)
+        self.assertRaises(AttributeError, d.shift, days=1)
+        self.assertRaises(AttributeError, d.set_epoch, 0)
+        self.assertEqual(d.get(), (2010, 7, 23, 16, 27, 43))
+
+
+class FrozenDateTime_thawTest(unittest.TestCase):
+
+    def test_thaw(self):
+        "FrozenDateTime.thaw() returns a mutable DateTime"
+
+        d = chrono.FrozenDateTime("2010-07-23 16:27:43").thaw()
+
+        self.assertTrue(isinstance(d, chrono.DateTime))
+        self.assertEqual(d.get(), (2010, 7, 23, 16, 27, 43))
+        self.assertFalse(chrono.FrozenDateTime().thaw().is_set())
+
+
+if __name__ == "__main__":
+    unittest.main()
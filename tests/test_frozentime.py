@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+
+import chrono
+import datetime
+import pickle
+import unittest
+
+
+class FrozenTime__cmpTest(unittest.TestCase):
+
+    def test_cmp(self):
+        "FrozenTime compares with times and other values"
+
+        t = chrono.FrozenTime("16:27:43")
+
+        self.assertTrue(t == chrono.FrozenTime(hour=16, minute=27, second=43))
+        self.assertTrue(t == chrono.Time("16:27:43"))
+        self.assertTrue(t < "16:27:44")
+        self.assertTrue(t > datetime.time(16, 27, 42))
+        self.assertTrue(t != chrono.FrozenTime())
+        self.assertTrue(chrono.FrozenTime() < t)
+
+
+class FrozenTime__eqTest(unittest.TestCase):
+
+    def test_eq(self):
+        "FrozenTime.__eq__() compares with times"
+
+        t = chrono.FrozenTime("16:27:43")
+
+        self.assertTrue(t == chrono.FrozenTime("16:27:43"))
+        self.assertTrue(t == chrono.Time("16:27:43"))
+        self.assertTrue(t == datetime.time(16, 27, 43))
+        self.assertTrue(t != datetime.time(16, 27, 44))
+
+    def test_other(self):
+        "FrozenTime.__eq__() is False for values which aren't times"
+
+        t = chrono.FrozenTime("16:27:43")
+
+        self.assertFalse(t == datetime.datetime(2010, 7, 23, 16, 27, 43))
+        self.assertFalse(t == chrono.FrozenDateTime("2010-07-23 16:27:43"))
+        self.assertFalse(t == "16:27:43")
+        self.assertTrue(t != "foo")
+
+
+class FrozenTime__hashTest(unittest.TestCase):
+
+    def test_hash(self):
+        "FrozenTime.__hash__() hashes equal times the same"
+
+        self.assertEqual(
+            len(set([
+                chrono.FrozenTime("16:27:43"),
+                chrono.FrozenTime(chrono.Time("16:27:43")),
+                chrono.FrozenTime(datetime.time(16, 27, 43)),
+                chrono.FrozenTime("16:27:44"),
+            ])),
+            2
+        )
+
+    def test_pytime(self):
+        "FrozenTime.__hash__() hashes the same as equal datetime.time"
+
+        times = {datetime.time(16, 27, 43): 1}
+        times[chrono.FrozenTime("16:27:43")] = 2
+
+        self.assertEqual(times, {datetime.time(16, 27, 43): 2})
+
+
+class FrozenTime__initTest(unittest.TestCase):
+
+    def test_init(self):
+        "FrozenTime.__init__() accepts the same values as Time"
+
+        self.assertEqual(chrono.FrozenTime("16:27:43").seconds, 59263)
+        self.assertEqual(
+            chrono.FrozenTime(chrono.FrozenTime("16:27:43")).get(),
+            (16, 27, 43)
+        )
+        self.assertEqual(chrono.FrozenTime().seconds, None)
+        self.assertRaises(
+            chrono.HourError, chrono.FrozenTime, hour=24, minute=0, second=0
+        )
+        self.assertRaises(TypeError, chrono.FrozenTime, 1.5)
+
+    def test_partial(self):
+        "FrozenTime.__init__() gives an empty time for partial times"
+
+        t = chrono.Time("16:27:43")
+        t.minute = None
+
+        self.assertEqual(chrono.FrozenTime(t).seconds, None)
+
+
+class FrozenTime__reduceTest(unittest.TestCase):
+
+    def test_pickle(self):
+        "FrozenTime can be pickled"
+
+        for t in (chrono.FrozenTime("16:27:43"), chrono.FrozenTime()):
+            self.assertEqual(pickle.loads(pickle.dumps(t)), t)
+
+
+class FrozenTime__reprTest(unittest.TestCase):
+
+    def test_repr(self):
+        "FrozenTime.__repr__() shows code to recreate object"
+
+        self.assertEqual(
+            repr(chrono.FrozenTime("16:27:43")),
+            "chrono.FrozenTime(hour=16, minute=27, second=43)"
+        )
+        self.assertEqual(repr(chrono.FrozenTime()), "chrono.FrozenTime()")
+
+
+class FrozenTime__setattrTest(unittest.TestCase):
+
+    def test_immutable(self):
+        "FrozenTime can't be changed"
+
+        t = chrono.FrozenTime("16:27:43")
+
+        def set_seconds():
+            t.seconds = 0
+
+        def set_hour():
+            t.hour = 0
+
+        self.assertRaises(AttributeError, set_seconds)
+        self.assertRaises(AttributeError, set_hour)
+        self.assertEqual(t.get(), (16, 27, 43))
+
+
+class FrozenTime_formatTest(unittest.TestCase):
+
+    def test_format(self):
+        "FrozenTime.format() formats the time"
+
+        t = chrono.FrozenTime("16:27:43")
+
+        self.assertEqual(t.format("$12hour:$0minute $ampm"), "4:27 PM")
+        self.assertEqual(str(t), "16:27:43")
+        self.assertEqual(str(chrono.FrozenTime()), "")
+        self.assertEqual(t.get_datetime(), datetime.time(16, 27, 43))
+        self.assertRaises(
+            chrono.NoDateTimeError, chrono.FrozenTime().format, "$hour"
+        )
+
+
+class FrozenTime_thawTest(unittest.TestCase):
+
+    def test_thaw(self):
+        "FrozenTime.thaw() returns a mutable Time"
+
+        t = chrono.FrozenTime("16:27:43").thaw()
+
+        self.assertTrue(isinstance(t, chrono.Time))
+        self.assertEqual(t.get(), (16, 27, 43))
+        self.assertFalse(chrono.FrozenTime().thaw().is_set())
+
+
+if __name__ == "__main__":
+    unittest.main()
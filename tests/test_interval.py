@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+
+import chrono
+import datetime
+import unittest
+
+
+class Interval__containsTest(unittest.TestCase):
+
+    def test_contains(self):
+        "Interval.__contains__() checks if a value is in the interval"
+
+        i = chrono.Interval("2010-07-23 00:00:00", "2010-07-24 00:00:00")
+
+        self.assertTrue(chrono.DateTime("2010-07-23 00:00:00") in i)
+        self.assertTrue(chrono.DateTime("2010-07-23 23:59:59") in i)
+        self.assertFalse(chrono.DateTime("2010-07-24 00:00:00") in i)
+        self.assertFalse(chrono.DateTime("2010-07-22 23:59:59") in i)
+
+    def test_types(self):
+        "Interval.__contains__() handles all date and date/time types"
+
+        i = chrono.Interval(
+            chrono.Date("2010-07-23"), chrono.Date("2010-07-25")
+        )
+
+        self.assertTrue(chrono.Date("2010-07-24") in i)
+        self.assertTrue(chrono.CompactDate("2010-07-24") in i)
+        self.assertTrue(chrono.CompactDateTime("2010-07-24 12:00:00") in i)
+        self.assertTrue(datetime.date(2010, 7, 24) in i)
+        self.assertTrue(datetime.datetime(2010, 7, 24, 12) in i)
+        self.assertTrue("2010-07-24 12:00:00" in i)
+        self.assertFalse(datetime.date(2010, 7, 25) in i)
+        self.assertRaises(TypeError, lambda: 1 in i)
+
+
+class Interval__eqTest(unittest.TestCase):
+
+    def test_eq(self):
+        "Interval.__eq__() compares the ends of the intervals"
+
+        self.assertEqual(
+            chrono.Interval(chrono.Date("2010-07-23"), "2010-07-24 00:00:00"),
+            chrono.Interval(
+                datetime.datetime(2010, 7, 23),
+                chrono.CompactDate("2010-07-24")
+            )
+        )
+        self.assertNotEqual(
+            chrono.Interval("2010-07-23 00:00:00", "2010-07-24 00:00:00"),
+            chrono.Interval("2010-07-23 00:00:00", "2010-07-24 00:00:01")
+        )
+
+
+class Interval__initTest(unittest.TestCase):
+
+    def test_invalid(self):
+        "Interval.__init__() raises errors on invalid input"
+
+        self.assertRaises(
+            ValueError, chrono.Interval,
+            chrono.Date("2010-07-24"), chrono.Date("2010-07-23")
+        )
+        self.assertRaises(
+            chrono.NoDateTimeError, chrono.Interval,
+            chrono.DateTime(), chrono.DateTime("2010-07-23 00:00:00")
+        )
+        self.assertRaises(TypeError, chrono.Interval, 1, 2)
+
+    def test_strings(self):
+        "Interval.__init__() parses strings as DateTime"
+
+        i = chrono.Interval("2010-07-23 16:27:43", "2010-07-24 00:00:00")
+
+        self.assertEqual(i.start, chrono.DateTime("2010-07-23 16:27:43"))
+        self.assertEqual(i.end, chrono.DateTime("2010-07-24 00:00:00"))
+
+
+class Interval_containsTest(unittest.TestCase):
+
+    def test_interval(self):
+        "Interval.contains() checks if an interval is in the interval"
+
+        i = chrono.Interval(
+            chrono.Date("2010-07-01"), chrono.Date("2010-08-01")
+        )
+
+        self.assertTrue(i.contains(i))
+        self.assertTrue(
+            i.contains(
+                chrono.Interval("2010-07-10 00:00:00", "2010-08-01 00:00:00")
+            )
+        )
+        self.assertFalse(
+            i.contains(
+                chrono.Interval("2010-07-10 00:00:00", "2010-08-01 00:00:01")
+            )
+        )
+
+
+class Interval_durationTest(unittest.TestCase):
+
+    def test_duration(self):
+        "Interval.duration() returns the length of the interval"
+
+        self.assertEqual(
+            chrono.Interval(
+                "2010-07-23 16:27:43", "2010-07-24 16:27:44"
+            ).duration(),
+            chrono.Duration(days=1, seconds=1)
+        )
+
+
+class Interval_intersectionTest(unittest.TestCase):
+
+    def test_intersection(self):
+        "Interval.intersection() returns the common interval"
+
+        a = chrono.Interval(
+            chrono.Date("2010-07-01"), chrono.Date("2010-08-01")
+        )
+        b = chrono.Interval("2010-07-15 12:00:00", "2010-09-01 00:00:00")
+
+        self.assertEqual(
+            a.intersection(b),
+            chrono.Interval("2010-07-15 12:00:00", "2010-08-01 00:00:00")
+        )
+        self.assertEqual(a.intersection(b), b.intersection(a))
+
+    def test_none(self):
+        "Interval.intersection() returns None for separate intervals"
+
+        self.assertEqual(
+            chrono.Interval(
+                chrono.Date("2010-07-01"), chrono.Date("2010-08-01")
+            ).intersection(
+                chrono.Interval(
+                    chrono.Date("2010-08-01"), chrono.Date("2010-09-01")
+                )
+            ),
+            None
+        )
+
+    def test_type(self):
+        "Interval.intersection() raises TypeError for other types"
+
+        a = chrono.Interval("2010-07-23 00:00:00", "2010-07-24 00:00:00")
+
+        self.assertRaises(TypeError, a.intersection, "2010-07-23 12:00:00")
+        self.assertRaises(TypeError, a.intersection, None)
+
+
+class Interval_overlapsTest(unittest.TestCase):
+
+    def test_overlaps(self):
+        "Interval.overlaps() checks if intervals have time in common"
+
+        a = chrono.Interval("2010-07-23 00:00:00", "2010-07-24 00:00:00")
+
+        self.assertTrue(
+            a.overlaps(
+                chrono.Interval("2010-07-23 23:59:59", "2010-07-25 00:00:00")
+            )
+        )
+        self.assertFalse(
+            a.overlaps(
+                chrono.Interval("2010-07-24 00:00:00", "2010-07-25 00:00:00")
+            )
+        )
+        self.assertFalse(a.overlaps(chrono.Interval(a.start, a.start)))
+        self.assertTrue(chrono.Interval(a.start, a.start).is_empty())
+
+    def test_type(self):
+        "Interval.overlaps() raises TypeError for other types"
+
+        a = chrono.Interval("2010-07-23 00:00:00", "2010-07-24 00:00:00")
+
+        self.assertRaises(TypeError, a.overlaps, chrono.Date("2010-07-23"))
+        self.assertRaises(TypeError, a.overlaps, None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,12 @@
 from __future__ import absolute_import
 
+from .test_bulk import *
+from .test_cache import *
 from .test_common import *
 from .test_euro import *
+from .test_infer import *
 from .test_iso import *
 from .test_parser import *
+from .test_stream import *
+from .test_template import *
 from .test_us import *
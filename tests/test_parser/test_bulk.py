@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+
+import array
+import chrono
+import os.path
+import subprocess
+import sys
+import unittest
+
+
+class bulk_parse_manyTest(unittest.TestCase):
+
+    strings = [
+        "2010-07-23 16:27:43", "07/23/2010 04:27:43 PM",
+        "23.07.2010 16:27:43", "1970-01-01 00:00:00",
+        "2009-12-27 16:27:43", "0001-01-01 00:00:00",
+        "9999-12-31 23:59:59",
+    ]
+
+    def test_collect(self):
+        "parse_many() collects errors per chunk if errors is 'collect'"
+
+        strings = self.strings + ["abc", "2010-02-30 00:00:00"]
+
+        for workers in (1, 2):
+            result = chrono.parser.parse_many(
+                strings, workers=workers, chunksize=4, errors="collect"
+            )
+
+            self.assertEqual(result.epoch[-2:], array.array("q", [0, 0]))
+            self.assertEqual(
+                [(i, type(e)) for i, e in result.errors],
+                [(7, chrono.ParseError), (8, chrono.DayError)]
+            )
+            self.assertEqual(result.chunks, [(0, 4, 0), (4, 8, 1), (8, 9, 1)])
+
+    def test_columns(self):
+        "parse_many() returns columns if columns is True"
+
+        for workers in (1, 2):
+            result = chrono.parser.parse_many(
+                self.strings, workers=workers, chunksize=3, columns=True
+            )
+
+            self.assertTrue(result.epoch is None)
+            self.assertEqual(result.columns[0].typecode, "h")
+            self.assertEqual(result.columns[1].typecode, "b")
+            self.assertEqual(
+                list(zip(*result.columns)),
+                [chrono.parser.CommonParser.parse_datetime(s)
+                 for s in self.strings]
+            )
+
+    def test_context(self):
+        "parse_many() uses the parser from chrono.context()"
+
+        with chrono.context(parser=chrono.parser.EuroParser):
+            result = chrono.parser.parse_many(["23.07.2010 16:27:43"])
+
+        self.assertEqual(result.epoch, array.array("q", [1279902463]))
+
+    def test_empty(self):
+        "parse_many() handles empty input"
+
+        result = chrono.parser.parse_many([])
+
+        self.assertEqual(len(result), 0)
+        self.assertEqual(result.chunks, [])
+
+    def test_epoch(self):
+        "parse_many() returns timestamps in input order"
+
+        expected = array.array("q", [
+            chrono.calendar.Calendar.unix_utc(
+                *chrono.parser.CommonParser.parse_datetime(s)
+            )
+            for s in self.strings
+        ])
+
+        for workers in (1, 2, 3):
+            result = chrono.parser.parse_many(
+                iter(self.strings), workers=workers, chunksize=2
+            )
+
+            self.assertEqual(result.epoch, expected)
+            self.assertTrue(result.columns is None)
+            self.assertEqual(result.errors, [])
+            self.assertEqual(len(result.chunks), 4)
+
+    def test_import(self):
+        "Importing chrono.parser doesn't import the parallel parsing modules"
+
+        path = os.path.dirname(os.path.dirname(os.path.dirname(
+            os.path.abspath(__file__)
+        )))
+        code = (
+            "import sys; sys.path.insert(0, {0!r}); import chrono.parser; "
+            "print(' '.join(sorted(sys.modules)))"
+        ).format(path)
+
+        modules = subprocess.check_output(
+            [sys.executable, "-c", code]
+        ).decode("ascii").split()
+
+        self.assertTrue("chrono.parser.bulk" in modules)
+
+        for module in (
+            "concurrent.futures", "multiprocessing",
+            "multiprocessing.shared_memory"
+        ):
+            self.assertFalse(module in modules, module)
+
+    def test_invalid(self):
+        "parse_many() raises ValueError for invalid arguments"
+
+        self.assertRaises(
+            ValueError, chrono.parser.parse_many, self.strings, errors="x"
+        )
+        self.assertRaises(
+            ValueError, chrono.parser.parse_many, self.strings, chunksize=0
+        )
+
+    def test_parser(self):
+        "parse_many() uses the given parser"
+
+        result = chrono.parser.parse_many(
+            ["2010-07-23 16:27:43"], parser=chrono.parser.ISOParser
+        )
+
+        self.assertEqual(result.epoch, array.array("q", [1279902463]))
+        self.assertRaises(
+            chrono.ParseError, chrono.parser.parse_many,
+            ["07/23/2010 04:27:43 PM"], parser=chrono.parser.ISOParser
+        )
+
+    def test_raise(self):
+        "parse_many() raises the first error if errors is 'raise'"
+
+        strings = self.strings + ["2010-02-30 00:00:00", "abc"]
+
+        for workers in (1, 2):
+            self.assertRaises(
+                chrono.DayError, chrono.parser.parse_many, strings,
+                workers=workers, chunksize=2
+            )
+            self.assertRaises(
+                TypeError, chrono.parser.parse_many, [None],
+                workers=workers, chunksize=2
+            )
+
+
+class bulk_ParseResult__lenTest(unittest.TestCase):
+
+    def test_len(self):
+        "ParseResult.__len__() returns the number of values"
+
+        self.assertEqual(
+            len(chrono.parser.ParseResult(array.array("q", [1, 2]))), 2
+        )
+        self.assertEqual(
+            len(chrono.parser.ParseResult(
+                columns=tuple(array.array("b", [1, 2, 3]) for i in range(6))
+            )), 3
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+
+import chrono
+import threading
+import unittest
+
+
+class ParseCache__initTest(unittest.TestCase):
+
+    def test_policy(self):
+        "ParseCache.__init__() raises ValueError on invalid policy"
+
+        self.assertRaises(ValueError, chrono.parser.ParseCache, policy="abc")
+
+
+class ParseCache_clearTest(unittest.TestCase):
+
+    def test_clear(self):
+        "ParseCache.clear() removes entries and resets counters"
+
+        c = chrono.parser.ParseCache()
+        c.lookup(chrono.parser.ISOParser.parse_date, "2010-07-23")
+        c.lookup(chrono.parser.ISOParser.parse_date, "2010-07-23")
+        c.clear()
+
+        self.assertEqual((len(c), c.hits, c.misses), (0, 0, 0))
+
+
+class ParseCache_lookupTest(unittest.TestCase):
+
+    def setUp(self):
+
+        unittest.TestCase.setUp(self)
+
+        self.calls = []
+
+    def parse(self, value):
+
+        self.calls.append(value)
+
+        if value == "invalid":
+            raise chrono.ParseError("Invalid value")
+
+        return value.upper()
+
+    def test_counters(self):
+        "ParseCache.lookup() counts hits and misses"
+
+        c = chrono.parser.ParseCache()
+
+        for value in ("a", "b", "a", "a"):
+            self.assertEqual(c.lookup(self.parse, value), value.upper())
+
+        self.assertEqual((c.hits, c.misses), (2, 2))
+        self.assertEqual(self.calls, ["a", "b"])
+
+    def test_errors(self):
+        "ParseCache.lookup() caches errors"
+
+        c = chrono.parser.ParseCache()
+
+        for i in range(2):
+            self.assertRaises(chrono.ParseError, c.lookup, self.parse, "invalid")
+
+        self.assertEqual(self.calls, ["invalid"])
+
+    def test_errors_disabled(self):
+        "ParseCache.lookup() doesn't cache errors if errors is False"
+
+        c = chrono.parser.ParseCache(errors=False)
+
+        for i in range(2):
+            self.assertRaises(chrono.ParseError, c.lookup, self.parse, "invalid")
+
+        self.assertEqual(self.calls, ["invalid", "invalid"])
+        self.assertEqual(len(c), 0)
+
+    def test_fifo(self):
+        "ParseCache.lookup() evicts first inserted entry with fifo policy"
+
+        c = chrono.parser.ParseCache(size=2, policy="fifo")
+
+        for value in ("a", "b", "a", "c", "a"):
+            c.lookup(self.parse, value)
+
+        self.assertEqual(self.calls, ["a", "b", "c", "a"])
+
+    def test_lru(self):
+        "ParseCache.lookup() evicts least recently used entry with lru policy"
+
+        c = chrono.parser.ParseCache(size=2)
+
+        for value in ("a", "b", "a", "c", "a", "b"):
+            c.lookup(self.parse, value)
+
+        self.assertEqual(self.calls, ["a", "b", "c", "b"])
+        self.assertEqual(len(c), 2)
+
+    def test_nonstring(self):
+        "ParseCache.lookup() doesn't cache non-string values"
+
+        c = chrono.parser.ParseCache()
+
+        self.assertRaises(
+            TypeError, c.lookup, chrono.parser.ISOParser.parse_date, None
+        )
+        self.assertEqual((len(c), c.hits, c.misses), (0, 0, 0))
+
+    def test_threads(self):
+        "ParseCache.lookup() is thread-safe"
+
+        c = chrono.parser.ParseCache(size=10)
+        values = ["2010-07-{0:02}".format(i) for i in range(1, 21)]
+        results = []
+
+        def run():
+            results.append([
+                c.lookup(chrono.parser.ISOParser.parse_date, v)
+                for v in values * 20
+            ])
+
+        threads = [threading.Thread(target=run) for i in range(4)]
+
+        for t in threads:
+            t.start()
+
+        for t in threads:
+            t.join()
+
+        expected = [(2010, 7, i) for i in range(1, 21)] * 20
+
+        self.assertEqual(results, [expected] * 4)
+        self.assertEqual(c.hits + c.misses, 1600)
+        self.assertEqual(len(c), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
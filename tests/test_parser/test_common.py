@@ -80,6 +80,14 @@ class CommonParser_parse_dateTest(unittest.TestCase):
             (2010, 8, 13)
         )
 
+    def test_iso_week_lowercase(self):
+        "CommonParser.parse_date() handles lowercase ISO week dates (yyyy-www)"
+
+        self.assertEquals(
+            chrono.parser.CommonParser.parse_date("2010-w32"),
+            (2010, 8, 9)
+        )
+
     def test_iso_year(self):
         "CommonParser.parse_date() handles ISO years (yyyy)"
 
@@ -88,6 +96,21 @@ class CommonParser_parse_dateTest(unittest.TestCase):
             (2010, 1, 1)
         )
 
+    def test_mixed_separators(self):
+        "CommonParser.parse_date() raises ParseError on mixed separators"
+
+        self.assertRaises(
+            chrono.ParseError,
+            chrono.parser.CommonParser.parse_date, "27.08/2010"
+        )
+
+    def test_none(self):
+        "CommonParser.parse_date() raises TypeError on None"
+
+        self.assertRaises(
+            TypeError, chrono.parser.CommonParser.parse_date, None
+        )
+
     def test_us(self):
         "CommonParser.parse_date() handles US dates (mm/dd/yyyy)"
 
@@ -173,6 +196,14 @@ class CommonParser_parse_timeTest(unittest.TestCase):
             (16, 27, 43)
         )
 
+    def test_iso_hour(self):
+        "CommonParser.parse_time() parses ISO times with only hours (hh)"
+
+        self.assertEquals(
+            chrono.parser.CommonParser.parse_time("16"),
+            (16, 0, 0)
+        )
+
     def test_iso_time(self):
         "CommonParser.parse_time() parses ISO times (hh:mm:ss)"
 
@@ -203,6 +234,14 @@ class CommonParser_parse_timeTest(unittest.TestCase):
             (16, 27, 43)
         )
 
+    def test_us_hour(self):
+        "CommonParser.parse_time() handles times with only hours (hh ampm)"
+
+        self.assertEquals(
+            chrono.parser.CommonParser.parse_time("4 p.m."),
+            (16, 0, 0)
+        )
+
     def test_us_time(self):
         "CommonParser.parse_time() handles normal times (hh:mm:ss ampm)"
 
@@ -310,6 +310,14 @@ class EuroParser_parse_timeTest(unittest.TestCase):
             (16, 27, 43)
         )
 
+    def test_date(self):
+        "EuroParser.parse_time() raises ParseError for dates"
+
+        self.assertRaises(
+            chrono.ParseError,
+            chrono.parser.EuroParser.parse_time, "23-07-2010"
+        )
+
     def test_invalid(self):
         "EuroParser.parse_time() raises error for invalid times"
 
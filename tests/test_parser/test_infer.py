@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+
+import chrono
+import unittest
+
+
+class InferredParserTest(unittest.TestCase):
+
+    def test_date(self):
+        "InferredParser for date format only parses dates"
+
+        p = chrono.parser.infer(["2010-07-23"])
+
+        self.assertEqual(p.parse_date("2009-12-27"), (2009, 12, 27))
+        self.assertRaises(chrono.ParseError, p.parse_date, "2009-W36")
+        self.assertRaises(chrono.ParseError, p.parse_time, "16:27:43")
+        self.assertRaises(
+            chrono.ParseError, p.parse_datetime, "2009-12-27 16:27:43"
+        )
+
+    def test_datetime(self):
+        "InferredParser for datetime format parses datetimes"
+
+        p = chrono.parser.infer(["07/23/2010 04:27:43 PM"])
+
+        self.assertEqual(
+            p.parse_datetime("12/27/2009 01:00 AM"),
+            (2009, 12, 27, 1, 0, 0)
+        )
+        self.assertEqual(p.parse_date("12/27/2009"), (2009, 12, 27))
+        self.assertEqual(p.parse_time("01:00 AM"), (1, 0, 0))
+        self.assertRaises(
+            chrono.ParseError, p.parse_datetime, "2009-12-27 16:27:43"
+        )
+
+    def test_invalid(self):
+        "InferredParser raises errors on invalid values"
+
+        p = chrono.parser.infer(["07/23/2010"])
+
+        self.assertRaises(chrono.DayError, p.parse_date, "02/29/2010")
+        self.assertRaises(TypeError, p.parse_date, None)
+
+    def test_time(self):
+        "InferredParser for time format only parses times"
+
+        p = chrono.parser.infer(["16:27:43"])
+
+        self.assertEqual(p.parse_time("01:02"), (1, 2, 0))
+        self.assertRaises(chrono.ParseError, p.parse_date, "2009-12-27")
+        self.assertEqual(p.try_parse_time("1:02 PM"), None)
+
+
+class inferTest(unittest.TestCase):
+
+    def test_alternatives(self):
+        "infer() lists other consistent formats"
+
+        p = chrono.parser.infer(["2010"])
+
+        self.assertEqual(p.format, "ISOParser.year")
+        self.assertEqual(p.alternatives, ("ISOParser.compacttime",))
+
+    def test_ambiguous(self):
+        "infer() reports ambiguity between US and european ordering"
+
+        p = chrono.parser.infer(["03/04/2010", "05/06/2010"])
+
+        self.assertEqual(p.format, "USParser.date")
+        self.assertEqual(p.alternatives, ("EuroParser.slashdate",))
+        self.assertTrue(p.ambiguous)
+        self.assertEqual(p.parse_date("03/04/2010"), (2010, 3, 4))
+
+        p = chrono.parser.infer(["03.04.2010"])
+
+        self.assertEqual(p.format, "EuroParser.date")
+        self.assertEqual(p.alternatives, ("USParser.dotdate",))
+        self.assertTrue(p.ambiguous)
+        self.assertEqual(
+            p.parse_date("03.04.2010"),
+            chrono.parser.CommonParser.parse_date("03.04.2010")
+        )
+
+    def test_consistent(self):
+        "infer() picks the format consistent with all samples"
+
+        p = chrono.parser.infer(["03/04/2010", "25/06/2010"])
+
+        self.assertEqual(p.format, "EuroParser.slashdate")
+        self.assertFalse(p.ambiguous)
+        self.assertEqual(p.parse_date("03/04/2010"), (2010, 4, 3))
+
+    def test_datetime(self):
+        "infer() detects datetime formats"
+
+        self.assertEqual(
+            chrono.parser.infer(
+                ["2010-07-23T16:27:43", "2010-07-24 00:00"]
+            ).format,
+            "ISOParser.date ISOParser.time"
+        )
+        self.assertEqual(
+            chrono.parser.infer(["23.07.2010 16:27"]).format,
+            "EuroParser.date ISOParser.time"
+        )
+
+    def test_empty(self):
+        "infer() raises ParseError without samples"
+
+        self.assertRaises(chrono.ParseError, chrono.parser.infer, [])
+
+    def test_inconsistent(self):
+        "infer() raises ParseError if no single format matches"
+
+        self.assertRaises(
+            chrono.ParseError, chrono.parser.infer,
+            ["2010-07-23", "07/23/2010"]
+        )
+        self.assertRaises(chrono.ParseError, chrono.parser.infer, ["abc"])
+
+    def test_iterator(self):
+        "infer() handles iterators"
+
+        self.assertEqual(
+            chrono.parser.infer(iter(["2009-W36-3"])).format,
+            "ISOParser.weekdate"
+        )
+
+    def test_type(self):
+        "infer() raises TypeError on non-string samples"
+
+        self.assertRaises(TypeError, chrono.parser.infer, [None])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,6 +5,238 @@ import re
 import unittest
 
 
+class LazyPattern__getTest(unittest.TestCase):
+
+    def test_compile(self):
+        "LazyPattern compiles the pattern on first use"
+
+        class Test(object):
+            re_test = chrono.parser.parser.LazyPattern("^a+$", re.IGNORECASE)
+
+        self.assertTrue(isinstance(
+            Test.__dict__["re_test"], chrono.parser.parser.LazyPattern
+        ))
+        self.assertTrue(Test.re_test.match("AaA"))
+        self.assertTrue(Test.__dict__["re_test"] is Test.re_test)
+        self.assertEqual(Test.re_test.flags & re.IGNORECASE, re.IGNORECASE)
+
+    def test_subclass(self):
+        "LazyPattern replaces the attribute in the defining class"
+
+        class Test(object):
+            re_test = chrono.parser.parser.LazyPattern("^a+$")
+
+        class SubTest(Test):
+            pass
+
+        self.assertTrue(SubTest().re_test is Test.re_test)
+        self.assertFalse("re_test" in SubTest.__dict__)
+        self.assertFalse(isinstance(
+            Test.__dict__["re_test"], chrono.parser.parser.LazyPattern
+        ))
+
+
+class Parser_cachedTest(unittest.TestCase):
+
+    def test_cache(self):
+        "Parser.cached() returns parser with its own cache"
+
+        a = chrono.parser.CommonParser.cached()
+        b = chrono.parser.CommonParser.cached()
+
+        self.assertTrue(issubclass(a, chrono.parser.CommonParser))
+        self.assertTrue(isinstance(a.cache, chrono.parser.ParseCache))
+        self.assertFalse(a.cache is b.cache)
+        self.assertFalse(hasattr(chrono.parser.CommonParser, "cache"))
+
+    def test_errors(self):
+        "Parser.cached() returns parser raising same errors as parser"
+
+        p = chrono.parser.ISOParser.cached()
+
+        for i in range(2):
+            self.assertRaises(chrono.ParseError, p.parse_date, "abc")
+            self.assertRaises(chrono.DayError, p.parse_date, "2010-02-29")
+            self.assertRaises(TypeError, p.parse_date, None)
+
+        self.assertEqual(p.cache.hits, 2)
+
+    def test_nested(self):
+        "Parser.cached() only caches the outer call"
+
+        p = chrono.parser.CommonParser.cached()
+
+        for i in range(2):
+            self.assertEqual(
+                p.parse_datetime("07/23/2010 04:27:43 PM"),
+                (2010, 7, 23, 16, 27, 43)
+            )
+
+        self.assertEqual(len(p.cache), 1)
+        self.assertEqual(p.cache.misses, 1)
+        self.assertEqual(p.cache.hits, 1)
+
+        self.assertEqual(p.parse_date("07/23/2010"), (2010, 7, 23))
+        self.assertEqual(len(p.cache), 2)
+
+    def test_try_parse(self):
+        "Parser.cached() caches try_parse_*() results"
+
+        p = chrono.parser.CommonParser.cached()
+
+        for i in range(2):
+            self.assertEqual(
+                p.try_parse_datetime("07/23/2010 04:27:43 PM"),
+                (2010, 7, 23, 16, 27, 43)
+            )
+            self.assertEqual(p.try_parse_date("2010-02-30"), None)
+            self.assertEqual(p.try_parse_time("invalid"), None)
+
+        self.assertEqual(len(p.cache), 3)
+        self.assertEqual(p.cache.misses, 3)
+        self.assertEqual(p.cache.hits, 3)
+
+    def test_parse(self):
+        "Parser.cached() returns parser giving same results as parser"
+
+        p = chrono.parser.USParser.cached()
+
+        for i in range(2):
+            self.assertEqual(p.parse_date("07/23/2010"), (2010, 7, 23))
+            self.assertEqual(p.parse_time("04:27:43 PM"), (16, 27, 43))
+            self.assertEqual(
+                p.parse_datetime("07/23/2010 04:27:43 PM"),
+                (2010, 7, 23, 16, 27, 43)
+            )
+            self.assertEqual(p.try_parse_date("02/29/2010"), None)
+
+
+class Parser_convert_dateTest(unittest.TestCase):
+
+    def test_date(self):
+        "Parser.convert_date() converts year, month, and day"
+
+        self.assertEqual(
+            chrono.parser.Parser.convert_date(
+                {"year": "2010", "month": "07", "day": "23"}
+            ),
+            (2010, 7, 23)
+        )
+
+    def test_invalid(self):
+        "Parser.convert_date() returns None for invalid dates"
+
+        for match in (
+            {"year": "2010", "month": "02", "day": "29"},
+            {"year": "2010", "month": "13"},
+            {"year": "0"},
+            {"year": "2010", "day": "366"},
+            {"year": "2010", "week": "53"},
+            {"year": "2009", "week": "53", "day": "8"},
+        ):
+            self.assertEqual(chrono.parser.Parser.convert_date(match), None)
+
+    def test_month(self):
+        "Parser.convert_date() uses the first day for months"
+
+        self.assertEqual(
+            chrono.parser.Parser.convert_date({"year": "2010", "month": "7"}),
+            (2010, 7, 1)
+        )
+
+    def test_ordinal(self):
+        "Parser.convert_date() converts ordinal dates"
+
+        self.assertEqual(
+            chrono.parser.Parser.convert_date({"year": "2009", "day": "163"}),
+            (2009, 6, 12)
+        )
+
+    def test_two_digit_years(self):
+        "Parser.convert_date() expands two-digit years if enabled"
+
+        match = {"year": "10", "month": "7", "day": "23"}
+
+        self.assertEqual(
+            chrono.parser.Parser.convert_date(dict(match)), (10, 7, 23)
+        )
+
+        self.assertEqual(
+            chrono.parser.EuroParser.convert_date(dict(match)), (2010, 7, 23)
+        )
+
+    def test_week(self):
+        "Parser.convert_date() converts ISO weeks and weekdates"
+
+        self.assertEqual(
+            chrono.parser.Parser.convert_date({"year": "2009", "week": "32"}),
+            (2009, 8, 3)
+        )
+
+        self.assertEqual(
+            chrono.parser.Parser.convert_date(
+                {"year": "2009", "week": "53", "day": "7"}
+            ),
+            (2010, 1, 3)
+        )
+
+    def test_year(self):
+        "Parser.convert_date() uses the first day for years"
+
+        self.assertEqual(
+            chrono.parser.Parser.convert_date({"year": "2010"}), (2010, 1, 1)
+        )
+
+
+class Parser_convert_timeTest(unittest.TestCase):
+
+    def test_ampm(self):
+        "Parser.convert_time() converts 12-hour times"
+
+        self.assertEqual(
+            chrono.parser.Parser.convert_time(
+                {"hour": "12", "minute": "30", "second": None, "ampm": "am"}
+            ),
+            (0, 30, 0)
+        )
+
+        self.assertEqual(
+            chrono.parser.Parser.convert_time(
+                {"hour": "4", "minute": None, "second": None, "ampm": "P.M."}
+            ),
+            (16, 0, 0)
+        )
+
+    def test_invalid(self):
+        "Parser.convert_time() returns None for invalid times"
+
+        for match in (
+            {"hour": "24", "minute": None, "second": None},
+            {"hour": "16", "minute": "60", "second": None},
+            {"hour": "16", "minute": "27", "second": "60"},
+            {"hour": "13", "minute": None, "second": None, "ampm": "pm"},
+            {"hour": "0", "minute": None, "second": None, "ampm": "am"},
+        ):
+            self.assertEqual(chrono.parser.Parser.convert_time(match), None)
+
+    def test_time(self):
+        "Parser.convert_time() converts hour, minute, and second"
+
+        self.assertEqual(
+            chrono.parser.Parser.convert_time(
+                {"hour": "16", "minute": "27", "second": "43"}
+            ),
+            (16, 27, 43)
+        )
+
+        self.assertEqual(
+            chrono.parser.Parser.convert_time(
+                {"hour": "16", "minute": None, "second": None}
+            ),
+            (16, 0, 0)
+        )
+
+
 class Parser_regexpTest(unittest.TestCase):
 
     re_isodate = re.compile('''
@@ -57,5 +289,186 @@ class Parser_regexpTest(unittest.TestCase):
         )
 
 
+
+class Parser_matchTest(unittest.TestCase):
+
+    re_isodate = Parser_regexpTest.re_isodate
+
+    def test_integer(self):
+        "Parser.match() raises TypeError for integer subject"
+
+        self.assertRaises(
+            TypeError, chrono.parser.Parser.match, self.re_isodate, 1
+        )
+
+    def test_nomatch(self):
+        "Parser.match() returns None if input doesn't match expression"
+
+        self.assertEqual(
+            chrono.parser.Parser.match(self.re_isodate, "2009-12-"), None
+        )
+
+    def test_parse(self):
+        "Parser.match() parses string using regexp, returns named groups"
+
+        self.assertEqual(
+            chrono.parser.Parser.match(self.re_isodate, "2009-12-27"),
+            {"year": "2009", "month": "12", "day": "27"}
+        )
+
+
+class Parser_try_formatTest(unittest.TestCase):
+
+    def test_date(self):
+        "Parser.try_format() parses a date format"
+
+        self.assertEqual(
+            chrono.parser.USParser.try_format("namedate", "23-Jul-10"),
+            (2010, 7, 23)
+        )
+
+    def test_invalid(self):
+        "Parser.try_format() returns None for invalid values"
+
+        self.assertEqual(
+            chrono.parser.ISOParser.try_format("weekdate", "2009-W54-1"), None
+        )
+
+    def test_nomatch(self):
+        "Parser.try_format() returns None for invalid format"
+
+        self.assertEqual(
+            chrono.parser.ISOParser.try_format("date", "2009-163"), None
+        )
+
+    def test_none(self):
+        "Parser.try_format() raises TypeError for None"
+
+        self.assertRaises(
+            TypeError, chrono.parser.ISOParser.try_format, "date", None
+        )
+
+    def test_time(self):
+        "Parser.try_format() parses a time format"
+
+        self.assertEqual(
+            chrono.parser.USParser.try_format("compacttime", "0427 pm"),
+            (16, 27, 0)
+        )
+
+
+class Parser_try_parse_dateTest(unittest.TestCase):
+
+    def test_fallback(self):
+        "Parser.try_parse_date() catches errors from parse_date() by default"
+
+        class Test(chrono.parser.Parser):
+
+            @classmethod
+            def parse_date(cls, date):
+                raise chrono.DayError("Invalid day")
+
+        self.assertEqual(Test.try_parse_date("2010-07-32"), None)
+
+    def test_inferred(self):
+        "Parser.try_parse_date() parses dates with inferred parsers"
+
+        parser = chrono.parser.infer(["23-Jul-2010"])
+
+        self.assertEqual(parser.try_parse_date("24-Jul-2010"), (2010, 7, 24))
+        self.assertEqual(parser.try_parse_date("32-Jul-2010"), None)
+        self.assertEqual(parser.try_parse_time("16:27:43"), None)
+
+    def test_invalid_date(self):
+        "Parser.try_parse_date() returns None for invalid date"
+
+        self.assertEquals(
+            chrono.parser.CommonParser.try_parse_date("2010-02-29"), None
+        )
+
+    def test_invalid_format(self):
+        "Parser.try_parse_date() returns None for invalid format"
+
+        self.assertEquals(
+            chrono.parser.ISOParser.try_parse_date("xyz"), None
+        )
+
+    def test_none(self):
+        "Parser.try_parse_date() raises TypeError for None"
+
+        self.assertRaises(
+            TypeError, chrono.parser.CommonParser.try_parse_date, None
+        )
+
+    def test_parse(self):
+        "Parser.try_parse_date() returns parsed date"
+
+        self.assertEquals(
+            chrono.parser.CommonParser.try_parse_date("2010-07-23"),
+            (2010, 7, 23)
+        )
+
+
+class Parser_try_parse_datetimeTest(unittest.TestCase):
+
+    def test_invalid_datetime(self):
+        "Parser.try_parse_datetime() returns None for invalid datetime"
+
+        self.assertEquals(
+            chrono.parser.CommonParser.try_parse_datetime(
+                "2010-07-23 24:00:00"
+            ),
+            None
+        )
+        self.assertEquals(
+            chrono.parser.CommonParser.try_parse_datetime(
+                "2010-07-32 16:27:43"
+            ),
+            None
+        )
+
+    def test_invalid_format(self):
+        "Parser.try_parse_datetime() returns None for invalid format"
+
+        self.assertEquals(
+            chrono.parser.USParser.try_parse_datetime("xyz"), None
+        )
+
+    def test_parse(self):
+        "Parser.try_parse_datetime() returns parsed datetime"
+
+        self.assertEquals(
+            chrono.parser.CommonParser.try_parse_datetime(
+                "2010-07-23 16:27:43"
+            ),
+            (2010, 7, 23, 16, 27, 43)
+        )
+
+
+class Parser_try_parse_timeTest(unittest.TestCase):
+
+    def test_invalid_format(self):
+        "Parser.try_parse_time() returns None for invalid format"
+
+        self.assertEquals(
+            chrono.parser.CommonParser.try_parse_time("xyz"), None
+        )
+
+    def test_invalid_time(self):
+        "Parser.try_parse_time() returns None for invalid time"
+
+        self.assertEquals(
+            chrono.parser.EuroParser.try_parse_time("16:60:00"), None
+        )
+
+    def test_parse(self):
+        "Parser.try_parse_time() returns parsed time"
+
+        self.assertEquals(
+            chrono.parser.CommonParser.try_parse_time("4:27:43 PM"),
+            (16, 27, 43)
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
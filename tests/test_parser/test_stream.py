@@ -0,0 +1,288 @@
+#!/usr/bin/env python
+
+import array
+import chrono
+import io
+import mmap
+import os
+import tempfile
+import unittest
+
+
+class StreamParser_extractTest(unittest.TestCase):
+
+    def test_field(self):
+        "StreamParser.extract() handles fields"
+
+        self.assertEqual(
+            chrono.parser.StreamParser(field=1).extract(
+                b"INFO 2010-07-23T16:27:43 message\n"
+            ),
+            b"2010-07-23T16:27:43"
+        )
+
+    def test_fields(self):
+        "StreamParser.extract() joins multiple fields"
+
+        self.assertEqual(
+            chrono.parser.StreamParser(field=1, fields=2).extract(
+                b"INFO  2010-07-23 16:27:43 message\n"
+            ),
+            b"2010-07-23 16:27:43"
+        )
+
+    def test_line(self):
+        "StreamParser.extract() returns entire line by default"
+
+        self.assertEqual(
+            chrono.parser.StreamParser().extract(b"2010-07-23 16:27:43\n"),
+            b"2010-07-23 16:27:43\n"
+        )
+
+    def test_missing(self):
+        "StreamParser.extract() returns None if date/time is not found"
+
+        self.assertEqual(
+            chrono.parser.StreamParser(field=3).extract(b"a b c\n"), None
+        )
+        self.assertEqual(
+            chrono.parser.StreamParser(offset=10).extract(b"a b c\n"), None
+        )
+        self.assertEqual(
+            chrono.parser.StreamParser(regexp=r"\d+").extract(b"a b c\n"),
+            None
+        )
+
+    def test_offset(self):
+        "StreamParser.extract() handles offset and length"
+
+        self.assertEqual(
+            chrono.parser.StreamParser(offset=1, length=19).extract(
+                b"[2010-07-23 16:27:43] message\n"
+            ),
+            b"2010-07-23 16:27:43"
+        )
+
+    def test_regexp(self):
+        "StreamParser.extract() handles regular expressions"
+
+        line = b"127.0.0.1 [2010-07-23 16:27:43] GET /\n"
+
+        self.assertEqual(
+            chrono.parser.StreamParser(regexp=r"\[(.*?)\]").extract(line),
+            b"2010-07-23 16:27:43"
+        )
+        self.assertEqual(
+            chrono.parser.StreamParser(
+                regexp=r"(\d+)\.0\.0\.1 \[(?P<datetime>.*?)\]"
+            ).extract(line),
+            b"2010-07-23 16:27:43"
+        )
+        self.assertEqual(
+            chrono.parser.StreamParser(regexp=r"\d{4}-\S+ \S+?(?=\])").extract(
+                line
+            ),
+            b"2010-07-23 16:27:43"
+        )
+
+    def test_separator(self):
+        "StreamParser.extract() splits fields on separator"
+
+        self.assertEqual(
+            chrono.parser.StreamParser(field=2, separator=",").extract(
+                b"a,b,07/23/2010 04:27:43 PM,c\n"
+            ),
+            b"07/23/2010 04:27:43 PM"
+        )
+
+    def test_text(self):
+        "StreamParser.extract() handles lines as strings"
+
+        line = "127.0.0.1,[2010-07-23 16:27:43],GET /\n"
+
+        for regexp in (r"\[(.*?)\]", br"\[(.*?)\]"):
+            self.assertEqual(
+                chrono.parser.StreamParser(regexp=regexp).extract(line),
+                "2010-07-23 16:27:43"
+            )
+
+        for separator in (",", b","):
+            self.assertEqual(
+                chrono.parser.StreamParser(
+                    field=1, separator=separator
+                ).extract(line),
+                "[2010-07-23 16:27:43]"
+            )
+
+
+class StreamParser_parseTest(unittest.TestCase):
+
+    def setUp(self):
+
+        unittest.TestCase.setUp(self)
+
+        self.data = (
+            b"[2010-07-23 16:27:43] first\n"
+            b"[2010-07-23 16:27:43] second\n"
+            b"[07/24/2010 04:27:43 AM] third\n"
+            b"[24.07.2010 17:00:00] fourth\n"
+        )
+        self.result = [
+            (2010, 7, 23, 16, 27, 43),
+            (2010, 7, 23, 16, 27, 43),
+            (2010, 7, 24, 4, 27, 43),
+            (2010, 7, 24, 17, 0, 0),
+        ]
+
+    def parse(self, source, **kwargs):
+
+        return [
+            value for chunk in chrono.parser.StreamParser(
+                regexp=r"\[(.*?)\]", **kwargs
+            ).parse(source) for value in chunk
+        ]
+
+    def test_chunksize(self):
+        "StreamParser.parse() yields chunks of chunksize"
+
+        chunks = list(
+            chrono.parser.StreamParser(
+                regexp=r"\[(.*?)\]", chunksize=3
+            ).parse(io.BytesIO(self.data))
+        )
+
+        self.assertEqual(chunks, [self.result[:3], self.result[3:]])
+
+    def test_empty(self):
+        "StreamParser.parse() handles empty files"
+
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+
+        try:
+            self.assertEqual(self.parse(path), [])
+
+        finally:
+            os.remove(path)
+
+    def test_file(self):
+        "StreamParser.parse() handles file objects"
+
+        self.assertEqual(self.parse(io.BytesIO(self.data)), self.result)
+
+    def test_invalid(self):
+        "StreamParser.parse() raises errors on invalid lines when strict"
+
+        self.assertRaises(
+            chrono.ParseError, self.parse, io.BytesIO(b"no date/time\n")
+        )
+        self.assertRaises(
+            chrono.ParseError, self.parse, io.BytesIO(b"[abc] message\n")
+        )
+        self.assertRaises(
+            chrono.DayError, self.parse,
+            io.BytesIO(b"[2010-02-29 00:00:00] message\n")
+        )
+
+    def test_mmap(self):
+        "StreamParser.parse() handles mmap objects"
+
+        with tempfile.TemporaryFile() as f:
+            f.write(self.data)
+            f.flush()
+
+            m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+            try:
+                self.assertEqual(self.parse(m), self.result)
+                self.assertEqual(self.parse(m), self.result)
+
+            finally:
+                m.close()
+
+    def test_nonstrict(self):
+        "StreamParser.parse() skips invalid lines when not strict"
+
+        self.assertEqual(
+            self.parse(
+                io.BytesIO(
+                    b"no date/time\n" + b"[abc] message\n" +
+                    b"[2010-02-29 00:00:00] message\n" + self.data
+                ),
+                strict=False
+            ),
+            self.result
+        )
+
+    def test_parser(self):
+        "StreamParser.parse() uses the given parser"
+
+        self.assertEqual(
+            self.parse(
+                io.BytesIO(b"[07/23/2010 04:27:43 PM] message\n"),
+                parser=chrono.parser.USParser
+            ),
+            [(2010, 7, 23, 16, 27, 43)]
+        )
+        self.assertRaises(
+            chrono.ParseError, self.parse,
+            io.BytesIO(b"[07/23/2010 04:27:43 PM] message\n"),
+            parser=chrono.parser.ISOParser
+        )
+
+    def test_path(self):
+        "StreamParser.parse() handles file paths"
+
+        fd, path = tempfile.mkstemp()
+        os.write(fd, self.data)
+        os.close(fd)
+
+        try:
+            self.assertEqual(self.parse(path), self.result)
+
+        finally:
+            os.remove(path)
+
+    def test_text(self):
+        "StreamParser.parse() handles iterables of strings"
+
+        self.assertEqual(
+            list(
+                chrono.parser.StreamParser(offset=1, length=19).parse(
+                    ["[2010-07-23 16:27:43] message"]
+                )
+            ),
+            [[(2010, 7, 23, 16, 27, 43)]]
+        )
+
+    def test_textfile(self):
+        "StreamParser.parse() handles files opened in text mode"
+
+        self.assertEqual(
+            self.parse(io.StringIO(self.data.decode("ascii"))), self.result
+        )
+
+
+class StreamParser_unixTest(unittest.TestCase):
+
+    def test_unix(self):
+        "StreamParser.unix() yields arrays of UTC timestamps"
+
+        chunks = list(
+            chrono.parser.StreamParser(field=0, fields=2, chunksize=2).unix(
+                io.BytesIO(
+                    b"1970-01-01 00:00:00 a\n"
+                    b"2010-07-23 16:27:43 b\n"
+                    b"1969-12-31 23:59:59 c\n"
+                )
+            )
+        )
+
+        self.assertEqual(
+            chunks,
+            [array.array("q", [0, 1279902463]), array.array("q", [-1])]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
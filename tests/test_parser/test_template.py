@@ -0,0 +1,221 @@
+#!/usr/bin/env python
+
+import chrono
+import unittest
+
+
+class TemplateParser__initTest(unittest.TestCase):
+
+    def test_calendar(self):
+        "TemplateParser.__init__() uses chrono.DEFAULT_CALENDAR by default"
+
+        self.assertTrue(
+            chrono.parser.TemplateParser("$year").calendar is
+            chrono.DEFAULT_CALENDAR
+        )
+
+
+class TemplateParser_parseTest(unittest.TestCase):
+
+    def test_12hour(self):
+        "TemplateParser.parse() handles 12-hour times"
+
+        p = chrono.parser.TemplateParser("$012hour:$0minute $ampm")
+
+        self.assertEqual(p.parse("12:30 am"), (None,) * 3 + (0, 30, 0))
+        self.assertEqual(p.parse("04:27 PM"), (None,) * 3 + (16, 27, 0))
+        self.assertRaises(chrono.HourError, p.parse, "13:00 PM")
+
+    def test_conflict(self):
+        "TemplateParser.parse() raises ParseError on conflicting values"
+
+        p = chrono.parser.TemplateParser("$0year-$0month-$0day ($weekday)")
+
+        self.assertEqual(
+            p.parse("2010-07-23 (5)"), (2010, 7, 23, None, None, None)
+        )
+        self.assertRaises(chrono.ParseError, p.parse, "2010-07-23 (4)")
+        self.assertRaises(
+            chrono.ParseError,
+            chrono.parser.TemplateParser("$year $0year").parse, "2010 2011"
+        )
+
+    def test_defaults(self):
+        "TemplateParser.parse() fills in missing values"
+
+        self.assertEqual(
+            chrono.parser.TemplateParser("$0year-$0month $hour").parse(
+                "2010-07 16"
+            ),
+            (2010, 7, 1, 16, 0, 0)
+        )
+
+    def test_invalid(self):
+        "TemplateParser.parse() raises errors on invalid values"
+
+        p = chrono.parser.TemplateParser("$0year-$0month-$0day $0hour")
+
+        self.assertRaises(chrono.MonthError, p.parse, "2010-00-23 16")
+        self.assertRaises(chrono.DayError, p.parse, "2010-02-29 16")
+        self.assertRaises(chrono.HourError, p.parse, "2010-07-23 24")
+        self.assertRaises(chrono.ParseError, p.parse, "2010-7-23 16")
+        self.assertRaises(TypeError, p.parse, None)
+
+    def test_literal(self):
+        "TemplateParser.parse() matches literal text exactly"
+
+        p = chrono.parser.TemplateParser("$$[${0year}.*] $abc")
+
+        self.assertEqual(p.parse(" $[2010.*] $abc "), (2010, 1, 1) + (None,) * 3)
+        self.assertRaises(chrono.ParseError, p.parse, "$[2010.x] $abc")
+
+    def test_names(self):
+        "TemplateParser.parse() handles month and weekday names"
+
+        p = chrono.parser.TemplateParser(
+            "$shortweekdayname $0day $monthname $year"
+        )
+
+        self.assertEqual(
+            p.parse("fri 23 JULY 2010"), (2010, 7, 23, None, None, None)
+        )
+
+    def test_roundtrip(self):
+        "TemplateParser.parse() parses values formatted with the template"
+
+        templates = (
+            "$0year-$0month-$0day $0hour:$0minute:$0second",
+            "$weekdayname, $monthname $day, $shortyear $12hour:$0minute $ampm",
+            "$0day.$0month.$year",
+        )
+
+        for cal in (chrono.calendar.ISOCalendar, chrono.calendar.USCalendar):
+            for template in templates:
+                p = chrono.parser.TemplateParser(template, calendar=cal)
+                f = chrono.formatter.Formatter(cal).compile(template)
+
+                for value in (
+                    (2010, 7, 23, 16, 27, 43), (2009, 12, 31, 0, 5, 0),
+                    (2008, 2, 29, 12, 0, 59),
+                ):
+                    result = p.parse(f(*value))
+
+                    self.assertEqual(result[:3], value[:3])
+
+                    if "hour" in template:
+                        self.assertEqual(result[3:5], value[3:5])
+
+    def test_week(self):
+        "TemplateParser.parse() calculates dates from week and weekday"
+
+        self.assertEqual(
+            chrono.parser.TemplateParser("$0year-W$0week-$weekday").parse(
+                "2009-W53-7"
+            ),
+            (2010, 1, 3, None, None, None)
+        )
+        self.assertEqual(
+            chrono.parser.TemplateParser(
+                "$0year-W$0week", calendar=chrono.calendar.USCalendar
+            ).parse("2010-W02"),
+            (2010, 1, 3, None, None, None)
+        )
+
+    def test_zone(self):
+        "TemplateParser.parse() matches offsets and zone names"
+
+        p = chrono.parser.TemplateParser(
+            "$0year-$0month-$0day $0hour:$0minute $offset $zonename"
+        )
+
+        self.assertEqual(
+            p.parse("2010-07-23 16:27 +02:00 Europe/Oslo"),
+            (2010, 7, 23, 16, 27, 0)
+        )
+        self.assertRaises(
+            chrono.ParseError, p.parse, "2010-07-23 16:27 Europe/Oslo"
+        )
+
+
+class TemplateParser_parse_dateTest(unittest.TestCase):
+
+    def test_missing(self):
+        "TemplateParser.parse_date() raises ParseError without year"
+
+        self.assertRaises(
+            chrono.ParseError,
+            chrono.parser.TemplateParser("$0hour").parse_date, "16"
+        )
+
+    def test_parse_date(self):
+        "TemplateParser.parse_date() returns year, month, and day"
+
+        self.assertEqual(
+            chrono.parser.TemplateParser("$0month/$0day/$0year").parse_date(
+                "07/23/2010"
+            ),
+            (2010, 7, 23)
+        )
+
+
+class TemplateParser_parse_datetimeTest(unittest.TestCase):
+
+    def test_missing(self):
+        "TemplateParser.parse_datetime() raises ParseError without time"
+
+        self.assertRaises(
+            chrono.ParseError,
+            chrono.parser.TemplateParser("$0year").parse_datetime, "2010"
+        )
+
+    def test_stream(self):
+        "TemplateParser can be used with StreamParser"
+
+        self.assertEqual(
+            list(
+                chrono.parser.StreamParser(
+                    parser=chrono.parser.TemplateParser(
+                        "$0day/$shortmonthname/$0year:$0hour:$0minute:$0second"
+                    ),
+                    regexp=r"\[(.*?) \+0000\]"
+                ).parse([b'127.0.0.1 [23/Jul/2010:16:27:43 +0000] "GET /"'])
+            ),
+            [[(2010, 7, 23, 16, 27, 43)]]
+        )
+
+
+class TemplateParser_parse_timeTest(unittest.TestCase):
+
+    def test_missing(self):
+        "TemplateParser.parse_time() raises ParseError without hour"
+
+        self.assertRaises(
+            chrono.ParseError,
+            chrono.parser.TemplateParser("$0year").parse_time, "2010"
+        )
+
+    def test_parse_time(self):
+        "TemplateParser.parse_time() returns hour, minute, and second"
+
+        self.assertEqual(
+            chrono.parser.TemplateParser("$0hour$0minute").parse_time("1627"),
+            (16, 27, 0)
+        )
+
+
+class TemplateParser_try_parseTest(unittest.TestCase):
+
+    def test_try_parse(self):
+        "TemplateParser.try_parse_*() return None on invalid values"
+
+        p = chrono.parser.TemplateParser("$0year-$0month-$0day $0hour")
+
+        self.assertEqual(p.try_parse_date("2010-02-29 16"), None)
+        self.assertEqual(p.try_parse_datetime("abc"), None)
+        self.assertEqual(p.try_parse_time("2010-07-23 24"), None)
+        self.assertEqual(p.try_parse_time("2010-07-23 16"), (16, 0, 0))
+        self.assertRaises(TypeError, p.try_parse_date, None)
+
+
+if __name__ == "__main__":
+    unittest.main()
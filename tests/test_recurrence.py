@@ -0,0 +1,394 @@
+#!/usr/bin/env python
+
+import chrono
+import itertools
+import unittest
+
+
+def occurrences(rule, start, count=None, calendar=None):
+
+    return list(itertools.islice(
+        chrono.recurrence.Rule(rule, start, calendar), count
+    ))
+
+
+class RecurrenceRule__initTest(unittest.TestCase):
+
+    def test_attributes(self):
+        "Rule() sets attributes from the rule parts"
+
+        rule = chrono.recurrence.Rule(
+            "RRULE:FREQ=YEARLY;INTERVAL=2;BYMONTH=1,12;BYDAY=MO,-1FR;"
+            "BYMONTHDAY=1,-1;BYSETPOS=1;UNTIL=20200101T000000Z",
+            "2010-07-23"
+        )
+
+        self.assertEqual(rule.freq, "YEARLY")
+        self.assertEqual(rule.interval, 2)
+        self.assertEqual(rule.byday, ((1, None), (5, -1)))
+        self.assertEqual(rule.bymonth, (1, 12))
+        self.assertEqual(rule.bymonthday, (1, -1))
+        self.assertEqual(rule.bysetpos, (1,))
+        self.assertEqual(rule.byweekno, None)
+        self.assertEqual(rule.count, None)
+        self.assertEqual(rule.start, (2010, 7, 23))
+        self.assertEqual(rule.until, (2020, 1, 1))
+
+    def test_bymonth(self):
+        "Rule() raises ParseError for invalid BYMONTH"
+
+        self.assertRaises(
+            chrono.ParseError,
+            chrono.recurrence.Rule, "FREQ=YEARLY;BYMONTH=13", "2010-07-23"
+        )
+
+    def test_byweekno(self):
+        "Rule() raises ParseError for BYWEEKNO without YEARLY"
+
+        self.assertRaises(
+            chrono.ParseError,
+            chrono.recurrence.Rule, "FREQ=MONTHLY;BYWEEKNO=1", "2010-07-23"
+        )
+
+    def test_count_until(self):
+        "Rule() raises ParseError for both COUNT and UNTIL"
+
+        self.assertRaises(
+            chrono.ParseError,
+            chrono.recurrence.Rule,
+            "FREQ=DAILY;COUNT=2;UNTIL=20100730", "2010-07-23"
+        )
+
+    def test_default_calendar(self):
+        "Rule() uses DEFAULT_CALENDAR by default"
+
+        rule = chrono.recurrence.Rule("FREQ=DAILY", "2010-07-23")
+
+        self.assertTrue(rule.calendar is chrono.DEFAULT_CALENDAR)
+
+    def test_empty(self):
+        "Rule() raises NoDateTimeError for empty start"
+
+        self.assertRaises(
+            chrono.NoDateTimeError,
+            chrono.recurrence.Rule, "FREQ=DAILY", chrono.Date()
+        )
+
+    def test_frequency(self):
+        "Rule() raises ParseError for invalid or unsupported frequency"
+
+        for rule in ("FREQ=HOURLY", "FREQ=SOMETIMES", "INTERVAL=2"):
+            self.assertRaises(
+                chrono.ParseError,
+                chrono.recurrence.Rule, rule, "2010-07-23"
+            )
+
+    def test_invalid(self):
+        "Rule() raises ParseError for invalid rule parts"
+
+        for rule in (
+            "FREQ=DAILY;FREQ=DAILY", "FREQ=DAILY;COUNT", "FREQ=DAILY;COUNT=0",
+            "FREQ=DAILY;INTERVAL=-1", "FREQ=DAILY;BYDAY=XX",
+            "FREQ=MONTHLY;BYDAY=0MO", "FREQ=MONTHLY;BYMONTHDAY=32",
+            "FREQ=DAILY;UNTIL=2010", "FREQ=DAILY;WKST=SU",
+        ):
+            self.assertRaises(
+                chrono.ParseError,
+                chrono.recurrence.Rule, rule, "2010-07-23"
+            )
+
+    def test_ordinal(self):
+        "Rule() raises ParseError for BYDAY occurrences with WEEKLY"
+
+        self.assertRaises(
+            chrono.ParseError,
+            chrono.recurrence.Rule, "FREQ=WEEKLY;BYDAY=1MO", "2010-07-23"
+        )
+
+    def test_type(self):
+        "Rule() raises TypeError for invalid rule type"
+
+        self.assertRaises(
+            TypeError,
+            chrono.recurrence.Rule, None, "2010-07-23"
+        )
+
+    def test_until(self):
+        "Rule() raises DateError subclass for invalid UNTIL date"
+
+        self.assertRaises(
+            chrono.MonthError,
+            chrono.recurrence.Rule, "FREQ=DAILY;UNTIL=20101301", "2010-07-23"
+        )
+
+
+class RecurrenceRule__iterTest(unittest.TestCase):
+
+    def test_byday_month(self):
+        "Rule iteration handles BYDAY occurrences within months"
+
+        self.assertEqual(
+            occurrences(
+                "FREQ=MONTHLY;INTERVAL=2;COUNT=6;BYDAY=1SU,-1SU",
+                "1997-09-07"
+            ),
+            [
+                (1997, 9, 7), (1997, 9, 28), (1997, 11, 2), (1997, 11, 30),
+                (1998, 1, 4), (1998, 1, 25),
+            ]
+        )
+
+    def test_byday_year(self):
+        "Rule iteration handles BYDAY occurrences within years"
+
+        self.assertEqual(
+            occurrences("FREQ=YEARLY;BYDAY=20MO", "1997-05-19", 3),
+            [(1997, 5, 19), (1998, 5, 18), (1999, 5, 17)]
+        )
+
+    def test_byday_year_bymonthday(self):
+        "Rule iteration counts BYDAY within years without BYMONTH"
+
+        self.assertEqual(
+            occurrences(
+                "FREQ=YEARLY;BYDAY=-1FR;BYMONTHDAY=31", "2010-01-01", 3
+            ),
+            [(2010, 12, 31), (2021, 12, 31), (2027, 12, 31)]
+        )
+
+    def test_bymonth(self):
+        "Rule iteration handles BYMONTH with BYDAY occurrences"
+
+        self.assertEqual(
+            occurrences("FREQ=YEARLY;BYMONTH=11;BYDAY=4TH", "2010-07-23", 3),
+            [(2010, 11, 25), (2011, 11, 24), (2012, 11, 22)]
+        )
+
+    def test_bymonthday(self):
+        "Rule iteration handles negative BYMONTHDAY"
+
+        self.assertEqual(
+            occurrences("FREQ=MONTHLY;BYMONTHDAY=-3", "1997-09-28", 3),
+            [(1997, 9, 28), (1997, 10, 29), (1997, 11, 28)]
+        )
+
+    def test_bymonthday_byday(self):
+        "Rule iteration limits BYMONTHDAY with BYDAY"
+
+        self.assertEqual(
+            occurrences(
+                "FREQ=MONTHLY;BYDAY=FR;BYMONTHDAY=13", "1997-09-02", 3
+            ),
+            [(1998, 2, 13), (1998, 3, 13), (1998, 11, 13)]
+        )
+
+    def test_bysetpos(self):
+        "Rule iteration selects occurrences in each period with BYSETPOS"
+
+        self.assertEqual(
+            occurrences(
+                "FREQ=MONTHLY;BYDAY=MO,TU,WE,TH,FR;BYSETPOS=-1;COUNT=3",
+                "2010-01-01"
+            ),
+            [(2010, 1, 29), (2010, 2, 26), (2010, 3, 31)]
+        )
+
+    def test_bysetpos_daily(self):
+        "Rule iteration applies BYSETPOS to each day for DAILY"
+
+        self.assertEqual(
+            occurrences(
+                "FREQ=DAILY;BYMONTH=1;BYSETPOS=1;COUNT=3", "2010-01-01"
+            ),
+            [(2010, 1, 1), (2010, 1, 2), (2010, 1, 3)]
+        )
+        self.assertEqual(
+            occurrences("FREQ=DAILY;BYSETPOS=-1;COUNT=3", "2010-01-01"),
+            [(2010, 1, 1), (2010, 1, 2), (2010, 1, 3)]
+        )
+        self.assertEqual(
+            occurrences("FREQ=DAILY;BYSETPOS=2", "2010-01-01"), []
+        )
+        self.assertEqual(
+            occurrences(
+                "FREQ=DAILY;BYMONTHDAY=1,-1;BYSETPOS=2", "2010-01-01"
+            ),
+            []
+        )
+
+    def test_byweekno(self):
+        "Rule iteration handles BYWEEKNO using ISO week numbers"
+
+        self.assertEqual(
+            occurrences("FREQ=YEARLY;BYWEEKNO=1;BYDAY=MO", "2010-01-01", 4),
+            [(2010, 1, 4), (2011, 1, 3), (2012, 1, 2), (2012, 12, 31)]
+        )
+        self.assertEqual(
+            occurrences("FREQ=YEARLY;BYWEEKNO=20;BYDAY=MO", "1997-05-12", 3),
+            [(1997, 5, 12), (1998, 5, 11), (1999, 5, 17)]
+        )
+
+    def test_byweekno_us(self):
+        "Rule iteration handles BYWEEKNO using US week numbers"
+
+        self.assertEqual(
+            occurrences(
+                "FREQ=YEARLY;BYWEEKNO=1;BYDAY=SU", "2010-01-01", 3,
+                chrono.calendar.USCalendar
+            ),
+            [(2010, 12, 26), (2012, 1, 1), (2012, 12, 30)]
+        )
+
+    def test_count(self):
+        "Rule iteration stops after COUNT occurrences"
+
+        self.assertEqual(
+            occurrences("FREQ=DAILY;COUNT=3", "2010-07-23"),
+            [(2010, 7, 23), (2010, 7, 24), (2010, 7, 25)]
+        )
+
+    def test_daily(self):
+        "Rule iteration limits DAILY with BYMONTH, BYMONTHDAY, and BYDAY"
+
+        self.assertEqual(
+            occurrences(
+                "FREQ=DAILY;INTERVAL=3;BYMONTH=8;BYMONTHDAY=1,-1;BYDAY=TU",
+                "2010-07-23", 3
+            ),
+            [(2010, 8, 31), (2034, 8, 1), (2038, 8, 31)]
+        )
+
+    def test_daily_never(self):
+        "Rule iteration skips months without BYMONTHDAY for DAILY"
+
+        self.assertEqual(
+            occurrences("FREQ=DAILY;BYMONTH=2;BYMONTHDAY=30", "2010-07-23"),
+            []
+        )
+
+    def test_missing(self):
+        "Rule iteration skips months and years without the start day"
+
+        self.assertEqual(
+            occurrences("FREQ=MONTHLY", "2010-01-31", 3),
+            [(2010, 1, 31), (2010, 3, 31), (2010, 5, 31)]
+        )
+        self.assertEqual(
+            occurrences("FREQ=YEARLY", "2008-02-29", 3),
+            [(2008, 2, 29), (2012, 2, 29), (2016, 2, 29)]
+        )
+
+    def test_until(self):
+        "Rule iteration stops after UNTIL"
+
+        self.assertEqual(
+            occurrences("FREQ=WEEKLY;UNTIL=20100806", "2010-07-23"),
+            [(2010, 7, 23), (2010, 7, 30), (2010, 8, 6)]
+        )
+
+    def test_weekly(self):
+        "Rule iteration handles WEEKLY with INTERVAL and BYDAY"
+
+        self.assertEqual(
+            occurrences("FREQ=WEEKLY;INTERVAL=2;BYDAY=TU,SU", "2010-07-23", 4),
+            [(2010, 7, 25), (2010, 8, 3), (2010, 8, 8), (2010, 8, 17)]
+        )
+
+    def test_weekly_us(self):
+        "Rule iteration starts weeks on the first day of the calendar week"
+
+        self.assertEqual(
+            occurrences(
+                "FREQ=WEEKLY;INTERVAL=2;BYDAY=TU,SU", "2010-07-23", 4,
+                chrono.calendar.USCalendar
+            ),
+            [(2010, 8, 1), (2010, 8, 3), (2010, 8, 15), (2010, 8, 17)]
+        )
+
+
+class RecurrenceRule__reprTest(unittest.TestCase):
+
+    def test_repr(self):
+        "repr() returns the rule and start"
+
+        self.assertEqual(
+            repr(chrono.recurrence.Rule("FREQ=DAILY", "2010-07-23")),
+            "chrono.recurrence.Rule('FREQ=DAILY', '2010-07-23')"
+        )
+
+
+class RecurrenceRule_afterTest(unittest.TestCase):
+
+    def test_after(self):
+        "Rule.after() returns the first occurrence after the date"
+
+        rule = chrono.recurrence.Rule("FREQ=MONTHLY;BYDAY=2TU", "2010-07-23")
+
+        self.assertEqual(rule.after("2010-08-10"), (2010, 9, 14))
+        self.assertEqual(rule.after("2500-06-20"), (2500, 7, 13))
+
+    def test_before_start(self):
+        "Rule.after() returns the first occurrence for dates before start"
+
+        rule = chrono.recurrence.Rule("FREQ=YEARLY;INTERVAL=4", "2010-07-23")
+
+        self.assertEqual(rule.after("1990-01-01"), (2010, 7, 23))
+        self.assertEqual(rule.after("2020-01-01"), (2022, 7, 23))
+
+    def test_byweekno(self):
+        "Rule.after() finds BYWEEKNO days in the first days of the next year"
+
+        rule = chrono.recurrence.Rule(
+            "FREQ=YEARLY;BYWEEKNO=53;BYDAY=FR", "2015-01-01"
+        )
+
+        self.assertEqual(rule.after("2015-12-31"), (2016, 1, 1))
+
+    def test_count(self):
+        "Rule.after() returns None after the last COUNT occurrence"
+
+        rule = chrono.recurrence.Rule("FREQ=DAILY;COUNT=10", "2010-07-23")
+
+        self.assertEqual(rule.after("2010-07-31"), (2010, 8, 1))
+        self.assertEqual(rule.after("2010-08-01"), None)
+
+    def test_empty(self):
+        "Rule.after() raises NoDateTimeError for empty date"
+
+        rule = chrono.recurrence.Rule("FREQ=DAILY", "2010-07-23")
+
+        self.assertRaises(chrono.NoDateTimeError, rule.after, chrono.Date())
+
+    def test_inclusive(self):
+        "Rule.after() includes the date itself if inclusive is True"
+
+        rule = chrono.recurrence.Rule("FREQ=WEEKLY", "2010-07-23")
+
+        self.assertEqual(rule.after("2010-07-30", True), (2010, 7, 30))
+        self.assertEqual(rule.after("2010-07-30"), (2010, 8, 6))
+
+    def test_until(self):
+        "Rule.after() returns None after UNTIL"
+
+        rule = chrono.recurrence.Rule(
+            "FREQ=DAILY;UNTIL=20100801", "2010-07-23"
+        )
+
+        self.assertEqual(rule.after("2010-08-01"), None)
+
+
+class RecurrenceRule_julianTest(unittest.TestCase):
+
+    def test_julian(self):
+        "Rule.julian() returns a generator of julian day numbers"
+
+        self.assertEqual(
+            list(chrono.recurrence.Rule(
+                "FREQ=DAILY;INTERVAL=7;COUNT=2", "1970-01-01"
+            ).julian()),
+            [2440588, 2440595]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -20,6 +20,20 @@ class Time__eqTest(unittest.TestCase):
         self.assertTrue(chrono.Time() == None)
         self.assertFalse(chrono.Time("16:27:43") == None)
 
+    def test_pytime(self):
+        "Time.__eq__() handles datetime.time objects"
+
+        self.assertTrue(
+            chrono.Time("16:27:43") == datetime.time(16, 27, 43)
+        )
+        self.assertTrue(
+            chrono.Time("16:27:43") == \
+            datetime.datetime(2009, 12, 27, 16, 27, 43)
+        )
+        self.assertFalse(
+            chrono.Time("16:27:43") == datetime.time(16, 27, 44)
+        )
+
     def test_string(self):
         "Time.__eq__() handles strings"
 
@@ -238,6 +252,18 @@ class Time__ltTest(unittest.TestCase):
         self.assertFalse(chrono.Time("16:27:43") < None)
         self.assertFalse(chrono.Time() < None)
 
+    def test_pytime(self):
+        "Time.__lt__() handles datetime.time objects"
+
+        self.assertTrue(chrono.Time("16:27:43") < datetime.time(16, 27, 44))
+        self.assertFalse(
+            chrono.Time("16:27:43") < datetime.time(16, 27, 43)
+        )
+        self.assertFalse(
+            chrono.Time("16:27:43") < \
+            datetime.datetime(2009, 12, 27, 16, 27, 42)
+        )
+
     def test_string(self):
         "Time.__lt__() handles strings"
 
@@ -406,6 +432,14 @@ class Time__setattrTest(unittest.TestCase):
 
         self.assertEquals(t.get(), (17, 27, 43))
 
+    def test_second_overflow_large(self):
+        "Time.__setattr__() handles large second overflows"
+
+        t = chrono.Time("16:27:43")
+        t.second += 10000000
+
+        self.assertEquals(t.get(), (10, 14, 23))
+
 
 class Time__strTest(unittest.TestCase):
 
@@ -475,6 +509,18 @@ class Time_formatTest(unittest.TestCase):
         )
 
 
+class Time_freezeTest(unittest.TestCase):
+
+    def test_freeze(self):
+        "Time.freeze() returns a FrozenTime"
+
+        f = chrono.Time("16:27:43").freeze()
+
+        self.assertTrue(isinstance(f, chrono.FrozenTime))
+        self.assertEqual(f.get(), (16, 27, 43))
+        self.assertFalse(chrono.Time().freeze().is_set())
+
+
 class Time_getTest(unittest.TestCase):
 
     def test_empty(self):
@@ -675,5 +721,19 @@ class Time_set_struct_timeTest(unittest.TestCase):
         self.assertEquals(t.get(), (16, 7, 37))
 
 
+
+class Time_sort_keyTest(unittest.TestCase):
+
+    def test_empty(self):
+        "Time.sort_key() returns -1 if no time is set"
+
+        self.assertEqual(chrono.Time().sort_key(), -1)
+
+    def test_sort_key(self):
+        "Time.sort_key() returns seconds since midnight"
+
+        self.assertEqual(chrono.Time("16:27:43").sort_key(), 59263)
+        self.assertEqual(chrono.Time("00:00:00").sort_key(), 0)
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,5 @@
+from __future__ import absolute_import
+
+from .test_rule import *
+from .test_tzif import *
+from .test_zone import *
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+
+"""
+Embedded TZif data for tests, so they don't depend on the system zoneinfo
+directory.
+"""
+
+import struct
+
+
+def tzif(transitions, indexes, types, footer=None, version=b"2"):
+    """
+    Builds TZif data from a list of transition times, a list of type indexes
+    for each transition, and a list of tuples with offset, daylight saving
+    flag, and abbreviation for each type
+    """
+
+    chars = b""
+    raw = []
+
+    for offset, dst, abbr in types:
+        raw.append(struct.pack(">lBB", offset, dst, len(chars)))
+        chars += abbr.encode("ascii") + b"\0"
+
+    def block(size):
+        return (
+            b"TZif" + version + b"\0" * 15 +
+            struct.pack(
+                ">6l", 0, 0, 0, len(transitions), len(types), len(chars)
+            ) +
+            struct.pack(
+                ">{0}{1}".format(len(transitions), "q" if size == 8 else "l"),
+                *transitions
+            ) +
+            bytes(indexes) + b"".join(raw) + chars
+        )
+
+    if version == b"\0":
+        return block(4)
+
+    return block(4) + block(8) + b"\n" + (footer or "").encode("ascii") + b"\n"
+
+
+# Europe/Oslo for 2009-2010, with the current rule after that
+OSLO = tzif(
+    [1238288400, 1256432400, 1269738000, 1288486800],
+    [1, 0, 1, 0],
+    [(3600, False, "CET"), (7200, True, "CEST")],
+    "CET-1CEST,M3.5.0,M10.5.0/3"
+)
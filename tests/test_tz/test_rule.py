@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+
+import chrono
+import unittest
+
+
+class Rule__initTest(unittest.TestCase):
+
+    def test_dst(self):
+        "Rule.__init__() parses rules with daylight saving time"
+
+        r = chrono.tz.Rule("CET-1CEST,M3.5.0,M10.5.0/3")
+
+        self.assertEqual(r.std, (3600, False, "CET"))
+        self.assertEqual(r.dst, (7200, True, "CEST"))
+
+    def test_invalid(self):
+        "Rule.__init__() raises ZoneError on invalid rules"
+
+        self.assertRaises(chrono.ZoneError, chrono.tz.Rule, "")
+        self.assertRaises(chrono.ZoneError, chrono.tz.Rule, "CET")
+        self.assertRaises(chrono.ZoneError, chrono.tz.Rule, "CET-1CEST,M3")
+
+    def test_quoted(self):
+        "Rule.__init__() handles quoted abbreviations"
+
+        r = chrono.tz.Rule("<+0530>-5:30")
+
+        self.assertEqual(r.std, (19800, False, "+0530"))
+        self.assertEqual(r.dst, None)
+
+
+class Rule_lookupTest(unittest.TestCase):
+
+    def test_dst(self):
+        "Rule.lookup() returns the offset in effect"
+
+        r = chrono.tz.Rule("EST5EDT,M3.2.0,M11.1.0")
+
+        # 2010-03-14 07:00:00 UTC, 2010-11-07 06:00:00 UTC
+        self.assertEqual(r.lookup(1268550000 - 1), (-18000, False, "EST"))
+        self.assertEqual(r.lookup(1268550000), (-14400, True, "EDT"))
+        self.assertEqual(r.lookup(1289109600 - 1), (-14400, True, "EDT"))
+        self.assertEqual(r.lookup(1289109600), (-18000, False, "EST"))
+
+    def test_southern(self):
+        "Rule.lookup() handles daylight saving time over new year"
+
+        r = chrono.tz.Rule("AEST-10AEDT,M10.1.0,M4.1.0/3")
+
+        self.assertEqual(r.lookup(1262304000), (39600, True, "AEDT"))
+        self.assertEqual(r.lookup(1277942400), (36000, False, "AEST"))
+
+    def test_std(self):
+        "Rule.lookup() handles rules without daylight saving time"
+
+        self.assertEqual(
+            chrono.tz.Rule("<-03>3").lookup(0), (-10800, False, "-03")
+        )
+
+
+class Rule_transitionsTest(unittest.TestCase):
+
+    def test_julian(self):
+        "Rule.transitions() handles julian day rules"
+
+        # day 60 is march 1st with or without a leap day
+        for year, timestamp in ((2010, 1267401600), (2012, 1330560000)):
+            self.assertEqual(
+                chrono.tz.Rule("XXX0YYY,J60/0,J300/0").transitions(year)[0][0],
+                timestamp
+            )
+
+    def test_transitions(self):
+        "Rule.transitions() returns the transitions in a year"
+
+        self.assertEqual(
+            chrono.tz.Rule("CET-1CEST,M3.5.0,M10.5.0/3").transitions(2010),
+            (
+                [1269738000, 1288486800],
+                [(7200, True, "CEST"), (3600, False, "CET")]
+            )
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
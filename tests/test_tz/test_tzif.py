@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+
+from __future__ import absolute_import
+
+from . import data
+
+import chrono
+import chrono.tz.tzif
+import unittest
+
+
+class tzif_parseTest(unittest.TestCase):
+
+    def test_invalid(self):
+        "parse() raises ZoneError on invalid data"
+
+        self.assertRaises(chrono.ZoneError, chrono.tz.tzif.parse, b"")
+        self.assertRaises(chrono.ZoneError, chrono.tz.tzif.parse, b"abcd")
+        self.assertRaises(
+            chrono.ZoneError, chrono.tz.tzif.parse, data.OSLO[:60]
+        )
+
+    def test_v1(self):
+        "parse() handles version 1 data"
+
+        self.assertEqual(
+            chrono.tz.tzif.parse(
+                data.tzif(
+                    [-100, 100], [1, 0],
+                    [(3600, False, "CET"), (7200, True, "CEST")],
+                    version=b"\0"
+                )
+            ),
+            (
+                [-100, 100],
+                [(7200, True, "CEST"), (3600, False, "CET")],
+                (3600, False, "CET"),
+                None
+            )
+        )
+
+    def test_v2(self):
+        "parse() uses the 64-bit data and footer of version 2 data"
+
+        self.assertEqual(
+            chrono.tz.tzif.parse(data.OSLO),
+            (
+                [1238288400, 1256432400, 1269738000, 1288486800],
+                [
+                    (7200, True, "CEST"), (3600, False, "CET"),
+                    (7200, True, "CEST"), (3600, False, "CET"),
+                ],
+                (3600, False, "CET"),
+                "CET-1CEST,M3.5.0,M10.5.0/3"
+            )
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,263 @@
+#!/usr/bin/env python
+
+from __future__ import absolute_import
+
+from . import data
+
+import chrono
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+try:
+    import zoneinfo
+
+except ImportError:
+    zoneinfo = None
+
+
+def system_zone(name):
+    "Returns a zoneinfo zone for *name*, or None if it is unavailable"
+
+    if zoneinfo is None:
+        return None
+
+    try:
+        zoneinfo.ZoneInfo(name)
+
+    except Exception:
+        return None
+
+    for directory in chrono.tz.Zone.path:
+        if os.path.isfile(os.path.join(directory, name)):
+            return zoneinfo.ZoneInfo(name)
+
+    return None
+
+
+class Zone__initTest(unittest.TestCase):
+
+    def test_invalid(self):
+        "Zone.__init__() raises ZoneError on invalid data"
+
+        self.assertRaises(
+            chrono.ZoneError, chrono.tz.Zone, "Test", [0], []
+        )
+        self.assertRaises(
+            chrono.ZoneError, chrono.tz.Zone, "Test",
+            [10, 0], [(0, False, "A"), (3600, False, "B")]
+        )
+        self.assertRaises(chrono.ZoneError, chrono.tz.Zone, "Test")
+
+    def test_rule(self):
+        "Zone.__init__() accepts rules as strings"
+
+        z = chrono.tz.Zone("Test", rule="CET-1CEST,M3.5.0,M10.5.0/3")
+
+        self.assertEqual(z.rule.std, (3600, False, "CET"))
+        self.assertEqual(z.lookup(1277942400), (7200, True, "CEST"))
+
+
+class Zone__reprTest(unittest.TestCase):
+
+    def test_repr(self):
+        "Zone.__repr__() includes the name"
+
+        self.assertEqual(
+            repr(chrono.tz.Zone.fixed(0)), "chrono.tz.Zone('UTC')"
+        )
+
+
+class Zone_fixedTest(unittest.TestCase):
+
+    def test_fixed(self):
+        "Zone.fixed() returns a zone with a fixed offset"
+
+        z = chrono.tz.Zone.fixed(-9000)
+
+        self.assertEqual(z.name, "UTC-02:30")
+        self.assertEqual(z.lookup(0), (-9000, False, "UTC-02:30"))
+        self.assertEqual(z.to_local(1000000000), 1000000000 - 9000)
+
+
+class Zone_format_offsetTest(unittest.TestCase):
+
+    def test_format(self):
+        "Zone.format_offset() formats offsets as +hh:mm"
+
+        self.assertEqual(chrono.tz.Zone.format_offset(0), "+00:00")
+        self.assertEqual(chrono.tz.Zone.format_offset(19800), "+05:30")
+        self.assertEqual(chrono.tz.Zone.format_offset(-36000), "-10:00")
+        self.assertEqual(chrono.tz.Zone.format_offset(-1125), "-00:18:45")
+
+
+class Zone_getTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.path = chrono.tz.Zone.path
+        self.directory = tempfile.mkdtemp()
+
+        os.mkdir(os.path.join(self.directory, "Test"))
+
+        with open(os.path.join(self.directory, "Test", "Oslo"), "wb") as f:
+            f.write(data.OSLO)
+
+        chrono.tz.Zone.path = [
+            os.path.join(self.directory, "missing"), self.directory
+        ]
+
+    def tearDown(self):
+
+        chrono.tz.Zone.path = self.path
+        shutil.rmtree(self.directory)
+
+    def test_cache(self):
+        "Zone.get() returns the same object for later calls"
+
+        z = chrono.tz.Zone.get("Test/Oslo")
+
+        self.assertEqual(z.name, "Test/Oslo")
+        self.assertEqual(z.lookup(1277942400), (7200, True, "CEST"))
+
+        os.remove(os.path.join(self.directory, "Test", "Oslo"))
+
+        self.assertTrue(chrono.tz.Zone.get("Test/Oslo") is z)
+
+    def test_invalid(self):
+        "Zone.get() raises ZoneError for invalid and unknown zones"
+
+        self.assertRaises(chrono.ZoneError, chrono.tz.Zone.get, "Test/Bergen")
+        self.assertRaises(chrono.ZoneError, chrono.tz.Zone.get, "../Oslo")
+        self.assertRaises(chrono.ZoneError, chrono.tz.Zone.get, "/Test/Oslo")
+        self.assertRaises(chrono.ZoneError, chrono.tz.Zone.get, "")
+        self.assertRaises(chrono.ZoneError, chrono.tz.Zone.get, None)
+
+    def test_utc(self):
+        "Zone.get() returns UTC without a zoneinfo directory"
+
+        z = chrono.tz.Zone.get("UTC")
+
+        self.assertEqual(z.name, "UTC")
+        self.assertEqual(z.utcoffset(1000000000), 0)
+
+
+class Zone_lookupTest(unittest.TestCase):
+
+    def test_lookup(self):
+        "Zone.lookup() returns the offset in effect at a time"
+
+        z = chrono.tz.Zone.from_tzif(data.OSLO, "Test/Oslo")
+
+        self.assertEqual(z.lookup(0), (3600, False, "CET"))
+        self.assertEqual(z.lookup(1238288400 - 1), (3600, False, "CET"))
+        self.assertEqual(z.lookup(1238288400), (7200, True, "CEST"))
+        self.assertEqual(z.lookup(1269738000), (7200, True, "CEST"))
+        self.assertEqual(z.lookup(1288486800), (3600, False, "CET"))
+
+        # after the last transition the rule is used
+        self.assertEqual(z.lookup(1301187600 - 1), (3600, False, "CET"))
+        self.assertEqual(z.lookup(1301187600), (7200, True, "CEST"))
+        self.assertEqual(z.lookup(253402300799), (3600, False, "CET"))
+
+    def test_system(self):
+        "Zone.lookup() matches the system zoneinfo data"
+
+        utc = system_zone("UTC")
+
+        for name in ("Europe/Oslo", "America/New_York", "Australia/Sydney"):
+            zi = system_zone(name)
+
+            if zi is None or utc is None:
+                continue
+
+            z = chrono.tz.Zone.get(name)
+
+            for i in range(1000):
+                timestamp = random.randint(-2 ** 32, 2 ** 32)
+                d = chrono.DateTime(timestamp, zone="UTC").get_datetime()
+
+                self.assertEqual(
+                    z.utcoffset(timestamp),
+                    d.replace(tzinfo=utc).astimezone(zi).utcoffset()
+                    .total_seconds()
+                )
+
+
+class Zone_to_localTest(unittest.TestCase):
+
+    def test_local(self):
+        "Zone.to_local() converts UNIX timestamps to local time"
+
+        z = chrono.tz.Zone.from_tzif(data.OSLO, "Test/Oslo")
+
+        self.assertEqual(z.to_local(1262304000), 1262304000 + 3600)
+        self.assertEqual(z.to_local(1277942400), 1277942400 + 7200)
+
+
+class Zone_to_local_manyTest(unittest.TestCase):
+
+    def test_many(self):
+        "Zone.to_local_many() gives the same results as Zone.to_local()"
+
+        z = chrono.tz.Zone.from_tzif(data.OSLO, "Test/Oslo")
+        timestamps = sorted(
+            random.randint(1200000000, 1400000000) for i in range(1000)
+        ) + [1238288400 - 1, 1238288400, 1301187600 - 1, 1301187600, 0]
+
+        self.assertEqual(
+            list(z.to_local_many(timestamps)),
+            [z.to_local(t) for t in timestamps]
+        )
+
+
+class Zone_to_utcTest(unittest.TestCase):
+
+    def test_fold(self):
+        "Zone.to_utc() uses fold for local times which occur twice"
+
+        z = chrono.tz.Zone.from_tzif(data.OSLO, "Test/Oslo")
+
+        # 2010-10-31 02:30:00 occurs in both CEST and CET
+        self.assertEqual(z.to_utc(1288492200), 1288492200 - 7200)
+        self.assertEqual(z.to_utc(1288492200, 1), 1288492200 - 3600)
+
+    def test_gap(self):
+        "Zone.to_utc() handles local times which don't occur"
+
+        z = chrono.tz.Zone.from_tzif(data.OSLO, "Test/Oslo")
+
+        # 2010-03-28 02:30:00 is skipped when clocks are turned forward
+        self.assertEqual(z.to_utc(1269743400), 1269743400 - 3600)
+        self.assertEqual(z.to_utc(1269743400, 1), 1269743400 - 7200)
+
+    def test_utc(self):
+        "Zone.to_utc() converts local time to UNIX timestamps"
+
+        z = chrono.tz.Zone.from_tzif(data.OSLO, "Test/Oslo")
+
+        for timestamp in (0, 1262304000, 1277942400, 1893456000):
+            self.assertEqual(z.to_utc(z.to_local(timestamp)), timestamp)
+
+
+class Zone_to_utc_manyTest(unittest.TestCase):
+
+    def test_many(self):
+        "Zone.to_utc_many() gives the same results as Zone.to_utc()"
+
+        z = chrono.tz.Zone.from_tzif(data.OSLO, "Test/Oslo")
+        values = sorted(
+            random.randint(1200000000, 1400000000) for i in range(1000)
+        ) + [1288492200, 1269743400, 0]
+
+        for fold in (0, 1):
+            self.assertEqual(
+                list(z.to_utc_many(values, fold)),
+                [z.to_utc(v, fold) for v in values]
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
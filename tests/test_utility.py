@@ -254,5 +254,166 @@ class integerTest(unittest.TestCase):
         )
 
 
+class try_int_dayTest(unittest.TestCase):
+
+    def test_int(self):
+        "try_int_day() passes integers"
+
+        self.assertEqual(chrono.utility.try_int_day(1), 1)
+
+    def test_none(self):
+        "try_int_day() returns None for None"
+
+        self.assertEqual(chrono.utility.try_int_day(None), None)
+
+    def test_nonnumeric(self):
+        "try_int_day() returns None for non-numeric string"
+
+        self.assertEqual(chrono.utility.try_int_day("abc"), None)
+
+    def test_string(self):
+        "try_int_day() converts strings"
+
+        self.assertEqual(chrono.utility.try_int_day("1"), 1)
+
+
+class try_int_hourTest(unittest.TestCase):
+
+    def test_int(self):
+        "try_int_hour() passes integers"
+
+        self.assertEqual(chrono.utility.try_int_hour(1), 1)
+
+    def test_none(self):
+        "try_int_hour() returns None for None"
+
+        self.assertEqual(chrono.utility.try_int_hour(None), None)
+
+    def test_nonnumeric(self):
+        "try_int_hour() returns None for non-numeric string"
+
+        self.assertEqual(chrono.utility.try_int_hour("abc"), None)
+
+    def test_string(self):
+        "try_int_hour() converts strings"
+
+        self.assertEqual(chrono.utility.try_int_hour("1"), 1)
+
+
+class try_int_minuteTest(unittest.TestCase):
+
+    def test_int(self):
+        "try_int_minute() passes integers"
+
+        self.assertEqual(chrono.utility.try_int_minute(1), 1)
+
+    def test_none(self):
+        "try_int_minute() returns None for None"
+
+        self.assertEqual(chrono.utility.try_int_minute(None), None)
+
+    def test_nonnumeric(self):
+        "try_int_minute() returns None for non-numeric string"
+
+        self.assertEqual(chrono.utility.try_int_minute("abc"), None)
+
+    def test_string(self):
+        "try_int_minute() converts strings"
+
+        self.assertEqual(chrono.utility.try_int_minute("1"), 1)
+
+
+class try_int_monthTest(unittest.TestCase):
+
+    def test_int(self):
+        "try_int_month() passes integers"
+
+        self.assertEqual(chrono.utility.try_int_month(1), 1)
+
+    def test_none(self):
+        "try_int_month() returns None for None"
+
+        self.assertEqual(chrono.utility.try_int_month(None), None)
+
+    def test_nonnumeric(self):
+        "try_int_month() returns None for non-numeric string"
+
+        self.assertEqual(chrono.utility.try_int_month("abc"), None)
+
+    def test_string(self):
+        "try_int_month() converts strings"
+
+        self.assertEqual(chrono.utility.try_int_month("1"), 1)
+
+
+class try_int_secondTest(unittest.TestCase):
+
+    def test_int(self):
+        "try_int_second() passes integers"
+
+        self.assertEqual(chrono.utility.try_int_second(1), 1)
+
+    def test_none(self):
+        "try_int_second() returns None for None"
+
+        self.assertEqual(chrono.utility.try_int_second(None), None)
+
+    def test_nonnumeric(self):
+        "try_int_second() returns None for non-numeric string"
+
+        self.assertEqual(chrono.utility.try_int_second("abc"), None)
+
+    def test_string(self):
+        "try_int_second() converts strings"
+
+        self.assertEqual(chrono.utility.try_int_second("1"), 1)
+
+
+class try_int_weekTest(unittest.TestCase):
+
+    def test_int(self):
+        "try_int_week() passes integers"
+
+        self.assertEqual(chrono.utility.try_int_week(1), 1)
+
+    def test_none(self):
+        "try_int_week() returns None for None"
+
+        self.assertEqual(chrono.utility.try_int_week(None), None)
+
+    def test_nonnumeric(self):
+        "try_int_week() returns None for non-numeric string"
+
+        self.assertEqual(chrono.utility.try_int_week("abc"), None)
+
+    def test_string(self):
+        "try_int_week() converts strings"
+
+        self.assertEqual(chrono.utility.try_int_week("1"), 1)
+
+
+class try_int_yearTest(unittest.TestCase):
+
+    def test_int(self):
+        "try_int_year() passes integers"
+
+        self.assertEqual(chrono.utility.try_int_year(1), 1)
+
+    def test_none(self):
+        "try_int_year() returns None for None"
+
+        self.assertEqual(chrono.utility.try_int_year(None), None)
+
+    def test_nonnumeric(self):
+        "try_int_year() returns None for non-numeric string"
+
+        self.assertEqual(chrono.utility.try_int_year("abc"), None)
+
+    def test_string(self):
+        "try_int_year() converts strings"
+
+        self.assertEqual(chrono.utility.try_int_year("1"), 1)
+
+
 if __name__ == "__main__":
     unittest.main()